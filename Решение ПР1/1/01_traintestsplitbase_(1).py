@@ -17,16 +17,22 @@ Original file is located at
 # Загружаем необходимые библиотеки для анализа данных и визуализации.
 # %pylab inline
 
-import matplotlib.pyplot as plt  # Импортируем библиотеку Matplotlib для создания графиков.
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Общий модуль lazy_imports находится в родительском каталоге скрипта
+from lazy_imports import lazy_import, lazy_attr  # Отложенный импорт: библиотеки графиков и статистики загружаются при первом использовании.
+
 import numpy as np  # Импортируем NumPy для работы с массивами и математическими функциями.
 import pandas as pd  # Импортируем Pandas для работы с данными в табличном формате.
-import statsmodels.api as sm  # Импортируем Statsmodels для статистического моделирования.
-import statsmodels.formula.api as smf  # Импортируем формулы Statsmodels для удобного задания моделей.
-from statsmodels.graphics.api import abline_plot  # Импортируем функцию для добавления линий регрессии на графики.
-import patsy  # Импортируем Patsy для преобразования данных в формат, подходящий для статистического моделирования.
-import seaborn as sns  # Импортируем Seaborn для создания более красивых и информативных графиков.
-sns.set(context='notebook', style='whitegrid', palette='deep', font='sans-serif', font_scale=1, rc=None)  # Настраиваем стиль графиков Seaborn, чтобы они выглядели более профессионально и читабельно.
-import sklearn as skl  # Импортируем библиотеку Scikit-learn для машинного обучения и анализа данных.
+# Seaborn для более красивых графиков (загружается при первом обращении).
+sns = lazy_import('seaborn')
+# Matplotlib для создания графиков (загружается при первом обращении); сразу после загрузки применяется стиль seaborn
+plt = lazy_import('matplotlib.pyplot', on_load=lambda module: sns.set(context='notebook', style='whitegrid', palette='deep', font='sans-serif', font_scale=1, rc=None))
+sm = lazy_import('statsmodels.api')  # Statsmodels для статистического моделирования (загружается при первом обращении).
+smf = lazy_import('statsmodels.formula.api')  # Формулы Statsmodels для удобного задания моделей.
+abline_plot = lazy_attr('statsmodels.graphics.api', 'abline_plot')  # Функция для добавления линий регрессии на графики.
+patsy = lazy_import('patsy')  # Patsy для преобразования данных в формат, подходящий для статистического моделирования.
+skl = lazy_import('sklearn')  # Scikit-learn для машинного обучения и анализа данных.
 
 """Загрузка, подготовка и анализ набора данных spambase, который используется для классификации электронной почты как спам или не спам."""
 
@@ -51,7 +57,9 @@ column_names = [  # Определяем имена столбцов для за
     "capital_run_length_longest", "capital_run_length_total", "class"  # Последний столбец 'class' указывает, является ли сообщение спамом или нет.
 ]
 
-spam = pd.read_csv(target_url, header=None, names=column_names)  # Загружаем данные из CSV файла по указанному URL, без заголовка, и присваиваем имена столбцам.
+from spambase_loader import load_spambase  # Импортируем загрузчик spambase с локальным колоночным кэшем.
+
+spam = load_spambase(target_url, names=column_names)  # Загружаем данные по указанному URL (или из кэша при повторных запусках) и присваиваем имена столбцам.
 
 # Информация о данных
 print(spam.info())  # Выводим информацию о загруженных данных, включая количество записей и типы данных в каждом столбце.
@@ -66,11 +74,16 @@ spam.head()
 ### Использовать **pandas**
 """
 
-# Выбор случайной выборки из набора данных spam, которая составит 67% от общего объема данных
-spamtrain = spam.sample(frac = 0.67, random_state = 1066)
+from splits import shuffle_split  # Импортируем разбиение по позициям строк на основе одной перестановки.
+
+# Одна перестановка позиций строк: первые 67% - обучающая выборка (те же строки, что spam.sample(frac=0.67, random_state=1066)),
+# остальные - тестовая. Дополнение строится по позициям, без spam.drop(spamtrain.index) и поиска по меткам индекса.
+# Строки частей идут в порядке перестановки, как у sample(); с keep_order=True они шли бы в исходном порядке.
+train_index, test_index = shuffle_split(len(spam), 0.67, random_state=1066)
 
-# Удаление из набора данных spam всех строк, которые были выбраны для spamtrain, чтобы получить тестовый набор данных
-spamtest = spam.drop(spamtrain.index)
+# Выбор строк обучающей и тестовой выборок по позициям
+spamtrain = spam.iloc[train_index]
+spamtest = spam.iloc[test_index]
 
 # Подтверждение, что данные были разделены правильно, выводя количество классов в обучающем наборе
 print(spamtrain['class'].count())
@@ -86,25 +99,33 @@ print(spam['class'].count())
 ### Использовать **train_test_split** из **sklearn.model_selection**
 """
 
-from sklearn.model_selection import train_test_split  # Импортирует функцию train_test_split из библиотеки scikit-learn для разделения данных на обучающую и тестовую выборки.
 import pandas as pd  # Импортирует библиотеку pandas для работы с данными в формате таблиц.
 
-df = pd.read_csv("north_korea_missile_test_database.csv")  # Загружает данные из CSV-файла "north_korea_missile_test_database.csv" в DataFrame df.
+from missile_loader import load_missile_tests  # Импортирует загрузчик базы испытаний ракет по явной схеме типов.
+
+# Загружает данные из CSV-файла "north_korea_missile_test_database.csv" в DataFrame df:
+# даты разбираются по явным форматам, повторяющиеся строки хранятся как category, 'Unknown' в числовых столбцах - NaN,
+# а тяжелые текстовые столбцы ('Additional Information', 'Source(s)') читаются только по запросу (missile_loader.LazyText).
+df = load_missile_tests("north_korea_missile_test_database.csv")
 y = df["Missile Name"]  # Извлекает столбец "Missile Name" из DataFrame df и сохраняет его в переменной y (это целевая переменная).
 X = df.drop("Missile Name", axis=1)  # Удаляет столбец "Missile Name" из DataFrame df и сохраняет оставшиеся данные в переменной X (это признаки).
 
-# Разделяет данные на обучающую и тестовую выборки с использованием функции train_test_split.
-# 80% данных будет использоваться для обучения (X_train, y_train), а 20% - для тестирования (X_test, y_test).
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.2, random_state=31  # Устанавливает размер тестовой выборки в 20% и фиксирует случайное состояние для воспроизводимости.
-)
+# Разделяет данные на обучающую (60%), валидационную (20%) и тестовую (20%) выборки.
+# Разбиение совпадает с двумя последовательными вызовами train_test_split(..., random_state=31):
+# сначала 20% данных уходит в тестовую выборку, затем 25% оставшихся - в валидационную.
+# Позиции строк сохраняются в манифест (компактные массивы int32), ключ которого - хэш содержимого df, параметров и функции разбиения,
+# поэтому при повторных запусках и в других процессах разбиение загружается, а не вычисляется заново.
+from split_manifest import SplitManifestStore, train_val_test_positions
+
+split_params = {'test_size': 0.2, 'val_size': 0.25, 'random_state': 31}
+manifest_store = SplitManifestStore()
+parts = manifest_store.get_or_create(df, split_params, lambda: train_val_test_positions(len(df), **split_params),
+                                     splitter=train_val_test_positions)
 
-# Разделяет обучающую выборку на новую обучающую выборку и валидационную выборку.
-X_train, X_val, y_train, y_val = train_test_split(
-    X_train, y_train,  # Использует текущие обучающие данные X_train и y_train для дальнейшего разделения.
-    test_size=0.25,  # Устанавливает размер валидационной выборки в 25% от текущей обучающей выборки (что соответствует 20% от исходного набора данных).
-    random_state=31  # Фиксирует случайное состояние для обеспечения воспроизводимости результатов.
-)
+# Выборки получаются по сохраненным позициям строк
+X_train, y_train = X.iloc[parts['train']], y.iloc[parts['train']]
+X_val, y_val = X.iloc[parts['val']], y.iloc[parts['val']]
+X_test, y_test = X.iloc[parts['test']], y.iloc[parts['test']]
 
 len(X_train)
 
@@ -119,6 +140,21 @@ print(len(y_val))
 print(len(X_test))
 print(len(y_test))
 
+# Для CSV, которые не помещаются в память, разбиение в тех же долях 60/20/20 выполняется потоково:
+# файл читается блоками, каждая строка по хэшу своего содержимого попадает в train/val/test
+# с сохранением долей каждого значения 'Missile Name', а части сразу пишутся в отдельные файлы.
+# Это другое разбиение, чем у train_test_split выше: строки выбираются по хэшу, а размеры частей
+# каждого класса совпадают с заданными долями с точностью до строки и могут зависеть от chunksize.
+import tempfile
+
+from stream_split import split_csv
+
+# Файлы частей пишутся во временный каталог, который удаляется после проверки размеров частей
+with tempfile.TemporaryDirectory(prefix="missile_splits_") as split_dir:
+    split_sizes = split_csv("north_korea_missile_test_database.csv", split_dir,
+                            stratify="Missile Name", seed=31, chunksize=10_000)
+    print(split_sizes)
+
 """# Задания:
 1. Подготовить pandas dataframe на основе "сырых" данных - https://archive.ics.uci.edu/ml/machine-learning-databases/spambase/https://archive.ics.uci.edu/ml/machine-learning-databases/spambase/ **spambase.data spambase.names**
 2. Провести его анализ на предмет сбалансированности классов.
@@ -149,7 +185,7 @@ column_names = [  # Создает список названий столбцо
 ]
 
 # Загрузка данных в DataFrame
-spam_df = pd.read_csv(data_url, header=None, names=column_names)  # Загружает данные из указанного URL в DataFrame, устанавливая названия столбцов.
+spam_df = load_spambase(data_url, names=column_names)  # Загружает данные из указанного URL (или из локального кэша) в DataFrame, устанавливая названия столбцов.
 
 # Просмотр первых строк
 print(spam_df.head())  # Выводит первые 5 строк DataFrame для предварительного просмотра загруженных данных.
@@ -164,11 +200,11 @@ class_distribution = spam_df['class'].value_counts(normalize=True)
 print("Распределение классов:")
 print(class_distribution)
 
-# Импортируем библиотеку для визуализации
-import matplotlib.pyplot as plt
+# Библиотека визуализации plt загружается здесь, при первом обращении (см. lazy_imports в начале скрипта):
+# plt.gca() импортирует matplotlib и применяет стиль seaborn до построения графика
 
 # Строим столбчатую диаграмму для визуализации распределения классов
-class_distribution.plot(kind='bar', color=['blue', 'orange'])
+class_distribution.plot(kind='bar', color=['blue', 'orange'], ax=plt.gca())
 
 # Устанавливаем заголовок графика
 plt.title("Распределение классов")
@@ -184,36 +220,32 @@ plt.show()
 
 """Задание 3"""
 
-from sklearn.model_selection import StratifiedShuffleSplit
-
-# Создание объекта StratifiedShuffleSplit
-# Этот объект будет использоваться для разбиения данных на обучающую и тестовую выборки с учетом распределения классов.
-sss_80_20 = StratifiedShuffleSplit(n_splits=1, test_size=0.2, random_state=42)
-sss_70_30 = StratifiedShuffleSplit(n_splits=1, test_size=0.3, random_state=42)
-
-# Разбиение 80/20
-# Цикл для получения индексов обучающей и тестовой выборок с использованием метода split.
-for train_index, test_index in sss_80_20.split(spam_df, spam_df['class']):
-    # Создание обучающей выборки на 80% данных
-    train_80_20 = spam_df.iloc[train_index]
-    # Создание тестовой выборки на 20% данных
-    test_80_20 = spam_df.iloc[test_index]
-
-# Разбиение 70/30
-# Цикл для получения индексов обучающей и тестовой выборок с использованием метода split.
-for train_index, test_index in sss_70_30.split(spam_df, spam_df['class']):
-    # Создание обучающей выборки на 70% данных
-    train_70_30 = spam_df.iloc[train_index]
-    # Создание тестовой выборки на 30% данных
-    test_70_30 = spam_df.iloc[test_index]
+from splits import StratifiedSplitter
+
+# Создание стратифицированного разбиения (аналог StratifiedShuffleSplit с random_state=42).
+# Каждый класс перемешивается один раз, а все доли получаются из одной перестановки:
+# тестовая выборка - начало перемешанного отрезка каждого класса, обучающая - оставшаяся часть.
+splitter = StratifiedSplitter(spam_df['class'], random_state=42)
+
+# Разбиения 80/20 и 70/30 - массивы индексов (по маске за O(n)), строки DataFrame не копируются
+splits = splitter.splits([0.2, 0.3])
+train_80_20_index, test_80_20_index = splits[0.2]
+train_70_30_index, test_70_30_index = splits[0.3]
+
+# Выборки при необходимости получаются по позициям, например spam_df.iloc[train_80_20_index]
+n_columns = spam_df.shape[1]
 
 # Проверка размеров выборок
 # Вывод размеров обучающей и тестовой выборок для разбиения 80/20
 print("80/20 Разбиение:")
-print(f"Обучающая выборка: {train_80_20.shape}")
-print(f"Тестовая выборка: {test_80_20.shape}")
+print(f"Обучающая выборка: {(len(train_80_20_index), n_columns)}")
+print(f"Тестовая выборка: {(len(test_80_20_index), n_columns)}")
 
 # Вывод размеров обучающей и тестовой выборок для разбиения 70/30
 print("\n70/30 Разбиение:")
-print(f"Обучающая выборка: {train_70_30.shape}")
-print(f"Тестовая выборка: {test_70_30.shape}")
\ No newline at end of file
+print(f"Обучающая выборка: {(len(train_70_30_index), n_columns)}")
+print(f"Тестовая выборка: {(len(test_70_30_index), n_columns)}")
+
+# Проверка стратификации: доли классов в тестовых выборках совпадают с исходными
+print(spam_df['class'].iloc[test_80_20_index].value_counts(normalize=True))
+print(spam_df['class'].iloc[test_70_30_index].value_counts(normalize=True))
\ No newline at end of file
@@ -80,6 +80,16 @@ df = pd.read_csv(url)
 columns = ['bedrooms', 'bathrooms', 'sqft_living', 'sqft_lot', 'floors', 'price']
 df = df.loc[:, columns]  # Фильтрация DataFrame по выбранным столбцам
 
+# Уменьшение типов столбцов (общий модуль dtype_optimizer в родительском каталоге)
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Каталог модуля определяется от файла скрипта, а не от текущего каталога
+from dtype_optimizer import optimize_dtypes, memory_saved
+
+# Дробные столбцы (в том числе целевая переменная price) остаются float64 для обучения и метрик
+df, dtype_report = optimize_dtypes(df, downcast_floats=False)
+print(memory_saved(dtype_report))
+
 # Просмотр первых 10 строк отфильтрованного DataFrame
 df.head(10)
 
@@ -282,22 +292,16 @@ The code below outputs the accuracy for decision trees with different values for
 # Определяем диапазон значений для максимальной глубины дерева решений.
 max_depth_range = list(range(1, 25))
 
-# Создаем список для хранения среднего значения R² для каждого значения max_depth.
-r2_list = []
-
-# Проходим по каждому значению глубины в заданном диапазоне.
-for depth in max_depth_range:
-    # Создаем экземпляр регрессора дерева решений с заданной максимальной глубиной и фиксированным состоянием генератора случайных чисел.
-    reg = DecisionTreeRegressor(max_depth=depth, random_state=0)
+# Импортируем параллельный перебор глубины дерева с выборками в разделяемой памяти.
+from depth_sweep import sweep_max_depth
 
-    # Обучаем модель на тренировочном наборе данных.
-    reg.fit(X_train, y_train)
+# Обучаем отдельное дерево для каждого значения глубины параллельно (random_state=0, как в последовательном цикле).
+# За один проход получаем R² и на обучающем, и на тестовом наборе данных.
+# depth_curve.depth_curve строит похожую кривую быстрее по одному дереву, но оба R² у нее приближенные.
+r2_train_list, r2_test_list = sweep_max_depth(X_train, y_train, X_test, y_test, max_depth_range, random_state=0)
 
-    # Оцениваем модель на тестовом наборе данных и получаем коэффициент детерминации R².
-    score = reg.score(X_test, y_test)
-
-    # Добавляем полученное значение R² в список для дальнейшего анализа.
-    r2_list.append(score)
+# Список значений R² на тестовом наборе для каждого значения max_depth.
+r2_list = r2_test_list
 
 """The graph below shows that the best model R² is when the hyperparameter max_depth is equal to 5. This process of selecting the best model (max_depth = 5 in this case) among many other candidate models (with different max_depth values in this case) is called model selection."""
 
@@ -347,32 +351,9 @@ fig.tight_layout()
 In order to understand why max_depth of 5 was the “best model” for our data, take a look at the graph below which shows the model performance when tested on the training and test set.
 """
 
-# Создаем список значений для максимальной глубины дерева, которые будем тестировать
-max_depth_range = list(range(1, 25))
-
-# Список для хранения значений R^2 для тестового набора данных
-r2_test_list = []
-
-# Список для хранения значений R^2 для обучающего набора данных
-r2_train_list = []
-
-# Проходим по каждому значению глубины дерева из заданного диапазона
-for depth in max_depth_range:
-
-    # Создаем экземпляр регрессора дерева решений с заданной максимальной глубиной и фиксированным состоянием генератора случайных чисел
-    reg = DecisionTreeRegressor(max_depth = depth,
-                             random_state = 0)
-
-    # Обучаем модель на обучающем наборе данных
-    reg.fit(X_train, y_train)
-
-    # Оцениваем модель на тестовом наборе данных и сохраняем значение R^2
-    score = reg.score(X_test, y_test)
-    r2_test_list.append(score)
-
-    # Плохая практика: оценка модели на тех же данных, на которых она обучалась
-    score = reg.score(X_train, y_train)
-    r2_train_list.append(score)
+# Значения R^2 для обучающего (r2_train_list) и тестового (r2_test_list) наборов данных
+# уже получены выше за один параллельный проход sweep_max_depth, повторно деревья не обучаем.
+# Плохая практика: оценка модели на тех же данных, на которых она обучалась (r2_train_list)
 
 # Создаем фигуру и ось для графика с заданными размерами и белым фоном
 fig, ax = plt.subplots(nrows = 1, ncols = 1, figsize = (10,7), facecolor = 'white');
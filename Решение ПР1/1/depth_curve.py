@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Приближенная кривая R² по глубине дерева за одно обучение.
+
+Вместо обучения отдельного дерева для каждого max_depth выращивается одно
+дерево максимальной глубины, и для каждой глубины берется значение узла,
+в котором остановится объект при обходе сверху вниз (значения хранятся
+для всех узлов дерева).
+
+Это приближение, а не замена перебора с переобучением (depth_sweep.sweep_max_depth),
+причем для обеих кривых: дерево с ограниченной глубиной может выбрать другие
+разбиения уже на верхних уровнях - при равных улучшениях sklearn выбирает по
+случайному порядку признаков, который зависит от числа уже построенных узлов.
+Поэтому меняются и разбиения обучающей выборки, и предсказания на тестовой.
+На данных с большим числом равенств разница R² доходила до 0.11 на обучающей
+и 0.076 на тестовой выборке, на данных вроде King County - около 0.01.
+Подходит для быстрого просмотра формы кривой, но не для выбора max_depth.
+"""
+
+import numpy as np
+from sklearn.metrics import r2_score
+from sklearn.tree import DecisionTreeRegressor
+
+
+def predict_by_depth(reg, X, depths):
+    """Предсказания обученного дерева, обрезанного на каждой из глубин.
+    Args:
+        reg: обученный DecisionTreeRegressor с одним выходом
+        X: матрица признаков (DataFrame или массив)
+        depths: последовательность глубин (>= 1)
+    returns:
+        массив формы (len(depths), n_samples)
+    """
+    tree = reg.tree_
+    left = tree.children_left
+    right = tree.children_right
+    feature = tree.feature
+    threshold = tree.threshold
+    value = tree.value[:, 0, 0]
+
+    # Дерево sklearn сравнивает признаки в float32
+    X = np.asarray(X, dtype=np.float32)
+    rows = np.arange(X.shape[0])
+
+    depths = list(depths)
+    wanted = {depth: i for i, depth in enumerate(depths)}
+    predictions = np.empty((len(depths), X.shape[0]), dtype=np.float64)
+
+    # Все объекты начинают обход с корня; на каждом шаге спускаемся на один уровень
+    node = np.zeros(X.shape[0], dtype=np.intp)
+    for depth in range(1, max(depths) + 1):
+        internal = left[node] != -1
+        go_left = X[rows, feature[node]] <= threshold[node]
+        # Объекты, уже находящиеся в листе, остаются на месте
+        node = np.where(internal, np.where(go_left, left[node], right[node]), node)
+        if depth in wanted:
+            predictions[wanted[depth]] = value[node]
+
+    return predictions
+
+
+def depth_curve(X_train, y_train, X_test, y_test, max_depth_range, random_state=0):
+    """Приближенные R² на обучающей и тестовой выборках для каждого max_depth за одно обучение.
+    Args:
+        X_train, y_train: обучающая выборка
+        X_test, y_test: тестовая выборка
+        max_depth_range: последовательность значений max_depth
+        random_state: random_state дерева
+    returns:
+        (r2_train_list, r2_test_list) в порядке max_depth_range
+    """
+    y_train = np.asarray(y_train).ravel()
+    y_test = np.asarray(y_test).ravel()
+
+    # Выращиваем одно дерево наибольшей из нужных глубин
+    reg = DecisionTreeRegressor(max_depth=max(max_depth_range), random_state=random_state)
+    reg.fit(np.asarray(X_train), y_train)
+
+    train_pred = predict_by_depth(reg, X_train, max_depth_range)
+    test_pred = predict_by_depth(reg, X_test, max_depth_range)
+
+    r2_train_list = [r2_score(y_train, pred) for pred in train_pred]
+    r2_test_list = [r2_score(y_test, pred) for pred in test_pred]
+    return r2_train_list, r2_test_list
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Параллельный перебор max_depth для DecisionTreeRegressor.
+
+Обучающая и тестовая выборки один раз копируются в разделяемую память
+(multiprocessing.shared_memory), после чего процессы пула подключаются к ним
+без сериализации данных. Каждый процесс обучает дерево для своей глубины и
+возвращает R² на обучающей и тестовой выборках за один проход.
+
+Пул всегда запускается методом fork: скрипт вызывает sweep_max_depth на
+верхнем уровне без защиты if __name__ == '__main__', а при spawn и
+forkserver (по умолчанию на macOS и Windows, на Linux - с Python 3.14)
+каждый процесс пула заново выполнял бы весь скрипт. Где fork недоступен
+(Windows), глубины перебираются последовательно в текущем процессе.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+
+# Массивы, подключенные к разделяемой памяти в процессе-обработчике
+_shared = {}
+
+
+def _to_shared(arr):
+    """Копирует массив в новый блок разделяемой памяти.
+    Args:
+        arr: массив numpy
+    returns:
+        (SharedMemory, описание массива для подключения в другом процессе)
+    """
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[...] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def _attach(specs):
+    """Инициализатор процесса пула: подключает массивы из разделяемой памяти."""
+    for key, (name, shape, dtype) in specs.items():
+        shm = shared_memory.SharedMemory(name=name)
+        # Ссылку на SharedMemory храним вместе с массивом, иначе буфер будет закрыт
+        _shared[key] = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+
+def _fit_depth(depth, random_state):
+    """Обучает дерево заданной глубины и возвращает (R² train, R² test)."""
+    X_train, y_train = _shared['X_train'][1], _shared['y_train'][1]
+    X_test, y_test = _shared['X_test'][1], _shared['y_test'][1]
+
+    reg = DecisionTreeRegressor(max_depth=depth, random_state=random_state)
+    reg.fit(X_train, y_train)
+    return reg.score(X_train, y_train), reg.score(X_test, y_test)
+
+
+def _fork_context():
+    """Контекст multiprocessing с методом fork или None, если fork недоступен."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def sweep_max_depth(X_train, y_train, X_test, y_test, max_depth_range, random_state=0, n_jobs=None):
+    """Обучает DecisionTreeRegressor для каждой глубины параллельно.
+    Args:
+        X_train, y_train: обучающая выборка (DataFrame, Series или массивы)
+        X_test, y_test: тестовая выборка
+        max_depth_range: последовательность значений max_depth
+        random_state: random_state каждого дерева, как в последовательном цикле
+        n_jobs: число процессов (None - по числу ядер; без fork - последовательно)
+    returns:
+        (r2_train_list, r2_test_list) в порядке max_depth_range
+    """
+    arrays = {
+        'X_train': np.ascontiguousarray(X_train),
+        'y_train': np.ascontiguousarray(y_train).ravel(),
+        'X_test': np.ascontiguousarray(X_test),
+        'y_test': np.ascontiguousarray(y_test).ravel(),
+    }
+
+    context = _fork_context()
+    if context is None:
+        # Без fork пул повторно выполнял бы вызывающий скрипт: обучаем деревья здесь
+        _shared.update({key: (None, arr) for key, arr in arrays.items()})
+        try:
+            scores = [_fit_depth(depth, random_state) for depth in max_depth_range]
+        finally:
+            _shared.clear()
+        return [train for train, _ in scores], [test for _, test in scores]
+
+    blocks = []
+    specs = {}
+    try:
+        for key, arr in arrays.items():
+            shm, specs[key] = _to_shared(arr)
+            blocks.append(shm)
+
+        with ProcessPoolExecutor(max_workers=n_jobs, mp_context=context, initializer=_attach,
+                                 initargs=(specs,)) as pool:
+            scores = list(pool.map(_fit_depth, max_depth_range, [random_state] * len(max_depth_range)))
+    finally:
+        # Освобождаем разделяемую память даже при ошибке в обработчиках
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+    r2_train_list = [train for train, _ in scores]
+    r2_test_list = [test for _, test in scores]
+    return r2_train_list, r2_test_list
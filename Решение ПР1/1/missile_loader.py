@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Загрузка north_korea_missile_test_database.csv по явной схеме типов.
+
+Без схемы pd.read_csv оставляет все столбцы строковыми (object). Здесь:
+- даты разбираются по явным форматам ('9-Apr-84', для неточных дат - 'Sep-84');
+- названия, типы ракет, площадки и другие повторяющиеся значения
+  читаются сразу как category;
+- координаты и расстояния ('200 km', '1,380 km') становятся float32,
+  'Unknown' превращается в NaN;
+- тяжелые текстовые столбцы ('Additional Information', 'Source(s)') не
+  читаются при загрузке и подгружаются отдельно при первом обращении.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Форматы дат: сначала полная дата, затем месяц и год для неточных дат
+DATE_COLUMNS = {
+    'Date': ['%d-%b-%y', '%b-%y'],
+    'Date Entered/Updated': ['%d-%b-%y'],
+}
+
+CATEGORY_COLUMNS = [
+    'Launch Time (UTC)', 'Missile Name', 'Missile Type', 'Launch Agency/Authority',
+    'Facility Name', 'Facility Location', 'Other Name', 'Landing Location',
+    'Confirmation Status', 'Test Outcome',
+]
+
+# Числовые столбцы; для столбцов с единицами измерения значения хранятся в километрах
+NUMERIC_COLUMNS = ['Facility Latitude', 'Facility Longitude']
+KM_COLUMNS = ['Apogee', 'Distance Travelled']
+
+# Текстовые столбцы, которые читаются только по запросу
+TEXT_COLUMNS = ['Additional Information', 'Source(s)']
+
+MISSING_VALUES = ['Unknown']
+
+
+def _parse_dates(values, formats):
+    """Разбирает даты по списку форматов; каждое следующее применяется к еще не разобранным."""
+    parsed = pd.to_datetime(values, format=formats[0], errors='coerce')
+    for fmt in formats[1:]:
+        parsed = parsed.fillna(pd.to_datetime(values, format=fmt, errors='coerce'))
+    return parsed
+
+
+def _parse_km(values):
+    """'1,380 km' -> 1380.0; 'Unknown' и пропуски -> NaN."""
+    cleaned = values.str.replace(r'km|,|\s', '', regex=True)
+    return pd.to_numeric(cleaned, errors='coerce').astype(np.float32)
+
+
+def load_missile_tests(path='north_korea_missile_test_database.csv', include_text=False):
+    """Загружает базу испытаний ракет с типизированными столбцами.
+    Args:
+        path: путь к CSV файлу
+        include_text: прочитать также тяжелые текстовые столбцы TEXT_COLUMNS
+    returns:
+        DataFrame
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [column for column in header if include_text or column not in TEXT_COLUMNS]
+
+    dtypes = {column: 'category' for column in CATEGORY_COLUMNS if column in usecols}
+    dtypes.update({column: 'string' for column in DATE_COLUMNS.keys() | set(KM_COLUMNS) if column in usecols})
+    dtypes.update({column: np.float32 for column in NUMERIC_COLUMNS if column in usecols})
+    if include_text:
+        dtypes.update({column: 'string' for column in TEXT_COLUMNS if column in usecols})
+
+    # 'Unknown' считается пропуском только в числовых столбцах; в категориях это обычное значение
+    na_values = {column: MISSING_VALUES for column in NUMERIC_COLUMNS if column in usecols}
+    df = pd.read_csv(path, usecols=usecols, dtype=dtypes, na_values=na_values, keep_default_na=True)
+
+    for column, formats in DATE_COLUMNS.items():
+        if column in df:
+            df[column] = _parse_dates(df[column], formats)
+    for column in KM_COLUMNS:
+        if column in df:
+            df[column] = _parse_km(df[column])
+    if 'F1' in df:
+        df['F1'] = pd.to_numeric(df['F1'], downcast='integer')
+    return df
+
+
+class LazyText:
+    """Текстовые столбцы базы, которые читаются из файла при первом обращении.
+    Args:
+        path: путь к CSV файлу
+    """
+
+    def __init__(self, path='north_korea_missile_test_database.csv'):
+        self.path = path
+        self._columns = {}
+
+    def __getitem__(self, column):
+        if column not in self._columns:
+            # Читается только один запрошенный столбец
+            self._columns[column] = pd.read_csv(self.path, usecols=[column], dtype='string')[column]
+        return self._columns[column]
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""Загрузка набора данных spambase с локальным колоночным кэшем.
+
+При первом запуске файл spambase.data скачивается (или читается с диска),
+проверяется его контрольная сумма SHA-256, и таблица сохраняется в каталог
+кэша в виде типизированных столбцов: признаки - float32, 'class' - int8.
+Каждый источник (URL или путь) кэшируется в своем подкаталоге. При
+последующих запусках столбцы открываются через np.load(mmap_mode='r'),
+поэтому повторного скачивания и разбора текста не происходит.
+
+Контрольная сумма: если она не задана явно (expected_sha256 или
+KNOWN_SHA256), при первой загрузке URL его SHA-256 записывается в
+pins.json каталога кэша, и все последующие загрузки (refresh=True, новый
+кэш) сверяются с ней. Локальный файл не закрепляется: для него в meta.json
+хранятся размер и время изменения, и при их изменении кэш пересобирается.
+
+По умолчанию DataFrame построен поверх отображенных в память массивов и
+доступен только для чтения: присваивание значений вызывает ошибку
+"assignment destination is read-only". Для изменяемой таблицы используйте
+writable=True (или df.copy()).
+"""
+
+import hashlib
+import io
+import json
+import os
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+# URL набора данных spambase в UCI Machine Learning Repository
+SPAMBASE_URL = "https://archive.ics.uci.edu/ml/machine-learning-databases/spambase/spambase.data"
+
+# Названия столбцов из spambase.names
+COLUMN_NAMES = [
+    "word_freq_make", "word_freq_address", "word_freq_all", "word_freq_3d", "word_freq_our",
+    "word_freq_over", "word_freq_remove", "word_freq_internet", "word_freq_order", "word_freq_mail",
+    "word_freq_receive", "word_freq_will", "word_freq_people", "word_freq_report", "word_freq_addresses",
+    "word_freq_free", "word_freq_business", "word_freq_email", "word_freq_you", "word_freq_credit",
+    "word_freq_your", "word_freq_font", "word_freq_000", "word_freq_money", "word_freq_hp",
+    "word_freq_hpl", "word_freq_george", "word_freq_650", "word_freq_lab", "word_freq_labs",
+    "word_freq_telnet", "word_freq_857", "word_freq_data", "word_freq_415", "word_freq_85",
+    "word_freq_technology", "word_freq_1999", "word_freq_parts", "word_freq_pm", "word_freq_direct",
+    "word_freq_cs", "word_freq_meeting", "word_freq_original", "word_freq_project", "word_freq_re",
+    "word_freq_edu", "word_freq_table", "word_freq_conference", "char_freq_;", "char_freq_(",
+    "char_freq_[", "char_freq_!", "char_freq_$", "char_freq_#", "capital_run_length_average",
+    "capital_run_length_longest", "capital_run_length_total", "class"
+]
+
+# Известные контрольные суммы источников {источник: SHA-256}; дополняют pins.json
+KNOWN_SHA256 = {}
+
+# Имена файлов внутри каталога кэша
+FEATURES_FILE = 'features.npy'
+TARGET_FILE = 'class.npy'
+META_FILE = 'meta.json'
+PINS_FILE = 'pins.json'
+
+
+def _read_source(source):
+    """Читает сырые байты spambase.data по URL или из локального файла.
+    Args:
+        source: URL (http/https) или путь к локальному файлу
+    returns:
+        bytes
+    """
+    # Локальный файл позволяет работать без доступа к сети
+    if os.path.exists(source):
+        with open(source, 'rb') as f:
+            return f.read()
+    with urllib.request.urlopen(source) as response:
+        return response.read()
+
+
+def _local_stamp(source):
+    """Размер и время изменения локального файла (None для URL)."""
+    if not os.path.exists(source):
+        return None
+    stat = os.stat(source)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _source_dir(cache_dir, source):
+    """Подкаталог кэша для источника: разные URL и файлы не перезаписывают друг друга."""
+    return os.path.join(cache_dir, hashlib.sha256(source.encode('utf-8')).hexdigest()[:16])
+
+
+def _read_pins(cache_dir):
+    path = os.path.join(cache_dir, PINS_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _pin(cache_dir, source, sha256):
+    """Запоминает контрольную сумму источника при первой загрузке."""
+    pins = _read_pins(cache_dir)
+    if source in pins:
+        return
+    pins[source] = sha256
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(os.path.join(cache_dir, PINS_FILE), 'w', encoding='utf-8') as f:
+        json.dump(pins, f, indent=1)
+
+
+def expected_checksum(source, cache_dir='spambase_cache'):
+    """Ожидаемый SHA-256 источника: из KNOWN_SHA256 или из pins.json (None - источник еще не загружался)."""
+    return KNOWN_SHA256.get(source) or _read_pins(cache_dir).get(source)
+
+
+def _cache_is_valid(cache_dir, source, names, expected_sha256):
+    """Проверяет, что кэш существует и соответствует источнику, запрошенным столбцам и контрольной сумме."""
+    meta_path = os.path.join(cache_dir, META_FILE)
+    if not os.path.exists(meta_path):
+        return False
+    with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('source') != source or meta.get('columns') != list(names):
+        return False
+    # Локальный файл мог измениться после сборки кэша
+    if meta.get('stamp') != _local_stamp(source):
+        return False
+    if expected_sha256 is not None and meta.get('sha256') != expected_sha256:
+        return False
+    return all(os.path.exists(os.path.join(cache_dir, name)) for name in (FEATURES_FILE, TARGET_FILE))
+
+
+def build_cache(source=SPAMBASE_URL, cache_dir='spambase_cache', names=COLUMN_NAMES, expected_sha256=None):
+    """Скачивает spambase.data, проверяет контрольную сумму и записывает колоночный кэш.
+    Args:
+        source: URL или путь к локальному файлу spambase.data
+        cache_dir: каталог, в который записывается кэш этого источника
+        names: список названий столбцов, последний из которых - целевой
+        expected_sha256: ожидаемый SHA-256 исходного файла (None - не проверять)
+    returns:
+        string SHA-256 исходного файла
+    """
+    # Отметка снимается до чтения: если файл изменится во время чтения, кэш будет пересобран
+    stamp = _local_stamp(source)
+    raw = _read_source(source)
+
+    # Проверяем целостность загруженного файла
+    sha256 = hashlib.sha256(raw).hexdigest()
+    if expected_sha256 is not None and sha256 != expected_sha256:
+        raise ValueError(f"Контрольная сумма {source} не совпадает: {sha256} != {expected_sha256}")
+
+    # Разбираем текст один раз, сразу с компактными типами
+    features = list(names[:-1])
+    target = names[-1]
+    dtypes = {name: np.float32 for name in features}
+    dtypes[target] = np.int8
+    df = pd.read_csv(io.BytesIO(raw), header=None, names=names, dtype=dtypes)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Признаки храним в порядке Фортрана: каждый столбец лежит в памяти непрерывно
+    np.save(os.path.join(cache_dir, FEATURES_FILE), np.asfortranarray(df[features].to_numpy(dtype=np.float32)))
+    np.save(os.path.join(cache_dir, TARGET_FILE), df[target].to_numpy(dtype=np.int8))
+
+    # Метаданные записываем последними: их наличие означает, что кэш полный
+    with open(os.path.join(cache_dir, META_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'source': source, 'sha256': sha256, 'stamp': stamp, 'columns': list(names), 'rows': len(df)}, f)
+
+    return sha256
+
+
+def load_spambase(source=SPAMBASE_URL, cache_dir='spambase_cache', names=COLUMN_NAMES,
+                  expected_sha256=None, refresh=False, writable=False):
+    """Загружает spambase как DataFrame, используя колоночный кэш.
+    Args:
+        source: URL или путь к локальному файлу spambase.data
+        cache_dir: каталог кэша
+        names: список названий столбцов, последний из которых - целевой
+        expected_sha256: ожидаемый SHA-256 исходного файла
+            (None - для URL из KNOWN_SHA256 или сохраненной при первой загрузке в pins.json,
+            для локального файла - без проверки)
+        refresh: принудительно пересобрать кэш
+        writable: вернуть изменяемую копию вместо таблицы только для чтения поверх mmap
+    returns:
+        DataFrame с признаками float32 и столбцом 'class' типа int8
+    """
+    local = _local_stamp(source) is not None
+    if expected_sha256 is None and not local:
+        expected_sha256 = expected_checksum(source, cache_dir)
+    source_dir = _source_dir(cache_dir, source)
+    if refresh or not _cache_is_valid(source_dir, source, names, expected_sha256):
+        sha256 = build_cache(source, source_dir, names, expected_sha256)
+        # Закрепляется только сумма скачанного файла; локальный файл может законно меняться
+        if not local:
+            _pin(cache_dir, source, sha256)
+
+    # Открываем столбцы через отображение в память, без чтения всего файла
+    mmap_mode = None if writable else 'r'
+    features = np.load(os.path.join(source_dir, FEATURES_FILE), mmap_mode=mmap_mode)
+    target = np.load(os.path.join(source_dir, TARGET_FILE), mmap_mode=mmap_mode)
+
+    df = pd.DataFrame(features, columns=names[:-1], copy=False)
+    df[names[-1]] = target
+    return df
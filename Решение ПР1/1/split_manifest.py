@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Сохраненные разбиения train/val/test, привязанные к содержимому данных.
+
+Разбиение вычисляется один раз и сохраняется в каталог манифестов в виде
+компактных массивов позиций (по одному .npy на часть): int32, если все
+позиции меньше 2**31, иначе int64 (тип записан в заголовке .npy).
+Ключ манифеста - SHA-256 от хэша содержимого набора данных, параметров
+разбиения, имени функции разбиения, версии формата манифеста и версии
+scikit-learn, поэтому повторные
+запуски и другие процессы с теми же данными и параметрами загружают точно
+такое же разбиение (через отображение в память), а изменение данных,
+параметров, функции разбиения или библиотеки автоматически дает новый манифест.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.model_selection import train_test_split
+
+from atomic_dir import write_directory
+
+# Версия алгоритма и формата манифеста; увеличивается при изменении train_val_test_positions
+MANIFEST_VERSION = 2
+
+
+def dataset_hash(df):
+    """SHA-256 содержимого DataFrame (значения, индекс и названия столбцов)."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(column) for column in df.columns]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def train_val_test_positions(n, test_size=0.2, val_size=0.25, random_state=None):
+    """Позиции train/val/test, совпадающие с двумя вызовами train_test_split.
+    Args:
+        n: число строк
+        test_size: доля тестовой выборки от всех строк
+        val_size: доля валидационной выборки от оставшейся обучающей
+        random_state: random_state обоих вызовов train_test_split
+    returns:
+        dict {'train', 'val', 'test': массив позиций}
+    """
+    train, test = train_test_split(np.arange(n), test_size=test_size, random_state=random_state)
+    train, val = train_test_split(train, test_size=val_size, random_state=random_state)
+    return {'train': train, 'val': val, 'test': test}
+
+
+def _position_dtype(parts):
+    """int32, если все позиции помещаются в него, иначе int64."""
+    largest = max((int(np.max(positions)) for positions in parts.values() if len(positions)), default=0)
+    return np.int32 if largest < 2 ** 31 else np.int64
+
+
+def _splitter_name(splitter):
+    """Полное имя функции разбиения для ключа манифеста."""
+    if splitter is None or isinstance(splitter, str):
+        return splitter
+    splitter = getattr(splitter, 'func', splitter)  # functools.partial
+    return f"{splitter.__module__}.{splitter.__qualname__}"
+
+
+class SplitManifestStore:
+    """Хранилище манифестов разбиений в каталоге root.
+    Args:
+        root: каталог манифестов
+    """
+
+    def __init__(self, root='split_manifests'):
+        self.root = root
+
+    def key(self, data_hash, params, splitter=None):
+        """Ключ манифеста по хэшу данных, параметрам и функции разбиения."""
+        payload = json.dumps({
+            'data': data_hash,
+            'params': params,
+            'splitter': _splitter_name(splitter),
+            'version': MANIFEST_VERSION,
+            'sklearn': sklearn.__version__,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.root, key)
+
+    def load(self, key):
+        """Загружает разбиение (массивы открываются через mmap) или возвращает None."""
+        path = self.path(key)
+        meta_path = os.path.join(path, 'manifest.json')
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in meta['parts']}
+
+    def save(self, key, parts, params=None):
+        """Сохраняет части разбиения как массивы int32 (или int64 для позиций от 2**31)."""
+        dtype = _position_dtype(parts)
+
+        def write(path):
+            for name, positions in parts.items():
+                np.save(os.path.join(path, f"{name}.npy"), np.asarray(positions, dtype=dtype))
+            with open(os.path.join(path, 'manifest.json'), 'w', encoding='utf-8') as f:
+                json.dump({'parts': list(parts), 'params': params}, f)
+
+        # Другие процессы не увидят неполный манифест
+        write_directory(self.path(key), write)
+
+    def get_or_create(self, df, params, make_split, splitter=None):
+        """Возвращает сохраненное разбиение или вычисляет и сохраняет его.
+        Args:
+            df: DataFrame, по содержимому которого вычисляется ключ
+            params: словарь параметров разбиения (сериализуемый в JSON)
+            make_split: функция без аргументов, возвращающая dict {часть: позиции}
+            splitter: функция разбиения (или ее имя), которую вызывает make_split;
+                None - используется имя самой make_split
+        returns:
+            dict {часть: массив позиций int32 или int64}
+        """
+        key = self.key(dataset_hash(df), params, make_split if splitter is None else splitter)
+        parts = self.load(key)
+        if parts is None:
+            self.save(key, make_split(), params)
+            parts = self.load(key)
+        return parts
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""Стратифицированное разбиение на несколько долей за одно перемешивание.
+
+Каждый класс перемешивается один раз, и объекты группируются по классам:
+получается один массив индексов, в котором у каждого класса свой отрезок в
+случайном порядке. Тестовая выборка для доли share - первые
+ceil(share * размер класса) объектов отрезка каждого класса, обучающая -
+остальные. Поэтому пропорции классов сохраняются с точностью до одного
+объекта на класс, а выборки для разных долей вложены друг в друга: тест
+80/20 входит в тест 70/30. Перемешивание и группировка выполняются один раз
+(для меток uint16 - поразрядной сортировкой за O(n)), каждое разбиение -
+одна маска за O(n), без сортировки.
+"""
+
+import numpy as np
+
+
+class StratifiedSplitter:
+    """Вложенные стратифицированные разбиения по одной перестановке.
+    Args:
+        y: метки классов (массив или Series)
+        random_state: seed или np.random.Generator
+    """
+
+    def __init__(self, y, random_state=None):
+        _, labels = np.unique(np.asarray(y), return_inverse=True)
+        labels = labels.ravel()
+        n = len(labels)
+        rng = np.random.default_rng(random_state)
+
+        # Перемешиваем все позиции, затем устойчиво группируем по классу:
+        # внутри каждого класса порядок остается случайным.
+        # Для меток uint16 NumPy выполняет устойчивую сортировку поразрядно, за O(n)
+        perm = rng.permutation(n)
+        shuffled = labels[perm]
+        if labels.max(initial=0) < 2 ** 16:
+            shuffled = shuffled.astype(np.uint16)
+        self.grouped = perm[np.argsort(shuffled, kind='stable')]
+
+        self.counts = np.bincount(labels)
+        starts = np.concatenate(([0], np.cumsum(self.counts)[:-1]))
+        # Позиция объекта внутри отрезка своего класса в массиве grouped
+        self._rank = np.arange(n) - np.repeat(starts, self.counts)
+
+    def __len__(self):
+        return len(self.grouped)
+
+    def quotas(self, test_size):
+        """Число объектов каждого класса в тестовой выборке: ceil(доля * размер класса).
+        Args:
+            test_size: доля тестовой выборки (0 < test_size < 1) или число объектов
+        """
+        n = len(self.grouped)
+        if isinstance(test_size, (int, np.integer)):
+            # Целочисленно, без ошибок округления: ceil(k * n_c / n)
+            return -(-int(test_size) * self.counts // n)
+        # Округление отбрасывает погрешность вида 0.3 * 10 = 3.0000000000000004
+        return np.ceil(np.round(test_size * self.counts, 9)).astype(np.int64)
+
+    def split(self, test_size):
+        """Индексы обучающей и тестовой выборок для доли test_size.
+        Args:
+            test_size: доля тестовой выборки (0 < test_size < 1) или число объектов
+                (размер тестовой выборки может превышать его не больше чем на число классов - 1)
+        returns:
+            (train_index, test_index) - индексы, сгруппированные по классам
+        """
+        quotas = self.quotas(test_size)
+        k = int(quotas.sum())
+        if not 0 < k < len(self.grouped):
+            raise ValueError(f"Недопустимый размер тестовой выборки: {test_size}")
+        in_test = self._rank < np.repeat(quotas, self.counts)
+        return self.grouped[~in_test], self.grouped[in_test]
+
+    def splits(self, test_sizes):
+        """Разбиения для нескольких долей: dict {test_size: (train_index, test_index)}."""
+        return {test_size: self.split(test_size) for test_size in test_sizes}
+
+
+def shuffle_split(n, train_size, random_state=None, keep_order=False, as_mask=False):
+    """Случайное разбиение позиций 0..n-1 на обучающую и тестовую части по одной перестановке.
+
+    Заменяет пару spam.sample(frac=...) + spam.drop(spamtrain.index): дополнение
+    строится по позициям, без поиска меток индекса, поэтому работает и для
+    неуникального индекса. При целом random_state обучающая часть совпадает с
+    DataFrame.sample(frac=train_size, random_state=random_state).
+    Args:
+        n: число строк
+        train_size: доля (0 < train_size < 1) или число строк обучающей части
+        random_state: int, np.random.RandomState или None
+        keep_order: вернуть позиции каждой части в исходном порядке строк
+        as_mask: вернуть булевы маски вместо массивов позиций
+    returns:
+        (train, test) - срезы перестановки, отсортированные позиции или маски
+    """
+    k = train_size if isinstance(train_size, (int, np.integer)) else round(train_size * n)
+    if not 0 <= k <= n:
+        raise ValueError(f"Недопустимый размер обучающей выборки: {train_size}")
+
+    # Тот же генератор, что и в DataFrame.sample: первые k элементов перестановки
+    rng = random_state if isinstance(random_state, np.random.RandomState) else np.random.RandomState(random_state)
+    perm = rng.permutation(n)
+    if not (keep_order or as_mask):
+        return perm[:k], perm[k:]
+
+    # Маска строится за O(n), исходный порядок строк сохраняется без сортировки
+    mask = np.zeros(n, dtype=bool)
+    mask[perm[:k]] = True
+    if as_mask:
+        return mask, ~mask
+    return np.flatnonzero(mask), np.flatnonzero(~mask)
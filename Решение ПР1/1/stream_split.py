@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Потоковое разбиение CSV на train/val/test без загрузки файла в память.
+
+Файл читается блоками (pd.read_csv(chunksize=...)), каждая строка получает
+детерминированное псевдослучайное число из хэша ее содержимого и seed, и
+блок сразу дописывается в выходные файлы частей. Без стратификации часть
+определяется только хэшем строки. Со стратификацией для каждого класса
+ведется счетчик уже распределенных строк: в каждом блоке класс получает
+столько строк в каждую часть, сколько нужно, чтобы накопленные доли
+совпадали с заданными (с точностью до одной строки), а какие именно строки
+попадут в часть, решает порядок их хэшей внутри блока. Поэтому разбиение
+детерминировано для данных, seed и chunksize, но при другом chunksize
+отдельные строки (и размеры частей в пределах одной строки на класс) могут
+отличаться. Весь файл обрабатывается за один проход.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+def _row_uniforms(chunk, key_columns, seed):
+    """Детерминированные числа из [0, 1) по содержимому строк."""
+    frame = chunk if key_columns is None else chunk[key_columns]
+    hash_key = f"{seed:016x}"[-16:]
+    hashes = pd.util.hash_pandas_object(frame, index=False, hash_key=hash_key).to_numpy()
+    return (hashes >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+
+def _stratified_assign(labels, u, fractions, counts, totals):
+    """Номера частей для строк блока с сохранением долей внутри каждого класса."""
+    codes, uniques = pd.factorize(labels)
+    assign = np.zeros(len(labels), dtype=np.intp)
+    order = np.lexsort((u, codes))
+    bounds = np.searchsorted(codes[order], np.arange(-1, len(uniques) + 1))
+
+    for code in range(-1, len(uniques)):
+        rows = order[bounds[code + 1]:bounds[code + 2]]
+        if len(rows) == 0:
+            continue
+        # Пропущенное значение метки считается отдельным классом
+        label = None if code == -1 else uniques[code]
+        done = counts.setdefault(label, np.zeros(len(fractions), dtype=np.int64))
+        total = totals.get(label, 0) + len(rows)
+        totals[label] = total
+
+        # Строки класса уже упорядочены по хэшу: раздаем их частям 1..k-1 подряд,
+        # каждой - сколько не хватает до округленной доли от всех строк класса; часть 0 получает остаток
+        start = 0
+        for part in range(1, len(fractions)):
+            n_part = int(np.floor(fractions[part] * total + 0.5)) - done[part]
+            n_part = max(0, min(n_part, len(rows) - start))
+            assign[rows[start:start + n_part]] = part
+            done[part] += n_part
+            start += n_part
+        done[0] += len(rows) - start
+    return assign
+
+
+def split_csv(path, out_dir, fractions=None, stratify=None, key_columns=None, seed=0,
+              chunksize=100_000, **read_csv_kwargs):
+    """Разбивает CSV на части за один потоковый проход.
+    Args:
+        path: путь к исходному CSV
+        out_dir: каталог для файлов частей (<имя части>.csv)
+        fractions: dict {имя части: доля}; первая часть получает остаток
+            (по умолчанию train/val/test = 0.6/0.2/0.2)
+        stratify: название столбца, доли которого сохраняются в каждой части
+        key_columns: столбцы для хэша строки (None - все столбцы)
+        seed: seed хэша; одинаковые данные и seed дают одинаковое разбиение
+        chunksize: число строк в блоке (при стратификации влияет на то, какие строки попадут в части)
+        read_csv_kwargs: дополнительные параметры pd.read_csv
+    returns:
+        dict {имя части: число строк}
+    """
+    if fractions is None:
+        fractions = {'train': 0.6, 'val': 0.2, 'test': 0.2}
+    names = list(fractions)
+    probs = np.array([fractions[name] for name in names], dtype=np.float64)
+    if not np.isclose(probs.sum(), 1.0) or np.any(probs < 0):
+        raise ValueError("Доли частей должны быть неотрицательными и в сумме давать 1")
+
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {name: os.path.join(out_dir, f"{name}.csv") for name in names}
+    written = {name: 0 for name in names}
+    counts, totals = {}, {}
+    # Части 1..k-1 берут младшие значения хэша, часть 0 - все остальные
+    bounds = np.cumsum(probs[1:])
+
+    first = True
+    for chunk in pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs):
+        u = _row_uniforms(chunk, key_columns, seed)
+        if stratify is None:
+            assign = np.searchsorted(bounds, u, side='right') + 1
+            assign[u >= probs[1:].sum()] = 0
+        else:
+            assign = _stratified_assign(chunk[stratify], u, probs, counts, totals)
+
+        for i, name in enumerate(names):
+            part = chunk[assign == i]
+            # Первый блок перезаписывает файлы и пишет заголовок, остальные дописываются
+            part.to_csv(paths[name], mode='w' if first else 'a', header=first, index=False)
+            written[name] += len(part)
+        first = False
+
+    return written
@@ -17,9 +17,29 @@ import pandas as pd  # Импортируем библиотеку pandas, ко
 import numpy as np   # Импортируем библиотеку numpy, которая предоставляет поддержку для работы с массивами и матрицами, а также математические функции.
 import matplotlib.pyplot as plt  # Импортируем модуль pyplot из библиотеки matplotlib, который используется для создания графиков и визуализации данных.
 
-# Читаем данные из HDF5 файла 'nsfg.hdf5' и загружаем их в переменную nsfg
+from nsfg_reader import iter_nsfg_chunks, read_clean_nsfg  # Импортируем потоковое чтение NSFG с проекцией столбцов.
+
+# Читаем данные из HDF5 файла 'nsfg.hdf5' блоками строк и загружаем в переменную nsfg только нужные столбцы
 # 'nsfg' - это имя набора данных внутри HDF5 файла
-nsfg = pd.read_hdf('nsfg.hdf5', 'nsfg')
+# Специальные коды и значения вне допустимого диапазона (nsfg_reader.CLEANING_SPEC) заменяются на NaN
+# в каждом блоке за один проход, там же вычисляется birth_weight
+replaced_counts = {}
+nsfg = read_clean_nsfg('nsfg.hdf5', 'nsfg', counts=replaced_counts)
+
+# Печатаем число замененных значений по каждому столбцу
+print(replaced_counts)
+
+# Уменьшаем типы столбцов (общий модуль dtype_optimizer в родительском каталоге) и печатаем экономию памяти
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Каталог модуля определяется от файла скрипта, а не от текущего каталога
+from dtype_optimizer import optimize_dtypes, memory_saved
+
+# Дробные столбцы остаются float64: по ним считаются длительности беременности, квантили и веса,
+# а в float32 такие вычисления дают ошибки округления (например, -1.5e-07 вместо 0)
+nsfg, dtype_report = optimize_dtypes(nsfg, downcast_floats=False)
+print(dtype_report)
+print(memory_saved(dtype_report))
 
 # Отображаем количество строк и столбцов в DataFrame nsfg
 print(nsfg.shape)
@@ -38,11 +58,12 @@ print(ounces.head(5))
 ### Clean a variable
 """
 
-# Подсчитываем количество уникальных значений в столбце 'nbrnaliv' DataFrame nsfg
-nsfg['nbrnaliv'].value_counts()
+# Подсчитываем количество уникальных значений в исходном (еще не очищенном) столбце 'nbrnaliv':
+# читаем из файла только этот столбец, без замен из nsfg_reader.CLEANING_SPEC
+raw_nbrnaliv = pd.concat(chunk['nbrnaliv'] for chunk in iter_nsfg_chunks('nsfg.hdf5', 'nsfg', columns=['nbrnaliv']))
+raw_nbrnaliv.value_counts()
 
-# Заменяем значение 8 на NaN в столбце 'nbrnaliv' DataFrame nsfg
-nsfg['nbrnaliv'].replace([8], np.nan, inplace=True)
+# Значение 8 в столбце 'nbrnaliv' уже заменено на NaN при чтении (nsfg_reader.CLEANING_SPEC)
 
 # Печатаем значения и их частоты в столбце 'nbrnaliv'
 print(nsfg['nbrnaliv'].value_counts())
@@ -86,28 +107,11 @@ plt.ylabel('Number of pregnancies')
 
 """### Compute birth weight"""
 
-def resample_rows_weighted(df, column='wgt2013_2015'):
-    """Resamples a DataFrame using probabilities proportional to given column.
-    Args:
-        df: DataFrame
-        column: string column name to use as weights
-    returns:
-        DataFrame
-    """
-    # Копируем значения из указанного столбца весов
-    weights = df[column].copy()
-
-    # Нормализуем веса, деля каждое значение на сумму всех весов
-    weights /= sum(weights)
-
-    # Выбираем индексы строк из DataFrame с учетом весов, с заменой
-    indices = np.random.choice(df.index, len(df), replace=True, p=weights)
+# Взвешенная выборка строк: таблица накопленных весов + np.searchsorted и выбор строк по позиции
+from weighted_resample import resample_rows_weighted
 
-    # Создаем новый DataFrame, используя выбранные индексы
-    sample = df.loc[indices]
-
-    # Возвращаем новый DataFrame с выборкой
-    return sample
+# Исходные (не пересэмплированные) очищенные данные сохраняем для бутстрепа ниже
+nsfg_clean = nsfg
 
 # Resample the data
 nsfg = resample_rows_weighted(nsfg, 'wgt2013_2015')
@@ -115,18 +119,17 @@ nsfg = resample_rows_weighted(nsfg, 'wgt2013_2015')
 # используя веса из столбца 'wgt2013_2015'. Результат сохраняется обратно в переменную nsfg.
 
 # Clean the weight variables
-pounds = nsfg['birthwgt_lb1'].replace([98, 99], np.nan)
-# В этой строке мы извлекаем данные о весе при рождении в фунтах из столбца 'birthwgt_lb1'
-# и заменяем специальные коды 98 и 99 на NaN (отсутствующие значения), чтобы очистить данные.
+pounds = nsfg['birthwgt_lb1']
+# В этой строке мы извлекаем данные о весе при рождении в фунтах из столбца 'birthwgt_lb1'.
+# Специальные коды 98 и 99 уже заменены на NaN (отсутствующие значения) при чтении файла.
 
-ounces = nsfg['birthwgt_oz1'].replace([98, 99], np.nan)
-# Аналогично, здесь мы извлекаем данные о весе при рождении в унциях из столбца 'birthwgt_oz1'
-# и также заменяем специальные коды 98 и 99 на NaN для очистки данных.
+ounces = nsfg['birthwgt_oz1']
+# Аналогично, здесь мы извлекаем уже очищенные данные о весе при рождении в унциях из столбца 'birthwgt_oz1'.
 
 # Compute total birth weight
-birth_weight = pounds + ounces/16
-# Здесь мы вычисляем общий вес при рождении, складывая вес в фунтах и вес в унциях,
-# предварительно преобразованный в фунты (1 унция = 1/16 фунта). Результат сохраняется в переменной birth_weight.
+birth_weight = nsfg['birth_weight']
+# Общий вес при рождении (pounds + ounces/16, 1 унция = 1/16 фунта) вычислен при чтении каждого блока
+# и после взвешенной выборки берется из столбца 'birth_weight'.
 
 # Create a Boolean Series for full-term babies
 full_term = nsfg['prglngth'] >= 37
@@ -173,4 +176,27 @@ mult_full_term_weight = birth_weight[~single & full_term]
 # живорожденным, и комбинируем это с условием по полной беременности.
 
 print('Multiple full-term mean:', mult_full_term_weight.mean())
-# Здесь мы вычисляем средний вес для многоплодных полнородных детей и выводим его на экран.
\ No newline at end of file
+# Здесь мы вычисляем средний вес для многоплодных полнородных детей и выводим его на экран.
+
+"""### Bootstrap confidence intervals"""
+
+# Импортируем пакетный взвешенный бутстреп средних по группам
+from bootstrap import bootstrap_means
+
+# Фильтры строим по исходным (не пересэмплированным) данным, уже загруженным выше:
+# бутстреп сам выполняет взвешенные выборки
+data = nsfg_clean
+full_term = (data['prglngth'] >= 37).to_numpy()
+single = (data['nbrnaliv'] == 1).to_numpy()
+
+# 1000 взвешенных выборок в виде матрицы индексов; средние для всех групп считаются сразу по всей матрице
+summary = bootstrap_means(
+    data['birth_weight'],
+    {'full_term': full_term, 'single_full_term': single & full_term, 'mult_full_term': ~single & full_term},
+    data['wgt2013_2015'],
+    n_replicates=1000,
+    seed=0,
+)
+
+# Выводим средние значения и 95% доверительные интервалы
+print(summary)
@@ -31,6 +31,15 @@ The scikit-learn model training process should be familiar to you at this point,
 """
 
 wine = pd.read_csv('wine_types.csv')  # Читаем CSV файл 'wine_types.csv' и загружаем его содержимое в переменную 'wine' в виде DataFrame.
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Общий модуль dtype_optimizer находится в родительском каталоге скрипта
+from dtype_optimizer import optimize_dtypes, memory_saved
+
+# Уменьшаем целые типы, кроме Proline: np.log от int16 считался бы в float32; дробные столбцы остаются float64
+wine, dtype_report = optimize_dtypes(wine, downcast_floats=False, columns=wine.columns.drop('Proline'))
+print(memory_saved(dtype_report))  # Выводим объем памяти до и после
 wine.head()  # Выводим первые 5 строк DataFrame 'wine' для предварительного просмотра данных.
 
 X = wine[['Proline', 'Total phenols', 'Hue', 'Nonflavanoid phenols']]  # Извлекаем столбцы 'Proline', 'Total phenols', 'Hue' и 'Nonflavanoid phenols' из DataFrame 'wine' и сохраняем их в переменной 'X' как набор признаков (features).
@@ -121,35 +130,18 @@ print(wine_subset_scaled[:3])
 Let's first take a look at the accuracy of a K-nearest neighbors model on the `wine` dataset without standardizing the data. The `knn` model as well as the `X` and `y` data and labels sets have been created already. Most of this process of creating models in scikit-learn should look familiar to you.
 """
 
-# Импортируем библиотеку pandas для работы с данными
-import pandas as pd
-
-# Загружаем данные из CSV файла 'wine_types.csv' в DataFrame
-wine = pd.read_csv('wine_types.csv')
+# Импортируем эксперимент KNN с общим кэшированным разбиением
+from knn_experiment import KNNExperiment
 
-# Удаляем столбец 'Type' из DataFrame и сохраняем оставшиеся данные в переменной X
-X = wine.drop('Type', axis=1)
+# Используем уже загруженный DataFrame wine (повторно CSV не читаем).
+# Признаки - все столбцы, кроме целевого 'Type' и добавленного выше 'Proline_log'.
+features = [column for column in wine.columns if column not in ('Type', 'Proline_log')]
 
-# Извлекаем столбец 'Type' из DataFrame и сохраняем его в переменной y
-y = wine['Type']
+# Разделяем позиции строк на обучающую и тестовую выборки один раз; индексы кэшируются в объекте
+experiment = KNNExperiment(wine, target='Type', features=features)
 
-# Импортируем класс KNeighborsClassifier из библиотеки sklearn для классификации
-from sklearn.neighbors import KNeighborsClassifier
-
-# Создаем экземпляр классификатора KNN
-knn = KNeighborsClassifier()
-
-# Импортируем функцию train_test_split из библиотеки sklearn для разделения данных
-from sklearn.model_selection import train_test_split
-
-# Разделяем набор данных и метки на обучающую и тестовую выборки
-X_train, X_test, y_train, y_test = train_test_split(X, y)
-
-# Обучаем модель K-ближайших соседей на обучающих данных
-knn.fit(X_train, y_train)
-
-# Оцениваем точность модели на тестовых данных и выводим результат
-print(knn.score(X_test, y_test))
+# Обучаем модель K-ближайших соседей на необработанных данных и выводим точность на тестовых данных
+print(experiment.evaluate(['raw'])['raw'])
 
 """### KNN on scaled data
 The accuracy score on the unscaled wine dataset was decent, but we can likely do better if we scale the dataset. The process is mostly the same as the previous exercise, with the added step of scaling the data.
@@ -157,23 +149,19 @@ The accuracy score on the unscaled wine dataset was decent, but we can likely do
 
 """
 
-# Импортируем класс KNeighborsClassifier из библиотеки sklearn для классификации
-from sklearn.neighbors import KNeighborsClassifier
-
-# Создаем экземпляр модели K-ближайших соседей
-knn = KNeighborsClassifier()
-
-# Создаем метод масштабирования
-ss = StandardScaler()
+# Масштабирование обучается только на обучающей выборке того же разбиения, поэтому тестовые данные не "утекают" в StandardScaler.
+# Сравниваем необработанные данные, логарифм Proline и стандартизированные данные на одном и том же разбиении.
+scores = experiment.evaluate(['raw', 'log_proline', 'standardized'])
 
-# Применяем метод масштабирования к набору данных, используемому для моделирования
-X_scaled = ss.fit_transform(X)
+# Выводим точность модели на стандартизированных данных
+print(scores['standardized'])
 
-# Разделяем масштабированные данные и метки на обучающую и тестовую выборки
-X_train, X_test, y_train, y_test = train_test_split(X_scaled, y)
+# Выводим точность для всех вариантов предобработки
+print(scores)
 
-# Обучаем модель K-ближайших соседей на обучающих данных
-knn.fit(X_train, y_train)
+# Перебираем число соседей n_neighbors на стандартизированных данных.
+# Индекс ближайших соседей строится один раз, расстояния до тестовых объектов считаются один раз для всех k.
+neighbor_scores = experiment.sweep_neighbors('standardized', range(1, 16))
 
-# Оцениваем точность модели на тестовых данных и выводим результат
-print(knn.score(X_test, y_test))
\ No newline at end of file
+# Выводим точность для каждого значения n_neighbors
+print(neighbor_scores)
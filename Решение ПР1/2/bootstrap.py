@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Пакетный взвешенный бутстреп средних по группам.
+
+Вместо цикла, который на каждой итерации копирует DataFrame, выборки
+генерируются матрицей позиций (WeightedResampler.draw), из которой
+получается матрица кратностей строк (сколько раз строка попала в выборку).
+Суммы и количества для всех групп во всех выборках тогда считаются одним
+матричным произведением: кратности (B x n) @ [значения, индикаторы] (n x 2G).
+"""
+
+import numpy as np
+import pandas as pd
+
+from weighted_resample import WeightedResampler
+
+
+def _multiplicities(positions, n):
+    """Матрица кратностей строк (B x n) по матрице позиций (B x size)."""
+    n_replicates = positions.shape[0]
+    offsets = (np.arange(n_replicates) * n)[:, None]
+    counts = np.bincount((positions + offsets).ravel(), minlength=n_replicates * n)
+    return counts.reshape(n_replicates, n).astype(np.float64)
+
+
+def bootstrap_replicates(values, groups, weights, n_replicates=1000, seed=None, batch_size=256):
+    """Средние значения по группам в каждой взвешенной бутстреп-выборке.
+    Args:
+        values: одномерный массив значений (NaN пропускаются, как в Series.mean)
+        groups: словарь {имя группы: булев массив длины n}
+        weights: веса строк для взвешенной выборки
+        n_replicates: число бутстреп-выборок B
+        seed: seed или np.random.Generator
+        batch_size: число выборок, обрабатываемых за один раз (ограничивает память)
+    returns:
+        DataFrame формы (B, число групп)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    n = len(values)
+
+    # Для каждой группы - столбец значений (0 вне группы) и столбец индикаторов
+    names = list(groups)
+    masks = np.column_stack([np.asarray(groups[name], dtype=bool) & valid for name in names])
+    design = np.hstack([np.where(masks, values[:, None], 0.0), masks.astype(np.float64)])
+
+    resampler = WeightedResampler(weights, seed)
+    result = np.empty((n_replicates, len(names)), dtype=np.float64)
+    for start in range(0, n_replicates, batch_size):
+        stop = min(start + batch_size, n_replicates)
+        positions = resampler.draw(n_replicates=stop - start)
+
+        # Суммы и количества по всем группам и выборкам пакета за одно произведение
+        stats = _multiplicities(positions, n) @ design
+        sums, counts = stats[:, :len(names)], stats[:, len(names):]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result[start:stop] = np.where(counts > 0, sums / counts, np.nan)
+
+    return pd.DataFrame(result, columns=names)
+
+
+def bootstrap_means(values, groups, weights, n_replicates=1000, ci=0.95, seed=None, batch_size=256):
+    """Бутстреп-оценки средних по группам с доверительными интервалами.
+    Args:
+        values: одномерный массив значений
+        groups: словарь {имя группы: булев массив длины n}
+        weights: веса строк для взвешенной выборки
+        n_replicates: число бутстреп-выборок
+        ci: уровень доверия процентильного интервала
+        seed: seed или np.random.Generator
+        batch_size: число выборок, обрабатываемых за один раз
+    returns:
+        DataFrame с индексом по группам и столбцами mean, std, ci_low, ci_high
+    """
+    replicates = bootstrap_replicates(values, groups, weights, n_replicates, seed, batch_size)
+    alpha = (1 - ci) / 2
+    return pd.DataFrame({
+        'mean': replicates.mean(),
+        'std': replicates.std(),
+        'ci_low': replicates.quantile(alpha),
+        'ci_high': replicates.quantile(1 - alpha),
+    })
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Декларативная очистка специальных кодов в данных опросов.
+
+Спецификация очистки сопоставляет каждому столбцу список специальных кодов
+и допустимый диапазон значений:
+
+    spec = {
+        'nbrnaliv': {'sentinels': [8], 'range': (1, 7)},
+        'birthwgt_oz1': {'sentinels': [98, 99], 'range': (0, 15)},
+    }
+
+Столбцы с одинаковыми правилами обрабатываются вместе: из них собирается
+одна двумерная матрица, маска заменяемых значений вычисляется за один
+векторизованный проход, и по той же маске считается число замен в каждом
+столбце. Это заменяет цепочку вызовов .replace(), каждый из которых
+создает новую Series.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _group_spec(spec, columns):
+    """Группирует столбцы спецификации с одинаковыми правилами."""
+    groups = {}
+    for column, rule in spec.items():
+        if column not in columns:
+            continue
+        low, high = rule.get('range', (None, None))
+        key = (tuple(rule.get('sentinels', ())), low, high)
+        groups.setdefault(key, []).append(column)
+    return groups
+
+
+def apply_cleaning(df, spec, nullable=False):
+    """Заменяет специальные коды и значения вне диапазона на пропуски.
+    Args:
+        df: DataFrame
+        spec: словарь {столбец: {'sentinels': [...], 'range': (low, high)}};
+            границы диапазона включаются, None - без ограничения
+        nullable: вернуть столбцы в nullable-типах pandas (Int64/Float64)
+            вместо float64 с NaN
+    returns:
+        (DataFrame, Series с числом замененных значений по столбцам)
+    """
+    # Поверхностная копия: столбцы заменяются целиком, исходный DataFrame не меняется
+    df = df.copy(deep=False)
+    counts = {}
+
+    for (sentinels, low, high), columns in _group_spec(spec, df.columns).items():
+        # Одна матрица на группу столбцов с одинаковыми правилами
+        values = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        mask = np.isin(values, sentinels)
+        if low is not None:
+            mask |= values < low
+        if high is not None:
+            mask |= values > high
+
+        for column, count in zip(columns, mask.sum(axis=0)):
+            counts[column] = int(count)
+
+        missing = mask | np.isnan(values)
+        for i, column in enumerate(columns):
+            if not nullable and not missing[:, i].any():
+                # Заменять нечего: столбец остается без изменений и в исходном типе
+                continue
+            if nullable and pd.api.types.is_integer_dtype(df[column].dtype):
+                filled = np.where(missing[:, i], 0, values[:, i]).astype(np.int64)
+                df[column] = pd.arrays.IntegerArray(filled, missing[:, i])
+            elif nullable:
+                df[column] = pd.arrays.FloatingArray(np.where(missing[:, i], 0.0, values[:, i]), missing[:, i])
+            else:
+                df[column] = np.where(missing[:, i], np.nan, values[:, i])
+
+    return df, pd.Series(counts, name='replaced', dtype=np.int64)
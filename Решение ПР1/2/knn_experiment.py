@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Сравнение вариантов предобработки для KNN на одном разбиении.
+
+Данные читаются один раз, индексы обучающей и тестовой выборок вычисляются
+один раз и кэшируются, а каждый вариант предобработки обучается только на
+обучающей выборке (StandardScaler не видит тестовые данные). Поэтому все
+варианты сравниваются на одном и том же разбиении и без утечки данных.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.neighbors import KNeighborsClassifier
+from sklearn.preprocessing import StandardScaler
+
+from neighbor_index import NeighborIndex
+
+
+def _raw(X_train, X_test, columns):
+    """Без предобработки."""
+    return X_train, X_test
+
+
+def _log_proline(X_train, X_test, columns):
+    """Логарифмическая нормализация столбца Proline."""
+    i = columns.index('Proline')
+    X_train, X_test = X_train.copy(), X_test.copy()
+    X_train[:, i] = np.log(X_train[:, i])
+    X_test[:, i] = np.log(X_test[:, i])
+    return X_train, X_test
+
+
+def _standardized(X_train, X_test, columns):
+    """Стандартизация, обученная только на обучающей выборке."""
+    ss = StandardScaler().fit(X_train)
+    return ss.transform(X_train), ss.transform(X_test)
+
+
+# Варианты предобработки: функция (X_train, X_test, columns) -> (X_train, X_test)
+VARIANTS = {
+    'raw': _raw,
+    'log_proline': _log_proline,
+    'standardized': _standardized,
+}
+
+
+class KNNExperiment:
+    """Эксперимент KNN с общим кэшированным разбиением.
+    Args:
+        data: DataFrame с признаками и целевой переменной
+        target: название целевого столбца
+        features: список признаков (None - все столбцы, кроме target)
+        test_size: доля тестовой выборки
+        random_state: random_state разбиения
+    """
+
+    def __init__(self, data, target='Type', features=None, test_size=0.25, random_state=None):
+        if features is None:
+            features = [column for column in data.columns if column != target]
+        self.features = list(features)
+        self.X = data[self.features].to_numpy(dtype=np.float64)
+        self.y = data[target].to_numpy()
+
+        # Разбиваем позиции строк один раз; все варианты используют одни и те же индексы
+        self.train_index, self.test_index = train_test_split(
+            np.arange(len(self.y)), test_size=test_size, random_state=random_state)
+        self._transformed = {}
+        self._indexes = {}
+
+    @classmethod
+    def from_csv(cls, path='wine_types.csv', **kwargs):
+        """Создает эксперимент по CSV файлу (файл читается один раз)."""
+        return cls(pd.read_csv(path), **kwargs)
+
+    def split(self):
+        """Возвращает (X_train, X_test, y_train, y_test) для кэшированного разбиения."""
+        return (self.X[self.train_index], self.X[self.test_index],
+                self.y[self.train_index], self.y[self.test_index])
+
+    def transform(self, variant):
+        """Обучающая и тестовая матрицы для варианта предобработки (результат кэшируется)."""
+        if variant not in self._transformed:
+            X_train, X_test, _, _ = self.split()
+            self._transformed[variant] = VARIANTS[variant](X_train, X_test, self.features)
+        return self._transformed[variant]
+
+    def evaluate(self, variants=tuple(VARIANTS), **knn_params):
+        """Точность KNeighborsClassifier для каждого варианта предобработки.
+        Args:
+            variants: названия вариантов из VARIANTS
+            knn_params: параметры KNeighborsClassifier
+        returns:
+            dict {вариант: точность на тестовой выборке}
+        """
+        y_train, y_test = self.y[self.train_index], self.y[self.test_index]
+        scores = {}
+        for variant in variants:
+            X_train, X_test = self.transform(variant)
+            knn = KNeighborsClassifier(**knn_params).fit(X_train, y_train)
+            scores[variant] = knn.score(X_test, y_test)
+        return scores
+
+    def index(self, variant):
+        """Индекс ближайших соседей по обучающей матрице варианта (строится один раз)."""
+        if variant not in self._indexes:
+            X_train, _ = self.transform(variant)
+            self._indexes[variant] = NeighborIndex(X_train, self.y[self.train_index])
+        return self._indexes[variant]
+
+    def sweep_neighbors(self, variant='standardized', ks=range(1, 16)):
+        """Точность KNN для каждого n_neighbors без пересчета расстояний.
+        Args:
+            variant: название варианта предобработки
+            ks: последовательность значений n_neighbors
+        returns:
+            dict {n_neighbors: точность на тестовой выборке}
+        """
+        _, X_test = self.transform(variant)
+        return self.index(variant).score_many(X_test, self.y[self.test_index], ks)
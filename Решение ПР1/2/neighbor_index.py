@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Индекс ближайших соседей для перебора n_neighbors без пересчета расстояний.
+
+Индекс строится один раз по обучающей матрице. Запросы обрабатываются
+блоками: квадраты расстояний считаются через матричное произведение
+(||a||² - 2ab + ||b||², BLAS), для каждой строки запроса остаются k_max
+ближайших соседей, упорядоченных по расстоянию. Голоса для всех k получаются
+накопленной суммой меток вдоль соседей, поэтому точность для любого набора
+значений k считается за один проход по тестовой выборке.
+"""
+
+import numpy as np
+
+
+class NeighborIndex:
+    """Блочный brute-force индекс ближайших соседей (евклидово расстояние).
+    Args:
+        X: обучающая матрица признаков (обычно уже стандартизированная)
+        y: метки классов обучающей выборки
+        block_size: число строк запроса, обрабатываемых за один раз
+    """
+
+    def __init__(self, X, y, block_size=1024):
+        self.X = np.ascontiguousarray(X, dtype=np.float64)
+        self.classes, self.labels = np.unique(np.asarray(y), return_inverse=True)
+        # Квадраты норм обучающих строк считаются один раз
+        self.sq_norms = np.einsum('ij,ij->i', self.X, self.X)
+        self.block_size = block_size
+
+    def query(self, X, k):
+        """Позиции k ближайших соседей каждой строки X в порядке возрастания расстояния.
+        Args:
+            X: матрица запросов
+            k: число соседей
+        returns:
+            массив формы (len(X), k)
+        """
+        X = np.asarray(X, dtype=np.float64)
+        k = min(k, len(self.X))
+        neighbors = np.empty((len(X), k), dtype=np.intp)
+
+        for start in range(0, len(X), self.block_size):
+            block = X[start:start + self.block_size]
+            # ||b||² для строк запроса одинаков для всех соседей и на порядок не влияет
+            dist = self.sq_norms - 2.0 * (block @ self.X.T)
+
+            # Сначала отбираем k ближайших без полной сортировки, затем упорядочиваем только их
+            if k < len(self.X):
+                nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+            else:
+                nearest = np.broadcast_to(np.arange(k), (len(block), k))
+            order = np.argsort(np.take_along_axis(dist, nearest, axis=1), axis=1, kind='stable')
+            neighbors[start:start + len(block)] = np.take_along_axis(nearest, order, axis=1)
+
+        return neighbors
+
+    def predict_many(self, X, ks):
+        """Предсказания большинством голосов для каждого k за один проход.
+        Args:
+            X: матрица запросов
+            ks: последовательность значений n_neighbors
+        returns:
+            dict {k: массив предсказанных меток}
+        """
+        ks = list(ks)
+        neighbors = self.query(X, max(ks))
+
+        # Голоса: накопленная сумма one-hot меток вдоль упорядоченных соседей
+        onehot = np.eye(len(self.classes), dtype=np.int32)[self.labels[neighbors]]
+        votes = np.cumsum(onehot, axis=1)
+
+        # При равенстве голосов argmax выбирает наименьший класс, как KNeighborsClassifier
+        return {k: self.classes[np.argmax(votes[:, min(k, votes.shape[1]) - 1], axis=1)] for k in ks}
+
+    def score_many(self, X, y, ks):
+        """Точность для каждого k.
+        Args:
+            X: матрица запросов
+            y: истинные метки
+            ks: последовательность значений n_neighbors
+        returns:
+            dict {k: точность}
+        """
+        y = np.asarray(y)
+        return {k: float(np.mean(pred == y)) for k, pred in self.predict_many(X, ks).items()}
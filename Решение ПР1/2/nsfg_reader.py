@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Потоковое чтение nsfg.hdf5 с проекцией столбцов.
+
+Файл читается блоками строк, из каждого блока остаются только нужные столбцы,
+и к блоку сразу применяются очистка по CLEANING_SPEC и расчет
+birth_weight. Пиковая память ограничена размером блока, а не размером файла.
+Для формата 'table' PyTables читает с диска только выбранные столбцы, для
+формата 'fixed' столбцы отбрасываются сразу после чтения блока.
+"""
+
+import pandas as pd
+
+from cleaning import apply_cleaning
+
+# Столбцы NSFG, которые используются в анализе
+NSFG_COLUMNS = ['birthwgt_lb1', 'birthwgt_oz1', 'prglngth', 'nbrnaliv', 'agecon', 'agepreg', 'wgt2013_2015']
+
+# Специальные коды (нет ответа, отказ, не знаю) и допустимые диапазоны значений;
+# всё, что в них не попадает, заменяется на NaN
+CLEANING_SPEC = {
+    'birthwgt_lb1': {'sentinels': [98, 99], 'range': (0, 20)},
+    'birthwgt_oz1': {'sentinels': [98, 99], 'range': (0, 15)},
+    'nbrnaliv': {'sentinels': [8], 'range': (1, 7)},
+    'prglngth': {'range': (0, 50)},
+}
+
+
+def iter_nsfg_chunks(path='nsfg.hdf5', key='nsfg', columns=NSFG_COLUMNS, chunksize=100_000):
+    """Читает набор данных из HDF5 блоками строк, оставляя только columns.
+    Args:
+        path: путь к HDF5 файлу
+        key: имя набора данных внутри файла
+        columns: список нужных столбцов
+        chunksize: число строк в блоке
+    returns:
+        генератор DataFrame
+    """
+    columns = list(columns)
+    with pd.HDFStore(path, mode='r') as store:
+        storer = store.get_storer(key)
+        if storer.is_table:
+            # Формат 'table' поддерживает проекцию и блоки на уровне PyTables
+            for chunk in store.select(key, columns=columns, chunksize=chunksize):
+                yield chunk
+            return
+
+        # Формат 'fixed': читаем диапазоны строк и сразу отбрасываем лишние столбцы
+        nrows = int(storer.shape[0])
+        for start in range(0, nrows, chunksize):
+            chunk = store.select(key, start=start, stop=min(start + chunksize, nrows))
+            yield chunk[columns].copy()
+
+
+def clean_chunk(chunk, spec=CLEANING_SPEC, counts=None):
+    """Заменяет специальные коды на NaN и вычисляет birth_weight.
+    Args:
+        chunk: DataFrame с блоком строк NSFG
+        spec: спецификация очистки (см. cleaning.apply_cleaning)
+        counts: словарь, в который добавляется число замен по столбцам
+    returns:
+        DataFrame
+    """
+    chunk, replaced = apply_cleaning(chunk, spec)
+    if counts is not None:
+        for column, count in replaced.items():
+            counts[column] = counts.get(column, 0) + count
+
+    # Общий вес при рождении в фунтах (1 унция = 1/16 фунта)
+    if 'birthwgt_lb1' in chunk and 'birthwgt_oz1' in chunk:
+        chunk['birth_weight'] = chunk['birthwgt_lb1'] + chunk['birthwgt_oz1'] / 16
+    return chunk
+
+
+def iter_clean_nsfg(path='nsfg.hdf5', key='nsfg', columns=NSFG_COLUMNS, chunksize=100_000,
+                    spec=CLEANING_SPEC, counts=None):
+    """Генератор очищенных блоков NSFG (см. iter_nsfg_chunks и clean_chunk)."""
+    for chunk in iter_nsfg_chunks(path, key, columns, chunksize):
+        yield clean_chunk(chunk, spec, counts)
+
+
+def read_clean_nsfg(path='nsfg.hdf5', key='nsfg', columns=NSFG_COLUMNS, chunksize=100_000,
+                    spec=CLEANING_SPEC, counts=None):
+    """Читает и очищает NSFG блоками, возвращая только нужные столбцы.
+    Args:
+        path: путь к HDF5 файлу
+        key: имя набора данных внутри файла
+        columns: список нужных столбцов
+        chunksize: число строк в блоке
+        spec: спецификация очистки (см. cleaning.apply_cleaning)
+        counts: словарь, в который добавляется число замен по столбцам
+    returns:
+        DataFrame
+    """
+    chunks = list(iter_clean_nsfg(path, key, columns, chunksize, spec, counts))
+    if not chunks:
+        return pd.DataFrame(columns=list(columns))
+    return pd.concat(chunks)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Взвешенная выборка строк с возвращением.
+
+Таблица накопленных весов строится один раз, после чего каждая выборка -
+это массив равномерных случайных чисел и np.searchsorted по этой таблице.
+Строки выбираются по позиции (DataFrame.take), без поиска по меткам индекса,
+а несколько бутстреп-выборок можно получить одной матрицей индексов.
+"""
+
+import numpy as np
+
+
+class WeightedResampler:
+    """Генератор позиций строк с вероятностями, пропорциональными весам.
+    Args:
+        weights: одномерный массив неотрицательных весов
+        seed: seed или np.random.Generator для воспроизводимости
+    """
+
+    def __init__(self, weights, seed=None):
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or len(weights) == 0:
+            raise ValueError("Веса должны быть непустым одномерным массивом")
+        if not np.all(np.isfinite(weights)) or np.any(weights < 0):
+            raise ValueError("Веса должны быть конечными и неотрицательными")
+
+        # Накопленные веса: строка i выбирается, если u попадает в [cdf[i-1], cdf[i])
+        self.cdf = np.cumsum(weights)
+        self.total = self.cdf[-1]
+        if self.total <= 0:
+            raise ValueError("Сумма весов должна быть положительной")
+
+        self.rng = np.random.default_rng(seed)
+        self._buffer = np.empty(0, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.cdf)
+
+    def draw(self, size=None, n_replicates=None):
+        """Возвращает позиции выбранных строк.
+        Args:
+            size: размер одной выборки (по умолчанию - число строк)
+            n_replicates: число выборок (None - одна выборка)
+        returns:
+            массив позиций формы (size,) или (n_replicates, size)
+        """
+        size = len(self) if size is None else size
+        shape = (size,) if n_replicates is None else (n_replicates, size)
+        count = int(np.prod(shape))
+
+        # Буфер случайных чисел переиспользуется между вызовами
+        if len(self._buffer) < count:
+            self._buffer = np.empty(count, dtype=np.float64)
+        u = self._buffer[:count].reshape(shape)
+        self.rng.random(out=u)
+        u *= self.total
+
+        # side='right' исключает строки с нулевым весом
+        positions = np.searchsorted(self.cdf, u, side='right')
+        # Защита от округления, при котором u оказывается равным total
+        np.minimum(positions, len(self) - 1, out=positions)
+        return positions
+
+
+def resample_rows_weighted(df, column='wgt2013_2015', seed=None):
+    """Resamples a DataFrame using probabilities proportional to given column.
+    Args:
+        df: DataFrame
+        column: string column name to use as weights
+        seed: seed или np.random.Generator
+    returns:
+        DataFrame
+    """
+    positions = WeightedResampler(df[column].to_numpy(), seed).draw()
+    return df.take(positions)
+
+
+def bootstrap_positions(df, column='wgt2013_2015', n_replicates=100, seed=None):
+    """Матрица позиций строк для n_replicates взвешенных бутстреп-выборок.
+    Args:
+        df: DataFrame
+        column: string column name to use as weights
+        n_replicates: число выборок
+        seed: seed или np.random.Generator
+    returns:
+        массив формы (n_replicates, len(df))
+    """
+    return WeightedResampler(df[column].to_numpy(), seed).draw(n_replicates=n_replicates)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Пакетное вычисление линейной модели predict(data, w) = data.dot(w).
+
+Вместо вызова predict для каждой строки матрица признаков обрабатывается
+блоками строк: на каждый блок приходится одно матрично-векторное
+произведение (GEMV), результат пишется прямо в заранее выделенный буфер.
+Поддерживаются float32 и поток блоков (например, чтение файла частями).
+"""
+
+import numpy as np
+
+
+def _result_dtype(data, w, dtype):
+    """Тип результата: заданный явно или общий тип данных и весов."""
+    if dtype is not None:
+        return np.dtype(dtype)
+    return np.result_type(np.asarray(data).dtype, np.asarray(w).dtype, np.float32)
+
+
+def _gemv(block, w, out):
+    """Одно произведение блока на вектор весов с записью в out."""
+    if block.dtype != out.dtype:
+        block = block.astype(out.dtype)
+    np.dot(block, w, out=out)
+    return out
+
+
+def predict_batch(data, w, out=None, dtype=None, block_rows=65536):
+    """Предсказания линейной модели для всех строк матрицы.
+    Args:
+        data: матрица признаков (n, k) или один вектор (k,); может быть np.memmap
+        w: вектор весов (k,)
+        out: заранее выделенный буфер (n,) нужного типа (None - создать)
+        dtype: тип вычислений, например np.float32 (None - общий тип data и w)
+        block_rows: число строк в одном блоке
+    returns:
+        массив предсказаний (n,) или скаляр для одного вектора
+    """
+    dtype = _result_dtype(data, w, dtype)
+    w = np.asarray(w, dtype=dtype)
+    data = np.asarray(data)
+
+    # Один вектор признаков: поведение как у predict(data, w)
+    if data.ndim == 1:
+        return data.astype(dtype, copy=False).dot(w)
+
+    n = data.shape[0]
+    if out is None:
+        out = np.empty(n, dtype=dtype)
+    elif out.shape != (n,) or out.dtype != dtype:
+        raise ValueError(f"Буфер out должен иметь форму {(n,)} и тип {dtype}")
+
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        _gemv(data[start:stop], w, out[start:stop])
+    return out
+
+
+def predict_stream(blocks, w, dtype=np.float32, out=None):
+    """Предсказания для потока блоков строк.
+    Args:
+        blocks: итерируемый объект с матрицами (m_i, k)
+        w: вектор весов (k,)
+        dtype: тип вычислений
+        out: буфер, переиспользуемый для каждого блока (длина не меньше
+            наибольшего блока); возвращаемые массивы тогда являются его видами
+            и действительны до следующей итерации
+    returns:
+        генератор массивов предсказаний для каждого блока
+    """
+    dtype = np.dtype(dtype)
+    w = np.asarray(w, dtype=dtype)
+    for block in blocks:
+        block = np.asarray(block)
+        if out is None:
+            yield _gemv(block, w, np.empty(len(block), dtype=dtype))
+        else:
+            yield _gemv(block, w, out[:len(block)])
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Произведение цепочки матриц с оптимальной расстановкой скобок.
+
+Результат (AB)C и A(BC) одинаков, но число операций может отличаться на
+порядки: для матриц p x q и q x r умножение стоит 2pqr операций с плавающей
+точкой. Порядок выбирается динамическим программированием по числу операций
+(классическая задача о перемножении цепочки матриц), после чего цепочка
+вычисляется в этом порядке. Промежуточные результаты пишутся в буферы,
+которые освобождаются после использования и переиспользуются на следующих шагах.
+"""
+
+import numpy as np
+
+
+def chain_order(shapes, worst=False):
+    """Оптимальная расстановка скобок для цепочки матриц.
+    Args:
+        shapes: список форм (строки, столбцы) матриц цепочки
+        worst: найти самый дорогой порядок вместо самого дешевого (для сравнения)
+    returns:
+        (число операций, таблица разбиений split[i][j])
+    """
+    n = len(shapes)
+    dims = [shapes[0][0]] + [shape[1] for shape in shapes]
+    for i in range(1, n):
+        if shapes[i - 1][1] != shapes[i][0]:
+            raise ValueError(f"Несогласованные формы матриц {i - 1} и {i}: {shapes[i - 1]} и {shapes[i]}")
+
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for length in range(2, n + 1):
+        for i in range(n - length + 1):
+            j = i + length - 1
+            cost[i][j] = None
+            for k in range(i, j):
+                # (A_i..A_k)(A_k+1..A_j): dims[i] x dims[k+1] на dims[k+1] x dims[j+1]
+                candidate = cost[i][k] + cost[k + 1][j] + 2 * dims[i] * dims[k + 1] * dims[j + 1]
+                if cost[i][j] is None or (candidate > cost[i][j] if worst else candidate < cost[i][j]):
+                    cost[i][j] = candidate
+                    split[i][j] = k
+    return cost[0][n - 1], split
+
+
+def left_to_right_flops(shapes):
+    """Число операций при вычислении цепочки слева направо: ((AB)C)D..."""
+    flops = 0
+    rows = shapes[0][0]
+    for shape in shapes[1:]:
+        flops += 2 * rows * shape[0] * shape[1]
+    return flops
+
+
+def _parenthesize(split, i, j):
+    """Строковая запись порядка умножения, например '(A0(A1A2))'."""
+    if i == j:
+        return f"A{i}"
+    k = split[i][j]
+    return f"({_parenthesize(split, i, k)}{_parenthesize(split, k + 1, j)})"
+
+
+class _BufferPool:
+    """Пул одномерных буферов для промежуточных произведений."""
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+        self.free = []
+
+    def acquire(self, shape):
+        size = shape[0] * shape[1]
+        # Берем наименьший свободный буфер подходящего размера
+        fitting = [i for i, buf in enumerate(self.free) if buf.size >= size]
+        if fitting:
+            buf = self.free.pop(min(fitting, key=lambda i: self.free[i].size))
+        else:
+            buf = np.empty(size, dtype=self.dtype)
+        return buf, buf[:size].reshape(shape)
+
+    def release(self, buf):
+        self.free.append(buf)
+
+
+def chain_matmul(arrays, return_info=False):
+    """Перемножает цепочку матриц в оптимальном порядке.
+    Args:
+        arrays: список двумерных массивов
+        return_info: вернуть также сведения о выбранном порядке
+    returns:
+        произведение или (произведение, dict с ключами order, flops,
+        flops_left_to_right, flops_worst, flops_saved и flops_saved_vs_worst);
+        flops_saved - экономия относительно порядка слева направо (0, если он уже оптимален),
+        flops_saved_vs_worst - относительно самого дорогого порядка
+    """
+    arrays = [np.asarray(a) for a in arrays]
+    if not arrays or any(a.ndim != 2 for a in arrays):
+        raise ValueError("chain_matmul ожидает непустой список двумерных массивов")
+
+    shapes = [a.shape for a in arrays]
+    flops, split = chain_order(shapes)
+    dtype = np.result_type(*arrays)
+    pool = _BufferPool(dtype)
+
+    def multiply(i, j):
+        """Возвращает (буфер или None, результат) для A_i..A_j."""
+        if i == j:
+            return None, arrays[i]
+        k = split[i][j]
+        left_buf, left = multiply(i, k)
+        right_buf, right = multiply(k + 1, j)
+        buf, out = pool.acquire((left.shape[0], right.shape[1]))
+        np.matmul(left, right, out=out)
+        # Операнды больше не нужны: их буферы можно использовать на следующих шагах
+        for used in (left_buf, right_buf):
+            if used is not None:
+                pool.release(used)
+        return buf, out
+
+    _, result = multiply(0, len(arrays) - 1)
+    if len(arrays) == 1:
+        result = result.copy()
+
+    if not return_info:
+        return result
+    naive = left_to_right_flops(shapes)
+    worst, _ = chain_order(shapes, worst=True)
+    info = {
+        'order': _parenthesize(split, 0, len(arrays) - 1),
+        'flops': flops,
+        'flops_left_to_right': naive,
+        'flops_worst': worst,
+        'flops_saved': naive - flops,
+        'flops_saved_vs_worst': worst - flops,
+    }
+    return result, info
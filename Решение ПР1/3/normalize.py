@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Нормировка строк матрицы на их сумму (A / A.sum(axis=1, keepdims=True)).
+
+Выражение из задания 6 создает вторую матрицу того же размера. Здесь строки
+обрабатываются блоками: сумма считается для блока строк, и результат деления
+пишется либо на место исходных данных (inplace), либо в переданный буфер out.
+Поэтому дополнительная память ограничена размером блока, и тот же код
+подходит для np.memmap. Строки с нулевой суммой обрабатываются явно, без
+деления на ноль.
+"""
+
+import numpy as np
+
+from reductions import BLOCK_BYTES
+
+
+def normalize_rows(A, out=None, inplace=False, zero_rows='keep', block_bytes=BLOCK_BYTES):
+    """Делит каждую строку матрицы на сумму ее элементов.
+    Args:
+        A: двумерный массив или np.memmap
+        out: буфер для результата той же формы (None - создать новый массив)
+        inplace: записать результат в A (A должна иметь вещественный тип)
+        zero_rows: что делать со строками с нулевой суммой:
+            'keep' - оставить без изменений, 'nan' - заполнить NaN,
+            'uniform' - заполнить 1 / число столбцов
+        block_bytes: размер блока строк в байтах
+    returns:
+        нормированная матрица (A, out или новый массив)
+    """
+    if zero_rows not in ('keep', 'nan', 'uniform'):
+        raise ValueError(f"Неизвестный режим zero_rows: {zero_rows}")
+    if A.ndim != 2:
+        raise ValueError("normalize_rows ожидает двумерную матрицу")
+
+    if inplace:
+        if not np.issubdtype(A.dtype, np.floating):
+            raise TypeError("Нормировка на месте возможна только для вещественной матрицы")
+        out = A
+    elif out is None:
+        out = np.empty(A.shape, dtype=A.dtype if np.issubdtype(A.dtype, np.floating) else np.float64)
+    elif out.shape != A.shape:
+        raise ValueError(f"Буфер out должен иметь форму {A.shape}")
+
+    n_rows, n_cols = A.shape
+    rows = max(1, block_bytes // max(n_cols * A.itemsize, 1))
+    for start in range(0, n_rows, rows):
+        block = A[start:start + rows]
+        dest = out[start:start + rows]
+
+        sums = block.sum(axis=1, keepdims=True, dtype=np.float64)
+        zero = sums[:, 0] == 0
+        # Для строк с нулевой суммой делим на 1, чтобы не получить inf/NaN
+        sums[zero] = 1.0
+        np.divide(block, sums, out=dest, casting='same_kind')
+
+        if zero_rows == 'nan':
+            dest[zero] = np.nan
+        elif zero_rows == 'uniform':
+            dest[zero] = 1.0 / n_cols
+
+    return out
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Блочные нормы и суммы для больших (в том числе отображаемых в память) тензоров.
+
+np.abs(u).sum() и np.linalg.norm создают временный массив размером с исходный.
+Здесь тензор обходится блоками размера block_bytes (порядка размера кэша):
+для норм и полной суммы - блоками плоского представления массива (так что
+и массив формы (2, 10_000_000) делится на блоки нужного размера), для суммы
+по оси - блоками по первой оси. Все промежуточные значения пишутся в один
+переиспользуемый буфер размера блока. Частичные суммы блоков складываются
+с компенсацией ошибки округления (алгоритм Ноймайера), поэтому точность не
+падает с ростом числа блоков. Тот же код работает и для np.memmap, который не
+помещается в оперативную память.
+"""
+
+import numbers
+
+import numpy as np
+
+# Размер блока по умолчанию: 1 МиБ
+BLOCK_BYTES = 1 << 20
+
+
+def _blocks(a, block_bytes):
+    """Генератор (start, блок) по первой оси массива."""
+    if a.ndim == 0:
+        a = a.reshape(1)
+    row_bytes = max(a[:1].nbytes, 1) if len(a) else 1
+    rows = max(1, block_bytes // row_bytes)
+    for start in range(0, len(a), rows):
+        yield start, a[start:start + rows]
+
+
+def _flat_blocks(a, block_bytes):
+    """Генератор блоков из не более чем block_bytes байт по всем элементам массива (порядок не важен)."""
+    if a.ndim == 0:
+        yield a.reshape(1)
+        return
+    if a.flags.c_contiguous or a.flags.f_contiguous:
+        # Для непрерывного массива (и np.memmap) плоское представление - это view, без копирования
+        flat = a.ravel(order='K')
+        step = max(1, block_bytes // max(a.itemsize, 1))
+        for start in range(0, flat.size, step):
+            yield flat[start:start + step]
+        return
+    # Несмежный массив: блоки по первой оси, слишком большие строки делятся дальше
+    for _, block in _blocks(a, block_bytes):
+        if block.nbytes > block_bytes and len(block) == 1 and block.ndim > 1:
+            yield from _flat_blocks(block[0], block_bytes)
+        else:
+            yield block
+
+
+def _neumaier_add(total, compensation, value):
+    """Добавляет value к total с компенсацией; работает со скалярами и массивами."""
+    new_total = total + value
+    compensation = compensation + np.where(
+        np.abs(total) >= np.abs(value), (total - new_total) + value, (value - new_total) + total)
+    return new_total, compensation
+
+
+def _reduce_abs_power(a, p, block_bytes):
+    """Компенсированная сумма |a|^p по всем элементам за один проход блоками."""
+    a = np.asarray(a)
+    total, compensation = 0.0, 0.0
+    scratch = None
+    for block in _flat_blocks(a, block_bytes):
+        if scratch is None or scratch.size < block.size:
+            scratch = np.empty(block.size, dtype=np.float64)
+        buf = scratch[:block.size].reshape(block.shape)
+        # Все промежуточные значения пишутся в буфер блока
+        np.abs(block, out=buf)
+        if p == 2:
+            np.multiply(buf, buf, out=buf)
+        elif p != 1:
+            np.power(buf, p, out=buf)
+        total, compensation = _neumaier_add(total, compensation, buf.sum())
+    return float(total + compensation)
+
+
+def norm(a, ord=2, block_bytes=BLOCK_BYTES):
+    """Поэлементная норма тензора любой размерности.
+    Args:
+        a: массив или np.memmap
+        ord: 1, 2, 'fro', np.inf или любое p >= 1 (норма считается по всем элементам)
+        block_bytes: размер блока в байтах
+    returns:
+        float
+    """
+    if ord != 'fro' and (isinstance(ord, str) or not isinstance(ord, numbers.Real)):
+        raise ValueError(f"Неизвестная норма: {ord!r}")
+    if ord in ('fro', 2):
+        return float(np.sqrt(_reduce_abs_power(a, 2, block_bytes)))
+    if ord == 1:
+        return _reduce_abs_power(a, 1, block_bytes)
+    if ord == np.inf:
+        result = 0.0
+        for block in _flat_blocks(np.asarray(a), block_bytes):
+            if block.size:
+                result = max(result, float(np.max(np.abs(block))))
+        return result
+    if not ord >= 1:
+        raise ValueError("Норма определена только для p >= 1")
+    return _reduce_abs_power(a, ord, block_bytes) ** (1.0 / ord)
+
+
+def blocked_sum(a, axis=None, block_bytes=BLOCK_BYTES):
+    """Сумма элементов тензора (всех или по оси) с обходом блоками.
+    Args:
+        a: массив или np.memmap
+        axis: None (сумма всех элементов) или номер оси
+        block_bytes: размер блока в байтах
+    returns:
+        float или массив без оси axis
+    """
+    a = np.asarray(a)
+    if axis is None:
+        return _sum_all(a, block_bytes)
+
+    if a.ndim == 0:
+        raise ValueError("Сумма по оси не определена для 0-мерного массива")
+    if not -a.ndim <= axis < a.ndim:
+        raise ValueError(f"Ось {axis} вне диапазона для массива размерности {a.ndim}")
+    axis = axis % a.ndim
+    if axis == 0:
+        # Частичные суммы блоков накапливаются с компенсацией
+        total = np.zeros(a.shape[1:], dtype=np.float64)
+        compensation = np.zeros_like(total)
+        for _, block in _blocks(a, block_bytes):
+            total, compensation = _neumaier_add(total, compensation, block.sum(axis=0, dtype=np.float64))
+        return total + compensation
+
+    # Для остальных осей каждый блок дает свою часть результата
+    out = np.empty(a.shape[:axis] + a.shape[axis + 1:], dtype=np.float64)
+    for start, block in _blocks(a, block_bytes):
+        block.sum(axis=axis, dtype=np.float64, out=out[start:start + len(block)])
+    return out
+
+
+def _sum_all(a, block_bytes):
+    """Компенсированная сумма всех элементов."""
+    total, compensation = 0.0, 0.0
+    for block in _flat_blocks(a, block_bytes):
+        total, compensation = _neumaier_add(total, compensation, block.sum(dtype=np.float64))
+    return float(total + compensation)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Заранее выделенный тензор для складывания матриц без копирования.
+
+np.stack([A, B, C]) создает новый массив и копирует в него все матрицы,
+поэтому на время копирования в памяти находятся и исходные матрицы, и тензор.
+TensorStack выделяет один непрерывный буфер формы (n, *shape) (при
+необходимости - отображаемый в память файл), матрицы записываются прямо в
+его ячейки, а обращение к ячейке возвращает вид (view), а не копию.
+"""
+
+import numpy as np
+
+
+class TensorStack:
+    """Тензор из n_slots матриц одинаковой формы в одном буфере.
+    Args:
+        n_slots: число матриц
+        shape: форма одной матрицы
+        dtype: тип элементов
+        filename: путь к файлу для np.memmap (None - буфер в памяти)
+    """
+
+    def __init__(self, n_slots, shape, dtype=np.float64, filename=None):
+        full_shape = (n_slots,) + tuple(shape)
+        if filename is None:
+            self.array = np.empty(full_shape, dtype=dtype)
+        else:
+            self.array = np.memmap(filename, dtype=dtype, mode='w+', shape=full_shape)
+        self.filled = 0
+
+    @classmethod
+    def open(cls, filename, n_slots, shape, dtype=np.float64, mode='r'):
+        """Открывает ранее записанный тензор из файла без чтения его в память."""
+        stack = cls.__new__(cls)
+        stack.array = np.memmap(filename, dtype=dtype, mode=mode, shape=(n_slots,) + tuple(shape))
+        stack.filled = n_slots
+        return stack
+
+    def __len__(self):
+        return self.array.shape[0]
+
+    def __getitem__(self, index):
+        """Вид ячейки (или среза ячеек) без копирования."""
+        return self.array[index]
+
+    def __setitem__(self, index, matrix):
+        """Записывает матрицу в ячейку буфера."""
+        self.array[index] = matrix
+
+    def slot(self, index):
+        """Вид ячейки для записи результата напрямую, например rng.random(out=stack.slot(0))."""
+        return self.array[index]
+
+    def append(self, matrix):
+        """Записывает матрицу в следующую свободную ячейку и возвращает ее вид."""
+        if self.filled >= len(self):
+            raise IndexError("Все ячейки тензора уже заполнены")
+        self.array[self.filled] = matrix
+        self.filled += 1
+        return self.array[self.filled - 1]
+
+    def flush(self):
+        """Сбрасывает изменения на диск для тензора в файле."""
+        if isinstance(self.array, np.memmap):
+            self.array.flush()
@@ -11,8 +11,10 @@ Original file is located at
 ![PyCaret.png](data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAABLYAAAJfCAIAAADtn8iyAACAAElEQVR42uzdCXxU5b038P9zzizZk0nYQcBMUFQQlABWwV6wmgjWFc2g1rZXr5q0b/vWtmBDvfftVbgGa++9XVistmqVBEvVKokJalATVCBAwiJbJoSwJ5lMtklmOec872dmwjA5M5nMhCQE+H0//VAzyZw5c+Y5Z57feTYN55wAAAAAAAAAiAQcAgAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAICLhAaHIExFRUVbtmzZsWPHtm3brFar90GDwTBr1qwZM2bccssts2fPTklJwYECAAAAAICLVz+3IlZVVaWlpbEwZGZm5uTkrF27tqqqaigfoJqampycnOTk5IULF65YsaKkpMSXD4nIarWWlJSsWLFi4cKFw4YNM5lM5eXlKFVDKtjPnDnTW+SSk5OXLVuGYwIDymKxmEwm34XOZDJZLBYcFgAAALiIMM55P27OZDKtX78+0melp6f//Oc/N5lMQ62q97vf/W7FihWRPjEjI2PVqlWpqakoXhfcypUrly5d6v9I/xZ4AJWcnJzVq1f7P5KXl7dkyRIcGQAAALhY9HMrYnNzcx+eVVFRsXjx4szMzJqamiFyXKqqqjIzM/uQD4mopKQkPT19iLeOAsBACLyIlZaW4rAAAADA5RsRz8fQSVZVVVXz5s2rqKgI+luDwZBxVnp6etC/sVqt8+bNQ/EKymKxZGZm+vfEuwwPgn+X7OTk5JUrV6JgDB0FBQXJycneTyctLa2oqAjHBAAAAC4fAztdjdFofPLJJ1UPtrS0qCZ9USWrioqKC9hL05sPA/fNYDA8++yzixYtCty38vLydevWFRQUqIYplpeXz5kzB4VMZf/+/SUlJb4f169fX1BQcLkdhJKSErPZ7CsqpaWl6Is4dLz++uu+c9lsNu/du3fBggVhPjfw+nDffffhkAIAAAAiYpe0tLQQFd/y8vIXXnjBPy14q8s5OTnFxcUX5HBYLJYHHnggMB/m5uY+88wzPU1YOsfj+eeff+2111588cXApwPAZeL5559vamryDsk2GAwmk2nRokU4LAAAAHARuZAdTefMmVNcXJydna16vKSk5EI1K/3oRz/yte345OfnL1++vNcFLVJSUpYsWVJRUZGRkeF9JD4+HiUM4LKSkpJSUFDAPZqamlatWoW1cAAAAAARMTKrVq3KyspSPfj+++8P/p6Ul5cHTsean58f0WC51NTU4uLivLy87OzsadOmoYQBAAAAAAAiYmT+9Kc/qR5Zv3794C8m9sILL6geyc3N7dtkKkuWLFm1ahWKFwAAAAAAICJGLCUlJbAhcf/+/YO5D+Xl5apRkQaD4ZlnnkERAQAAAAAARMTBduONN6oeOX78+GDuwLp161SPPPvsswM9iKi8vHzlypUmk2nmzJnMT1paWmZm5rJly/pxCZDy8nKTyeR7iczMzLVr14bZVFtUVLRs2TL/lSoYYzNnzjSZTGvXrh06q1kONIvFUlBQYDKZfCsiJCcnR3QkB05NTc3atWtNJpNvLQ3f7i1btuw8l20oKCjIycnxL6VpaWk5OTn9vhpEQUGB71WSk5NNJlOvw5KrqqrWrl2bk5OjKp/e9z4QOzkIH6X3gKvekfeysHLlyn5fGaiqqmrZsmX+n+/MmTNzcnLKy8v7fKYElsaB238AAADoZ7xf+WZq8crIyAjziWVlZaody8vL8/12zZo1BoPB96vc3NxIdywvL8+3BYPBUFhY6P/bxsbGwCPT2NjIB0ZZWVl2drb/OwrBaDSq9rYnjY2NvnUaVe8xcE6gwIMcVH5+vtFo7HUns7OzQx+unhaQDM1sNp/noc7Ly4uowPuXNFXpzc/PD/GRGQyG0AfTbDaH+YmrPv1e36PZbO7p8+1bQerpxIlU0PO0rKzMV6KMRqPvI/YvvSplZWVB33Vubm44hTOcT6ewsLAPbzA7Ozvoaeh/GQz/Ghj+R+k9dPn5+WFuNsSVwWw2B/bgUF3DKysrw38LjY2N4ZSZvpVGAAAAGBwXR0TMzc09z/CgqrKo6ouBFcSsrKyBONyq6uN5VkZDH0PfewxR6QxRbzabzRHtqsFgCFqV55xXVlb2LWP0mmD7PSKq3rLvUwtdjfYv8D1F5TVr1vTtIPR0VIPePTn/MB80V/TjHSjVJ+J9d6FfK/AIBF4QwpGent7Tew/z8w3nDQZeyvpcVs+nvIVzZSgsLAyn8BgMhjDjaGVlZURl5vzvAQEAAMBAGCodTQO7lU6ZMsX333feeafqtxs2bAh/40VFRaq1ClUrlW3cuFH1lHvvvXcg3ubvfvc71YjHMK1evXrlypV9eGJOTs7q1av70PEsPT09ol21Wq1z584N2i2wra3t4m1mt1gsmZmZgVPdBlVSUvLcc88F/VVLS0u/71tOTs7TTz8d0Tqcq1evzszM7LVbrPddV1RUDNoRDv+1ioqKVqxY0YcXqqioeOSRR4L+qrm5+cKWMZPJtHTp0kifWFJSMmnSpL712ywoKFi4cGE4hce7Vm2vr+JdVDaiMnPy5El05AEAABiChkpE3LNnj+qRhIQE33/PmTNH1aPslVdeCX/jqgSYnp6emprq/8j27dtVT5k1a9ZAvM0dO3aoHjEajbm5uWvWrCk7Kz8/P2g31KVLl0Y66q+goECVDzM8QjcdWCyWefPmqeqOGRkZ+fn5vrv+ZrO5sLAwsJkxaFXymmuu6VtnxZtvvnko5EP/Wq/RaMzOzs7zCNrKunr16qCD3/r2XgwGwzXXXBP0VytXrlR9uAaDITc317/NraysLLDXX0VFRU851ue5555T1fUzMjIKCwt9bVZlZWW5ubmhP9YwW6FVr2UwGLyltKe/37t3b+BR8n4ovpOosLAwaDfUntZcnT9/fh8+nb71CAh6BILeg0hPT8/NzfUWttzc3KANdFar9YEHHoh0KGxBQcHixYtV78X7QtnZ2YHHzWq1PvHEE72+C9WistnZ2f6lsbKyMj8/v88NtgAAADB4hkhH08BKSa+9sMIcIRM4znDNmjXq7rYBNc4BarT1rx5lZ2eHeAtBOzeGHoSp6k6myplZWVn+3boqKyvz8vKCdvQKrPiG6GYW2Fct6IduNpt91ffALpdlwUQ0AmqAOpr6V8qDdrcL2rMuPT29p254vnen6v2bnp4e9CD01BMvsDdjiF6UQctSiP6rgRvvqZ9zZWWl6tPPz8/37XzQ/VF9Iqouo3l5ef7PKiwsDOxs7F9+vME1ogLQ06fjf9hVn6k36gQK+gYj7WgatH9pdnZ20I++p6GDoTvGq3ZJ9e5UV4YQexXiUKvCYeiLhnfIpcFgQEdTAACAoWlIRMRwhgIGVkHCGZ7nnWVE9URVxS5wpFxEM0xExPtOe6r/BVJV5kJPXhJYN430WAU9XL3OKhH48YV+Sp8Haw1+RPSvVff0kTU2Ngbe4Og136p2LNIip3rFnmJPiLIU4imq+Bp63wLjRx8SUa+hQnUp8LY0hh6l6dOHkcyqYhDRmNiIinfgZS2c4xB4kkaa+UPcLwsaxXsNoqo/Dv+CAwAAAEPQhe9oarFYfvKTn6geDBwKmJqaqrp93uts+F7vv/++qpajWsoicKRcUlLSAL3ZBQsWcM5XrVql6unak5///Oeqqm0fVpjIyMgIfx3/X//616rK8YIFC3p9U6pQ8eabb15KLe3p6enFxcU9fWQpKSkvvPCC6sGvv/564PanoKDAP1oYDIbi4uJen6XqylhRUdHT6DLVmaUqEipz5szxPzErKir6tshEXl6eyWQK5y9TU1ObmpqKi4vnzJkTzt8//vjjqke2bds2RIrWb3/728B82OtxMJlMgUn7j3/8Y6Svnp+f/9RTT/X026eeekp1J2LTpk09/fHmzZv9f7z11lvRQwcAAODidYEjYk1NTWZmpupWenp6etBKkio3Wq3WXiujFotFVTMOZx6awEUaL5Tbb79d9UikEzwYDIa33347zD8uKipSZY/A6nVPtUlVGrng6wT2bz4MvUKmyWRSVaZVNeb+9fLLL/v/GOYCnoE3Wd55553AP6uqqvIfhmo0GntNYvPmzfP/ccuWLX24i7FkyZIBOlypqamqFtS6urqhULQsFkvgUOEwc/KSJUtURW79+vUR3T8KJ4uq7n1Yrdaebiuo5vsZN24cvlwBAAAQEftSPVq5cmV6enrgDHivvvpqTxVx1cCnwJlIVT7++GNVXgqsFX355ZdD9uNJSUnp86p0Xm+99VY4+SHo8TSZTGE+d9q0aaoK69atWy+B08PbQBfOQbjjjjtC1Jj7966K6pRRTc8bgur+SNBGIVWjelpaWq+bve666/x/DJyTqdeDHH4rd9+EuXziIFNdnXptsA2d3yJqHQ2zzTZw1q4wZyfet28fvlwBAAAuXpoB3Xp1dXXgUg0tLS07duzoaUGF/Pz8adOm9bRBk8nkf9999erVzz//fIgavKqXaZh36IeUWbNm+R+r1tbW8J+bkZHRazfREJnhrrvuCv+53tF6vh/37t0b0UsPTWE20BHRxIkT+1ZZj5Rqy4HT84agmhx1cNa0COcgh/8W+ubGG2/0700wEAuQ9IHq6hROg62/wC4GX3zxRfiNkOH8WeDnsm/fvqA7OWPGDP/L1EsvvbRo0aLwb04BAADAZRQRzWZzRIt99dr36amnnlJ1zfr44497ekpgL9OHH374Yv/AIopeETXO1NTUqHr8Tp48uc+18Nra2svqRFKtaRHRWoUR+eKLL/x/nDlzZvjPDbz5UlNTM9DxLDSj0ThwXUx7Emk75wBR3ZGJdDWIlJQUVS+MwMV7zl9GRoZ/9uspXd9yyy2qK793NdELW7oAAACgb4bKuohGo7GsrKzXW+CBHRpff/31nv5Ytbx+pDfpLwER1c8CRzmeT/WuD9PqQB8OrKr1MlK9Dm0NZ0ypqldhRLM9hdOR9VL9HFX3EaZOnRrpRlQ3CC5gs/CCBQtUV+aKior09PSVK1deMsOSAQAAEBEHNRzm5+dXV1eHmd9++ctf+v9YUlLSUxpRjWns6Sb9hV2fvaqqau3atTk5OZmZmcnJySxATz1y+13gmEwWiYiai6HPVOVh6dKlEX1MvW4/sDNqr2lfdaKpZq8ZnLhVUFCwbNmyzMzMtLS0i6JwBobzPkzxcp43CPpX4N06q9W6dOnSSZMm5eTk9DTPDQAAACAidsnIyMjKylqzZk1lZWV1dXVEQwQDR+AEzvoQdFaPMCfnJKLS0tKBPgLe2XrS0tKmT5/+9NNPr169uqSkZOB6JwKEKSUlRXUzJXBhBn/l5eWqEy3wDB04BQUFM2fONBqNixcvXrFiRUlJSdCVBi8K8fHxkT4lMTEx8OO4UPs/Z86coAs2Wq3W1atXT58+febMmWGuVAQAAACXckTsadHt4uLigoKCp556KsTMND0JnLs/6AyoqtwYYlaPwJrZQPeMKigomDRp0tKlSy/e6mw4HxPOrqFvzJgxgQ/++Mc/9v9x9erVPdXsq6qq7r77btUpPzgffVVVVVpa2uLFi4fIpDuRCpzzsw8XQ9VcshecyWSqrKzsaf7YioqKxYsXp6WlISgCAABc1hFxgKjm7g+6CLgqN6rWoA9dMxvQSmdOTs7ixYsv7QZDo9EYYkluGCJyc3ODxjnVavhEtHjx4szMzKKiIt/dk6qqqmXLlk2fPl1VkgOXdB8IBQUF06dPv6jvsAyRWVX73bRp06qrq/Pz83sKimaz2VucMEYRAAAAEbE/BS6QqFoEPLCXaejOb6qVtQeuv9batWtVM7J6A1Vubm5ZWZnZbA5scc3IyLhQx5n3VXV1dR+aRKAP8vLy+vwxLV++vKfNJicnqx4pKSlZuHDhsGHDvKP7pk+fvmLFCtXfhF6xpr9UVVUtXrxY9aDBYMjOzi4sLKysrAx8p4MTXCMyZcqUwPcV6UYCmyJVQ0kv4CW6urq6sLCwp8tXSUkJUiIAAAAiYj/Lzs72/1G1uIVqLtOsrKzQK3QFrhzw0Ucf9fs+19TU/OpXv1I9uGbNmurq6uXLl8+ZMwedM2EoCHojo1e9rljTX5544onAq8Hhw4dXrVq1YMGCi+XeREJCguqRMFel9xfYFDmkliJcsGBBcXGx2WzOzc1V3dTzdtb40Y9+hNMNAAAAEbHfPPTQQ/4/ms3moqIi34+vvPKK/28fe+yx0Fu79dZbVY+oMme/2LBhg6pXXn5+/tDpkBnYrIF7/EOQqsW73/srWiwW/xsZ6enpvbZjZ2RkVFZWDk4+DJwdJzs7e9WqVZfAKu3Hjx+P9Cmq1Ud76tt5YaWmpi5fvvzw4cO5ubmBl1nMdAoAAICI2G+mTZumqitv3LjR+x9VVVX+g5QMBkOva80HdkM1m8393tf073//u6piPTi16jAFNmvs378fZ8hQo8pC/b4K/GuvveZ/I2P9+vXFxcWVlZW5ubn+WdFgMGRkZOTl5VVWVhYXFw9a252qed9gMDz//PMX4+cY2CO0rq4u0o2o1soP7DA/pMrt8uXLA6c8HbRFfQAAAODSj4iB/c18s+SpxiWGE8MCJ/onohdeeKF/d1jV+nHfffcNqeMZuC5l4EgnuODmz5/v/+O2bdv6d/v+K774piedNm3a8uXLi4uLfaP7mpqaiouLlyxZMsgdO1WR+I477rhI2w9TUlJUjX6qW0i9slgsqkvK4K9IGSmTyaRqlB6EFYYAAADgMoqIixYt8v/RarV6U6Kqj2iYPTlVE/17b2/7d17td0NtwvrAVoigq4kMBPRoDf8IqPoDW63W/i2lF1erzo033jgIrzJAs4/ecccd/j9WVFTU1NSE/3TViGsiuummmy66exwAAACAiNifApv+3n//fVUvU6PRGGYrx5w5cwLHXD366KN9GypTVFSUmZkZUYWvp+RQXV09aIdU1TBbUVExEDO7Bq7Fdxn2aB0/frzqUIf5xAULFqhm/vj9738/QDu5bdu2SyO979y5M6K/V00c1e+9eb3uuusu1SO//e1vw78yvPTSS/6PpKenYxphAAAAuNwjYuA8NOvXr1+7dq3/I08++WT4W/v1r3+tesRqtc6bNy+ilGixWJYtW7Zw4cKSkpKTJ0+G+Msvv/yy16098sgjg7n4W+CYzJ/97Gf9/iqBE7f2YaKOi924ceNUj4R/Q0HVd7p/m7v9W5KtVuvs2bMLCgqGbFAMp5viypUrI519auLEif4/DtBtmsC0v3r16jBvyjz33HOqK0OIpV+HFFWTLKZxBgAAQEQcjDqW/4+qzqihzZkzJ3DOPW9KVCXPnhQUFEyaNClwvTgvVSulatrVwKhpMpkGuddfamqqajWRioqKnJyciDYSTh1X9am9/vrrl9uJFx8fr3oksN9gT37xi1+oHom0ubvGI+ivVC3J3oXOfcshMsbS0tIyu1u5cuXatWsHZ2pKVTfFkpKS0NF65cqVS5cujfRVEhMTVQdhgBZKffbZZ1WP3H333b0eyZycHNWFLj09/QLOfVVVVcUYW7ZsWa+3EiwWi2rPA2eTBgAAgAuP9ytVCsrIyOADLDDU+Veb+rDBnmYFNBqNa9asCbq6vXe+x8AZ58vKyvz/bM2aNao/yM7ODroPlZWVPe1GiKXSy8rKzv/DNZvNgSuYpaenq95L6IOwZs2a0H8cODlQfn6+6m8KCwsbGxvPs3gErpkeUQEOf2H6Phx81XE2GAyqZd8bGxsLCwvDL/Z5eXmhj1hjY2N+fr734BsMhkhPgV4ZjcbAzzH0JxLpJaKysjKwcAZ9142NjYHFLMwXDedVzGZz0JMiopLQ2NgYdKWKnj7KsrKyoGuQqEpOP14ZwjkjfFc2g8EQohCazWZV0TIYDOd/jgMAAEC/01zsEfehhx7qqdWubz2viouLMzMzA8eGmc3mp59+2lutmTVrlu+meIhRZKpBd4sWLfrVr37lv6LA6tWra2pqfvKTn8yePds7MWN5efm6dev8b7Snp6eHP1CtXxoSV61atXjxYlVb4ty5c9PT0x988MEpU6b4lsdobW3du3fvzp07N23a5P++ep3e495771X1/Vu8ePHLL7/84IMPekeOeTc4aKuxXxAmk8n/g7ZardOnT8/KyvJOwVJaWuptQzabzYGd8Z555plNmzapCsbSpUtffPFFk8k0bdo0/8mQ9u3bV1dXp/p71RKd/rZv375s2bKeTqsQvE2OL7/88quvvjpA4+KmTZuWkZHh37peUVExe/bsF154YdasWd4DVVVVVVJS8uKLL/reY6Qn0bRp04xGo39PzoqKikmTJplMpokTJ7a0tHgPptFoPM8+qCkpKf/4xz+mT5+uenypR0ZGhq/VtLa2dtOmTUG7nefn51/YUYi+891qtXr33FuMb775Zl8J3Lx5c2B332efffYSWNASAAAArYhDrhUxRKNHn+9PNzY29rpceGgGgyFoc0rgsmCh5ebmqloABroVsW/7GX5Tp+8IB7ZV9mE7F3UrYuBTguqp/baxsfE818ELsW+q/sZ9KP9B29vPvxXR28QXTuHxf4nGxsZIXzSw5IR5DPtQEs7ndOu12XYQWhHDLMn90ssDAAAABoFwCaRc1egpr6ysrD7fn05JSSkuLl6zZk1ENVH/CmhFRUXQ5i+TyRRmddAbMpcvX36hGrgKCwv79vaJyNd6EOIIv/XWW71uRzUk7BITdOxroMBRi/6ltKe+lOGU0p5+pRrqZjAYCgsLy85as2ZNnp+srKzAcmK1WiMdwhpRE9/mzZvDLJy5ubnFxcV9uBQsWbKk1wTe5xMk8HSrrKwM2uM09KsXFhYOhWb2OXPmRHq3Iisrq7i4GLdoAQAALotWxLy8PF+1KZyBSf0iaHNKT4O4It2y/zvqtcaWnZ0delCQ76Z76OpgRkaGfyOM7915O7+F2fh5/k24Eb197+7l5uaG2EOVXlNo+JsK8RK+Q20wGHJzc3ttz/HtkrcKHuYLqcZZ9TTKNNLWKqPRGE5xiqjROysrK8SJqUqtgSMkez1uPkGfqMpCfW4oNpvNod+10Wj0b4D1va/wP9YQoxlDfMp9Pg3DP91CD/nr3yuD6pIeYkxyfn5+OCl30L4XAAAAoM8Y5/wSCLqqoVMGg6Gpqakft19eXv7ll1+WlpaqBh8ajca0tLT58+dPmTJlwYIFEW2zqKho48aNNTU1voFV6enpM2fOfPjhh+fMmTOkDm9RUdGWLVt27Nixbds2/zFs6enpKSkpM2bMmDp1qm8kWEQsFsuGDRvee+89/y1nZGTMmDHj8ccfv0wmxK+pqXnttdd27NjhKwne8a733XffokWLwmwBq6mp+fjjjzdv3mw2m/2LqHdTSUlJ3rFhoYtWVVWValxcZWVlmOPcAp+bl5e3ZMmSAT10VVVV77zzjn/JNBqN6enp9957b381r3mHB2/fvt13VPv9JcI53byf44wZM2655ZZILzWDyTsQtLS0tLq62jdy8mLZeQAAAPC6RCJiWlqa/0QO2dnZq1atwqcLEBFVF9Pc3NyIujqbTCb/KUlwGgIAAABcjC6FsYhFRUWqif4efvhhfLQAkdq0aZP/j3feeWdET/fOxeoTesVCAAAAAEBEHChvvvmm/49Go3GoddQEuCiobrVEeh7t3LnT/0fVMvcAAAAAgIg4GCwWi2q5rT7P8QgA/qqqqiI6E1WNkOPHj8cxBAAAAEBEHGwbNmxQPfLQQw/hcwU4f/4r1Pfqueee85/KyGAw3H777TiGAAAAAIiIg+3VV1/1/9FoNIY5ASMAqKha4JcuXbpy5cpen2WxWEwmk/88N0T07LPP9nlhUgAAAAC4gC7uGU0vyDz7AJeq8vLyuXPnqh40Go1ZWVm33HLL2LFj/e+/VFVVnThxYuPGjQUFBf7th97VUPq2YD0AAAAAICKeF9Uc/d75Ni6TxfQABuecihTyIQAAAMBF7eLuaFpQUKCqmyIfApyPVatW5eXl9fnpWVlZyIcAAAAAiIgXLB+qurc98cQT+EQBztOSJUvMZnN2dnak4bCsrKygoAD5EAAAAOCidhF3NC0vL//BD37gXcnNYDCYTKbnn38e1VOA/mKxWLZu3bp3797S0lKLxVJRUeH/W6PRmJaWNmPGjKlTp95+++049QAAAAAQEQEAAAAAAOCSIuAQAAAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAAFzWNDgEAAAAAABwXniwBxmOCyIiAAAAAABcHpHQKfE2p9LicP/b7FCc8rnfCoxidWxEtDg2XozSICkiIgIAAAAAwKVL4bzdyY+0SLvrnVX1zgPNrmqb3ObgpHgaExlFadmEWPG2MfrHpsZfkYDEgYgIAAAAAACXKk4nWuX3D9s+OeGobpFaHEqbxNtlrihEvCsiko2YTI6RXQ8AIiIAAAAMLTVtUm27cqxDaXNxvYaNjhKujBOM8WKUiA5gABABF+c7zjjfPdRZWtexv0XqcHF3IBQYY8SEc6MPucKjNWxcgiZai4sMIiIAAAAMJTssrnW1js8a+QGrs8OhEOfEmKgVrkzQfitFePAK7cKxegFVOAAIJx/KVGlxvb7fVnDQ1upUiDHmN86wq8HQ+69C8XrBaNDEaLGAAiIiAAAADA0y56sPdf7uoHSk2UWMuytuZ6tqsqxUW13VFqXwpGy6wvXc1JhR0ajGAUAoCqeT7dJre9o3VHvyod+9Je5ZSU8rkI5Iw5jAyCWykbHiFUlaPeaqQUQEAACAoZEP6d+rOl/6xuGSZWKK32/Y2Zv8EgmsyeZcdVA82sHXzoodG4OUCAA9stqVT2s7K045LHaF+fdR56ThFKcTUuPFyQma0XFivI51uLjRoB0ZLSAhIiICAADAkPDHg50r9tnJnQ95VzJUGGlYtFbjlBXZKXtaFBXPb+XCY/xZHVs7KyZGg5QIAEE4FX64VfpnbWd1m0TMr/1QoXgNm5GivXls1JQU7dhYMSmKRYnMpVC0hsXikoKICAAAAENBhUV66aBEii8fCjqNsGCcfm4KGxEl2CS+wyp/eFI+3S4RyUScmJx/VLptlOsHqXocPQAIZLHLu+odOxqdLc5zTYicU6KGpQ/TPjI59vaJMWPiRQxsRkQEAACAIUfh/K81jhNtrq4OpUxIjtKsnB69aLwuUddVfZMUMtU7f76rs7KR3CmRkywr/3PQcf8VugRMPwgAAU62yrtOODocnPyuEBpO05O1j14T+920mORozI986UDjLwAAwCWlpl3ZYuEke8cfMoEJz18f9Xia3pcP3RU7geaP0q1KjxkezbomqVekb9p4eYOEAwgAgRo65ANNLruieC8YnJOg8HHRwh0Totz5EOvnICICAADAkGVuk4+0SZ5veE5cmDtK9+B4XdC//NZwbdZEPYlaT5Ykl0xbGlw4gACg4uT8RId8uE1ycsbODkTUMDZrlG72aH1ytMgQEBERAQAAYMiqtyttTs8IQ2KkyDOSKEXf49f9bSO1xOWuHxT5WLuMAwgA/jhRU6dyol1pcnDZ71GtyG4Yqb8qOYK+6bJCsnzuf5JMioIDPBRdvmMRlePbhNJnHPbLpWDqROZKNGoW/o8QnYxyDwBwCXPxswtYe8SIFGICiQQt+dfRnArHAQS4FHId506ns7293WazMQ/uuS7odLqkpCS9Xh/JpuhMm3ymXeLeG08ejFGsjo03aIbHiWFVvInanby6Se5w8q4mR+7eyOh4YWISOqkiIg6R08ZpUxq+EegyKpCciMtOsjUQIiIAwCUtUcu0Guby9hhlwjG7YJd5TwOFDrUqpNGS5PT+sUGP7kUAl0hEPH369ObNm7du3arT6QRBcDqdgiCkpaXdc889EydOjCgiNnbKTXblbLZz1ypjRHZltDgmSowKbw5Tu8yrmpz/9VVLdbOk8YRKxilWJyy+OuYnNyQgIyIiDo3TxnqE7/izU1HockqJjEvktKHQAwBc2sbGCCOitSdcCpFCApWedh5o1U03aIJW2tYddZLc1XeMCcKUJEx1DnCJRMSWlpbdu3d/8MEHjDFBECRJiouLa25unjdvXkSbUojX2+SGDolz3rUiIie94L7UxIfdydTu4idbpANNziMtEnkSoUB0fbI2FivrIyIOFYpEzbVaneCwU9eE4JfDlYKIKzJHRAQAuNRNTtBMSRROtHi6gpFyrFV6bnfnmpmxY2MEVT58YW/nV43e5RPdCTFJo8wfpcUBBLg0IqIsy21tbadOneJnu54nJCS0trbKshzhpuhwq1TdJp+bqkbhUQK7Il4Tpw2330G7QznRIrk4kciYyDh3h5BrDNpJCciIQ9Hl2J+EdzTJJ3aSwi+ffOjNiIw4I8xDAABwiUvSsXvHiFFRuq5vOYFvPOZ89Evb32vt9XZF5tQu8S/qnTnbbC9/Y5dccld/GkHMGq+dnCDiAAJcqvwHJYbPyXl1m3zUJnN2rlYZLQpGgzZOF26+a7Yrh5pcndLZZRW5O4SMjhNHxmM21KHogrUiKpwsHc6aZsf+etsBi63VLttcXCtSSrR2ZJxu6ohYoyFqeKwuXi8OQERslOvKmHRZjsjHPAQAAJeBR6/U/fOEVHxCS9zlmbtG/uyUY0ezckWUPVnLbRI/4RTrbb72Q++3I9cKnPHLagQGAPRec2xxKh0uheRuTUvRWnZlkiZeF25rU5NDPtDsiYhniYyuSNKMiUcrIiKixxmba/nnR79p6JC5oigkcS6fnXuNExcYE4j+ecDiafJixPhtVyY/MWPUqDhdv0VEW32UaHc4h0xY4gpxhbvft0BcZowRO3e+cc8s5IyIex/kime4SOTJmbmfRhodCj1AqNNRps4WisGkTnCRi9MKv7shqtamHLByIu9q+Epbh+ObDkaMeb50JWLd0yCXV1dLUaLtN9fHRGPuCADwcMr8eIvUploCgFG0ThgXr4kJYyyi+3LD6USncqhdtnPy9lUVBIrTC8OjxUQdpsi67CNi4SHL23vq69tdrU7vgFfhbAY6l9ZkzmViLk8Q8gbHwsONn9VaY7TinZOSH71+RLz+/Pa5w8LrviJ5yORD2SGkZYrXm6Svfi9Xf6xf9KZ85HPl4IcknH2b9hbNnF8KCWNc21/hbSeF0TeQo51bDp37g3BrvkRc4AIGmUA3kiOsDtdMQ2K/Xi0Uyf0/f4KWIrr1wRWSnWH9paCJ4HSRJdrwJH3n32nM9SH3XybF1c8v3cuXdDtZ66j1JHVY3YdO1LpzbOJYSrqCtDEoyBDENUmaN78V/dMd9q/qmef2okyMd30fMOpaNZEEz/93jbyQXM7fHWQu3vmbKVEJqLcBXE45sLFDPuJp5RP8+n0yRjYn393gPNUhdxudJjCbpOytdzZ1qKvUnLhAbGSsOC5Bk3B2huR2p2Kxy82e+r33JlWUSBNixRS9gNtRl3VErLc5f/NZ3TcNtnaHTALzfBMx6rEnNPevs0oKa3HyFqfzzd1nPjxkmTs+8Yc39L1RkXc28dOV8uD0MuVK13vs3jBIXCbvlFBMIEGrnNnDt1p5yzH3j/oEptF3e7o2WqnepGiiuK2B6eLEKQ/xpmr51C7SxxGLoELtPiFFjaCPR6EHn89/R+V/cIeNXguPqKNoAxkm0BUzKPXbNHrqeSUf82f0wTNkbz13WnCFYlPo3j/Q+FlhbcHVSesepRO7wtoNjZ6ik9w7P+5GMv4Ljb4+1LMEDTXup9fvpsc/opHXBP8beyute4RO7+vl1b3HLSqBEsa4NzXhJho/m2JSIjtWrg468BFVvUO1X1PbKeKuc9/R7i9aHSWNowk3040P06Tb3C8H4G9minbdzcLqaudbNY6T7USi6D7ZuoKiQAqP0/H5o3TbLPLpDpm4RMRkp+OPh7hL5iumRQ9+SlQUpa2tTZYkFsbgJEEQ9Hp9VHT0wO2Py+Vqa2tjnpk/BEFITEpi4Y2asrW3d9rtoiBwzqOjo6NjzvdGjq293eFwMMZkWY6JjYuJiUbxhn5kcylV9c53D9lO2xT/CWgYkUPhpzuV4x0yde9cUN+hvLW/PUZkqiq1rHC9yBYaY+L0QldE5NTcKVtsyrnhTpyiGLs6QZOCW1GXc0TcZLb+YevxeptLIUaMiEcaz7r6oUoKNdikDw9ZPj1izbpuxPemjYzSRFywuNMmt50c8HlqOHFHCxt+rZA4lisKtZ/kbaeJK1yRiAks5WohZhi3NytNNczVwbhCiqtr6PDZVMklO4sfwwyp1FTNZQcTRMYENuwqljSeiAuTMnlnM7eaSXJQeF9X7kAqaigqCYUefA78k2y1JIVTfjz/HiujPW+RoqFxM+nbz9CU+6gPXZ65QiXLqGGX+nXbzbTpOXqiJKyNtJ6k6mJydoR1KnftfDntebtr5299hq6/v9t9G9V1sf0o/fW79IMPaNS1QX7fUud+dVnq/dXZ2X/3exJdzEi67h6a+1MaeW1Yb3PPu1Ty79S4rysQeht6/Pv6MCdZa6i1hirfonE30Z0vuIMigL+JceKKaVGPTtB8Wi+XnZGq26Q2l6IT2BWx4k3DNHeM1k5JFD894/rRDkd9u6d8MZJcztVm6pT5H9JjYwZ3lFBDQ8N/r8w7dPCgRtN7/UQQRb1en5SYNHrMmEmTJ0+/8YaJE68Uxf6cwuDDf77/zrp1suw+/0RR8+//+Z/XTpkSzhN3V1X97+9eliVJlqRJV1+9dNmvk1NS+rwbp06efGnFitraIwIT4hMSfpn7q2uvm4KyDf0ZEZ102OoqP+OsbZNFQVWldX/vuLp3S2eMWpxKWb2TBXRFUmQapmF3GmN8Vw9OdMYmn2qTFOXcRvUCjU/QJGIh1ss2Iq7afvL9/Q1Wh6LqUNqn3OV+ukthLQ7+18rTW461/J9ZY2eMiY+0fhqlZ47O882InHOBsR63oji1d/yXMP4WpfGQO9qNucH1jx8olsNMH6/77p94lIGsR9iwq6SKP8v7PxCGTxave1DavlZu2O897bizgw2/Svud5crRLdLRzzUzn2bxo6WqdSx+NIs2kGRnV8ymxsO85SiRPcyJBdx/JOooZhgKPfhInsHnSoTPYhId/4refpCuuY8WraG4EZE9/dh2Orq1K/D4cxLVlNHpvTQqvJqPxINsJJydP/EVrXuQqh6kB1ZRbA8nhEzUbKbX76Yf/JNGXRfkUiRTX17ddoZ2vEK73qZ5v6L5S0M1QspO+vAX9NUfunam55tR50Ljya/ptUy69ZeU8ZveW4bhsiIyNtWgnWrQ5kziLsV94osCaRjpz84juGi8u5r24510qs3pLVCKy/mXI8zFO/6QHpOoHbyU6HI6j9bWHty/X6MNtxALAhNFUaPR6vX666ZOvX/Rom/dMic2Lu78d6apqemDd9/bXVWl9eyMoij/+Ps7YUbEyddMHj58+Cclm7RaTW1t7dXXXPPDJ/6N9WneRs75hnfWf/rJx4qiSJJrUZZp4pWpKNXQv+ySUt8htzi5XQk2YxULUteUiWxK8AqnJkoYGXsu/nFO9Tb5ZLus+JZVJB6tEY0GbVIUIuJlGRH/+PXxDQcabU6lPzfqDorcpbB9Zzp+Vmx+5PqRj984SiMwznnvF1+pU6nfK/DzyocCI61WIK3AHTJjzO6Ug76ukDpfKv1/Sv03JGhYVAJvO0myQ7vwL8qpXdKhj8jewrTR3N7irglq9BSV0FVbZILS2cSuuEk37z+UI6XyngIuuUgbS/p44rJybKtivJ03meWKP7vfr9TZcztI4CnLiGkYao5w/qfg2dBy8D36ywn61w8jS4lV60mQg8Qe94ndSXv+EW5E7PPOe1svD/yd/nqCfvgBxfZwZ1/ypcQPgqTEvlG8vUNt9OmvqeEQPfjnHieQ+udPqWJNkBTqa5YMXLRH8gTgsv+iDgvdv5oEfO1CAJ3AeurVdf94vVagnB3seKuj67aD5PhbLZcU2//OiBk+WNU4xphGo9FqtRqtlnMuSVKI2fk9s7AJjBjn5PL4+ssvt3399S1zb/237OwpU6ee585s+eKLw4cORkVFCZ7TiXP+WWnpw997zJiW1utzDckpj/3wXw/sP9BYf8adLd9Znz5z9vXTp/VhNyq2b//gvfcEQWCMGdPSHn3s+zExGH8M/azVyc3NUodL8Xzx8O6nWZB6rvtPFB70RmmslqUliqNiRa3oa0XkjZ1yfafMfQMPGdNo2ch4MQ6tiJdhRPzqeOt7By02hzIg02dzTow6FeGNytOHmjqeTh8zKTn63L2Jnp7UYeGnqkhS+vS9RTqNQFFiY6P95fePfV3TdqrZ+Ys7x37/W8ODLCTBFVIUcfr3af97svkT3niQ6ROYIZUlTZS++j01HCAmeMZjdo3LPHc2ujo1Ux4iJsr7/iEf+Cd3dXjOS09XW/d3YIc7Uro6ydZA2uizk0KFsfNEDpfCYlJQ4qHXohK0TAmex1VNji6iU9vovR/T994Jd/v2Ftr3zx6bxRSi3Rto3lLSRPXzznvvd/qfqU6ik1/Sxl/QQ3/p8brhTok1XT1OR/cWXMWAVz+78lNXMvSPqS6i3W9S/AhauDLIq+96m7atVXfEFbxvREv6RBK1JDnI3kyi4v4z3n3LO16hkdfS3J+iOENkvjtOrxMoewc/0uIi7jlNJVf+UXLxjt/PiBkdPag1Oc65Xq+/bsqU+MREpYdlvmVZ7mhvt1gsDQ0NLpdLo9F4s9zmTz85UmP+2S9+Oe873+nzDrS1tpZ+8nFra6ter/feg2aMNVut7234+y+e/VU4W5iRnp65YMG6v73JGDtWd+yNv7z2Ql5edIQjJ9vb219/9c9nTp/WarWCINxz331XX3MNyupFTfbourALgiiKoStzntbjc18I4TylDxTijGh8rKYz+tzah4yRpPA2iTe7eLevJE4GLUvRi4G96RROo2KEOSP1w/yuGC6FTtmVU52KQl1TZYkCGfRCSoygD7srO/dMacn9vmE1WE7xYoyIbQ4pr6yu1S7RgH5+iuRiwhe1Le0O+f/MHjNlRFwvKbGjiZ/eLUW+NiDnXJJpQ0X9+7uslXXtp5pd7Q736f2rDXU/uHlE4OhKLuic7z8uXnWXmDpfM/tHyukq6YsXmT6eFBdJne5d9A3hUu0tl5hhMjk7lPq93FbPopO4Kqd6/xUEFslsIYLAFG2cOALfK9BLyBk7i777W/Vco5xTewPVfkl7/k7tp7oFPBfR3r/TgSKavCCsl6guJWtNt7wk+MUnmej0XjpSTpO+05dr2Q3fp5ueIsmu/lZpPUM1X9CeDdTZqN75nX+jmT+k1Ft73KxE1HqECn9JjxeFurYIRNMfoytvIdlvmlNFpg4L1e+n2q/IdlwdFCWisv+mq++kSfO7v6KdPlupvqiIRAYj3fxjmnQbJYxyR0SXnZpqad/7tPXPZG/q9r5kos0r6Lp7KXkCCjVEJmOM/lWRPb2dDlvP3leRnRvqyC7b/jwrdtQgpkRZlpOSkp780Y+vve5a3sO3tqIoTqezo6Pj9KlTu3bu/HRTybG6OsaYTqc7Wlv727wX4+Pj02fP7tsOVFXu2rZ1qzeYJSUZHA5He3ubIsvlX3zxwENZV6b23tVTEMXv/fCHX24pP2I263S6ss82F334wQMPZUW0G/98792tX32l0+kUWZ4ybfqDpsUopUOWJEkOh0M5N96ua0YljUajKIrL5fKUovbW1tbOzk5v2ImKjk5KTIyLi4uJiVGNv/UWb6fTabFYrFar73GdTpeYmJiQkBAdHa3VavsrKw6PFjMmRs8e3e1k0wisqVPZUe/47LSjVeq2Itu0FN1d46M1grodkXNKihKuG6ZLPnu5UDg1OZUjNuWko2vjnPNEDUuLFYbpepnQwBMLyaVwmVOnzFskxbd/IqMkrRAlMi1z76cQRsKUFO6SSdWPVmCkD5k1Fe5+oqRe8oN0GhZibSDuORROudvVS2DubKz1NKXKnBTOmaexh3U11rorCcIlHxHzttSdbHPSIOR7rhBjO0+2v1R+/Cc3jZ0xJj5ESuSuTh3vjHRBRMZIVvhvPjz+xpZ6q012ye5isvz+CcvePdrY5mzrlGIC1/dnTGk4SPYWWRdHgqi764/C2JlK/Tck6j2T1shM0HDPzDTqGzDaGHnnX1nSBM2tS11fvMhP7uhWkvnZTBnhWxAYyVGJbNQ0XMEhVFEnikmhK+cG/+30LJq/lPIfpZrN3QIJI9r+13Aj4q516vHuw6+iMwe7ZaHKgr5EREZkmEgTvhX8tzcspm//nN56iE7tOrfznEiQaceb7rcc4lqlEDk7ejvFiK6+g258JPhv7a208y3a9Bx1NJHfWH1iMn3+EqXN6/bqdV/T6T3djrBINHoGPb6R4kedezCK3D9OuInSv09vPkAN+889RSHqrKfd79C//BKFGiI2f6TutVns37axg00OYp4CKzs3ntD+4Gvbq7NjxsWIg7Yngigmu/Xe/2XSVVfdMnfuw48+WvD2WwXr1tna27Vabd3Ro6++snbClVcOHzEi0pd2Oh1FGze2t7VpNBq9Xv9kTk7Ftm2FH36g0+mOHzv26aZNTzz9dDjbGTFixA+feOL/LVvmzQ+vrV1744z0K43GMHfj8KFDb7z6qiLLTBS1et2/PvlkXDymJR+6qqurd+7a1dRkddfumDsIxcfHf/vb3x4/fnxTU9OePXsqKip27NhRV1fnjZGc8yRDclrapGnXT7n11luNRqPWbwhuc3Pzzp07Kyoqdu7cWVdXdzaA8ZiYmHHjxs2YMWP27NmTJ09OTEwU+mNcwchYMdMYI3cPQqJA3zQ6j7dJojvVKL4aaYxGuH64btHkWJ0QZFYOjUAxWhZ9dgyzS+EnW6Qmm6zI3Beq4rXC2Bgxqrf1V+0SP2aXD7VLx+1yvVOxSIpvhQ0NoxFaYUK0ZlKsmBqjSdIJodsjHRKvbZH2NTjbnYpv3xROY+I0s8foe2rM5EQWp1LT7KqzSpxzdxb1dP/TCeyGUfoxcT1eDyXOGzuV3WcczZ2KKJBnzkmKEtn4RM3VKTpG1NAhN9sVjUAJ0aKWM73ItFpuk3i0KAyRvrcDEhH31tvKjrYM3sqDnJPAvmnsfPnL4z/91rjZY+N5T1O4KJK7KidFun2SFfr9J6ccLvfpIQpsyZ1jfzx/1Ls7LTtq2x2SEhgRGZF49V2y+WNqPuoZamggjY631Cknd2juWOkq+r+8/huKHcZihvG2U97RlV2xjwncaZO//oNm3q+18//D9em/K+ZPz448IlJcxERiInfZPJ+engnacPKiZxxiDEu8AldwOB8JY+jB1+j3s8nWcK7YKURHv6bOZorubbpcay0d/uRckmFEccPpu/9Nb5vcIYqf3dqBImo7Q/Ej+3nnh6XRg6/SqltJsZ3beZnoSDlJdtIO5ATyUQl0cw6Nuo7++l2yt3V79epSOrWn2xqMx3e6M6Hc/Svqjv/olg+71UGvoftX0yu3uQOnf49Tcyl9+xeEbjjQB3NHaF+bxZ+soG8afSnRVXKSfvB1xyuzYlLjBi8lyrIcbp4UhGHDh//4//5s7Lgr/vu3K9ta23Q63fatW7eUld1z//2RtrQc3H+g7LPPPK06fMKEiffcf390dNTnm0sdDofkcn1eWrrgu98dM3ZsOJu6PSPz882fbfqoSKvVnD516tVX1j73m/+Miuq9M729s/O1tWsaGxqYIMgu1z333/etm29G4RyyOOcnTpwoLS3ds2eP5HIxxhRFGTVq1IQJE6xWa1lZ2eeff37o0KHa2tr29vZztXCtbs+ePTsqtu3YsWPBggXz58+Pi4vjnCorK4s++qhi+7ZDhw4dO3bM/ymMscTExL1795aVld1yyy0LFy688sordbrzXfIoSsOiNEFObbOVWeyKdHYOG87d2WxCjDA5STsuQSOGcWK5ZH6qXW5zKP7faomeZfd1PT/fofDDNqmqRTpql050Kk2S0ibxDuVcT1NGFCvS4Q55b7swPlqcGqe9Nl6T3PMSGk6Z1za73j9kM7fKUfqu5haZ08wx+rRh2tE9vBVZ4fvqHYU1nbvqXTLnomdYpsIpQcdydGxEbFRPDZDWTuWLY/YPqjtOtMsiI+auu/PZo/VJUQL3dgpkdKZDtnbKk4fr6qySTiOMN4hn2uXURM3IQbwTN9gR8dWdpzpcfJBPTSJ2uMnxp60nxJvGpY/pYSozxUUCi2jPGKMOh/LshqMOl8IY45zLCv0yc0xCtDgsTkvkGaAYZH9kYewMzQ2PkTaGuzrkyjeV49uZIMrlvxWmPqT9zvNMF8cdbdLWVbz5KGmjWcxwEnXEZdLGMn0877RKn+dpvvVT3R15rk25JIgsOpmJOqXTqtR8opmaJT71tVL9ibTrDbI39b46IvfMRCVqWHQyLuJwnpKvpKszqepv5+60cHInutYTvUfEfR+Qs/lcjBGJUm+lyXfS+JvIvKlrgwqR7RQd/IjSf9D/Oz/2Rkr9Nh0u6rbzrSfd+588ccAPXeq3ae7PqPQ/u706c7qznH9EbDutnilAiKLQncSvnENX/gvVfNq9B68epfXiVtuuVDa56jqUZqeiYTQ8SkiLF29M1iT2dRmxb1qkvVb5eIfcLnG9wEZGscmJ4g0p2qArV98yQvfGbPb4Vr670dmVEhXXpyf5E9s61qTHXJUgygrtsroOtMgnO5VOmceKbEyMcF2ieH2y9sLel7jnvvuO1Jjz//Y37lnVsPSTT+7IzIyJjY1oIxveecfW3i6IoqLwex54QKvVzv7Wzdded13F9u0arfab/d98tWXL/Q89FM471ev1j3zve7srd9WfOU3EPistnX3Tt+6+775en/hRYWHZ559zYoosTZg4MWvxI+HP8goXRGdn54njx3dXVdntXQMexo0b9/XXX7e2thYWFn7zzTf+Qwq9JJfz1MkTp06e2L17d11dnSRJ8+bNq62tffOttzZs+MepkycCB+Jyzpubmys99u7d29nZaTKZJk6c2L/Lvfg02pWadslxrgWRBE6p8ZorYgUiHs6k+pJCZ9qlFv+pSTgl6IXxiRp9sFymELW5+Dftri8szooWZ4vEfV9tQvfxWZ0K1dnlY3b5aKccw9jEGDE5VF2YHDI/aJW2NzhJe65HnqgXWlzKSC6KwabkaXUoX51wfmDurG7zG6bmibh3pEbPHsUTdMGPQF2b9O6hjk+O25vsniX/FEoS2cxRupRo0dutNCFKYIw3dChXc36szdXq5O2yttOhjBka+XCgIuLOU+0X5A4OER2wOj882Hh1SlS8PthbU+RI587x9jb+21f1XctGCOzH80cZYjUKp+p69yUgLkoMnG6NM0Ha/TaLGUZMQ4qkWGuY00aChredkne9odRsJk0UyU5urWWiVjn6pavxEG87JcSPkkr/g9tbSBtDdqu0bRU7MJa3nZD3vCNro6j9DNPolZpSV+MhikrkHY3k6ghnRlPGyC5xMXE8Lt/QL0Ze2+004p57Lx3W3s5PharWd2vy5kTTPKNypmW5I6K/XfkDEhGJaPRUqi7qfqvSRp1WoggjohD5YiFElP4YffHfJLd1a+6r20b+3eMD7/m47GRrpGE9z6HIRHrs71R/kHxfpJzTiKvRhHixqm6T/3Swo7SBjnbwFrtEnr5fglYYEa25Kpayxmu/b4yKjWS5wq2NrtWHOrdahWM22eaUSHEXOK1WGB2jmRJv/36qbtH4qMCcmJ6ifeMm9uQ22l5/NiVyafNJ+rdttu9P1BWfdFW08JMdisMluzcosGidODZGvDGx86lJUfNH6S7U0RNE8UHT4o9LSs6cPq3RaPbt3t3Q0DAhkoh48MCB8i8+97YCpRqN8267jYiGDR8+b/5te/fslSSX5HR+tPHD2zMyEhITw9ng1GnT7r3v/ldfWUtE7W1tBW+/dWN6+rgrQvXrOVZX907+uvb2dlHUaDS6+x96aNJVV+HUGOJUE8loNBpJkjZu3FhfX3/kyJHAfOjPbrd/8sknbW1tjLGSkpIPPvigoaFB6a0V/fDhw2+88cbo0aNjY2NHjRrV7+/IJXOrQ2l0KTKd+0IRGY2J1YyI0bDwqtQuhR9plSwO2f8bNClKuCJRE9i9kxO1upSqVtd7Z+wH2yXp7Jyp/GydXPT08/SmNU6kZSxZy66J1aTFauJDXhV1IkuJFvVRngV/xLMR0TNvOFOCP9Eu872Nri2nHO586H+J5O4v29ZOpd2hJAS7Z9fiVPY0uT475WhyeVpdOdeL7LoU7awx+lSDdygixQgsSScm6ZUkvTgmTmO3Ss3tyrAYMUrDLtmI+NbuM54OmRcE54qyyWydkKT/1xtGB/m1ZI8oIjLmPj3+9lVDh1PxnvMakWXPH+10KZJCRy32SSOjRYFJMg94okDNx5SmI95bLEzUdc1PI2rJ3so7dnlKF2MavTvjdTYptjPuv9FE8caDJGiYoCFRTx2NStspptGRonCuMFFLgpZcHUr9XvKMZiRRF04dUCMyKXaMePUCXL6hXwS/L9Fb6/zxHe4s5H8vMGli15jDyXdS9Aiy1Xf9ViY6UkZnvgl3ffnILnlRAXutkBxh5/PkVDLOd8daF0X8xBGT6cT2buMhLeZuf2O4gpjfUsTur0CiLX+kK2aFWsci2kATbkLZvOgpnApq7bm77UdtnFwu8lYlPH1fFImfbpVPt7CvLMr7J1z/MyPm2sTev8GdCv3vgY6XDkoNNolk2XMTnnu/B10upa5ZqmtmnzVS4QnXf02PHROjLmHTkzV/uSnmia209YyLmOz9Hv3itLK1iTscLu/U4l0b5NTpUKrtrupmoeQM/5HR9aspMXEXqEHxivHjJ19zTf3p04yxpibLiWPHJkyM4CbQB++9a21qYoxJTuedd901bPhw7+O3L7hzw9/fOVpbq9Xpdu3cue3rr7+TkRHOBkVRvOeB+8u++Hzvnj06nW7vnj3r/va3Z5YsUU1P4iNJUv7bb+3bu1en0zmdzmnTZy787t0C1rG5KL4f/Wplsiw3NTW1tbW5XC5JkryT4voWUFG4Z7qSs9d67xIvu3btWrZsWWNjY1NTk3e8onexE28vNh+/Wi8/duzYG2+8MWrUqAUL+rmax4maJX7GqbQ4FPnccobub6LR8eKIWDHM07tD4jubpeOdCjubsqI1QnKMmBwjigG3plpcyq4Wdz6s7pAc/NzcLZ6+mqRhLEnDOmXe6ql4axiN0wu3GHTfHqYfrmPRotA1tYzsDoSqbrM6gaVEaaN0IglnPyTPeFGSPRExWIOopVP+oNq2p9GpULfqtmciEW61y60OPjo+YN5Jom8anF8es7c5Pe2HjLhCCXr2nQnR1wzT+b/jGC1LjmJ6kQ2PFqNEcXi04OKKVhwqEbH/rzjr9zXwC/iGuKKI+k/MzbsCWjK57OSO1sgmeuHU0iE/9965UcJakaUNj5IVOtrokGR+1/VJPS7ZJGqZNpppY5g2mvxnbBJE0kR1Pe6tawsi00S5/5tzdwW2a6pS7s6K7r8R3Zvyhkn3N7HANFFMF0vuR8IuRrEjhTHpuHZDv2g41O00Yp5WLH1CL8+qWk+C1K2X6TV3dfVNTRhNV2eeuxj5FkgcCC3H1Tuv0ZEuwjXGdLH0cAGl3k4R9/pi7pSoaoPtaOo2C+u4GSR3P7Mloqq36W8PUv0BlL5LmUvhfzhkf2Kb/WirRLLLc0ooZ7tyeUIY4yQoLqfj41PyfWW2bZZe7lHYZb50l21Jpb3B5iQukcDPTjjht0GmdHQ63jwiPfal7Uh7kCaLKUmav8yOuXm0jrjg+5512D1rJzLut3tnN8jllk7nin2OnO22VtcFqw4YJ03yzQHe2NgQ/hOrDx8u+/xzRVFkSbrSaJx327m5s0aOHLXgrru8GYBzvmF9gcsV7m2iMWPHPfLY9z3DzLhWq/3ne+9+vWVLT3+89auvPnj3Xa1nZcjExMRHv/99X0yFiwjn3Ol02mw2p9Op0WhGjhw5d+7cRYsWmUymzMw7U1ON+oAhqR0dHQcOHGhsbPTmQ1EUJ02atGDBgsWLF999992zZs1KSVHP3mS323fv3n3w4MHW1tb+3n+ydsiN7ZKr+4VBYGxkjDgsRgynEuridNqh1HfITr8hFgkaGhUlBE4wo8i0r1XaWO84ZJPtCglnb5bGiWxavDZrdPST42OyRkcbYzUSJx1jMxN194yMum24fmKMGK9xJ7+qBufaXW3/OGg73uYK/P7VaHmMllTjwyRZaXfKcsC0yTaXst/i+vKU65T9XLg9t6tELQ6lPdjC77JMFaedpcccLl+wFFhytHjTWP0V8d3uCo2IFa8ZpovVsokG7dTh2lSDZkKiNlZ7ibYi/n/2vgNOqvJc//2+77QpOzu7s70vLL2zC9IEKYKKiigoXIm9xJJ4TXJvkpvkRu+9xhijscUYk7+JJvYSEAWRIiKgCAgsvW4vbN+ddur3/X9Tdma2wYBI0fP89hezs+ecOefwlfd5y/MqBm32auzcemF15XArWnWkZUxm14pEQwXFc0oUkTLW6NYa3Vo4hIjRPdMzgi0nYNPRDoTQjRPTDHr+L1KARJu5WJs4I3DXwcGPuuRYIgBbCiSeULhB7oA9S7tIsOgonGUawuhF8NUrXRbf0nfgkv8E7owW1CkdUPZZ95uXEsF26taXNQm+9za8diMc/vDUYonWHqUSqh90NaqXk10MeeOh6osuuloGwP734NAqKJoFIxdC0SUneeEmLkQsq1L/p1Txq1psUhUwJvJIZ8zQEWAEzAgqo2uH2rgfbFfenEQK7H26ep8+6H/qoBowu0KuTISAEQAm8Ug2GNCgW54FmR7V1tazn+70vzTBau9RYD/Uyf3tIut9W9mams5MnPD/4sBFMJM4LGs0wCFRZ+YW0/9xDNIk/OhoC4/PgcXjcIS9VgiBrCjxbpeUrVv9cU11NSFE1/WLL7kkN69Ljcbcq+e9+9ZbzU1NCKFdu3Zt+fzzKVOnxnnxWXPmfLJ2zdrVqwkhfp/vhT8+N3T48OQeFn9ba+uf//icz+fDGBuGMfWS6dNmzDBnxwUNp9M5ePDgiRMnjhkzJicnh+f55uaWXaW716//pHTXzpaWlp7BBo7jUlJSxo4dO3ny5BEjRiQlJbnd7urq6q1bt27cuPHQoUOxSk5er/fo0aMVFRXDhg07g9FmxqDJazR6KOvatiFJQKkWEmeOgE+jdR5d1cPuJMYAM5YmkhwLtnYNl1EGDYpR2qHt9mgGC/NDEaMsEQ+xccWJ/PAEPllArRot9xtVfmN4AndJsjjCwSXy2KCszkd3NqsflvnWl8mZVuKQcIadi03axAgEDiSCOIxiCaFCoUUxVMp3S46v6DBWlPuPeXSN9UieCirWtMqsowdF1CkcbdW2N6jH3DoKhj4ZhRQJj08XipxctyRSh4BDeaqipVMqFs6j+pAzTBE1g7HzgBJhXthR7/mypmN8djS0gQwN1FOIImIEKoVn1tZ1ej2A59CPZ2fplIkSeWJVHWMwIN1yni9MPEGamML3n2mu0Sa+PrxN8M7d4Knp3tgwtzjAEk+AI+ug9Wj0LAKQOQbyYtqV9ZsKKYOg6WA017SuFMo3QdEZNY3WPQrNh7pTxPQhYD8tB72UCDe+HmCJh5afguuJt3TfAajWpREl5mDmf8Mr8wBpXS6rAxheOLgs8MMlQs5Y6HcJFE6GzJGnef8mzivU+Izf7Fda/DqEJdUwJnhOFj8/h8+1YsVgu9vpq2XqgXYWLjll+pcN8NQB/LuxFqE3Dra5UXvqUDC5NCyXTQQOFuaJs9O5DAm5dfZFC32tXK316J11tfq7VWRGuvb9Ab04ZgY6yKJ8YU21AhHFN4ZdFm5RAT81lXPyqEmh6xuM18tVj4bCbfeZ/pdj+iXp2pXZ56AuUemkhYwBH7fKS01Nzfp16zRNIxhnZmVNnzmr27nZOTmXX3nV3/7yIi8Iiiy/9/ZbF02cGOf1RVG88557du3c2dLcjDHeu2fPP/7+twd+/JNuh7368iu7S0sJISE9zNvvvruvfFQTFwQEQRg7duySJUuuuOKK5OTkCIWbOXPG4EEDXnrppTVr1vRU7k1JSZkzZ879998/aNAgq9Ua4pCU0mnTphUUFj77zDMNDQ2RBoyMsaNHjx4+fHjIkCFnkiIC1HuMOq9OEQv21Q/MJguCfnbikuKsQwSvQmtadTkmeIQQykvg8h1ct3VLZ7Dbox/yRdON+GAe6aUucYpLSBdJsI9IcNcW8PRk4bI0KUPEIcEbn8a21MjP7vFsqFMMg1X4jPH1yjAX3z+Jj9b5AyRw2EK60z3dYB41KtkapjOU7WpSl5b5m1QaOSFUA8IihNarN/tptwxVn0Y/rvCVNqmxrGSgg1zXz5JqIRfW0D3D606LX6eMwrkmwVRXj7XB51XuWIoYTDR1Q9wclgE0dGgvb26IjK20BD7dKfhlY9PBjgN1vstHJAnkfJeDQAiQMxf3n20u0ybiGfP+lgAxo3p3V6K3GSq3wK43wV0JRo+zTiots/P1rp1qAUYtBBJjVgk2GDEfNvy2C43c+fqpUcSQ5dzz5lUv1O+FjU/D7re7a8xggGHzT1/WRUyAf3sN3rwZDr8X79LC9yiGNPQuDfdDxZlzn4QPfxT4vFv3i9DDGe1Q9glUfAJrACwpkFMCQ+bC0LmQXGiO4gsV/6rWdjTp4Xo/QFaRe3i4cOcAKZEPmyfzcmFJAf/jr/zvVShhUkeNd2v02/obI5N62cpfLlPro/QPuyT8x3HWq7IFa6cbe14uuz6Pv3+b/8sGNXAYA2rozx5SbizgE/juViZl8HqlBhwJTzCGBydxfxpnm5TGRQjqdXnsulz+7q2+CneYx3b41L8fxTPSeetZF2CoramJWM9JSfGqeW/6bMO+fft4nqeGMWbs2NFjxvQ85vIrr/xw+fvNTU2MsdKdO3ds2z5+Yrx1wIMGD1m4aNEfn36a53kEsHzZsvETJk6cPDlywNYvtyxb+l74nVN6/Y1L+sXdRNHE+Whkc1xmZuaVV145b968pKSk2EpFu91++eWXV1dXb9q0KbanRYhEXXTRRUuWLBk8ZIi9q9JS//79Z86YsX//gZUrVzQ3NUUGeXNzc2NjIzujYRqDsSqPXuk2DIYim5DIoWwbSYhbV7lVofubVLcW1WRDDLITuFwHh7uU94FXZTs6tIM+PcIiCi1kRrI4LUVwCTjCJyXA010ixuDkUSTVVTbYgRattkPXdQYYKZRtrVfGpAr5Tj422EkQJPPIQcAfPCzymIrOYkOlDGB3g7qpWmnwhoswMYBAwEKwT6eh5h0U2HE/bVG6MksGzX66plbd1xEOIQYLDnFRklCSKToE/J2miEdbfChUU3eOTV2GBWl3g6eyXclL7HSIUo2p8SaaIgBVZ18e8+gGC01pjGBQuoUazCKS360I7D2P31CA+hb8FXkMfCgvCECnqkJP+s0cQUTAwZpcBDrVFUM3wnOKMSZyGEkEVOpXjci8YiwwarHEBcavSv2KEVOFC4JIwGoX8saYy7SJuPYDgIot8McpvfwJB3+MHjKePEDR5TD82hNdtq0SDq3u0g4R22DYNd0PG7EAPn0iGjqjAPs/BE8D2OPreq0DfPEi7F0eVfXs9A2BrwW8DQHbu9vNEwBnfyhe8rVemmiHxf+AV5Tu1LQvkB4RGmaEgy6xmHw/pAyA9x+Elv2B2+5Jy43OD/1NcPQjOPYRrPw5DJwDFz8A/S42x/IFBsVg71RpwbTPwJ5CCLmniP/J0O41sgV27uliW4MCG+uC7QoRq25XXy8nLNjyK7LFCARqfOzTRtop4o0EjH43xnJDfpfBx2E0zsW/MA7NXW/UeYNzjhoH3fgfZcqUVE6OGXM8hgMd9LN6pVNGECXb+GdLLJdkdImeiQTNyRKeHgs3bvZ61eAFEWxtY/va9RLXWe3WIPv9+/fuZSxg2Nrs9jgbGLa2tq74YDkE5UDsCY4rrprXaxeBwsLC6TNmvv7Pfwqi0NTUtOqjFWPHlcQf6Jt/3YIvNm3etvVLQRCO19e//NJLg4cMSUoOkFh3R8c//vb3+ro6QRA0Vb1o4sSr5s0zZ8cFDUmSSkpKxowZk5zci58iISFh9OjRkydP/uyzz3w+X3i3xTg7O3vcuHHFxcU2a/dFgBCSnZNTUlKyaePGCEUMqk9p8VfGxuky9uis1m80BnMpO7VqmIhxbgJnj5vtNMt0V6vuMaIdLxBAhp1kdo0iKoxVyXqdQn0GcJ1qo0U2bopLSBGiojYIgcQhC+re6NTKo+Is8eNa5UCHjjAYgHa2atub1RmaJSmmqw9GkC7hZAEfj2nSqFPwaixWd1LT2aY65ZNaWQ3aI8xg/RK5MSlCq98obdWPyzRAdAA1a7Stqzxnm2Jsr1fK2nRFZ4ggBoApjE3lZ+SIyRKBC01j/AxTxCZfgImfDw/GdPVYC9pQ3rZkVHp0vEO8kXGEkE7pe181R04lGOaOStIp21vlXbWndXKRY1iuTZGNnpNKEjDweMv+tvUHO2rbNIuApg50XDEymVKmGb28HBqkf1gidQ3y0q9adlV7dYMVF9huGJeSnMD7FSpwiFj5A8fcf1p/fPpgxzUlLiU4uAPfZSFVDfIrm2tq29R5Y5Jnj0xWgrLCCAUo7qa9bSsOtVxygz53ZC/P6PP5Pv300yNHjixYsCAzMyoAK8vyn//85/37948ePfr73/++ucR/18D6YI89hSx4AFewbzs+YfbE3vdBbe0iVFN4MaQN7n5Y9ljIuwgqNoa/KNwg8SMovinu/ew4+I73/ifaG+klAlz5h5OkyMYD3grznoKOmq/j1Orlw0Fz4IdbYPsr8PmfoWEPYBZ4CtrjH4h2Ph3ywP53Yd9SGHszXPV4L0WPJs5bNCpsT4sWdBUgYJBtxXcU9V6Gm2PD/5bPfdmkqXrwnx3Rx/f5nzno7+atNChSKO1MCkVTMsV5Ob1ne45J5hYXiE8eVEFXAYGh6Q9s8/Y0/3SKVIN19hHjZqfjWZm9X3BWJn9FjvD2UX9IzKbWox1182eZIm5Yv76qsjL4Hmi//v3jbAbw+aZNe3fv5jiOGsaw4cMvmtB7bFAQxemzZq1ds7qluRkxtuXzz/fv2zdi5Mg47y01LW3h4kWHDh30ejyCIGzf+uXyZUu/d/MtgNCKDz7Y8vlmnucMw0h0OhcuWpySkmLOjgsaoiiOHDkyu28nRVpa2vDhw7du3RqhiBzH9e/ff9CgQYmJiai3FBerxZKdlSlJYswOwrqJqZ4BlzELEJ4Gmbp1xmIuLHEo38klivF+V4fKKjy634hm64gcSrWRZKmL2o1ssGN+w21Q3LlBpwt4gJXLlLqbF70m0lp5PC5TnJgpHmrT6vyUMmiU2bEOo95nJPAoUg6NEUoSsV2I4QIIDMZknUWERTTKjrbqW4+rh9v1UKsPhGBoEr+wv3VLrVzmNo4HHXkUoF1jrSpTKLN0ZhTWeOjHlXJD59NiBkk8mpolTMsWeXLhNaE683I154uZS6mHCpXtcuywwly8FRGhdhfLd7aEt10WGFg3TkwVCPrPtysUnT25qED2690mJAIQ7dzf19bvqPSu29+2pyY84T/Y1frml83/Oz83wyGwHtarJZHfd9S99KuWrWWedQfaO/wBC/n1L/EnB9r/55q8wYMSy4+5l66te39HyycH2nOSBOAwKJQxkET8+cH2Rz6oWbu/TdZog1sfmWNLTeA1g4kC3lfj+ffXy7xixiV35sR+YVVV1e9//3vGWENDQ2lpKWPsppuiNvijjz66a9euVatWtbe3p6WlNTU1/fKXvzRXeRPdHZnB0V4wE67/f5CUf+KZCDvf6M5qRi/qfdKNuh4qN3b5cMfr8VLESGwtLlIHwDlg/p9g2FVn4G1oPlj27zByAfSbFse+20M4A5NOGeOe5kUCTLoPxt8B5Zth71I4vBaaDgOoXZhh7OPrAMiAXS9Bwz64dVm8AVgT5xz1ftqmGuF5gkl/Gwx09Lk7j3SSVBtf02aEGKBBmY+hXiZeZNoZtNiJkvr2+l+SRp7cT6P+VSNACE90QYynZ/RJ+WwcKk6Et8MpNkzXjFr/WTUMqquqXvvHKyG5F13TJk2ZYrPbT3qWLMvvvvkGpRQHe9tde/31gtinwTB67NixJSUfr1zJcVxVZeWna9cNGTIk/r72l8yYsXHDhhXLlyOEdF1/9ZVXJkycJErSq6/8XVGUYEDSmDZjxpRp08ypcaEjJGQaEU/qZTPieYvFEltAiDFOTU11Op19UT5CiCRJ33QTFIOyVi9t89NQQCzqIuFQdgIfZxRR1VmHTL0qC/X+ZcE2FWkWnCLibhdQKKvw626dhg7jMRqRwPezxktSEICdw5PShH0N/AdVMmUIKOvwGbXtemECF0mcxwgSJWzjMTAUUd6iwTyOSKJpu0pXVfh3N2qawUKZrBlWbmSqMCZdrPHoEb0ZxkDWWZtstClUtBCMwK+yQ63aZ/VKc7B8kTEQAIY5uXHpYn4ifyG2KT7DFNHKn0e1mIiQBq8m61QK67MhhuKdUYpGvzjq9mvhdogIQXaS4Eqz/G1VzZp9bXdPyxg/wCH7jW4DNECx3q380/r6qhblxgmpSyamfnKgY+3+tr01vr01PpuIH56X67RykTgrRojn4Z2NDS991rBuf7ui0RE5tmvGJKc7uDe+bH57a7PLxo874v6wtHXVnjavYuS7xAHpEgTj2hKPqpqVZ9bWfVjaErpaeZNc1iRnJPIYo6YO7a8bjpdWe6dNy7n88stjXU3bt29/5plnIrLd48aNSww2/21ra3vooYdeeOEFVQ1X2TY0NDz22GP333+/0+k0F/rvCFBvmdO0xzGZxTDlhzBmEZCTeV2qt0Plli7tEK0ZMOiy3g8eehWs+m8w2sKmqAFQtgEa9kPakDPwXJF0WYqh8FKY+1vIHn0m/GIeePNmKP+wd97bC5+Uu98Y5rqUZfayTItQND3wY6jQdAQqvoDDa6B8E3RUAWbds39ZkELWfQFLfwg3vm52z78woNHY/GjUU1AhFhaCulpX7KTFHRJhJ1AVtXIIKIVoN86TXpCduHG/hUPR5p4MzqbKeWVFxeOP/mbXjh2YEMMw8oJJob3mi3bD5o2f7d+7N9Quf8SIkZOmTDnRA1oss2bP3rJ5s8fjwRivXrXymgXX5uTmxXmTFov1xptu2vrFF42NjYSQ4/X1Lzz3nGSRqioqOY4zDCM1NXXxkiUWi8WcGhf8loqQxWIRhD53SkEQbDZbN76Hgzi3d25Q1uw3vCrr2icKSTxKsmExPjnTVoU2+I1o/hwFkcAQB0mXuj+dxqBJpSGzmoW680vEJZzCBoYR5CZwuQk8ZmFHrE9jbX5qxFQLYgQZNuKSMGKMhsvIQDPAo1KdhZfiCrf+rwr/3g4NEcQY8AAT04QpmWKSBeU6uAQexb4Qr8ra/UaqFKCIx9q1L2qVBq+h03CXOiuHpuZKg1z8BboRn2GKmGEXYraZcwyma8dajU/L2+YUBTOuEAbMxznOvIrx2pZoJyUOo3EF9upa3y//VVmUbnl4fq4iG93+yQUOPfhG+bNr6w1Kf3VV7j3TMzJThIn927eWuVu8OgD8dcPxB+dkuew8DU4XggOj8/GVNU+vrqtpC7CyKQMcv7gyZ/YwJ7aQ6UOct750+OXNDa9+0ejuTGedXJQwJs9mhAYywStLW5ftaAmtQYyx1AS+IEUCgnSVvvll0983NTocjhkzZsQuNLW1tX/9618jrqnk5OS77ror9Pl99923bNmyyNVCB+i6XldXZ1LE7w6wAFJi13lEQW4FGmPAEoAR10JJfMG9XW8B1qPBPRxsh5iQ3vvBSQUwYDbsfSssysIAqA9K34VZvzx9fhtOncUgOQLX7z8NRl0P+RMAnYn9V3FHFU3j3AN0ufsCifmTZOpG37wA6UMDP+NvC3x19TbYsxRK3wNvNRhd110NoPQtmHSfWZd4YSBZxBJG/nCln1HpQ60aS+rDCKv00ha5my4v7m3Ud+aFInTMi2SDSX1kOu1rM4DjQFdPdsHIl6LSFv3Ggt5TYRnAUQ8DGmp6jYCgZAGdtnl9Ats6Fn6/v6219bNPP33tH69UVlRgQhhjHCHXLbx+8NChJ6fomrbsvfd8fn+IoV01f779ZIHHqdMueWvgwK+2byeElJeXr/lo1S133hn/ow0dNvz6xf/2p+eeDQWaNny6PpjAy4XowcLFi4cOG27Oi28HRTxx/idCKB4XxrnwW0Gt22hXojWEjIGdQJ6VpIpYiG/DO+4xKtr1mBIrJmA8IJF39UgfZUFfUqdCa2DxcPDIfooyVw4RJ4oR+VHQGchGFwUfgsBlJYldCapKWZtMQ4Vgx73Gxkq5vF3XdEAkQAfsPBqfIY5NEyQOp1mJlcNdKSJt8VHqDJgAu5q1j6tlj9HZIxZYkpWbkCX1c/IX6Og9wxQxJ0E4f6gyM/Q6L9pZ7wlRRER4xFvjdp/ApsPuyIZHMAzJtPzgH0dr29T37hucnigoMb1QGIDE45+/U/HU6loAGJ5j+6+52QKHNZkOyrAIXCgOiUIdQSLTiiPodytrfr20Sg5GBR0W8pPLsi8bkaQbTHXrQwc6RubYvjzmCXO24AQaW2DPz7AofoNgaOlQt5Z7/CrFKFxuUpAiZuZYfc3KK5sbn1hV61WN4hFF117bRUhk9+7dK1asiPyanp5+xx13tLe333nnnStXrpwzZ8769euVmBZSCKFQjNHEdwEEAozipneiApuhlI/XFsOxNdE2fRRg49MwehG4+p2cQe3t2g7RAKjdCf9c1Lu4C+ag8WCXmBgF2P0OXPIfJ2+QSAAGXRk4Uu+RyUk4kJzgyABbap8pnacBuT3aFzH+q/rbe3iRLScPxvaEmAD9pwd+5jwMG5+D9Y+C4ovuXAyAY7D/AyicYgYSLwBkWVBBAre/3Qj1MCz3oeVVyk39pJ5HqpQtr9Pb/Vq4zpDB1Ay+JJnoXc2gFpUtrzVa/HqoTOKTenVXq3BRSi+WSrvGXq9QobNIBGFyZTY/wI66XbDGz96uUFko2Klry2vRA4NplrUXR8v+Nn1VvRFUC6QAyGnlC+3c6dnWfr9/25YtTY1Rcf/uDhdN93i9TQ0NZWXHdu7YUVVRgRDCGFNKqWHMv+GGBddfH893bfl88+7S0sA2rarDhg+ffPHJPSsWq3XetdeW7toV4KIc9/7Sf81bcF380qkAsGDRog3r1+8u3UlI9P1Qwxg6YsTCGxaZk8LEuYWis6PtWrMcpYjAmEskgxOJI25Lv8GnV7v1qJYWAwFDgZNLsuBefVrdSOOpal+yTtWRyLW63SgCJJJgaWLMvqjorEk2lCBFPNymf1jmbwm27Q9QYg5NSheL04UUK9EYS7ZhiQ9nqAasIwRenbXKVKPQKuu7m9RDbVqoXT4zWJpEpmUJA5I4kSCTIgaQZOUxIOM8CSMCYF7oUMMGKuMksLogjtABDjbHr2pRwlmmwa4p6w92fHKg/X/n580vdsmKEesWkni8bEfzb1dUh359dEE+ZaAFRYK9Cg37hRnYJUJQaNAzycY/u7LmoWWVcjCXlTH24KVZUwcmGAYLN/TUw3si6pQ0zU4SitItoWFNEKptU+vatfCUYMwuErtINmxvfnVL04pdrdWtgZtPTnYNHx71RLa0tKxbty52Ay4oKACA++67b+XKlc8+++z48eNnzpwZSxE5jsvKyjLXyu+KvzMYp7L0iBnP+iX8+ZPoxKYAcgN88ltY8OJJLnj0E2g50j0NsmYb1G3r85RuJXYBSrkLKjYHuNBJpi2AMxf6TT1L78rXCq/eAMdWw6lKyLVXdU3bAbAkRfvmnwYkZ+AfyJkDb98GsXpYLPjqTFwQsHN4dpawv1UOOp+RR9Ef268OcXDjUrrv0S8cUt6tUCO99e0S/4sR1tk9lGM0xuZv8H5YbgBmALTWw/5rl/zSRTjf3sV579XZQ6X+LY16p/YpdknkmXH2AhvuySS3traXdQTldxk92G78bKf3qWJbstjlyEaF/vdu/8E2LcQPgcIwBxmSeDpBEkJIe2vrc888jWMSW7ovF5RqmqYogf2O57hQNIZSKoriwsWLb7/rroS+a8Civh5ZXv3RquamJo7jEEKz5lyWEaPfdgLMuHT2W6+/vm/vXoxxRUXFRx+uWLzkFPSRnU7n7Xff9cuf/tTn9aJgsg9jzGK13n7X3c6kJHNSmDi3kA12rMNoiVH+BAbJEumfyItxJ8HWeo0yt67HcDWBoAInn9Qj0RQjEBGQzn2RArRp1K0zx6lE4Fr9Rmuk8pkBj0HiuwVxGUcQCbWjQFG/W5tCdQoNfmNbg/J5g+rRAWFglLkEMq+fZXgKDwg4hJIsxCZ2FjEG1ySPSptlQ9Hp5hplR4MqG8Bw8O8MCh1kYX9rhpVcuGPgDFNEgWCEERjs/HnCSBI04iRkdcXjUdcMOFjv7+KqpOyTA+03Tkj95bw8pSs/ZIy1erX/ercyyPQg3cFfNsLJaOB7xQTug0/r/SoNuhTYLZPTHCIxKJNEsu1w+/99UOVXw/xwQLplQYkryc4rEXFhncldtXSL8+0DUkUWFCwNBja7P8ia/e1Ld7QcPu4PVTkmOp2zZs2KPaC+vv6dd96JGiV2e0pKyo9+9KPXXnvtxRdfvOOOOxobGyOaWqF0l5kzzZ77JqDfNBi5EHa/EQ0k6gDbX4aSW6Bg0olO/Oq13isbT0m8ggRFa05KEc8mVC+8tuh0+KGnARoOdu/dH6v3o8twaA1ovk6dLAppgyFr1MmvPOoGWPsoNB+KXpwF45wmLgzvDIIb84V/lqnNPhKaIvta9cWfe344QLwuX0gTsU7hkNt44bD8z3LNI2vheUVhShrpVSyUR+jaHH5tA5X9ctAYYuvqtOs2eh4cJF2WxTsFLBtsW5P27GHl/apgIWTIqMHctblCvq0X+y+RR3f0E3+xwxc24Azt1TLaILMHBklT0ngrh9wa/fS49uQBZUODHuk8QwR+XjbJtJxmVjcDUGSZMYZO8OKCfQUifk8AGDFy1C233zZ56rQ4k1QPHTz4xeebMELUMNIzMnPz86sqKzVVPbnBIwgl48bv2V0ailt+sGzZFVdddUp5NxMnT7l0zmXvvPVm6FZVVZ171dUnLoM0YeIsgDHwqKxBoT7GEI42RUwUUK6DE+JjPTqDIx5jT0eAIkasZonHOb31zBAwyhDJYb/hUQPz3WBQKxvNKs2Ou908ZazSrVe4tUgze6uAXRKJ7a2BMXJI2B7U+qHR0CYYgFTKPq+S1xzzK0Z4/5U4XODkijPEdBsJbdYOHieLxMIjubN1Y6tMqzv0NoWuqFK2NKoRERy7iAck82MzRYeITYoYdQ9YOawZ9LzhiCh6LwgDbz0pRcQI2mXj7a3NsbsUAMwckvjYgnxVNQLbVcxFeIJe2ti0r9YX/JBNG+SQg20qJBt3qNr3wvr6UCXhpP4JP5yZmWjhQnWzj3xQ3ezRI06MO6am5ySLWicn5Akqr/PXt3fZogZlWApTJY2GJezyksVpgxwbD3W0B8t7PYpxsM6X5RQyEoX6dpUBjBo16rbbbou9QlVVVXl5eQx5NrZv375///7nn3/+jjvuYIzV1NTE5vMIgnD//feba6UJAJj+M9i/HAxveDowAKbCmofh9pV9FvW1VcLh1fFKjJ5o3Q81SGwEe+r58jZajsHRdaCf+omHVoG/oXsUMWdsdFnavwJeXxB1siEALgG+vz5wzInBSyDYehByM8X0wsHYJHJnf/G3uztdKEw/2oYf3AmP7PFlSEihUCODR0egaxHlBZdD/MEAsa9Kv8UFwvs16rIKHkKuDKZvb6S3tLF03pMqIbfOamQs6wwMvVPZj+vvwD8Z3LuYvUaZbAQbLYbV34BSY1Ut+qTBmy1Sp4ibZVqvEVWN6Y/D8KQUfHM/8esMwxOLdiCEMEKarmOMGWP5BQUP/PjHY0tK7PaEeJcXSld/9FFtdY0Y5JmtrS0P/+qXLM4Ut+C85Tk+WEKCyo4dXb92zbxrrzsFk0kQ5i9cuHXLF1VVVQihzIyMq+fPF0XRnA4mzi1kyhpV2qxQxYjZ4hHYBJxixRxG8WzcDcGeGUqwST0KejytBBVYca8VaSKGfAvZ5UbHg9qnOmPlfqNOoSPjv2cNdjZppa0aRaEgIXJacVZiF4qIABJ4nCRgK8EePWhPY6QCNKq0rEP/sk7d1qQawbOZwQY4uQX9rDkxmRcEIJlHToKOB6hF4LJuLXBiaYN6pEVrkxkigZUDMShJ5y/PkxIFfEEPgzNMERHApDzHR4db2XmTa6pS5teoJSR5i/BJ7wsh5FfpR3taY0nj0CzrE4sLs12iotJuQWsi4OfW1kUKAgdlWKw8xgRt2t/2m+XV+2v9AHBdsetXV+UWpIgsyKLf2dK08ZDbCKopMcYSJDJ7WKLTzsuKEdZdFPC/gg0SO905gWv3T5MsNk7xGUFnCdhEfOvktGMN8gvr6/unSgtKXIMzrQ0d6pPBekgAcLlcsS2V2traNm7s0k/A6/UePHjwD3/4Q6j5oc/ne/nll7sR4CmmO9NEEFmjoORW2PJcNG6mAxz+GHa91aeS577loLR0mXAYIM71MlZ8hQJ4awPkauyS8+iFnIaKv+c4rP0NdPOfaQCFMcmxnNC9UT5yw4YnYPE/T+LdajoCzUe7xycTM82Re8GAYPTDgeJhD323LDIDKNXUBg01yMF5E8oFReE8ElHgfz6YuyK7z0CZhaDfjbJUen07miINNamuqTU6rpFDbh4txo9AUi3k96OlAY5efPY+nf52r/zIXhlCxRJRB6qualCmY/DRsN8oOkNwUTL/xFhrmnSaRhKlNMHhmDFrVlp6el+JphzhGLAPl71fVVmBMNY0LSMjK35+GFRALV+7+mO+M95oGIYek0oTl9kTaoCGsdfjWb3q45mz59jj6LERQUpKSrIrpaKiAmNsczjsCQnmXDBxzuHXWL1H96o0qDsV7XkvCSjZSrg45rRBocljuGUaLhAMsC6WJJJBTr5X3SwRoxwrsXHBdvNBK7dWoXs9WpGV5NsId7Lojl9nOxuU7Q1qbVD1izDIsOCBiVx6j7vlMTg5lMyDT4NQ20MKqFmm6yrkvS1aixoggoiBnaDRycLMPMkZEwbECLJsJMNKGhRKESCMvBT2t+l8ub/ao0dqFAUExenitGyJJ8ikiF1w0+j0VUdazxeGyJhPoy1+LZsXg+2meKDspJKrik6PNYbr8UKk7rIRSaOKHHKH1nOUHq3z76/zR2hVgkRW7mndXe37y4bjxxrlGUMSR+fZHro6N0Eiih7sDGMlL6w/3uTRIhbf1aOTk6w8jW1EhdCWY+5mT7TvYkmBfXi2NeqcDR6jG9QtGyKHH5yddd91eR118oNvlB1v1xBCCQkJI7t28q2vr1+5cmUsAwwFCR944IHIAc8991ys77a4uNh0Z5qIYOqPYNebYDR24SFr/hcGX95dBDWUptKtHSIGSO4P+VOC7cFPCEzg6CfQXtnli3a8dn5RxFNF9XZYeh80HejyUAQgayzklEQ/yRgBggOM9uir0wB2vgYpA+DS/+4zYKt64IOfgNbRPT6ZN8HUqrmQkGnFT46RbAReOaoE/v1op7JvaM6gzn9YRFKt5JdDhXsHnaSGdWAi9/JE64Nf+dbW0WANYUhRnnYdKBiADHCgR0dbrsnthXB6dPa/pf4nDyjUoBGJVEAkeB3a1wUnpOMniq3jXKdvY1BKHQ7H4iXfGzho0MlYVurvf/sbRVGrKiueferJh/7vEVfcHec/+vDDmpoaPiglahgGY6dju4RaFBCOK921c8vnn8+89NJTMVJY9Etj/78JE+cOPpXWtuuqzmJTUUSCkiXslDCJI4poUNbgNjr8XRYHp4CLnJylN51SHqF0AacK2EpACZ6EEfh01qLSXCuJ3IbfYBVtul1AGXYuchnVYEdatfcO+/a2aEYwBRQDjHHxJS6+1/Y8Dh65BFTjCzVrDEy8do2trZLbdBoKAzLKBqcIk7KE/EQuluZhhPISSLad7G4L+9f8FI56jCaZNihhhRsBwSAnNzpNyHZwF/owOPMP0D/J4pBIm19n5wdFlDWjXTGyQ78hDp1sAWZBpRkaQ6UwQrlJAsh6L8YWg6VfteCYLimr9rQ+trKaMjS+0DZ9SOJ/zMkalG3VNRaSpQlcQaMBfhiTAlacb3daSSQhVuTQ4Wpvbdcs00lFjiGZFl0zIgKqPsV4anXdq1803jI5bcnEVPDob37Z+NJnx0PHjxo16vbbb+/iYvH7jx49Gn0ojKdOnfrII4+EzVBN27Fjh2FEyyxFUYz81YQJAEguhEn3wbqHoiTHAGjeB5ufhxk/735wzVdd2iGGKOLM/4Jxt8X1XRv+ACt/1OWLjm2AhgOQNvg8fTkMoGo7WF3d9VQ1LzQdDdx8xUYw5O5ptwhgwj3Ax/hhkvJh8GWw+80uVY4MYO3DcHQDTPkB5F0ENhcQPrBS6TK46+Hop7DpGTi+q2vsMZihOvRqc9heYMizkWdLLJNTyB8O+A90cAEmRo0wE8MYMCFgXJ7B/WSoZVp6XDIOI5zcq5PsfzmiPH/QX6cIgdFEaTgSSDAgYkXG9QXCjwaJI5J6sQf8Ovt1qe/Z/YpuhDv1A8JOkczK4D45rjVrfODewhdEwQtiF6ffXiTeO1DMt5GvvYGzWPm0vnDFVVdt+/LLFR8sJ4Rs2rDhrTdev/ve++JpK9dw/PjyZcs4ErAKOUG47IorbHZ7X+qpfVpRPL9vz569u3cjhNpaWtatWTNx8mSr1WoOZhMXLjpUVtGuy+FsysD8xoxlWUmhlTh4HI/jUafsWJvW4DMgoh7KwCGggsTeFT4xgiQBD7NzlX56zK/bCBpi4yY6hcE2ng/38QaPRve0av/Y7S7JEBcOttmD8UFFZ4dbtGVHfMvK/BU+I9Sz3k7QuAxxRJpIUC/lFwkCSpUIQUaoZavOoE2jHVrY5EAIJIKmZYsz8yxC11tFAOk2km4hqLPoUKWsSWXNKhgsFCgFG4+uLrCMS+W/BcPgG+G4E7IdHx1pOT/sNqYz5tc7bSfCq9pJV3/WpZQyGGN32TnW23miBW864o7SPYR2VXsvGZw4b3Ty5SOSUpJFphiKQjubDYJkIWt3tza6u4hc5CYLVgGzTuFT4PErmxu/qvDGHpPm4J1WLqQcLHLIpxh/3XD8+U/qh2fb7pianpjI1zTIX5Z5IkkvRUVF2dnZsTHDhoaGjo6OqLmfnHzjjTdGqvy9Xu+7774be7zT6Zw6tYs6pK7rHMeZS+d3GRPvhW0vQ2tZF/L22R9g1A3dG2CUvgVIi7pOQh3zB8+N94tGzIc1/wN6W7T0kXphz3sw47/OwVNjAOFk9p4BsOkPsPkP0HM3Qp0KPd2cUzxAwUwo7tFe8pKfwcGPwGjvIjxjAJR/EvgRnJCQDoItQBzkdnAfB+YPH9BtZR9/F6QONMfshQcHj+8aIM3PE9bUaR/XqQfaabuKOIRSLbg4mbsqx1ri4iynkr+ULuFfDLd8r1D4qFZbV68e84BXYwKGLCuZmCpcncMPTSS9Wn2ywf5jh/f5gyqjnfwQiNNCnhsrLcgTy7zG8mptY4NW6Q0caSWowE6mpgtzs+397ASfxfC1xWK56bZb9+/bW15WhhB667XXRo4aHU/jig/ff/94fX1gdzOMiRdd9F+/fkgUhFP1biOEtm/d+suf/rSxsYHj+U0bPj104MDosWPNkWziwkWbYhxq1XwaixnnkG7B6RYc59TWKBxu0+p9Rqw5nSSSQUmStY9EVR6jUYl8md/o0OnUJGFCklBo5exc2CxtU+jaKvn5Pe59zVqWk2fBZNQOjW6qkpcd9n1Sq1T5g617GFgRFLu48elCdkJPhhjYLm08ThSDD9L5fJRBuJ0hAwnD2CR+UqZY4OS6LbQIQZJEEqXoO2BBZZ1Ib36MIMVCJmRJ/ZJMitgH/m1k+upjLTo9L55Qp0yNRDR5G9gzOV+9fkLNVdoj0ChyiPWw/AQer9zVtvmoO6YpKAxKt7zzk2GgMV02FJ8e4w0FSUCVDf6nV9cFKWJ03DksHM9hRQt8rSThvRXepV81exUjUt8Y1IBCmEPMYAIBWaP/+LzxoWVVNhE/tjB/8jAnGHRbuee97WFazvO8y+WKNswAKC0tffHFFymNFlImJCRcHLODer3epUuXRv7Kcdz48eNjn3fZsmVTp05NMpW4v9uwp8K0H8P790fZCwWQG2H9b+G6mAYYigd2/6sLacEAQ+b22TG/J5IKYOBs2PNWl2aMu96GaT85nRaCX3OJdBTC3MdPnrF5SgseD5A0CBb8Bbgej5M1GuY+Cf+6K0D7uvX/CFjtbaC0RTW3WW9p8wJA3nS49NdmlukFjFQRLy4QFxeIlIHfYCTo2D7tqyGAfBu5ewC5e4CkUyYbwGM4cbeuVoX+bJf84mEVWJQfpljJM8WWxcGm+YMd3OCh3H8MtagGaIwJGPHnTpphyNBhN91y62O/eUTX9ba2tuefebp/UdGJe1c0NzWt+milYRgEY47jrrn22tMO/RWPGzdyzOh1q1djjNtaWz9YtmzkmDHYnH4mLli0q+yQW/fTqBmJGMp3cHkODschg8YA2nV6yG00qDQiiIo5cFpIuh1zfaQXYIAMkUx3iQNs3CA7lysRIXiuQaG0QfmkSl5RKW+sVzQK+xrVpQe8bpWVe43SBnV3s1ovdwofM5Zl5xYNsY9JF3qV1UFBiuiUCAaIcrvIfxmzEjw9Vxrm4ns6zhACh4QTRBxuvdj1XEZZuoVcmiMOTOJ4/G2Y/t/Iij44xTI81X6eVGlyCPOdHgtkT8PZ48gJ76y7yYWAMjh0XMFcF9lcjqA3tjRd88z+4+1qJHcVIdhW7t13zKP59UgoMvQfScKH6v0/fbvis0MdmsFi946QeFowfRS5fcZjK2va/YZdIrGxTIEgwEjkkKyxV79o/MV7FQZjf/pe/ytKXIpX11W2q9Lb6tNxZ918rNj3tm3bfv7zn7/33nuxH0qSlJubG7mB8vLy2HweSZLuvffeyK8ffvjhNddcI8uyuW6aKLkFMkZD7AqvA2x7Gco3RT85+gk0H+5Ob8beeGpfNPbGHg0Sd0L55rPND5394NblkDn8jF2TBC+bNx1uXwmuwt6PGX8bLHgJJGeASaIeC1RIz8boLTKJg+Sz/1xY8iZIpuzFtwIYgY1D0pnbUDmM7Dw6MT9slOmPd/pfPKwE6yFD+aUk0849XxLmh11cEiRwh/y5lu6bO2/e9JkzA5SPkD27d7/wx+dO3LhizapVFcGoo6ppY4tLikvGnf6kJmT+ggWSJDLGOJ5fu3r10SNHzKFr4gIFBWhWaYPC9BgWhAGy7VyWnYvH9aFS1uyndTKVO6sZEYBLJFk2LJ0wuiZiNNLBX5Em9bdyAkY6Yw1+urFG/uc+74t7PGurA/wQI9hWr75Y6n5qZ8ezO90fV8t1wU73gdOBDXDwc/tbL+tnTbf1GQOz8cgp4p5clzEQMMpPIJOyxZzeGjIiAIeI7VLQ1u6NfubZuLkFlgu6F+I3ThEB4J7xmQY7H8KIiODo5oqsLpQ1Fk64NaLgDhr7q6rTZTtbgAJPEE8CPM3t11/Z3Lj4zweTbWTG4C5KHYpOf/1uxfEOTeSRyGGRwxKPRB5/cdh93z/L3viyqShdsosktiLy471tbT5DsnPVrerDy6re39G8+KKU4nx7rPknaxQIqmvX/riu7qfvVHgV+scb+11T4pK9usjjsiZtXyNE6twVRTl8+HBjY2Nzc/M777zz4IMPrlixYsqUKWrMfslxXIQxer3etWvXxt6SIAiXdhbcL1++fOHChUVFRWZxxbfQ+uzMhIz8nHRFEGxwyc/CR0YXSRXW/E/0mJ2vBYhQ5JocQM4YKJh8avfWfwakDgycG7kOD7Drja9186fMD/vDLe9DxrC4Xl1fP7iTFvJBcz9tJMz/C9zZNz8MofgmuG8TDL4WMBc4kZywgQUOXp8DSMiBuc/ALf86jxqEmLjg0CwbP9rh//tRFQwt7JdAXIade3G8tDD//BUwE0Xxnh/8oKCwkFLKcdyqFSuWL1vW5zM2Na1bt9br9YZOvPSyyxKdzq/z7eMvmjBy1JjQNtrW1rr0nbfNgWTiAkWjTOt9Bu2qvo0QOC3EGZ+zStFYk0dXOgu7WDA9L9+CTzUF/bifflTh+83nbf846D3i0REJdhkHKPMaW1v0cj9VUXBbDcY6HQSGO/nvDbL+YHRCmvVE5kAwioh7eRLKMiQ8I1Mc4hJsfTQTshCUwGORQz2pcqKAipK4IS7BfoH3uoi1gr4RjM1MGJORsKPOe44bcyHgCVj5KKFH1hQwKEJ9Nj1CCEk8TrSQdn9Yu8Wg8Ltu/9QAAIAASURBVFW5528bj0/sn4AANbjVdfvbH1pWNTjT8uM5WeML7WMfKqUxp7+zvbkwVbp8hNMa9NPqBmty63e8fKTRrc0a6vzZFdl3v3LU0xDNwntmbV2WU5jQz/7cuuNvfNk4f0zyvZdkVDZXxN7VZ4c6Bn7RuGxH6982Hk+2cS/dWrR4cpoiGzxGwFk8SQNbeQ6gKnL8Rx99dP/996enp7/wwgu6rv/617+eM2fO5MmTY72eUX+Pqh44cCB2vGuatm3bNoTQwYMHlyxZMnDgwMcee+yUOgKbuCBQMBWqd0IkumyokDfp5GeNuh4qv4Ctf4dIGbqhApGieRe8HZANLGLYLYcQTP73U04QFe0w+QFY+QvgO79FV0DojIzZ0yCrGOpKAwwq9C2MQvb4M/ZmCIAjxA+H9vLXxGzIGA2Nh8LffqIVCANvAUsSJBdCTjEMmAE5JcDFZ2anD4Wb3oHq7bDjNTj0MTQdBSqHqWnU6wlAMVhTIbcYhl8LI+aDNdkc1yZOHy2Kcc82+e3KID8MDzU+N4H7y3hpTqZwnt98fkHhbXfe9cjDD2ma5vf7//7//jpw0KDhI3vprLZt69bdO3dyHGfo+pChwyZOnoy+Xl4oz/PXXX/9l1u+CP26dvXq6xctzi8sNEeUifMS7AR/aPXqTW6jm5GMMaRasEuKK4Hap7HKdsOvsoicAAJIs5IsGzmlBOxd9co7+7w76tVWymjM5qfHtA4OfMyYU8DTM8Rr+lsn50rZdnLiPE8LhxKEUK/G7n/KSeCm51lclhNxvGQe5Ur4sNtQIaaaw2DDUviZOaLL8u3JMf8G1Ucenl646O29wXI8du4YIrILxGWNeUxOUFACQT2Gf2R6MJZk4W6dkv5UZ4NBhMBgcMffj141KgkB2ny0o6FDG5Nne+KGgunDnYDQ5AEJGw51REr/EEKPf1Tzwvr6nCSRJ6jBrdW3q1aB3Dol7alFBY4UKeVflUcb5Ail1A32k7fCHe0nFSX8dmFBfrbFHyOrgxFavqt1+a5WABiaZf399QWXFycrPgMj0Ckj/WdZLBc71z2N0BeRa3o8nrfffpsx5nK5HnjggV/96lfdmiLyPN+NGMf+6na7L7300rS0tEOHDo0ZM+bxxx+fOXOmuaZ++zDnYbj4gRh3CQKbK45pheCqJ2DmL4BGurAwsDqjy/f85+Cy/4v+iRMCHOk0MPEeGHVDp/J/EBH+IybAXavA3xFdoDGJ6+bjgg72fLh1OaQP6WODSYZ71oPsPnmxH8ZARBBsgds7nRUMQW5J4MdQobUCmo9Bew34W0H1BdipxQH2dEjKB1d/kxmaOAOo99Pvb/Uvq9Y744cAQPo5uRdLLDMzLwz1hZmzZ2/funXpe+9yHFdeVvaXF/70P4/+tpt/0+v1frxypcft5gVBEIUp06bmdJZdfB1cNHHi6LFjt2/dynFcU1Pjh8vfv/eHD5iD6jsFSqmmabGiuJTSbu2mezU7Y9O4QkK+mqadhOR1NWJlWe5L/rfbkbph+BWtW5AwliM2emm9Jyj90ilnyiPIlHCaBYt8XOynQ6WHmlWPL1imHExdRZRlWElOIndK8bXCRH5uoSXLSg62aQc69HqZhovyO0sBRR71S+BGpfCjM4RxqcKIFCEljiRPq4ASBBQgmjrtLGEMXDLLSi5KE0alC7YT5s0n8jjbSsrchqpHzgaRoBEp4sVZkpX/9hQhf4MUMTNBmF2UvOxA87nsfoGQgHGCEBNFFB3YVcQ17jD6SIOlDBxW7j8vz3r1i8aQrkxoalPKlu1oCY4tfM2Y5EeuzR+aY5WDkcZn/q1w0Z8PHajzBwMmKMS43LKxvy7cgXdghuWWSWk/nZsTmKg+Y9H4lAO1/na/Hjk4NIFLCux/vLHfwAwJDJbtFEITG3WK1nAEXTzQ8fjCguJBDtmthwS9UfY4GHb9AHteWlpaZBmKLAcjRox44IEHQt0vugl5x0YRrVbrlClTXnvttdhVrL29va2tbfbs2U8++eSwYcPMpf9bCcyBPe20JhYGW9+NxzjxFJRpTkyQTsD6eGvg58zv8TqkDIFZ/90nPwxBsAV+zhqIACkDAj8mTHxDKPcYP/jK/0G1FuWHiBuYxL9QLE7PuGDU+Ww220233bZ3z56jRw7zPL/5s8/eev312++6K7YHxp7S0s83b+IFgVKalZ075/LLz8hXJzgcl8+du/OrrwBAU7XPPv306vnXnhHyaeJCgd1u79+/v8/nU1UVIUQpTUlJObHOnyAImZmZJSUlzc3NGGPGmCAI/fr1s9vtfW7cGDscjlGjRtlstpAthzHOyspKSUnpxkURQpIkFRYWTpgwISRYyBizWq1FRUWWPkqHGECdV690a1EKyZiI0UAHlyLF6+nkMLgsZFKm2K4zRFCAZDI2MUvMc3D4VDjiEBef5+AuylL3NWmlLVq515A1FqC3CHEERIxcEh7s5MenCyPSBYcQ77UlHuc7uInpQrPKIt5bjGCES5iVL6VZT5INm2bD4zNEipC3s585RpBkIVOyxfxEnsNgUsS48Iup+XsavYeb5HMYdSUExQZ9kS0d502Gtl2gGX37gZhNIE/cUPB/y6sPHfdH/C8pdn5wlmVykeO3NxYaPl1RwwKho/ID1O5/P6jeWelti1ExJRgVpUm5ycIfFhUOz7OpSmDGqTr796tzyxqVVzY3RA7OTBSGZln/dFO/AZkWWaaSgL43KW1vrf/Tg+0hvpfu4K8Z4/rp3OzCTIu/Q+MIClwrfQQ39jZILCQAV1555ZtvvtnU1BS6YHZ29tSpU++9997Y5NLQYpSXl5eRkRH7uSRJixcvfvLJJ48cORJ6IkEQRo0aNWLEiL/+9a/mom/iOwXCwYIXzaCciW8h9rbpXzRpxzyGR2MiQdlWXJzMj0vhRIzKPMa92+SPajSgnfWHmB/i5F4aL004uw2+GGOGYei6Dgjpun4areT7FxUtueXmRx9+WJZlBvC3v7w4aMjgqdMuCf3VMIy333yjo62N43lgbPLFF/frX3RG7hwhNHHylIGDB5fu3Mlz3IF9+9atWX3TrbfF+bwY49N7XhPnD/Ly8q688srp06eH/h0ZY5IkDRgwoFveVhfPQkLC2OLixMREWZZRp+Kgy+XKy8vrK/bI83xeXt5NN93U0dER28u6sLCwWztQhJDL5Zo5c+bAgQNjrGKSmOjMSO/TPVztMcrchhEj2SkRNDCJT7LEy35SLOSKIuuMAkvMnUBOAueynLLulpVHI1KFISnCNRRkytpV2uYzdIQkATl4lMhhiSAOA3cqNY48CpDP+4oTZD2aCoQAshO5QifPn+wecxzcVUWWi7KESOMGHGyG0c/JCd+uxnDom16PNlV2/N+G8qYY4nRWH4+XZuZaHp3VpR6A1u9GK+7RdHriJxc5fLTB//1/HmvxaAhA5PGCkpQHr8gGykKtDmOXeJHDSMT/+17lytLWcI8NBIPSLf95WfaoQhvVmapHG04wAMnO/W5p1bIdzX6V8gT/aHbmwhIXQkgNduMIHGAhH25veX5dXVWrYhfJTy/PnjcuxVAN1WA8wQZDOHMMGf99nDYsUgG2YsWKn/3sZxzHpaen33PPPVdffXUkDgkAO3fuvPPOO0tKSm6++eYJEybE/imEmpqa+fPnM8Z4nh89evSTTz4Z6ZpowoQJEyYuUDCAzY3ak/v8nzUaHYxTtGAvfoQ4jiRgNiyBLeknvl2lr603wFDCKVyIG+ES/jbeUuw62yaPLMv79uxxB21fQRSHDR+e4HCc6kU0TduxbVvA5sZI0/Ss7KzBQ4ZG/rRt65eaooYydIYMHZqalnYG+e3BAwfq62oJJoZhZGRmDhw8+MRN/BVZ3rtnT0dHB0ZIsliGDhtmTzDFiC9UqKqqKEqsXR0YxoLA83xfwyCUm6qqauxZhJDQWX0Ns9ApsdlhCCGe53uabbphqKqqx6StIoQwxpIkxWaTRY9n8LONrU/t7GCdKWzMYNlW8qNR9gWD7HmJcS0IlIFKWTemxWH09YWZaVDgg6EAKyMInXbEzqDg78ECeIIEcvJrGjTwdEbX/ngcRjxG36YQ4tmgiADwz9LjL26r9evnwDeGOP6KfgkPXVLQZXa1V2mfPcYf36ka9IRrPfAcIhKGYPQPiQQMqsi9p5WHPhQtJCiBGhg4iMdAEJMNVac9K5YCJFAiQBk1GBYx6ExRadcJxixi4GpMZ0jAYDBZMYLppliniBReQsbfjRNzw2IgfSwiyOzLZMKECRPfYXg09sQB+YkDiltlYOhh4YjYrQhzAWuLUmCRzBpSnCb+ZZw4Jpk3X6AJE98dGAzqPcYvPm99eb83wueYzgod3CNTnLPzLC4Jm2/pu4Oz4SBcMjK9rE1ecbBFDxGvs0cQsQB6lr27eiCyp5PCaah1F/hPeDYC3WC61wjxLObVIw6Y3g4OfKj4DegUOGKyEb1Qz+MBFNkIViIC8/WS8ooRCpFGhIAFL4sRwhgMxHFDriBjb0O21BPww77u04QJEyZMfHf44Y93eF88ogPVg5HDmO2NdeoMMh26bEHchAzhTyXS6CTOfIEmTHynoBmsrE1r9tFuBitPUFYClyCYVqVJEb8B/GpqfpvP+KyylSF81lgiIlw/Jzc5r0eOChFQ2nDFb2CAeFo3nur9xn88i0PtNXS1kDqvITrJqO9xw68PyyOaJNCECRMmTPSBx/fLAX5oaJ07DQLMATUExNRgJQawYNJpdNfEl2Twfx4vDXSY/NCEie8cZJ2VNmm1XqMbRUzgUZqIBWzanN8tnL2Q8ROX9ZuY68TAzhqxQZj0S5KGpfUiO4ideWTsbbyFXBg8HiOKBZY8iJ/5f9zIxacpn2/ChAkTJr4zWH9c/9MxHfQIP8RWkb+lH79sumPTZUnrZiX+aoSYZ+e6mAGIzEzHJj80YeI7CEahwUvXVstH3Dp0skFGwcmh/nZiJSY/NCniN4mnL+8/Oddh5dDZYIkIMc3vtPSx1fE2kj9Jkdn53OESBckhEF4nFjLmZuG6l3DWWDDlzkyYMGHCxAmhU3ilTGl0qxCWnMCZdu7NydaXJtqvzhFKXNz0DOF/RlpXTrdfnCkAIhEj8bUKvUWl5gs0YeK7huM+45NK395mrUNlUdOYsSwrKU4Tvk3t/kycjxQRAJ68rGjRsFSXhbBvOJyIMEm38YNT+uybhlyD+Bm/Ruh8ZIko2DCDIawTERdOF679Gzf2lrD6sJlcasKECRMmTojDbn1LK+tMIkVWDv9+jOXK7O61REMTuRfG2fITuPD+Qo3DXlh/XDdfoAkT3x0wBjVuY1W5/50jvtpu6hgMMhK4cVmSXTCFakyK+M3jnvHZv5qaPzDZyuMIIfoGWBbCE7IdlxX13d0ME5RzEQxbZCAOAZwnKdYIBeUDENGJhLKK+Sue5Wc8hBLN3rsmTJgwYSJelHlohUcP764MTckUr8gSej1yaCJZlMcDx4d2Y53ClibNfIEmTHxboVHWIhutMu1QaJtM6zzGV8fV9w55X93v3XRcdRss2vaBQYKAi5K4QSm8yJnxie8czk3JweS8xMl5ic9vrV19pLXRp8oGQ2dMxgYhBIyx4S7+8oEn6X6NRAc38Yckp0Td8DioHqZ6UTAH9uzncgbFaIABYpyEeBtKGSJM/AFKzDEHqAkTJkyYOFU0KdSrdkYDKB2dCIl9qxFOTeMf29cp8E2Nap8ZLjBh4luLBq+xoVLmCbJwSNZZeYe+qlre26y1KlSOSe9jDHgGF6XyMzKlZBGbi4JJEc8eGGP3jsu6d1zWyzvq393f1K7ougEqZVEx7lMkWaF+v8HIJJuS7/zRpNwMe1w9nVDuJPHGf9GG/dr6h8HXxBgDXcFAQ3fxzbFF1HnXFAjjhMBvtlRScjfpN90clyZMmDBh4rShsy67KI9PlK4jEAaURvyjBjUr3k2Y+HaiQ6Hb6tQ/73S3G0zgkMHAo7E62XBrAeM3Nn6IGEsQydQcaUq2KJpapiZFPJuIdO27eUzGzWMyKtvlt/Y2rStrdcsGDXZ9Nyij0SaDUWoZTUwNcEKGQg0DEWAEVp7M6u9cMjIjK0E41fvBaUPE699gipvW7zT2v2/Ubg/QN6oHtkxmIBQmi+xrcsJQI8QANSQUEGCCmIGzx+HB15CsUSAkmCPShAkTJkx8TSTxSOSwogVrERE+4mE+nVn7SBUrbaVAeDDU0MEpZndsEya+pWjy0b3Nammr1qrScIVVyIxGXeKHQJlDxPMHWOYUWrMTODAZokkRzyHyEqWfTMr5yaScinZ5V53nQJPvYLO/ol2WdQMBivFpouh/ELJwJMMuFCVbhqRaxmY5ipKkr0tcxQSSfzHJvxgAaMNe1rCPNh1ijQepuyooC8cYMxAL0tSwDAA7MQ8OUlocmnOMEASEAUMJGcg1kKQPQ+kjUOr/Z+8+4Nsq7/3xf58zNG3Je484dvZOyIYECGGFQgmrrA4ut7T90wm95fJrb7ntvS20hXLbQlsKpYxAoC2jNIFAEpKQvXe87XhvydrSGc//ZR1bke0MO6OE5PNuXjSRpWPpSEfP83nmOHwKAQDgbBapdjHHLte4NGKcBFrTHNnZaVqQeZzG044Qf602RLpmFGiCKExNlnECAS5I9V71QKeiCETycdZq5NHRByaidLs4L9fywMTEqWkm5ENExPNFodNS6LTcGHdLd0htDyjdITWkckZMFLjTImXY5RTruS3GhIwJlDHh2BaEIbfedlhvL9U7Sins5VqIlLCgh7mmcl2PRsfoKnBc4KIoCDIxkUSRJDOJZsHiJGcBSx3NsiYLjlx87AAA4NwZ6xQnOqimi0erd3pHiH6wN7RsvjQyoV8PoU/Vf7Q/uLtTIx6NiExIk/VFWYiIABcgndMRt/JJa9ivGlOpjoU/xkiMjkg3C6zAJi4ZYf3ypIRCpyRjSAEi4vnMaZGclvPgeVqShIJ5QsE8fGgAAOB8ZpfYHYXy6jY9GApRdMPDre3qdWu7H5lgvTJLtotM47TfrT1VFlrVpPDYoBhBurPQVJSAWiHABciv6e0R3RXpyYcCp2NrMzIyiyzLKo53iFPSzZdkm6ammwudEmYgXuQYx1bsAAAAF5aAyv9tm295dYSob2lTJhJjmWaeaZO8Eb0uoGtcIF3tnTHBhQmp8nsLE4oSRJw9gAtPUOMbm8MbGkKawgKKrkTr/wKR3SRYZJZqFUoSxKIkKd8h2dF7CIiIAAAAF6Rav3bPZv+mFoVIPzZzngnRaqGxsX7fjVzMTxSem22/NseE8wZwoQppPKRx0gRPRI1o0YjIyGmSJIlEkdvRcQiIiAAAABe8Sq/2vV3+9xr16ALd+vFWnmAkymMT6akZtuuQDwEudLEd3Xjv9d+7B9uxBSEBEBEBAAAubB6F/6ki9Ex5sDEiRSIqaVrv9lGCIJqkZEm/JU96ZIJtBMaXAgAAIiIAAMBFoiWkrWiIbGlXj/q1gMplgbKt4rRkcUm+eYJTwvkBAABERAAAgIuRovOQThIjq4hhZQAAgIgIAAAAAAAAJ4VlbQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAAABERAAAAAAAAEBEBAAAAAAAAEREAAAAAAAAQEQEAAAAAAAAREQAAAAAAABARAQAAAAAA4IxJOAUAAAAAAJ8KXyBSUd+1qbRxd1lbS6enqt3b5An5IhojnmyWshLNRRnOgsykOeOzZ43JLs5LliURJw3ONcY5x1kAAAD4DNDDFKkirp0/tQgyF5FgxzsDMFyqpm8/3PS3T8pW76krbe5WNI04kcRIEIxrq+eferSWrurEdSJmN0tTR6R9bk7JrQvHFOcm4xwCIiIAAMBFL1xJZfNJ80Trj+dDZFUo50eU/V94ZwCGLhhR/r6h7E8rD2wraw5rOklibyBkJMqiWRIlUWAC03WuKlpI1biikU4kst64GFFTEs23Xjr6O7fNHDciHecTEBEBAAAu7ohYegnp3XSeFN0CkZBJo1aTdSLeHIBT4jr/cHvVf72+bXtZCwmMRMYYy0q2TShInVGcMSY/tSDVnum02swmURJUVfMHI82uQGVr9/6a9i1lLZVN7mAgQoJAXKeQkpRgeeDGaf/5hdnOBAvOLSAiAgAAXKwR8cj5FBGJSCZyfJFGvIQ3B+Dk2l3+H7z4ybK1RyKcE6NEu3nx5PzbLh196bicnLREQTjF0IBASNlX27Fya+WyjeU1DS5irOdPSJk6OuuP3148a1wOzjAgIgIAACAing/1CCJmpuJ3yXEN3h+AE9l0uPHrv/7wwNEOksREp/Xfrhj771dPGleYyhiLD4Gd/rAvEPGFFM7IJkuOBHOa3WyzyPGH6vQEX19X+tTbu2oaXSSLFFIyEy1/+N41n18wFucZEBEBAAAQEc8DMpF1IRWvwLo1AMf1148Pf+13a7r8YdEk3Tq3+Ed3z5tQkGr8SFW1Aw2ujaVNGyvbyprdR72hcFhVNJ2IJMYsZqnQaS3JdFxWkrloQu64vBRR7N2vrrnL95NXtzz/4UGVc1I1GwkvPXL9rVeMw9kGREQAGDat/IC+YYV6bq57QYlQWqbp2tuZAyutAVw0EdGYlJj/e0r7Gt4igAGWfXjg33+zOqhqGUm2x++77N5FE6RozPMEIu/urn11Y/n6mo5wWKXo6FOSRFEWnFaTTKxb1cJBhSsaqRox5rCa5hSl/X9XjrtuRpEs9RyBc/6XNYce/v3HXf4wcZ5skt/+yc0LpxXinAMiIgAMT+SDv5n+8OOIdjYvfE4kMxIYBSfPM335IXHkWGIMpxrgIoqIIpE8ikatJVMe3iWAmHc3ld/z+ApfRBtbmLrsoWunj8nuKYhV7dVNlU99sP9Qk9tYp1QySZPzU64ZlzO3KH1EekKyzSIy8qua2xs62Oxed6R5TWlzQ4eXNC4QLRyd+ditMxf0TT78ZO/ROx9f0dgdJEUrznSseerOwkwnzjwgIgLAcCLiR2/z3zwaPHsRkRFZRaakZcv3fMu06PM4wwAXY0QkIhNR8sOU90u8SwCGnWXN1/3w7x3dwUmjMv/+/z43KieZiCqb3d9atuX9Aw0kCSQwqyTcMm3EVxeOmV2cYTrxnvhtnuDrW6t+s/pwdZuHdF0UhP93w5Qf3jRdlnsesnF/3dKfvtfuC1FIufvKca/+6CacfDhD4mOPPYazAHDx0KpLaduaszXQ1CSwHotutjz8C2niJTi9AOf4Au6ijueIh0//CMa1f8pufhbtGBSGeeTQYXJcRTJWVgQgly90z8/+Wd7oGpmT/PaPbhyTl0pE7+05ettv1+yu6ySzTLo+tSD1pa9c9tC1kwvTEkXhZNeb3SzPKc74wswiVyC8p97FGVt/qKGuzbN4cr5JEgsynTnpie9srOCycKS2c+borFF5KXgL4ExIOAUAcBoERhZBUHNGmL/8PXnuVTghAOc1Hv0jmMiURkwkpYO0YHQx0kH3FKN/QkRt0YekENmItOifk9OJJDe1PkEjlvf8CoCL2+Ovbt56pNnutDz3navHFaQR0fKN5fc/v8HfU3zKpOn/tnDsk7fNdNrMsYd0BSL1Xb5mt78tGDELQnaCJS81IS/JFutdzEyyPX/fgktGpD38xnY/0UubKsIR9aUHF5tk8e4rxm051PjM27tV4k+9ueOamSNPuYsGACIiAJxNZoFposRvuMtyx9cErEwDcP7nQymF0r5CSbeSKZtIILWTuldQ+3MUqeuXEiUiF9HbRGuJOqIPTCa6jOhWomyiyKl+kULkepuS36WkpTjrcDHbWdr823/uI0n4/s3TF0XXj3lre/VX/rQ+JDCSBdL1R26c9tMbpkjRnsNQRP24ouWt/fV7Gro6/GHGSdF1IhIFJojCuHTHVWNzvjC9MMdpMw7+tSvHp9nNX3lxo4/R8q3VBalbn/jifCL60V1zV++oLWtxrztYv+lg/WWTC077+YfDYa/XGwwGNU2TJMlutycmJkrSsFODrus+v58GTWoTBMEUNdTvMM69Ph+danIc51yWZZvNdvK7qarqDwRY9BvObrdL4sAmLZ/fr2vaEI8WEwqFwuGwsYuJ3W4X+x+Wc+7z+Xh0gp/VajXJ8mm8L4FAwOv1hkIhzrnZbE6IYudm9QdERAAYBpGRSWBa8QTLfd+XJs/GCQH4DORDyxga8QIlzD92oymfbFMp+VaqvY98m3tTokRUTfRfRAfjHt5KVEq0mui/iaZEQ+ApsqhGzT+nxCtIROMRXLye/uv2oD88fXzOd26+hIj2Vbc9+MKGaD4USdW/fc2kn984zbjnx+Utv1pzaF+zS2TMIgk2uSc0mnnvgqWMsSOt3Tsbul7cVvngpWPum1siR1dDvXV2cYMr8N3l28hmemrVwcsn5F43Y0Rmiv3Bm6d/89k1qqK99UnF6UXEUCh0+MiRpqamQCAQW69EFMXExMSS4uKioiJBEIYVadauXatHE++AiCjLcpLTWVxcnJWVNZRntX79+kgkcvI4pGlafn7+nNmnqJy0d3Rs3ryZMcY5X7BgQXpa2oCDbNu2zeVycc7z8/LmzJkzxBdbWVV1+PBhSZI0TZs0adLYMWPifxqJRNatX68oiqZpM2bMGFlUNKz3xev1Hj58uKW1NRwOx94XWZZTU1PHjxuXnp5+1j/DwkVbYmKVHoDhsgiMWe30hW9Yf/4y8iHAZ6RdJ4kKn+uXD49d0mOo6GUyl0THoBK5iX7cPx/G1ER/1Bgdg3pyKlF4J3X+GSceLlo7Spvf2lpNJvE7n5/uTLCEI8p3Xt7UHIiQJJKm3zK98Fe39OTGiKb/9P39d728cX+zK9Ek2U2iIPQEIIdFzk2y5SfbsxxWWWAioySL5Aspj67Ye//rW1yB3t78b149cemMQuJcZfTom9u7o7ffecXY0dlJJLD3d9UGQspwn7nX6/143bqysrJAIMD6CILAOXe73dt37Ni5a5emacOob3Ou9VHjRCIRv99f39CwfsOGPXv2nHLtTB5NbkPBB8XR4z6t2P2P2zPJdb33x0M52qAXq3NeXl4eCAQGJ9hhPMk4XV1d69avr66pMXopY++LpmnNzc3rN2w4Wld31j/Gn0Ivok/VQ9G1MuLbAXROibJgEdlJ5tArOvdFdG3QA80is8tMPHG7gs4ppOoehXeGte6wFtK4qpPAjAcKTpPglAWbLJgEkk48blvRuX9oS3ywaFErCuzkBwT4LFUyGZMZ6ZNmWe/7vjhqIk4IwGeDTpR+DyUuOOEdzMWU+R2qe5Dk6PjSAyc+VA3RcqKHhjApkYhanybn53sODnDxeeXDg8FAeGRxxpI5PZfAi6sPrzvSTAlm4rwgLfGJ22dLohBR9Yff2fnarlqHRbJKok7cIkuXj8y4fHTm+Kyk1ASLKAgRVavq9G6tan97f11DdyDZKr97oCGs6i/dPc8si6LAHr1h6urSZk8gsre247XNFV+/akKq07Zk/qjy5dsaW7srG7oml2QO49tC13fv3u12uyVJ4pzrum4ymRhjRqgTRVEQhKrqaofDMaB/bIjiOwCNfkVRFDnnpaWlJpNpwoQJpwxguq7HDhLrzOScxxKmruvnw04NAmN+v7+isnLK5MlnfjRVVXfs3On3+433haLjVI3BwJqmiaKoadru3btTkpMTExM/2xHxo6OBfxz1qzqP/6woOr+7JOGqfLtFOmGmWtMQ+Eetvzusi325S+fEiF+fZ1lSlOAwH+e1RHTe6FP3d4b3dIQrupXWgNod0UMa1/oiYoLMnCYh1SLlJ0glTrnYaSpMkFItolli8R2sqs63toZeKvP0PO2TrwTHSGLMJrEUizgiURqbJI9ympItIpIifEYxIovIFLtTuPMb5iV3MknGOQH4zBBMlHzLKe7jWEymdPK10yenOtp6ovuIHNHkeRIakdBArU9SwbN4B+Bi4/IGP9hZQ4zdcMmIlESr2xt65qNDZJKIMdL5I1dPKE7vqcf/ZNX+Zbtrk62ySWSKrk/MSf7+lePnjEjvP5BSTkuwzC5MXzqt8Ger9r9f2pRiM71/pOnXHx9+5OpJRDSjKH3JxNzXt1SRLL62oeyrV44TBWHJJUW/fnuXL6gcrh9eRGzv6GhtazNySE9mGz8+KytLEIRQOHy0traqujo6PVKorqoaWVQ09GmEvd8KmjZh/Pjs7GyjE1LVtMbGxrpo35coSVXV1SNHjjSSz/HbsszmefPmGcGSMaYoyp49e4wpeXl5eSUlJcaPOOdDnzp4TomiWFNdPaKw0Ok80z0qm5qaXC6XKIq6riclJU2dMsU4pt/vP3joUEtLS897FApV19SclUT6aUZEXdc3NgW6IzrFwhajkEo5Jm1uhmyRzMd9VIVbeanU+3FjQKPoAG1GnLOIxqcmaolZqkm3DHgtGufVHvXDBv/a+mCZO+wO80i0ZaHnf2TMUI1u7h0NqgKFJZFZRZZiEUYkylNSzQtyrLMzLHJfsguqfHtb+O9VXnkIU0Kjnb8kEzNLLMMmTk+zLC1OmJ9lMaFHET5rZNZzgeizrrR+6XtiwZA6BEJqwBd2pdlzcfYAzoN6SgKZTjUfSc4gSwE1tlPTqY7WSeQhGkqFRyVyvUopd1LCZXgT4KKyv6KtormbLPK10wuJaMXu2oNNbrKbifNJuUl3zx1FRKtLm/64qSJBliSBqTq/YXzuj66bkhy3tGlE0xVVM0uiFJ15mJ9sf3LpTPWv2z6qaHFYpOe2Vi2dUjA6uj/+0kuKXt9eQwJtr+0oa3SPz0+ZXJSWl2RraHLVNHQN65m3t7cbi9MQ0fRp0woKer867HZ7akqKputVVVWiKPr8fo/Xm5aaOqyDc84dDkda3Ky/3Jwcq8Vy+MgRQRACgUCXy5V74ogoCkJmRkbsn+FIxFgMxsiE8T86HxiTSEPhcHlFxcxLznQ/sJbWVqNjVJKkmZdckpLSu52JxWKZPWvWmrVr/X6/IAhtbW1n91V8ChFxYqopxSJ2K3psfyYjtVV0RzwhJdVmokExLKDyZRXe7W0hlZPAonfnpHLKNuk3ZfHpaSaTqd8L8UT01fWB5ZXe3R1hT1jTec8hGWM9ia+3fab3V/CeqEk6UVjjIVV3hbUaj7qtJdjiDU1wpCTbLcbd/CqvcIVVneQhnDBOpOmkcj2gkTus13qUPe2hB8Y77hjtuGhTosZ5a0BzR/S4ZoEeDhPLsWPNpPNRdEN8QUnJkO/9trzo8zS09bJq3YdWlP9+XOrcK4vvHu5vDIVCL730cnR+PEXHkLArrrh8ypQpwzpIXV396tWrQ6HQ7NmzZ8yYfo5OzgcfrCotLdV1bjzP4uLiz33uhrNy5OrqmoqK8sWLFw9rPYB4kUikqam5sbGhra3N6/WpqioIgsViSUxMTEtLy+yRcaKW2p07d23btv0kM7UFQbDZ7OnpaYWFhSNGFNrt9pM/mfLy8pUr3zdOVNxB2KWXzr/kdEvNDz/86PDhw/HHZIwlJTnvvfee01htD/oud/Esz9HvKae91PIzKn6HmPmsHNLj8Rw8eHDr1q0dHR0ej0eSJIfDUVxcPHPmzJKSkuH2aQz3svrwww87OzvjL0xJkmw2W15eXkFBQWpq6mlfs3CB+WhfHem6M8E2oSidiN7ZUdNTc2WMdP222cUOm0nT+S/XHuGcm0Sm63x2UdpPb5hu7xsKV9vlXXmksayt2xdRHWZ5Rl7qjRMLHBbZZpIeuWbyvmZ3uy/cFQgv21Xz39dPJaKZRempDmtndzASVrdWtIzPT0lPsuWkJTQ0uVu6fMN65j6v11jBxW63D15CJj8vr6amxujpCQQCNMyIaASngcfMzy+vqDBGhwaDwWEd6/h/Pz8kJSV5vV7OeV1d3ciiolTjXEUnEJ7G0XoSIGM65ylOZ1JSUvyPLBZLRnp6ldcriqLX6/3MR8TCRHm0U6r3q9Fhor1kRs0BvT2gFiZzYdAZXFXvX3HU54lostC7i5POyS7yJRn82sKEjBSnIB57IU1+9dUK7xsVvnpfhPdESiYLJysYj/02xjiRohPXdScPmbUIUW9E7AprFd2KJJxsxuOgQzOjlFR0KnMrv9nvTrcK1xYmXpzfmK6I/psD7k3NQXNfx6we7aG6qcDyjcnJxFCynl9MAtM41y6/0XLvt8WM7CEFPDWwrvr1TXVvixZ9AjudfoNQKPTRR6tVVTVKEVEUR4woHFZEbGxs+n//74fG9/KHH3700EPfveyyc9KDsW/fvm3bthujZURRdLvdZxgRdV0/ePDg+++v2rFjR25u7jXXXHMaBzl8+Mj69ev37dvX0tIaP2EjvngWBCE1NXXMmNGzZs2aOXOm3W4bkOjWrFkzlKUIdF1PT0+fPXvW9ddfn5+fd8K2z5bW9es3DFjLThCExsamGTNmnEZh6ff7ly17rbu7O76qwZiQnOy8++67cOUer33OR0ojmUee7D5qB4WOUhJRVnT90pNIiY4yHWJ9TCHq/oBcb1LKvWf4Itxu9yuvvPL8889XVFQMqEdGGwiS5s6d+8ADD3zuc587R4u/+3y+H/7wh/v27RtwuyiKVqs1LS1t0aJFX//612fMmIFPHFTWdhCnwmRbhsPqC0b213eRKBAjySzdMDmfiHbVdexq6LKZJIExm0n83uXjY/nw/cMNL+yo6AxERGb0aLD9La6Dra7/WjzVZpKK0xKvHJ21bGeNWRQ3VLUpqiZLYk6SrSDZ1ukOEKeDdV3GVTEqy7F9H3cHIsNt2DFKCrPZPLjFzWQyGWMdjdlxZ+VciZJkTKVjpxufzkO6rmdmZJhMptbWVkVRysrL582d27tSyWk1JPWWoZybzObBR7BYLMYbN6xlhM7TiGiRxQnJpg3N4XBcRhQEag9Ts19ROR/QEljmjiwr99R71Vh05NGZDnMd2ucKTEXpTimu7bDOp/zhYPffq30dIV1kTBIGffQHNnPSgIVzBEZZFjYtRbSae+dc6Zw3+ZUmvzo4H/ITJ8/YX0RGnNFRn/bSke5Z6ZYU28U4lavVr33SFDzQGTaJQt9ZpQSRPpeu6WqCIJtRqJwnBCKLKESyCyxffkiet3ioJWLn7pXlf2oL1qiaziOnGfgZYyaTKX41Z1Ec3u7bmzdv9nq9RtEliuKqVR+eo4hoLGkd+zqW5TO6qMvLy1988S8HDx4yvvrN5mF3hpSWlr7xxpu7d++JTeg/SUnT1tbW0dGxZcvWr3/9a1dfvfgkr+vk2tvbV658f/36DXfffdeSJdcf/+MUXW9twPPRNK2ioqKqqqqkpGS4r3Tnzl0ul2vAARnj57QH6TNeW4mQ661TjPb0rKVIa0/2m0+076RHuzS6TaIynCpG6y/JcQ1Jpz8M7PDhw1/96lc3bdpk/NNut6ekpJhMJk3T/H5/V1eXy+VauXKl2+2+8sorExISztGJNOqvjDGz2Rz7JCuK4ot64YUX3nvvvRdffPH666/Hh+4iV93qJoFlOG0Ws1zR2NXuCfRERJ2XpCWMjM5C3FnXFVa0RLOo6Pr8kdnT8nu743bVd/xmU6mq6yOS7ffOKA5F1D/vrPJH1G11nZtq2haPySGi6fmpy3bWmCR2tMvf5gvnJtl6UqLDuie6rFxXd+8SmkkJVuIUUPWzewmc9QzXU1z1NWhyfuFsNcA5Hzd2bGtrqyiKDQ0Nra2tmZmZZx6D2TBv/+xFRCKalma2S95wXD1EJPKrVOdVFFU3xdUL/Yr+arl3V3tE59QXLkjhNMaq3ZwrTM52WKy22MlpCajPHfK8UelzR3RZ6L/waTSTCMQlRsZgT953uzHQVOe9vYiM8zwLjU02sb46R1jjtR61K6yJ/YeJ9iRVfpwObsaY0H9Nm2jLAe3qiOxr9V1RlHTO3s3zlNaTsdUmv2oWhdibyDklybwkgS6YdqMLgLEhvn79F2xf+LrgTBnKQwKKZ3Xlq9sa/smZpin6p/v8LRZL/GVosVg/E6d98+YtpaVlxmLZw21i1DTt9deXv/32O6qqDo528RdXrPQ1ftEQm4EHP5/Y2nHGcbxe7x//+FwgELjttluHVXx+/PG64UZEzvlHH310sX1/nlb1pO+PMeym8xVKvp0S5h7/zuFqan2SjE6/W6IL0hw6wWHzie40Ss2+EpSd6t3o+YgdoPbfU/aPT++lHDlyZOnSpWVlZUSUl5d33333XX311SUlJbIsc85dLtfevXvffPPNt956q6io6LTz4erVq5955hmz2fzII49MnTr1+JXj6NWUm5v7u9/9zul0cs7D4bDL5SovL3/99dfLysra2tp++MMfzpkzJzZT6Lz15ptvvvbaaw6H48c//nFxMVadPcsq2n0kMLOppyrrCSghNVp/5bwoJcFp7alY1rR7YjXRmfnHPi3/PNwQ0TSTKNw/a9T8kZlEtKep6+PqVoFRq6+389xiEiVR0HTyq7onpBiT/uW+qlVQ0eK/8JMt53ufRFtbm6IoRkEjX0AzBSKRSGZmZlZmZktrK+f8SGlpRkYGY0yMbh9yJjH9uDfyCykijk02ZVglV0ThceWLSqzKowYVzW4+9pl+v86/8qjfr+ixioqiU4qkfz6Lz89LdCYmUt8P/Iq+vML792pvd/98yKPxT2SUY9bH2vQiGyVFZzuqnCIaBTXmVcmlcrdCHkVwqaRzPs4h5CaaifUmVZ/KKzxKSCOb1K8Itgh8pEW3i/3e7bDOWsOsTRH4oJToV2lfe/CKAgcNs2/ksy6s8kq34lV0WTjWDywwSjdTQYLMREwf+vQJjCwCU0dOsNz3sDRlqLvEHmnb8n7FC13hBk3Tzofmv8suu2z9+vUVFZU9RWNy8u233/rZOPmCoOunk679fv/TT//f9u074pf5NnZLik570W02qyzLus4VRQmFQrHbjTufsnVGkqTRo0eJomTMvFdVxev1tbe3q6oaO4jx39dee33cuHETJ04Y4jPXdX3Tpk133XXnKWczxqutrT18+Iiua7hgT5oPJUq8lBxXEbNQYAd1v09KJ9X+OxX9heyD5n9GaqnmixQsIyGa/dKI/ofoEaKy4+XDx4gKiBQrJS0ie7Rb0v8Jda8mHjpZUNSJ2p+lpFvIOuzNcrxe74MPPmjkw4ULFz7//PMDmhVSU1NLSkpuvvnmtWvXRiKR0z5nlZWV77zzDmPsi1/84nEjYozNZluwYEFycnL8jffcc8/1119fXl5+6NChgwcPLliw4Dz/jBw6dOjdd9+12WwPPvggIuJZ5w4rxJgSTWt6rGjkZOsbTRq7URAoPdHSV1PS6t1+URAEgRlJ0h9RGzwBIRoAilJ6mz/8IVXTdGKCSWCxbdVCfckwtsii2x+O9iWeX0O09L7NBo32zaampoOHDhklkbE1/wXzGVCjr3HMmDFtbW0kCK2trQ2NjXm5ucIZ1P8ZY8FAoKa2Vo9rDhZFsdvtFs5NX8unUzvPSZBLHFKFR+1Xr2RU69M9ITXNzo2gfNgVWVbhbfSrsU45nZPMaHGqdk2eNTvFKcStv7+6IfDXKl9bUJPjTpXR0eeU+FynelU6m5hiSkuwWE1ST52MuKZxVeNhTQ+qmj+idYf1jpDqV/iYJDl+OQdPRC93KfHn33jSOWb+rWKW7zDpfUukcqKwxqq82rI6vs9DA3a60Iga/KqmqeJFFhFDGpW6I4pO8ZNCRaI8C2UmmjAR8VPXEw7NVn7zl2233k+WIa0W7Ql3ra56eWfD+yTQp955GJOU5PzpT3+yZ8+eSCQyceLE+JXTLjyBQODxx3+xf/9+rX9pIcvS1KnTZs6cUVxcnJycbAyCDQaD3d3d9fUNBw8e3Ldvf0dHxym7KxljaWlp//M/P40fwxmJRNra2j/55JO33nrbWG08NrT1nXfemTBh/BAHBXDOu7pcO3bsvPzyhUN/yWvXfhx7scaaCrh4B71tFsr7BWV8jVhf4ehZS7X/RsFDVLGE0h+g5JtJzuz5qZROrneo4SEKV1Pss6AQjSR6hugPRH+LTjs0RdcvnU90ezQlaslU9AdKvrX3e5s/TK6/Ut03SO06YUrUiaQ2avslFb403FezfPnytWvXEtGkSZNeffXVvLzjz3oVRXHx4sVnctqMD7kkSbFBpCf56A5u0CkuLr722mvLy8sjkUhjY+P5/zExvhYkScII7XN0HZLAuvxhTdNtFjm6JGl0Pf2+b6zcJFt06FrPLd5g77htsyTmJ9mrXT5Gwp+2Vlw2MmN3Y1d1l0/T9TkF6bMK0o27HW52M8Y0zh0mKTmaJEOKdrQ7GF3LkccWWazq8BGjEZnO8+ekSJK0/8CBg4cOGV/duq5HwmEmCD0vR9MyMzIGLMTy2W6pi77GrKys3Nzcuvp6xtiRI0cy09PPZNwcY6zL7d66deuA24WoCyciyqIwOdW8uimkqce6EUWixqDeHlRHcC4w5lP0V0o9e9vD0SVn+lIWp5lO9fP5cklmkmw+Nqiswq38tcpX4Y5I/U+/yilD5p/L0G7Ok8dkOhwJdlGSjeVNe7Oekex6vvW5pmkRVVNUVRAlyXSsnGgNqEe9yoCJiALxAiublWPPSe/XmqhzPjWscpP/yF6/yvsVmpwooGqapokX2Zdld0Sr8EQGLOYqMRqTyJKsmIX4aerdEH/CTMt9D0tjhrqdzr7mdR9Wvtittuq6zs+zHh2r1Tpv3rwL/o3Tdf2ZZ57dv/9AfGRijM2dO/eOO24rKioacH+Hw5GZmTl69OhFi670+Xzbtm1/6623TznncHBhZjKZ8vJy77zzC3l5uU8++evYUFVd10tLy7xer8PhOGkVQVTVY7909eo1CxcuGGKR6ff7P/lkY6x2brFYwuHw6fW+XrgfC6Ksr1HmN/u/91dS/i+p+i5S26j5p9T6FMmpJGZQyd9JaaBQXD6MpcTsaBpMJPoFUR5RUvTvOlGEKP+/KOX2uI+IQCl3UKSJGr53siemEHW9Qcl3kWMY6zB5PJ4XXnjB+Pujjz56onx4IkePHt20aZOx/GkoFDJW2583b97VV18dPx7V6D80al26rr/++ut79uwxhm2PHj36lltuGWLdy1jbQxTFE10ClZWVK1eu3Lt3b3d3tyzL2dnZixYtWrhw4Ul6ThobG1etWrVlyxZjS7S0tLQFCxYsWrToRI1fuq7v2rVrxYoVjY2NLpeLMeZwOCZMmHD11VePHj3aSIP79u1btWrVhg0bjH23//znP+fn52uapqrqtGnTlixZgsvozDnMkicQqXUFOn3hnGRbmk32esMkCp5gb0f3xNwUYkzTe2qfO+s677ikdzWpu6aPrOr0NnmDB1pde5u7orlRmFuY/t0FE4yhpE3dgfVVraLAgmFtTL4zLdoD2djla3EbUxBZUV5PjbSzO9DY5iWTVJR7fo15HtDVb3SpaZpmt9mmTZt2Ia0JHCtex40b19zSomlal8tVV19vMpnOpHGzJ0//CzuZPrUxflPSzImyEIqrowiM2sO8yadovKfM+udR/wf1Ab/KY31xEU4jLNrSXJqW47DZ7LEhuYrOV9b5treGdOqp78bnwySR35Cu3TPSPDorxWyzkSAObuvp/X+RJNk4HcbWib0/iGi83qu1BdX4LkHOSRao0M6SEqzUfyNHgShRoqlZLNkUaA3x+EcJRGaB+IlH5IQ13uhXazxKW0gLq5wRt0pCikXMsUu5dslpGvbF0x7Uan1Ko0/zhDWNuCwIDlnIsom5CVKGVZKFoVc8eGdQr/cpjX6tO6yrXBcYM4ss0SSkmMV0i5hiERNlQep/wIjO2wKaovP9neGjXlXqXxGUBbJJQn2QMS26giVjFpFl2USULv+qRk6yiExNSGK3f9V6w91MHlJbsivYuqrixX0taxkjTUUfzll6L/pfGkMpP1asWLlx46b4fChJ0n33fWUoC6smJCQsWnTl7NmzQqHQKdtBT/RkLrvssvfeWxHd+UOPRTiPx3OSiMiYMHr06MbGJo/HY3TFHD58uK6urrCwcChnaceOHV1dXcbzEQRh/vz5Rv8SxJXnCZRyz3Fud15L1okU2BMd7+KnsJ94HXk3kONqEhOJD1onPUK0kaiYaHb0m0KLZjxOZMqj5KXHOX7KrdT6K1KaTli4cSIpTC0/o4T5JAx1umBpaamxgujEiROvvfbaYVVDf/KTn/z5z39ubm4e8KNf//rXs2fPfvzxx2NjQQ8cOPD9738/VquLhVIiuuaaa2666aah9LOFw+EdO3YYLReDo6zf7//Vr3717LPPDti17De/+c2cOXN+9rOfLVw4sC9dVdXnn3/+iSeeqK2tjb/92WefnTBhwmOPPXbrrQNH0Tc3Nz/66KN/+9vffD7f4Iazxx577D/+4z+IaMuWLT/4wQ9iT/u3v/1t7G733nsvIuJZMSY9YUdNp9sTrGzonDchb3xOcs2hJpLFinZvpy+UmmCZOyJtTHriUbc/0SRuqGqrbO0uiXb3jUp3PL5kxrsH6466fKpOaXbz7ML0eSPSzVJv1ejlbZVN7oDAWFjTl4zv3Xx4T22HyxcigQkiuzS6UX5pXWdDly/FYRmTl3x6L4HHTV6Ib4PgcVnldA47qEyRZTkjI2PK5Mn/4i5EHveUBk/L77mxr3g9vVcaK52Tk5MLCgoqKytFUaysqjrD+ZaSKJoGjXRQoi6oiDg6Wc62iR0hLTYdUWAU0OioVyFdP9StLiv3NgfU+P7DRIF/LkNfmOtIcTriY/SRrsiahkBXSJPiApnOSWJ0abJ2ywjT6OxUc1ykPHXlOe6OAZVXeiJ+VTeL/QKQTaRRCYL1eGsPciJRlITo7v7UPyKmS/2P3iek8R2toY+bgvs6Qq0BzaPoisYZI1lgdllIMQvFDnl2lnVhjjV3aLsI1niUdU3BLS3BmuhCO8GeFMZFgVkk5pRZll2ekmJemGudmmY2iyc7LZrOy7qVT5oCO9rCR32qO9RzKC3azSsLZJaYXRKcJiHLJhU55DHJ8vhkc0GCZBaZzvmBzvDT+9zdEd0X0d0hPf78MaKQTm+18A3dbmICJ84Ym5cuf2dKEnY2+1fUJBkzCcRnXmH5ykNifvEQv9l3N330YeVf/FpXTzFxQcRDv99fX9/Q2toaCPhFUYpu9zciJSU5vqIWH+TO+hBxo7wc0BU2+JYBy6C1tra+/vry2H2MJ/bgg99YtGjR0H91QtSZPPmiohHGJLG+p3GKZdUEgWVlZWVnZ69btz42F2Xdug1f+tK9QzlRH320JhY18/Pzp0+fumbNGlzL/WNYGsnpxyvTLD3pzr+n9/0xJkb4NlHyzWQdR/7t/d43kaiJqJLo89EKQji+NpdN4vHGrYlOMuX0RMSTUIi0DdT1KqV9bYgvaNu2bUYrxuRhVh8ZY9u3b29ubs7MzMzPz8/JycnKyuro6Dh06FBZWdmWLVu+8pWvrF692uhsT0tLmz9/fktLS1VVFWNs3LhxycnJnHNFUSZOnDi4W2PwmoSqqj711FPGgqvXXnvtuHHj4n8aDAa/8Y1vvPzyy8ZWaRMmTCgpKXG73eXl5WVlZZs3b166dOnLL788IJs99thjP/vZz4w9wSdOnDhq1KhIJFJRUXEo6p577uns7HzggQfiU/G3v/3tv/71r4IgzJo169JLL83MzFQUpaamZteuXfv374+toJOTkzN79uzm5ua6ujpRFCdOnJiQkMA5j0QiY8aMwWV0VpRkp+yoaFOJby5tnjch75rphSv21xPJdZ3+Aw1dl4/NSbSavja35Lv/2J1gEtsD4SfWHPrNbbOs0X23c5y2r88fq0eT1IAlEt/ad/SVnTWiKHjD6pj0xKVTe/e1f29vXU+VV+Pjs5LGRxe/+XDPUQpExo7JGpE9vNxlio5AZoz5A4FgMDigjPB4PIqiiKIYXQ3OMtzTouv6iBEjUlNTje9/xphJlpOSkpxO579+2UJZkmLLqLrc7uzs7AGXbSAQYIzpun4arzSWsY1fMXrUqIaGBlVVPR6PMSj09Han0HU9LTNzzpw58TFbFMWDBw8eKS09F1PYPrXqeIZVHuOUD7uU2PaIjEjhrM6nNvgiL5X593ccG2JqnIzLk9UlBZa8NKcY1+Ohc1rfHCx1KTRoiOl4q7YkR5yYnTScfDiQV9HL3ZGeN7p/24NDohKHxKTjrBalE28Pad0KH1C4mAVelCCIgyLZUa+6vML7Qb2/2qP6lN7pmbyvHDfuvas9/HFT8ONG61fGJs7OtJ4k1oU0/lF94G/V3l1t4fagpug8bnePvgTbqWxpCa5p9N9clLC0ODHDevwPVldIX3nU93aN71BXpCusKzpncWcg9ncW3UbPZmJJJnFGmumbEx2T020Rje/vjKw46tejgURmA98BhdMRD9fcIeMgMqNxFpErdkJEPNdURXOmivd+x7R46RCvi3Z/wwflzx/p3MJ1rmvnbzrs6upqbW0zXhPnZLfbCgoKjnvP5ubmf/5zxZYtW9va2mJfrLquJyU5Z82adfvtt2dmZlRX1/z6108bSYwxslisP/zho6esqgaDoX379h04cKC5uTkcDhs7a0+ePHnSpImDmz/WrFmzYsX7HR0dsbyn63ptbe13v/tQXAEg3HbbbXPnHltD6J133vX7/fzYggfC0qVLh5UPzwWbzX7yUabRV8evueaqjz9eFwt+n3yy4Y47bjtlGVxTUxvdLl83ouaCBZclJjowHXFA2yZpbtK6j1dbiQzs4mNE3g3ERLLPId+giFhJ5Ip2IQ44u0orad7jpETdT2rHkJ5hy6/IcUNPXh2C0tJS4y/D2hzV6Je4/fbbZ82adc899xQVFcmybCS9jo6O733ve6+88kp1dfXbb7/9ve99j4jmz5+/cePG55577oEHHpAk6cknn7z22muNJnmjc37QBR7cvHmzsaKp1+utrKxcsWLFxx9/rOv6/PnzH3/88QG9jr///e+NfDhjxoz/+7//mzNnjiiKnPPu7u4//OEPP//5z7u6ur71rW+NHz8+Nj787bff/sUvfsE5Hzly5FNPPXXdddcZxwwEAsuXL//Rj37U1NT0yCOPTJ48ee7c3lVqd+/e/Y9//IOIvvzlL//ud7+LX0zB6/WuXbt25syZxj9vuOGGG2+88b//+78fe+wxu93+pz/9aebMmcbrxdb/Z8uk4ozX15cSYx/sqHn4lpk3XVL083d2N4dVzumNbdWXj80hoi/NLfmwvGVtZWuSRfq4ouUH7+764TVTMvqWrhFYv94ETdNf21Xz67WHVU2PaDys6t+/cnyK3UxEhxtd/zzUQJJAgcjSWUUJVpM/GHl3SxUJbMklIwRheFXf5GhTAmMsHA6XlpVNjxv8GfD7yysqjIq2LMvDWmksVrplZWUVnqBQ/hdzOBwWszkYCjHGqqurc3NynE5nrGAqKyuLRCJGGD5luXaS9l/jdDmdzqIRI0rLyoxr/4y+5gVh8CZbgiBcUCua9hRDApuSalpRF4wFD6MEqfHpr5R6P6wPBbVjozRVnaYmqEvzxbGZSeb+lYl6n7K1JeiO6PGjHHVONoHPT6FZ2Ql2ewKdQftER0ir8SgDrjKBeKaF8hPl44xcJYrotLk15Fd1SYhfcZ6yTXy0UxKkfg/Z3xn+3YHutQ0BV0RjxOTjdWkbi+7U+9SWgK/Zr/zntOQ5WVbxeFd+d0R/rcL7WrmnrFvRdC5Gh4Me50LlPffc0RZu8KkeRb9vrDNtUEps9Ksvl3nerPTW+Xq+1ySBWU4QTHm0S6k7rHcEdCtXAj6B0q1+lY50RTROVomdqLYgMjICMydyCnx8AgkilrM/95fe+GnsiVeFnCGN7tO5tq1+5Zqql0Pce/4sS3Miq1Z9uHz5G0b7nCAIo0aV/OpXvxzcPLlmzdq//OUlj8drrI0Z357ndnevXr1m9+49//mfP1AUta6uLrb4pyAI4XD45E9g06bNr732en10brqxkku0Q2PH3//+1vjx4x944N8HzBLs7Oysra1VVTW+2AiFwjU1NfFthB6PJz4Gr1u3PhYpBUEoKCi4447bzsX5PHlh1tDQGB9TR44cmZh4im7JcDg8fvz4/Py8+vqG6G5Yeltb+549e+MD8HGtXbu2L6v31Novv3xhXV09ruWBFDe5/0nWSQNvD+yiwOGBETFSR4FD5LiS2n7bLwsyoi1EmdF1a7QBD6kn3yeUcufA43vWUOToqfci0YjEKmr/P8r95VBejd/vN/6Smpo63DNx//33D74xLS3toYceeuedd7xerzEuNJaLYv0JsRrwiY5cX1//+c9/PlblNS6BgoKCb3/72/fdd9+AJqSmpqZnn33W2K5j2bJlsW46Y7v/Rx55hDH2yCOPVFdXP//88//7v/9rRNCnn35aURS73f7CCy9cfvnlca0wtvvuuy8hIeHuu+92u93GOFXjCVdWVhrfTjfddFN8PiSixMTEm266Kb42OazXC6dh4eQ8EhiJwpbS5t3lLdNHZ907v+QX7x8gq+mvu2q/e/XE0dlJsij8+ubp9768aV9rd5rV9MGRpop2z7/NHXXVmJwk67FWhrCq7avvfGlH9dryFmN9fldQ+ercktumj+htg/j4SJe3563PTLR8aeFYIvpoZ82+2g5LgmXJnGFvPJuZkWGxWCKRiCAI1dXVXo8nIzPTJMv+QKChocHv9wuCoKpqZmbm6a0+ys+b2eNmszkzM7OqulqSpEAgsH7Dhtzc3MTEREVRWltb29vbjThnsVgGdDCentGjR9fV10fXFWdnWCqfqEZ9LnyajUaTUszJ5n4tJbJApR79jepAW1CLJSBFpyyTfnMOzcx12BMSBiyAubsjXOZWNM4HdCEWWfV5mXJOkp3OYE8FjfNGv9oYUMX+YU8WqMBK6XbTcd+XnW2hFbX+AT8SGV2awgucFhaXKg91RR7f7fpHrd8d0U0CG7CX44A0ZREZJ9rcEnr2oLvOc5zVvX0K/0uZ54+Hug+7IsTJJLATBS6B9fzUJLImv/ZqmfeDWm+o//6qnaGe21884qmNziE0i+wk2Y1Ft5qMjomlfCtlRodJd4W1Q66IcNJ9s2I/YkTJJhrllEQJBdW5j4iFo4aYD9v99X/e9eiqut+HmU/XdCac7wF+8IjNwff55z9X/OY3v3W7uzVNjd8oIrYmmKZpnZ2djz/+i7q6Oj2OJEkn+nI3bn/jjTefeOIX9fX1xrreuq7FFvjWdf3IkSOPPfbfNTW1Axr/9BNM+YgX/3t37dodCATiH3LLLTefchnGs54Sq6ury8rK4vdavPrqxacs/HRdE0XxyiuvjN2TMbZ69eqTP8rn823cuKmvC1GYOHGiMYgO1/JxvlJbf0Xu9/o1MOphMo8ix0IaUDfTfOTbQvaZJKcdS4iMyB/dPX9UNCXGR0SdyD6j5w9XKP5Y/q3U9F80xKZxlajj+Z6HDEFsZYuz+PHOiTJ65E6jWaT3zPWJ3TkYDL7//vtPPPFEdXV1/D3XrVtXVVVlRNbjDuO8//77jT7SlStXer1eItq7d+/27duJaOnSpfH5MObmm2++5pprjIPHZio6HA7j62vz5s3oWv/UTSrJmJCXQpoeCESe/2A/EX1zydQR6Q7SeWd38Mfv7TU2vchNTnjl3vnzCtM7AhGNU2WH79H39tzywrpv/nXrz1bt/+Wag4+8s/OOF9bdv3zLh6XN0eUq9K6Q8qVZI//3ht59WdaXtTy/qYJEgYLK/ZePHZnlVFXt6Xd3k6JeOTF3SnHGcJ+53W4fO2aM8dlmjLW1t+/fv3/X7t1HSksDgYBRYJnN5gnjx18Ab9PYsWNtNptRwoZCofLy8t27d+8/cKC9vd24mnRdHztmjM1mO/PfZbPZiouLT2986afo04yIJclyrl0S4howBUYuhdrDPDaJT+NkEfh16dqifFtaknPAjiJhTd/THm4LavHLjRqzEKc4aWKaVT6zvbODKtV0K56wPiAgWUUa7xAddvOgkKavafA/vc9V3a3ET73TicbZtSW5ojPBHktMTQH16f2uNY0BnXO5/51VTqre81+9/1e9xEgS2MeNodV1vmD/UKdz+nu196VST4NPldmxRGf0QKqclOh/9f7VCbPE6nzqP2p9la5j3SOaztc0BN6o8rYHNbN4LBfwviem6L1HU/Weg2t9v8XMaIRNyLCbOPUctrJbYcLxN/TU+//hnPIslJtoJgx0OZ+YRdu8gpsuz/niuORLM2wjzIJVEJlsFiWzIErCeZgYB0SUwYll7959f/7zi9FUdqwXThCEhISEvLy8goJ8o6bFOW9vb1+27LUhNvjJsmnt2rXLlr1mVM7EPvEP1zTN7e5+9tnfx2cbY6/8wU9b6C8++u7evTv+nikpKbEhZOfifB53ekNbW9tvf/tMJBIxXq8kSZdcMuOUPYExl112qdlsNl61ruv79u1vajrZNLbt23e4XK7YBhuLFy8a3BwAvd/pahdV302195PrLXK9Sw0/oLKFFK6ikW9S8k0DU6JvLUlpZJtxrAwWieqJaojm9q8d6ESJ86jknZ57ll1NR7/Rc3z3P6j+u1RxI4VrhtqIrROJbnL9fYiVqlgbwWmfks7Ozj179qxZs+aDDz5YtWrVunXrjN62085ROTk5r7766nvvvffuu+++8cYbzzzzzPe///2CgoK1a9c+/vjjV1xxRfwUWWO5HYvFctlllx33aKmpqUZErKysNGb2Hjx40JiBOXgNm75vG3nOnJ5rraWlJfZtMH36dGN7w6eeemrJkiUvvPDCjh073G43rolPRaLNfNOloyiikkl6bUPZjvLmvLTE/7lztqxzEoU3tlb+Ye1h4565KQmvf/nS718xjoj5whrn1ODyv3+46YWtlX/YWP63fXWH2zyR6PQjd0gVmfDT66Y8dfMlcnQwWpsn+ODrW0MhhSLqJSPSHrpxGhEtW3N4/cFGkqWvf27q6Q2gGzt27ORJk2Lz5XoLs2ixqGmazWabO2fOcDv2Y82d/Gw3Cvce9rQuZ4fDMW/uXIfDYUTi2Cs1NuFgjE2aNGm4E3SNpQSM5zQw8hQXOxwOY1fh4Z4KPe6lHuen0bfG+PnZ/SR/mvO+ki3S2CR5T0ckoh+b6scYxccbnWh+knZTvmlEWpI8aNHFloBW5ooEVT2+l0/llGnSpyRL2U7bcQeCDp1P0Sq6FUWn+FGsxqoMDSH2bl2Ei7073fBoJ15Fd2RjS/BQZyQ2jNwYGDDSot+bxydmOuS+1tCIzl8p875fF+C83/aJWjTfZpv0ZJmHNWqOCIH+nTcio6DKP6oPXFNgL0gyxwLn1tbQS2Weep8qxc36M9KXQ+SZJl1i1KWyjgjT2bF+WBYd8bu/M7K7LTAuxWRUB2u9yoqj/lqPYhZZ/KswCZQt60kyF6IzCUMaBXUW6omyTOEU0ZlZopGJos1iDmu8zhMJRlR7tOdz8OQ1KRp3Wd9mkpJAYxO502Y6Z73lcDocltTxlnnjM+ZFP5mqJ9TZ4W9o9lY3eirbfLWuYFuY/KIscCKuGXOzz+tlbEKh0HPP/Sl+VKcgCNnZ2bffftu0aVONeQgej2fXrl3Ll7/Z1tbW3d09lIJH1/Wamuq9e/ca/xw1atSECRNsNmtDQ8OuXbv9fn/sW1vTtLKyst2798yePcu4Zd68ednZOZ988omx/b2RyrKzs+666674XxErpaLrT9TGChdBEMaOHXsac0KGKBDwt7a2ZmZmGiVfJBLp6OiMrqq/sm/+JJMksbi4+Jvf/ObQ58pnZGRccsmMTZs2GwWzoigbNnzyhS/ccaISd/Xq1bHhvunp6TNmzIjejoh4gpSoe6n9hZ4/MVW3U/FyGvka1XyZuv7am/0YkX8P6YGe7Of/gIx3TyY6HO3rmxLXU6gTOS6nkctJc1HVrRQ4RN511P7HY7PS2XAapbUUSr59KPeNrbBSX386g4q3bNnyxz/+cfv27XV1dbExq2cuISHh+uuvH7B1figUevLJJ3/84x/X1dU9/PDDH330kbEvhbGkqt1uLzjx/KuSkhIjBrtcLmOjC6PZ5SQ72sfGq7e3txt/ycvLe+655+65557Gxsb3o+x2e1FR0cSJE2+77bbFixdfSJuSfyZ8+ZpJz723tyOidgciP3192zs/uunueaPK6zp/8u5ebpMfenNHWqL19lkjez5RZvmRqyfdODn/z1sqPyxr7vCHVV0XmcCiKx7qnAsCS7WaPj8x76vzR4/u2+fQ7Q9/7aWNB492ELFkSXz6S/OTEyz1bZ7Hlm8jVV88rfCa2cWn/eQnTJiQnZ199OjRLpcrFArpui6Kot1uT09PH1FYONxeNUEQcnJyjIRpPxs9crHDZmVlGdvznvbHOz09/corrqitrW1paQmGQoqiCIJgNptTkpMLR4xITRn2liGJiYl5eXlGu/PANnezedLEiTW1taIo6ro+rFORnp5usVg458fd8MbpcOTl5V1Qy9UY83Enp5reqfVHIse/g8JprFW7JU+YmJ1ksdkGt4hUeZTGgKrzfi+DExVa+Jhks8XSr5cvpPGjXrUjpB53OKcenTVXmCilWo6d5a6wXtUd6b/aS7Rg1egfzfqq9u6eaNu3uoyi8+6I7ld0ua9/Rec9T3m8Xbszhy8uTHA4nayvl2x7a+j1Cm9Y41L/fJgs8SuS1ZkpQoZNVIkd8dDbTbwh1O8ZSCI77FbqPaE8h9k4XldYW1buKXMpAvXLhyLR5ERtYYo+yilaJaktzD9q1be4KKAd22pSFqgzwo90hbtDSopdNJbG2dMRprhDcU6pMl+QrM1LYalWURQFRaewxv0q9ym6X+HdKm8Pc6tI450WJkuMs5IE9tUi1h3W1nUKtSEmxcV+mWi6Q5/l1DXW24UsMpqVLpvM2CPx/CUyKdmamWzNHJU2w5ij6Al1dQYam33VTZ7KFm+tK9gaVL2SSZDN4nm3W2LUunXrGxsb42fxjRo16tFH/zM19VgxkJycfNVVV02aNOmnP/3f2ETEU7Ya1tc3GCu8ffWr/37llVfE5vc3NDT88pdP1tTUxK8+unHjxlhELIhqbGzcsWNn7A5JSUkn2lC+u9sTrUcee1ajRpWco9PFOfd4vP/xH48kJiYyRpqmRyIRIzbrfWu1mc2mhQsXfulLXxzuhP6rrrpq48ZNsV+0fv2GpUtvPu7uAtXV1YcPH4mNMl2w4DJjqtXZbo++sFLigCJOaaLK23oiYtHLJJioYxkZcwB4A4W3E1tIh2XyKD0fq1SiNURFRCV9o0x1IufVNHIZKS1UeSuFyii+ifE0ahypXyX7kPq9Z8+ebXSh79q1S9f1YS2m8txzzz300ENG92NqampJSYndbpckSVGUffv2nWiU6dB7CQbcaLFYHn744RUrVmzZsuXgwYOHDh1auHChruvBYNDo9xswP/C4SdhYP9noQjRq5Cd6SFJSkizLA1a6v/zyy9esWfP888+vXLmysrLS7/cfjFq+fPl11133pz/9KTc3FxfHv8yo/JQvLZ7w5N93UILlvW3Vz/xzzzdvnP7j22e3BpU/fnQoZKGvvLChOxC+b8FYo4djfFbSr26+pMMX3tvQubvJ3dIdDEZUWRLSEy3Tc5IvKUjNdBz7CJW3ev7tL59sLGsmxkRVf+r+BfPH5YQV9Vt/+Li2yW23yD++d54sntGYrJQoY64E74mpwmmvNm+32+efg82KZVn+/9m7D+i4int/4DO3bt+VtOqyLMm9G7DB4IZtwIlJKIEQWhp5LyQvIQmPGvLyJw9SXkIqCSQkGEJIAUJvAWzA2Jhi09yLZBXLlmT17XvbzP9or73eXRXLwhAZvp/jkxO0u3fvvdvme2fmN3PnzHn/21FVdVKK3b9nj50Zcemm6qqq6qqqwW61f/FHsNnZQ5bsqkr5IN7G/+bqkTML1AKHGNbN/jdZnAQldn4JO63c7/N5c6YgHoyIIaMrmTVRh6dyUY2HVvgUmj0LcV/UuHtHeGN7UhlogJzJSLVH/NpUd0Gpx/7p44QciFt7Y7kL+tkdla1JbjEzO/ESScgqD1Mgk7k+c0UJWTTGW1iQLx2aER7R2V93R/ZFzZzxpT6JX1Rinl+pjiv0ulSFCnSxZjnU2J27k1Er64l6dL43rM+xmJrqJn1pX/zV1qRu8XRvp909N89vXlZJTy3zFnjdoiRZnE0IJqNb4292HV5rhKYOZ3/M7EqY+W4SN9n2Hr09YcmHzlJq4C6fG2D/MU6ZWuxVUiPE7CFflsVMxjSTJU0rqlsm48U+J6eiIpA5RY5p7rytXdpr4YSVyEjCfVGcLCuil4z3MlFO/9GhyqKk4HfleCFQMeAsDDgLxxXMTr1JWFTv6Yq3tIb3tMbq8p0lo22HLct64YVVmZMP3W731Vd/OzMfphUXF1999bdvvPEm+wrlcFqNoiheddU3Fy5ckPn3ioqK73znW9dff2N6O4zx2to6wzAy60PkzE8Y4hnD4VAikcicAVhYWDjYnZubm9esWWuX5Bk4SlB68sknT5481ECaSCRit7MPjfM8+O1CKZ04ceLnPnfRySePZJjrjBnTKyvH7N3bbI+N2bdv3+bNW+bMOan/PV988aX08YqimA7PmHB1dKHRPEDqLybV95OqewlVSec9RCWk2SR3f4+s42S3SRJ21kmtcjEhte7F+NT/D3yK1PyVaHvInov6/vf9NDtFQsSJpPCqYd591qxZwWCwvb393Xff3bVrV85iEkN4++23b7zxxmg0WlpaessttyxevDgYDDqdTlmW29vbly1btmPHjmN+jlVVPeGEE15//XXTNHft2rV48WJBEOzOxng83tHRMVhCq6urs9/bdoy0E6NhGP0XdUxrbGy0w2FOjJw0adJtt91244031tbWbt68ecOGDWvXrq2trf3Xv/515ZVX/vOf/xwiqcIxd/XnTnn09bqGzgiRxe/f/9qsscFFsyrv/OKCErfyk2c3x3X+9ftfW1vfcdtn5pQEDnYoBT3qGZPLzkiVPB1QXDP+/nrdzU++19IT6/u8UvLzL87/0qK+7/Cb7lv/+Bt7CGPfPm/u/Jljjs0P/aEp+h8HWHFt1EXEco+crwqNNLuf7uBFcn56Pls+xlWc7xcGKjljML43YsQMlvn+tQhxC6zKI+a7lJxUuTdirm2Jb+rUHJIwUETkgkmpJhJysHdYs3hTpC+C9q8anFrmgZAh52JRQspV9rlKcVGl3+nzZxZiebsjuWZ/XMytkkrOyrcuqXGMKy1QHC67vzHfST49Tnpsn1EXyQp1BiftMcO0LFUWezTrqcZYR9LK/CCbqQ7Yiyvo0qpAIBCwF+eQCJlX6ZjbzraE4jEzc1l/2ptkoaRJCO9Ksv1RU7d4Ouvy1KDQiT55VllA8fkzXyj7kDwkNdqWMcI5EwSS6kN1qopDlrRookNLitmjD70Sn5YvFxYWEEHKOmEUo0yP38Qo+NQCn1pQnTdjdO7h/v0tmb15giAsX35W/0Wu08aNG3faaaetWbNmOPPLRVFctGhhTj48eE2xuvrEE0944403D22H9/T0hMPhERRpTFUE1TOjEedkiDE/b7319mOPPTbE/ouiGAgEho6Ig62ezzlvaGj4/e//sGrVquXLz5pzlFdzZVlesmTJX/5yf/rlePHFl/pHxEgkki5Uk1rDbVr6EizmIh59Suwg9ZeR6ntJ1R+J6ib3/ZbcTkjrW1l3S6b+dzchVxDyn4R87SJSvZLEtvXFS73x/c4DYIQUXUvksmHeffz48Wefffa9997b3t5+zz333HbbbcN84JNPPtnT02OvYHHJJZfkBLkPrsmbHs6afnPW1NTYb+Pa2trZs2cP+KimpiZ79LWdIe2HMMa2b99+zjnnDBYR7QXxBxyMWpAyb968r371q/v27fviF7/40ksvvfjii9u2bZtzLHpdYLjt20LvT76y6OIfP00kGoobX/n1C4/+v3NnVBfe/NmTJ1fkX/PAhpae2F/X7lq3q/WbS6dedkpNaWCoKQOdkeS/Njf/bs2OjfUdnFJishKP+ocrFp07t5oQctuDb/7yiXeIac2bWnHjZafi5MOxadr9e5/+3U69Mzng9Mu+VDHeJ5UH/bIy8JJZEZ21xi2dZS0/yBjJk8kYj+zOXtSec9IcM3o0yyOLTpHm/FNF6pNolYuUOg6P0YkZrC5sJEw24qocHTp9M6qEZF9mPtQs/kxTrC95Zg8xrXawC8eIVcX5qstDMw6pwu/Md0o5v/WMk5huWanfoQ3t2pYurS/ipk8CJ07Kzyrkp1b4AnmBzMUbJUmu8KnO1NL2mRtMWEwz+pqSYYP1allDuATaFzjrk+KuhMQHK7lKBSJKRJKFjGUrEozuiZg9Wvai+ZQUqmSMVyGi3Peow/+QDz8k7GPZ/VJbuzszVFBKFy1aNPRD5sw5aZhdVZTSFStWDHZrZtOQc55MJqPREc6MGqJLcMC9so7kiLMXxH76PuOpT2tqamLnhg0bb7nlh7/4xa+OdrrXwoULHA5HumjNO++8097ennOfDRs29vb2pgvVnHHGsvSYEfQijiQlWl2k4Qsk+iR5YjK5mZLWwe/cS8hthPx5Akm8Teo/ewzyoUyIdwnJv/SoHvRf//Vf9iTh3/72t3//+9+HfT1oPyGktLR0yZIlOTft3bs3PX9vsE/NyI6vvb39zTfftPsi7OmF9mRjewbRAw88MODFmo0bN65Zs4YQMnPmTDvvnXDCCXaR/UceeWTAejPNzc2PP/64ffnpiCtGVlRUXH755fanta2tLfOLyD5Yil/eD9Lnlk699oI5JKETgdS1hz/746e31LdTSi8+bcK6//n0l+ZPcEpiU0voun+8ecItT15y18u/fXHb2p2t21u6G7qi9V2Rrft7Xt7e8rsXt11618szbn3ii/es3VDfwS1OdfNTsytX3/Tpc+dWGxb7n7+8euNfXyMmH1fk+/N/L/c6MSALjo1/Zy9ifdj4445Qc8zsP6mBpkZ+7tVEXZAHCw8hnXVrlsm4LGSVM81TSLFLkrKXH4yZrDFshnQ+4PBsxolbJJUuIc+lZG5/T0hnnNPsvetfaJQeilKZHYOckBad3t9kyY7I1bPy3PagUk72x4xX25I5sVMkZHE+m1YScLhzZ7iKAhXpAHVBWapaA+dkXUuiS2M5a35Mc7EFJUpxnpeK/RfZpAP82HOeSg7ctLiRfXj2SNT1HZa+ObKgzJpeoNR45RKXdMTkHDfZrl5dZ9yVMWZVprzSSQpRmebf54Wm6F92RWfkS9Py1Un5arlb9igf/ZEkTU17M1qBQmFhYUXFEWbmBIPB4XRVUUqDwWBNTfVgdygvL8vcDmPMNEe4YIMkSZnRiNKDM5cGZE8gye515EeVrJxO5znnnON0HrxIZ5pmNBptaWmtr6/v7u62t2Y3fNetW9fb2/u97333iIvgp9lFa159db091yWZTK5f/9r555+XeaJWrVqdeZLtQjXpW9G6HUlKFHvJ375AridEH8Y74f9+SZTfkXND7/fbui+dOkjJTUQ4utJKc+bMuemmm2644QZN06688sq9e/deeeWVOaViCCENDQ0rV65cmmJP1UtN3A01NzeXlBwe9L5r166vfe1r/a9EpMeYpcoO9x7x857TD8kYq6uru+GGG+y1/qdOnXriiSfaN82bN2/x4sXPP//8U089tXLlyq9+9auZD+zo6Pj+979vV6m54oor7M2OGzfu3HPP/cMf/vDWW2/9/Oc/v/nmmzMHpcfj8VtuucUem3r55Zenl2HsTklH00x2l6MoiumVwdMLIdqzi/Gx+ED98CuLekLxlau2EZe6q6Vnxc2P/elbZ35ibk1Nke/ery25snbqHau2PrFl34HOyAMdkQfe2EMkUZQFhyIxQjTdZIbV13LiqcoWFpMpnT224MYVM86dWyMKQnt39Jt3v/LPtbsJ4+U+x/03nj1pbAHOORz3ETGss7u3h95oS1p84AGblNBtIdYeM0o8jgFTYpfGInpuyQJKSIFC8hxSzvIJbQmzNmTETeIQ++6U0yLmhPglUuURHRl9j50JqyFsiNlPLVBSLDGvmNXO4pwkGe01aYJnrR8oUhLV2UN1kYVFyuJKrz3QZlOX3hwxhexnL5D5omIp4PP0Xzk/2S+z8b6YR1SBSJR0JK3NXZpmHe5C5KmG45w8Oj7oGbAAjGaR/mdNFg5WlHGIAyyRL1DarbPnmuNvHNCqfPKUgDI9qEzPUyblKUHHoL0QIb0vIuacakUg4zyCB1e5/n16NfZqF1nXFicsIjKjxCXV+JWpBer0oGNiQB3jlb0fxcTY3t6RmayKigoHLI6S0xYcVuuX0uLi4iG2lir3QjOmQY68B8ztdsuynC7KSint7u4e4nmLi4szn8uyrI6OjmEuzUQpzcsLfP7zl/W/KRKJrl+//m9/+3soFLLTr2mamzdvefjhRy6//LLhH84ZZ5yxbt2r6fj68strPv3pT6UnhNTXN+zcuTNdqGbBgvmZM6/QizjCqBYj5I9REhne/Y0E+VOCzEuVsXk/A3tlQnyXEO8ZI3jo1VdffeDAgV/96lfRaPSmm27629/+9qlPfWr69On2UO2Ojo633nrr8ccft7sH7Yg4NbVoWzgcvu66626++eaqqqr29vY1a9bccccdkUikuLj4wIEDOc9SUVEhSZJpmnffffeECRPy8vLee+89SZI+/elP59yzu7v7l7/8pcfjsSt5dHZ21tfXb9iwwd6mqqo33XRTugKNoijf//73N27c2N3d/a1vfeudd94577zzampqwuHw5s2b77jjDnvViksuueT8889PP8W11167evXqurq6n/zkJ7t27br88ssnTJhgGMaOHTtWrlxpryO6cOHCK6+8Mv2Q1atXX3PNNRdffPGZZ545ffp0j8dDKQ2FQo8++ujvfvc7eyWDzMmcY8eOtUvj/P73vy8uLlZV9a233ioqKrJPIBxDqiLd/u2zLM7/vGo7cSn7euLn/fTZ737mpBsumONQ5XkTiueNL9rZ0vvUO42rt7VsaunpjOlWXI9FtYPzryilAlUlcVyBZ96EoktPHnfaxBKHKjHGn91Yf+O967Y0daXyofOvN5596vQKnHA47iMi4/zR+ujjDbGkxQdbk10USFOcNYT0KUEmS+JALV0rYfb/BeR5CvUpYs5ExJ4ki+lmvmQpItUY1Xlu669A4VVeSZAPnhCL8eaYeSBuSdkrLvok8uliflKeYJCsxfTjFt0TYy93kvoEydxXsS/FsZebIwvKnKIkmZy/3a4lGZdp5tkg411sYr5HVtQBg1bM4pQTTrNeNo9MFJHu6tT3x0yWsXKGxUlA5DPyxAKPs/+aH5yQkMEMRjJ7EjkhTpGnsh4tdopVXlGmlGVHd4kSTmmvzt7uSL7boQWahRqvfFKhurjMeUqxI79fUOSctMXM5qiZ8/q6JTrBK0oKlsj/txEo4YbG9WRfy57SfQm+XzPXdTDCY6KlF7mkap88tcAxvcAxKV8d45H8qvgROOpYLJZZq+ZoK3AOHaWGLgIhilLO2oYj5vf73W535oV/eyLTgJYuXbJoUdZqbIyxG274buaczKHZC130T79er+cTn1heU1N9883/G41GD1XisZ555tkVK1bk5+cN83DsuYV79+61i9Y0NTVt37595syZ9q0vvvhiZqGapUuXZO8b5iKOKKqtJeS9o3nI3lSN08tSpWtG+I1DCCkhJdeNcJdl+Wc/+1l1dfWPfvSjtrY2u0pnut/PrgJ68OqnptmFoC644IL77rtv7dq1r7zyytlnn+3z+SKRSDwedzqdv/3tb5955pnHHnss84H2iNDTTz99dcqSJUucTueBAwdOP/30M8880+4YT/fAd3Z2/vCHPxxwV6uqqm699dbPfS5r+Zb58+ffdddd3/jGN9rb2++6666VK1fm5eUlk0l7oXxCyHnnnfeb3/wms6tw3Lhxf/7zn7/85S/X1tY+/PDDjz76aF5enmVZ6WV4Tj311Lvvvjs/oyL/a6+9tm/fvp///Oe33357YWGhy+USBCEcDre1tXHOy8rKbr/99sxy+cuXLz/xxBPfeeedhx9+ePXq1bIsd3R0XHTRRYiIHwSXU7nrmk8WBdy/eOxtSxQ03fzBX19f/W7T/7t43pLZlZIoTC7Pm1yed83Zs9vD8bq20P7OSENEM1Jzf3yqNKHAXVXsH1vocztku8X29u7W2x5567ENDbppEYvNHJN///UrZk4owamGj0JEfONA8t4doa6kJWQsq8CzO/dESnoNsrPXON1g/oEiYtRgmsX7B0yPLLgUIWccY7FDuKBCXOwjnRp5uYvsihE5YxkGkZASB63wyOlMFTV5Q9iIGCxnPGWBzM8qUxZV+c2+B2WM4GK8J2mVNSZ+tkNLBbCsVLY7ZCR1wy1JCZPv6NH67/MUL833OIWBVnHsSJqhJMsci2vXj8lXBEkQdvZqUSOrqWQxUuZkY/0OpzpADNMs1hG3kmbWBE7CiU8m9mhDv0NcWOJY2xLf0dsXpzOPnqZWyJAJ7cuZGtuYTG7u1F5pSZxX7b50gneMN+vpdMYbI0Znwso8gZT2ncBqn0RFVI4aHTgnlsmtg60lk9KWBG/VrNc6E4THBFMvdEnVfmVKvjoxTz2t1FnjP167f3NahMd2BaEPbcCj2+0pKSkOh8Pp6Xm7du0abEqhIAj9090R+06Hb+LEicuXn/XYY4/b3ZKc83g8vnXr1pxcOnTrf+nSJffd95f0X1566WU7IobDkfXr16e7EKdMmWL3e2TEXfQijuDzTsiGo+8PfIOQz76fi1KEBL9B1Ckj3oAoit/85jdXrFhx7733Pvfcc7W1tYlEwjAMe6UZv99/0kknXXrppeedd54dtPx+/8qVK7/3ve8999xzsViso6PD6XQuWrTouuuu+9SnPrVhwwZVVSVJyvzguN3uO++885prrnn55ZejKU6n0+PxpLvcKaVerzcQCGSWPaSU+v3+kpKS8vLy00477fzzzx8zZoBKkhdeeOGECRN+/etfP//8811dXR0dHYIguN3uiRMnfuUrX/nSl77Uf32L+fPnP//887fffvvjjz/e2tra1dVlH2xlZeWll1769a9/PaeU8VVXXeVyuZ555pmGhoa2tjZ7t2VZLioqWrZs2be+9a1TTjkl8/7BYHDlypVXX331xo0bQ6GQIAgul8vpdJqmibqOHwRFkf7va0tOmFx6wx/X7O2MEqf86vaWFbc8vmTWmCvPmrF4ZkXQ5xIEWhJwlwxetKYrFH95S/Pf1ux6YdPeeMLo+2yZ7PNLpvz4PxeX5XtwkuGjEBH3xcw/bA3tDhnp9eWt1PLuAYkfMKh5KPTR1N+39RihpOl3DpB2EhbRs8ca2SsBumVB6ddgqvTKF0/0c8PxRoe+IZKwIkwWDz/KKfAxLiHoktNBLKKzupBhZEx05KnulyIHqfQ7RHegf4us1EuWkeif6zv3xlhOzdRenWmG4SbOXt3aHzNz2pMqJTUe0ekYeFXAxrAZ1q3MCZGsL9HxQqfIKd0bMZLZOZkTUuYkhW5VGKjV2JWwWmKmzg5HX94X/HhQFezhhZSQ+aWOz9c47t0da4xznVN7Lf7Mp0hnRcbJzl79TztMi/OrZgS8yuFnjJtsV8hImNx5aL0L+9Upc5ASj0KoiM/e6E+MFqVtCXbA5G+GrPm9kZOLHcfvkeVMH7LXKxsaY1bmANHRcRR08uTJtbV1h/aQ7du3v7a2dvLkycN+hY/l4Zx44omPPPJo1vdVY+PwI6JdtObBBx+Kx+P2cnMbNmzs7u7Oz89/8803Q6Fwem/PPPOMnHG/GGh69FcyUj2B9SP4zSYkTIh/RGNNJUKUWaTwyve/+zU1Nbfeeuv111/f3Nzc0tLS2dkpy3JhYeHYsWNLS0tzrn2MHz/+/vvvr6+vr6ursyyrJsVOYj/+8Y9vvPFGh8OR850wYcKEBx98sL6+vra2VhTFqqqqsWPHpsOb3+9/4IEH9OxFnAVBcDqddrgaulDqrFmz7r777paWlrq6ugMHDqiqWlVVVVNTkzk/MEd1dfUvf/nLG264oa6urqWlRRCEysrKcePGDVgMedy4cT/+8Y+vv/76lpaWvXv39vb2CoJQWlo6JmXAS0izZ89+6qmn7FPkcDjs40U+/AA/f5RevGTKvCmlP7r/tX+8siumWaZAV72z98X3mseW+JZMK587qWx2ZX5p0Ot1KUqqbIZmsnAs2dwRfq+p+/Wdra/vbtt3IGQx3tdu08yassAPP3/qRUunih+bdSngIx4RYwa7Z0foldZEegkHnso88/NYpYv+s432GIf7EkVCd4fM1pg2JqDSfusimha3+l1IFilxiETsP3qVUsnhIg5XZ2e0TdMEYqXTIOPEK5Eqt3iwEz+lW7P2hI2sFRc5UQRe6aRB96CX4T0O1SkJPOeH9OCSEMxOaBGD50xEdAi83CVK8sCvxbudWpJlrd5vMVLh4EUuSWekI2lZLLcdUOKgXlUesB5MfcTcHzMzH2Fx4hFImVPwKpL9kIBT/twEn19kT+1NbA2xToPqqcIQIsnNigIlDoF2J/mzjbEFRcqiMd70TRGd7erRc1YzUQRe5RYCmIh43CRGQmW5UDKvPdF38aTAcEv79mxgRkQoWjaqDsXtdmUWw+zs7DriYtzd3T2jLSISQk4++eQnn3wqMyk9/fQzw4+Ix5bP5805Renhc8NUWFg4d+7cdevW2UVrYrHYxo0bly9fvmbNmvR8y/z8/P7rYSAijoSZKlV6tCKpbDmyrnKLkuLriVR4rI7A6/VOTTniPRVFmZyS83d7TYgBH+J0OqelDHiNqays7P3suSiKdmA7qlBRkjLM+wdShnNyDrZYPJ6ZKfhkfGiqSgJ/um7FlZ+a/atH3npmY0MorjNZbGgNNezvvWfVdkURnU7F65AdkkA4iZsskjQSSd20Fw8XhL72n27VlPj/8xMzvnL2rMKAC6cUPiIRkRP+bFPsn3XRpMnTzU2Tkxqn9dkKweN2r+rWenQr/VMkCqQlwfeE9NnFTJVzG3PWQNX5Uklm0DrOmkUawkZ30hKFrNqj+Qqv8oriockAnJPWuLkvakrZFUodIhnnFtwOZZCjIzGDR/uPfaXEI/b9kaeK9Gi5kY7IAsl3SQO2VjuT1jsdWl+ky97oBDcJuhSd9yWx3Bs5D6iCQxb7j37jnGzp0lviFs2OiIUKq/IIzsMZleZ7nRdOojPypNdaE+90m3VR1qaRXpNqqTmcYmZQTNVxbU9Y77YnFlW40t2DHQnWEDayqu9w4hTIRK+gqpiIeBxIDQamnxqj3jg3ONY7rJeMm1HecKew//e04ltklEXEoqKizHTR0tLS0dFRXFw8xEN27NgxCmtmTpkyuapqbGNjk33VybKs9etfO+OMZYOtuvaBylzHP90OPtqNnHnmsrVr16Zfmtdee33GjJk7duy0t2wXqvF4PIiIx4BAyAialM5US2EE51smxL2C5F2IEw+Qac6Usr/9zzm793Y9vHbXU2/s2dTUlTAtQohuMV23QuHkoUal3UpjhHFCadAhnzqx+DOLJp4zf2K+14HTCB+piPhep37X9lB7wqIZtVU8Aj+vmM0p9QluX2ldd1Ps8BrxAiVRi2zvNs7SLbVfJ5s40FrrFic6H/S3rEczG8Nm3GRq5rLxhBSpdIxXIocmyCUt3hgye5NWTjlTn0jG+YTBSq0wTupCeuYEy/T2SxRiDxtIWsy0siIdTx2IUxEHWomCvNaWrA/pmaVqOCEugc8IUJ9L0RnRLMZZ7mqFTlmURKH/Vd+2uLmxPdmrHT4u+0RVu0iVTxGyRphQxeGcUaFMKEgsDyfqerWdvfquMNsd4Q0JGjKzWs6U9u1Ge1znpkFT43dNRpqjxoFEVhSnhPhkWuMTBRkRcZSnQ0plR7mT33Bi/vnjh1vWhXet47tuFRJb+5qhwqh7iWtqatKZwq7Csn79a5/5zPmD3T8Wi73++hv/lvXZh84+siyfd955v/71bw5/6VnWHXf8/pZbfmAvp/Zh2rZtuyAImSVSh07dA5o2bdrYsWObmvpCb2p25e6///3vhmGkI2L/1e1QrmZEbyxCVELGEPLuUT6wmBDv0UdESgj3keLvEophIwADmFhZcNPlp137uZNrm3ve3NW6cUdrU3uosT3UHE5GNYtQIc8pjQ04q4r81SWB+dPK5kwuG1PkEwQs9gMfuYjYnrDu3Bra1q2nByvyVFttcZ71yTGOgoBfUtWxHumtztQS7vTgTwwjZFuv2ZUwUsM7sz4YLokq2R8VmlrqqU0jEYMPOMD/QNzaGzEyW2CMEFXgFS5a5JLJoSGuEYPtCRsJ6/A8Op66rUAhY70yGaTUSo9mPdccjxtcEbOKhSqUjPMQhyzxQ4Gq/w83oWL/hBjSrMfqo6HsajQGI+OdbGq+w6EoWmpWI83+7U79J+0/LpcTsqYl8V6XZvHDEyxZKqJP8wsVXpX0v/wviA63p8rtGhs05mtaT0yr79WebTEfa7E6dZrTxcoYYxa3V2FMmqwpYkQNljOTs1DhpW4ZExFHdTyUZM7YZ6sd152U3/diDYfezff8ijTfJ1DTMriojsYfsClTJiuKrGnsUPlN9sQTTy5cuCCn6kPagw8+1NXV9W/pqopEwnZhxsHusHjxotWrV2/btt3OZoyxAwcO3Hrrj6655r/HjasZeuPCsZu10t3d/dxzz2emaM75lClHPeRVkqQlS063i9ZwzqPR6CuvrE3nw8mTJw245iTK1YzwB/8EQp48ykfNIsRNSPLonyvvC8QzH2cdYAiKLE2rKZxWU3jFJzHiF0aXD2mSa9Lk9+8Mr2qOZU5NMzmZ4GIXVgjjigKyw0EpneiXHULWMvEipfURa1/E6N8gCKqCRxJy0hGhZEsv29xtDNi2a42b+2JmZkizOPGIpMot+DImIvZqVl1Iz8lXssCr3LTSpwx40kI6e7Ihuqo5Lva7wJMv8+kBQZJlwolTFHIq2VBCEoy2JXnOkDaT8Ufqo+vbEpl9hHZSnZfPq/KcgiTKAnVINCcjck4OJLne7wr7jm798fpoa9TM7Bo1Oal2shMK5IBbHXyuiUBl1enxlRUHF0woOn+8v8wlZedWogjElzGyNWHxpqhpsZwiN7xAoflOGYvmj9Z0SKnirPaIf1pW8stFxcPMh7ztX3zDubRlJbEMyzjGrfZjWDuhpKRk5swZ6YDEOe/p6fnFL3414LqCjz/++BNPPPmhdSEqGQMTGGPt7R179gxVVEQUxa9//Wterzd9OKm6Nfv+53++/8ADD3Z1dQ34KMMwNm3a1NHRcVS5d7CXYN++fT/96W3t7e3prQmCMGHC+AEX7z6ihQsXOlI/AelXJ/2WPOOMMwYc7vtv6eA97hmELCCk8mgeEiDkzNQkxqMiEiJUkqL/xikHADhOfUi9iKv3xe+vjSQypiBanPhFfkEJO6ks4PEcLBo2MU/xyELIODxsSaKkXWO1vfq8MuZWs9JVuVsKOgWaPfleprQuwv5eF3epyrR81a8Kcmo+HON9uaW21+hMWqKQFagCMh/rETProR2IW03ZC/pxTmSBBBUaJ6KWsDIzmW6RjoT1Smv8LzsjPVpuLVPKySwvm5TnJqJEKclXBadIwxnLMlJCYiZZ1WrMqTBTJVWJXevlldb43TtCYS0rZpmcVDrY4mIp3+MkhDokElD6WonW4fmbRBDoWz1sS7e+yK3aZUsZJ3vC+l3beje0Jxkn6cO3OFEpn5PHpxWosqIkLd6dtBgnHllwiDRnxQt7ZxNcadK1HoOK9HDYT419JSUqST9As3h7wuLZGZsQKouCGxMRR2c8lBSBW5dPcF59Qn7QOayvBZ7Yz2t/SlsfppRY5rHv0uGc79lT//bb7wwdBkRRnDJl8tArE9ph4/zzz3/77XfS5VUYY9u3b7/hhu+ee+45M2fO8Hq9yWSysbFp9erVGzZstMtd6Lr+IXQkFhYWZV0eMq3f/e6OK674cnV1FSFk585dPp83p4TGmDFj/vu/v/PTn/4skUja54cxFo1G//GPB5566umpU6dOnDihqKhQUVTDMHp7e/fu3btz567GxsajKsATCoVfe+31srLSdEjTdaO9/cCmTVteffXVeDyefmkopYIgXHbZZSNL9YWFwZNPnrt27brMMav2igJz584Z7O2Bj+1RY4SUEHI5IT8e9kM+Q8gkQvSj/fQSUvgdolbjlAMAICIOamePfufW3raM7js7XizNM88a4wzm+YVDQzerfXLQIbTED7cSBEqSFtnRrYc1061m7W2ZRx7vkze06wY7nDwF2peIXmpJtia6F5S6Jvhln9KXEXXGOxPWyy2JhMUzu9HsiYhjvTI51LIxGG+KGh3Z8+iEVDzbHCa370hQycyMjhGD7+k1tvdqsYxxlelbC2X+iWIa9LvtNlaJSyp2SW2J3C7KZ/brQXd4UYXbKwsxg21oTz5QG2kIZ3V42otGLCtgM4q8DlXta9ULZKxHUgVqZMQxWSC7I/xPu6K9JrVXsWuMGI/Xx15picdMnhmPLU6mutniIqU84CaCWN+t/6M20pW0Kr1SoVPKVwW/KrglQRWoJFBOeMzk27q1xxti++OmnDGbkRKSr5Aar0APreuoWTysW5llWO2ezuYEfbXDKtN1zeJJi6sSnZavqBhY/29OhwKV1ck+etOc4iVj3MONb/sf4rU/E6xWlpoM+4G0Zhl7/vkXnn/+haG7nTlnv/3tb6qrj9wYnTFj+vLlZ73wwqr0GomMsba2tj/+8W5BoA6HwzTNdFF7l8t1wQWf+etf//YhRJFJkyaKomDPxLOPaO/evTff/AO7Rksikbjyyq/2r7J44oknXnfddb/5zW/C4Uh6ZULLssLh8IaUzL64dKbKPBxKaWYk65/B4vH4T3/6M0ppegt2GVhKaXpv7e1QSi+77NITTzxhxCfhjDPOWLt2XeZfBEGYP/80n8832NsDn92R0FOpbxchjwzjzgsJ+crRdyFKhDhOIcErcLIBABARB9WjWXduDb3XpdHsaFyjIQAAgABJREFU3rDpLvPCMWJVUUBRDq8HWO6Wy93S9t6+yJNZD2VHyGqPG6W+rMGQLlmYV+R4cX+iMWopGfe2U+KmLm1rt+6SBHv9Q8aIwZi9qD3NCF2KwMsdpCRjglzUYPai+Q4xa813ndM3e/j67gQh8ZwcKBAqUpKTD1mqgOdZQWt+mUd1Hqwi51fFOUH5vU6dZO9wj8Z/ty38ZFMsoEohzWyOWUkza9V+nqoBc4LHXFEmFQW86VB9UqHqV4RIRr+rPdr2pf3Jzd1GmUtihLREjW6N2QV+0gxOAhI/s4icVOxSHU5CyPYe7bGGaGPE8MiCKlJZoC6J+mTqkkRZpJzzXp21xc2o0RfI06+mPZlzqpePDyjpWZoW59mv4MGIuCPCvv9OuMART1osbrBJfvEXpwZVt4rP4b8tHsqKQtiXJju/fULQpwxv2Hm0ju/+Ee16njI+eL44Ng6FkKFC2lFNrvvyl7984ED7pk2b0ikxVRfZ4pzGYjH7PymlkiT+1399vbi46MPpqiovL1+wYMHatesys2vfmY5G7QMcrEzonDkn3XrrLXfd9aft27fb+S0dFId+RjvmBQKBioqKI74EOSchJ5uJoijL8he+cPk555zzfk7CtGlTx46tTFdqtZPn0qVLh7iCgM/viD5UqUue16VK1zxIyBDvlE8SckOqAupRfcz7vutlUnwjEf042QAAiIgD0y3+j9rI06kqpel2nEVInsQ+W8pnlwXcLndm/RaHLIzzy6+0JuPm4aGYkkCbYtbesD6tkEnZTaXTShynBuXWuGlyKmbX2JQpZYTETMaNw8FJyC4byjjximSMW8xcqS+ksz0ho3/L0F7sQThYICb3ppyfYMaJQyAL88yLq+SifH96FXtZpGdWuB5viHfpXMxOiSbjtSGDE5MSLlKamw85qVDZxeV8eqnP6Thc7PiEoDojT2qNWyxjiqS9jx0J60Dc4vasECFrJ83UENOl+ebycmdRnpcIoslIQ9gI6cyZ2q2EyROchzTecvDu9mb7dkzMrlLDORnrYEsLxaDPlT4TqkjdEu3fgtNTx7g7ZBLelzMrFEswk6mmCnz46VCgsjozQP9nbsGpZcPrPGQGab6P7fmlwHuZMVrG+R3VuhROp+OGG677059Wvvjii5ldYXYytEdL5uUFrrjiy4sWLXrvvU05TyQIH1SlpSuu+HJra2ttbZ29S5l7lVMyNEdVVdUtt/zgpZdefvrppxsbmwRB4If0O0sHuwM559XV1aefvmjx4sX5+fkjO+X2tjjns2fPuuSSSyZPnvR+f4okaenSpffe++d0iJ00aeL48eOOdPkAjh4jRCHkWkLmEvI3QrZml6JRCJlAyMWEfCLVQLCOvk3hPZ8EzsFpBgBARBzUq63Je3eEYwYTMoaYCpwsL7DOGOPKz/MJ/a6OTwwoTonGMqY2iZT0GGR3r77YYL7s+5d45YvGuRsixoZuy+REym4rCnZaGrwByTnxS7zKKzozatV0JK36sDnY4MehW6N2OCSE+GW+wGd9uVqcUpqX7kK0Hz632LmiQv1HfdLkJCclCtSe4ZfbG8kIKZHZZWXmskpvnt+XOUcwzylfUOXa2WvURxgRslLioUCbtTk7bSqULwxYF1VKk0v8suqw683uCRkJk0vCwZUPyaEwzA9vM3fHLEJKZbaimM8vc8qOw5PBvLIwyS+90Ew5ye1LlFPliDinMiVBJbfrFT6kWCWrTmpdOc3ztZl5bnl4vXChTXz3rTT0mmB9UJ2HnHPDMOyQcxTN3YwRj5ZlpR8uCEK6Uy6Ty+X69revWrhw/vPPr9qxY0coFLK3oChKaWnJKaec8olPLLfLnGqaljlzT+5z8AvTNM3MJxq6145zbt8//Yf+PWCBQOAHP7j5ySefevXV9W1tbfZ4V8650+kcO7Zy6GG0siwvX37W6acv3rJl68aNG3ft2t3e3h6Px03TtPdfkiRVVQKBvPLysilTpsyYMWP8+HEjLgUkSaLL5SouLp46dcppp5064Drjma9O+sCPeKIWLFjw97//Q9M0zrkgCMuWLRsi/xvG4ZeA0oFfaxgqJRJClhFyGiG7U//aUn8sJmQcIZNTq1wYR58PBUJ4Him+4UOrhAcAAMdfRKwPG7dv6d0bNSk9HDNMTk5wWxeMkSoKAwNWdR/vkwOK0JHMmt+kcbKtx+xNmJl1R+227vxy91eTOt8R3dTLdEbtldzpkCnOjjd2WMpXyFiPSA+NkGSc7ItYLfFU02qY7dpU1EwvaOES+BgHW1rAz6mQJpXku7y+nFaOVxX/Y4qnJaq/2mElU32lmX2bNPtHnHEiElLlYBeVmOdXu8uK8iU5d42pMyvd9b3afXXxfcm+h9hbo2SAcGjPWPQJfGGeddlYYe6YgMvjsXtxW+NGU9TULG7POhpsl9Ix2F7OcaxifbqIXVjlDOYFMjtYfLKwsMT5ZEOsOc5lcYDGgn26giqRRSyA8WGzGJ/t5/87t+yEIufwHhDjDb8njX+gJG7pH2DXjcvluvrq7xiGflQ1bwWBptfiW7hwQWXl4XKNXq93sIxxYkokEuno6IzH45Ik+v3+YDCY+aXU2dmRfjil1O12Ow5dBzn33HPmzZuXvmcwWDDEHgaDBddffx1jzA5slNIBFzB0u92XXHLxBRd8pqOjMxVcLUVR8/ICBQUFwxlMq6rqnDknzZlzEmMsHA6HQqFEImFZTBQFh8Ph8Xh8Pl9mUa4BLVu2dObMmUOfbYfD4fP5/H7/cPpvp0yZfPXV30n/Z0HBEU7UTTfdGAqF7Yg4WKGaQ6/1/DFjDo+SdTqdx7D+7ceFnmoCzCRk9qHQKKT+j3n09WnSDYqCrxLXiTi1AACIiAPr1djvtoRea41bqaqeB4MBJ0GZX1TOppfmudzuARuCVV6p0CHsDnGDHRqCmppbuK3H2BfRxgTUnBX/RElaUe3zifyf9bE3Oq0OnWiMDj1JRaB9uUuivEDm0zyk3COTQ/EmZrA9Yb0zYYmUHKFG46H+PiHVeykL3CuSEpXP8vHFQXpCkSuY73c43XSAth2dEvTcMMss2B5e22F16cTgJB2IeUa6EynJE/l0LzuvlC8u95QUFqjqAG16p6p8cbLPQa1HmpJ7YiRmHd5znpHxBEKcAi938KX57NMV8pTSPK/Pl851ikCqnaTFxcMmTzJq8sPrd/OMg7W3I1Puk8kUN/tkEVla4awoKsjsQux7V4l0TpHjshrHn3bHe4zDxQ5oxs74ZV7hEEUJEfHDtqzSc+44n2t4nYe8az2pvZXGNnOTWx/w5C9FUU477dT3s4WqlOHf35sy2K07duzM/M/CwkJVPRixJqcM81ncbveiRQuHfxLKy8vKy8tGfBIEQQikjOCxBSnH8DUtLCxcvLhw+PefPXv2MO85NgUf5/eLp3oLjwmREGEiKbwKJxUAABFxUDt7tKbexDRfVg+SRej8AFtS6Qn4/f3XdrflOaR5RUpC1w2LC4eChcmJV+Qx3bQs3v9Ksayoi6vyxvnEN1tib3Yau6OkU6cJRjV2sN+MEjvFEZkSVeAekRfKpNRBalxkdoFS4HGkw6rOuEj4ND9VKD/ioFKB9m3WK/KATIpUXuMkE31CpV8t8HlcbrcoyUM04maV+b/roKc2RdZ3mHUx3mMKCYvo/GDZUodAvBKvdPC5fn5aoTgu6PX7A/LgPQB5XucXppLp/tDLLdp7IdaWJFGLavxgVlQocYmkSGbTvOS0fDK70FWc73e6PJnxdVJAvnqa84x8c2vI2hMjrRqJmDRhkSQjll2Sp+/UEadI8kRW5eQzfXxOgTS+wOP1+xR1gMmE+U7p85N8Dm4+22K0ajTB+g5NpsQlEJ/EylU+3UvmBg+Hc/jQFLmGt6aF3s33/Jruu4+SY7/g4egXCoXee29TZumUiRMn4M0DMChGSPG1RC7HmQAA+AigH9Ck/17N7IwkTMPIqUbol2m+162qQ1Uo6YppXZE441l9FpyToNtR4HUOOuaKM0PXI0mtO2l1arTHEKIW0VJZTqREIX3xxiVyj8S9IneL1CkRVaKyrMqqmt6mwXhnTO+JJjhnZOgTQ4mQWmNQFuzsRBVJkGRFlmVhuOOdmKFpvTH9QNJq14Ueg8asvhQtU+4XeYnKi1TulwWHQ1VVlQ5jpBk3jUhC604YB5Kk0xB6LaIzSglxCzyo8FKFFajUrUqq6hAHGOLLicUMQ0/qRli3Qjrp0WmvSSOMaJwyTmTKPQLJk3lQZvkKcSuCQ+k7dUPtGGfxhNYU1hpipMsUTE5cAs+TeZHCCmTiU6iiqKrTKVBMRxx1+IF/kdqfUL2Oa0e9poWoUl59E6355nF9Bu65594nnngyPXdOEIQf/ejWGTNm4L0B/2ZaHdkxh7AQGVXXbWRCnEvIuKeJ4MJLBADwEfBB9SIGVCmgekf22AK3WjCChRCoIKuOfNWR7yfjR/wzJ9BSr1rq/XBqbAqy6ixUnYXHKu5Lss8r+7ykKiv5DXNeFyWiKItO2eH0EnJsrgNTweVyTnE5p+BzdhxJtrLd/0db//kBLYh/XHjhhReeeurpzHw4duzY4Y8sBfh4oYQwByn+LvIhAAAiIhw3v90Aw8E5py0Ps9qfClbLB7cg/ijX1NT05JNPrVq1Omd4xYUXfmbA8loA0NeO8F9MfGfiTAAAICICwEdIbA/Z/SPS+ZzwwS+IPxrs3r370UcfDwaD+fl5oigmk8nOzq6GPvWmaWUuSiFJ0rx5pyxcuBDvERgVOCeEj6KLfwIhtIQUX4dXBgAAEREAPiqYwZvvI3t+RXnP6FkQ/4NjWdYTTzz5wAMPaprWr+2du+i8KIrTpk39xjf+azjLTgB8GKhABBexLDJKZnEzg5RcRRxT8coAACAiAsBHAQ9t5rtuFcLrifWx6DxsaGhcuXLlli1bMxfcH6ARTqmdCc8668wvf/lLLhdmWMGooYwhE18mo6pYjYLVRwAAEBEB4CMQDs0YafwDafy9QOJM5x+TiYetrS2apiuKommaHQI5P7yAqN0rwzl3u92zZ89asWLFjBnT8VaB0YUqxIHKSQAA8AH/2nDOcRYAPk7p0OIdr/Ddtwp8NzFSa3EeWyrlZdfRcd8ZxUGxraGhvrGx6cCB9lAoZBg651yWZb/fX1JSUlNTPX78+GAwiHcKAAAAICICwMeAFePtL1IW50T+ID78gkC4dzr1TMKZBgAAAEBEBAAAAAAAgOMYyvQBAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAACIiAAAAAAAAICICAAAAAAAAIiIAAAAAAAAgIgIAAAAAAAAiIgAAAAAAACAiAgAAAAAAwDEm4RQAAAAAAMDxrkuzaiP6zl6tMWq0JYywwXTGJEHwSkKJU6rxKlMC6kSvkq+KOFdDo5xznAUAAAAAADgeHUiaz+2PPb0/+lZH/EDSJLJKKCV2xuGc0L7Ic/AvhlbilE4qcJ1d7l5e5i51yTh7iIgAAAAAAPAR0RDV/1gXeqAhdMAQCOHENAlnZIh0QymhApEkQmihxM6r8H5ton9KwIEziYgIAAAAAADHMY3xO3Z2/2pnT5clEkMnzDrqTQgikRUfta6o8V07NT/fgfl3iIgAAAAAAHAc2hPRrtrYvqbLIIYxknCYFRQFIqtTXPT2OUXzi104t4iIAAAAAABwPNnYlfzC+pamJCF68phtVFa8Irn9pMLPVftxhhERAQAAAADgOMmHnYnPrmtp1zkx9CEjDiWCSKhAKCGcpCYoMsLYUA8RJUWgd88runAsUiIiIgAAAAAAjHoNMfOTq5r2akPmQ0kmgqhaeolDLHRKDoEanPRoZlvCDPNUaDT1QevZiJJPIv9aVnlCvgMRERERAAAAAABGr4TFznupeV2PNej4UlEilM7Nky+t9i8udlW4ZbcoUErs2jYHEuZbnYmH9kae3Rc1+4KiMfBGFPVkn/DcmVUOkSIiAgAAAAAAjFI/3dpxy84YT8YHvllWS1XygxnBi6t9sjBUunu5LXbdO+3bo4zo2mAp8e65wUs/3pMSEREBAAAAAGD0qosYC/7VEDb5wPVLZXWaR7h/ftnkgDqcrbUlzMvW7X+91xw4JcrqqQHh+TOrJOHj25Eo4D0HAAAAAACj1i+2doSpPHA+lORqB3loUfkw8yEhpMQp/W1R+UQnJZI8wM2m8W6X1hgzPs4nHGtEAgAAAAB84JKMR3QWNy1GqESJWxK8siC/v66qHt0KGyxPEX3yETp+YiaLmdxgTBEEjyw4P7C5dnGTJS2uMc44FyiVBaoK1CkJ0kifsD5qPLo3QqyBRj5SQaXkznkl1V7lqLZZ4pB+d0rxOWtaklQgPLvSKWdJUdneq40faJsmJ52aJVNSoIrv5yx1aZbOeFAV5VHZV4mICPBxp2lGNJaMROO6OYoumFFKnQ7V73U5HaokiXiZAADgeNSjW290JNYdiG/p1fbGjB7NTJqMESJR6hBp0CHVeJU5QefiYtcJ+Q7laNJCl2Z9/72O51tjEc3Mc8gXVXpumhl0irlBcVuv9tS+yPr2RH1ED+mmybgiCgFFrPLIpxW5P1nunpXneP/H+F538q2u5NaeZGNU79KsqMH0QxFREohTFPyKWOaSJ/mUkwtd84LOctdRZJAHGnojgkKMxAC3ycoXxjoXFY1kyfsFRe6vVHvvaEwQrd+WBaElbub8jXGysq7nnj3hvVFdFugpQdf/ziwYftdl2p6I8b1N7W+0J3SLjfEo354cuLQ6MNret5iLCPDxxTlv7wj96+WNL67d1NbebVlsVO2ey6FOmlBx9pknnzpnitOh4PUCGPmHnRDe11xjyaQRCsW6Q1FNMyVJ8vncBQGv262KAqEU5wngWNoZ0v5U2/vkvsj+JCeiRBgjzEott8D7PpN9nzhKBKHvHxWors3Id3y+xn9ZtS+gHPnCqMn5xa80P9tF+uIN530bURz/WSH/5pTSjCii/2Rr1+PN0TjNfnZCDy4bKAiKpS8t9VwzJW/+iFLW+vbE/Q2hF1tj+xMmkZS+7bPUCoQHn+hg3Oh7ur5/qYNlLE9knyj3fHNi4IQC5xGfQmd8wbP1W6NsgBqkguATyRtnj6vyyCN7jdqT5qnPNrRqjFjZQ1gV520z/d+YnJ/5t5vfbb+tLk4skzCz76AUtVq2nj+zssJ1FM8eMdkZzzVs0SSiJftOkShRxh9dVLK83IuICACjIh82t3T+9LcPvbO5QVEkSjK/zUfLF5TJmMuhnvfJeV+6+EyXU8WrBnC0H3PTsjq6ou9taXzl9Z1vb2ls64gQ6vTmFeUXlhcUFOXlBQoK/AV57kK/NKZIrCwWgz4qy0RAXAR4HxIWv21r5521vWEuEVPPjR8D/+LRvhgpSpNc9IezCs6uOEJgeLMjsWRVU18SS7fkBUGh5PUVNVP8CiHkkabQte90HTAp0bXcgZQ5zyurCre+OdH//VmF6rA//LVh7eZNnU/tj1minDpGdhStCEEgsuom1vVTAtdODw79lO91Jxc912hmHunhIOe4tNzxp9PK3s8Vrjt2dF2/LZJdKJUSUfzX0orFxYdj886wduozDRonWevvO1z/Uan+Zm4JHfYe3FPbc9WmUNbTqc5PFUkPLhozqq7TYaApwMdUNJb43cqnNm3bqyoCIWx0tm8lgSaT+jOr3wr43JdesASvGsAwMcajseTbmxsefOz1p198r2Vfl+IOjJ8yY+qcxeXllU6XWxQFu7mlWWR/h7Wvnb1bJzhloTQoTKmSplQKfjfFEG+AEehMWl96reWlLosYFmEDzuCwo0B24OGcmAYxjV2WfPGrrbfO1L4zNTjEs2zsShBZzRohyZiuOF5vj03xK7/f2X3Dpi6TcWKZR/ql5URP6lT4ZV18V2jfyvnlR5zTSAh5sTX2n28eaDNoX/o1zRF8QxEtEROEm3eEw4Z16wnFQ9x3fUfcUhxkwLUuLPPCat/7TFZXTMx/eG/kTeImWrzvbFCBOFzLAnxeMKuH8+3OhC4pqa6/DLr2SKN204zCEudwI9XDjWGec8nAMhujnFEyqr5xEREBPp7NR7ZlR9NrG3bIsjDKRxIIAunuCa97c8f8k6eNHVOE1w7giCLRxKtv7L7zvtWrV72bjCY8JaXzlnxixuxTCgqCjHNmMdPQLYsKVKCUUiGFckq5xfneA6zxgPHmdmHWOHHWeCHfS8VjXftc08xEUktqhp6aFnWwyUyJJIqKLDlU2emQFSW3fcI4N03LHrJ2tM/I+75JqJQ6EtNijHGacVPqqYUhOgEY42ZqHD7N2SalkiQM2urWjVhcT2i60feU3H64KAqyLDpUWVVlhyIL/XpsLItZjOUcIydEFKh46JVI3YfT3GPkijzcRp1pWoz3Oxyhb/dGcHohU9xkX1q/76Ue3pc3chvdMhFEwqyDAz4lpe/NZ+i5nWOmYQnCTZt7Ch3SZTWBwYPoQMGM0h6dPdgYum5TF7OsrP6uI3xIGNHiz3S4/mP9/vsXVqhDVrJ5pytx+fqWkEkGXX3eHlCa/kxxlhp9ygcIirr2i13WSQXO8yp9gz3dm+1xPuCBCGKhxE4OOt/nS+YU6T3zy6/a0La+XdQYd0rCWYXir+YU55yEVP9q/0Owerj6clv0kuFNJmyOGW93J3Pr7lAadIiU8VE1fgMREeDjyDCttzfXiqLIORv9eytLUk9vZHf9PkREgKFZFtu8o/mOe1Y98NCrse6QnB+YfOpJc09ZVFxSzhhLJhP0UCyk/NB0KM5JX/uLCoQLlEtSX1YKx/ma96ztTeyUKeL0KsHtPBZN54S2v7Wntv7Apm1NdXva6ps7OrrC0aTBeV/akUXR53GUBH2VFcGqsYVTJpSPqy4eX1Wkqgcn+TQ2dz7x3NupxvNRt6JM3ZowofTsM2arivTU8+/sqW9LB1/OOeNkwSmTTpszfrCH1ze1P/LsW30pMvNbVDenT6k88/RpqiLnpK99rT3bd+1/Z3PDzt37G5s7O3qjSb2vNS9QwetSiwo8FWX5lRXBmqriCdXFYyuCpSUBUTi4P6vWbt22ozkVXGl6D0VK55w4buEpk+zw+cLabZu2Nck52Z2Tk06oOf3UyUc8G1090b/881XLZJnHY+jmhHGlZ54+3edx4nP0fvx2R9dL3f3yYWoQ6ZyAvKLcMyNPDSiiJNDmqP7s/uije02dCrlZK/WJ/N67HUtLPaWDdE+xAa/vGvq/9ke29mrMOjQekgp90ZTSg5MDqdD3v6YxcHrU4k93uH68peN/Zw/6a6tZ/JqNbSEmEjM5ULDoy71OZhQ5BZ9MZYEajHRrpDXBmOIghpYbFDknlN6yqf2sMq9roIKnBuM7Q/rAa12I0ow8KU8+Bn1v1R75ySUVuyNGj84KFGGib4DyB6cUuXzMCKXmUua8uE80Ry+uCgynM3NNWywqyMRI5mTdhUUuYZSN70dEBPg44px3doWOm/IUlMSTWjgSxwsHMARdN//51Jv/98sntr5XT1TRXVF24pwFM2afrCiOZDIhimIqdfCDXwGpcgSEsFQwpPZs5FRs7LtFFIgkku4I+ddG1tTOF84QSvNH/nWR1IzN25uffO7tZ1e9u3nnPiuSSPWLUSKKWd9CLNXVYLK+eOR1TKgseuieb8+aVmnfuHVn8zXf/QuPaeRoW4SUkEjijAtOW7pgqqpId96zavUTb5LMClhJ7dRls+76zVdnTKoYcAObtu298eq7iSwdvsZPKYlEz//CGfNPmZgZEds7w489+9ZfH1q38Z16LRSz+w2JmN2dYqXW/uaEyJLT6/rcOSf/3w8uLQ4e7EK596FXH7pvNaHi4eeymCTSb157/qGIyP/yz3UP/PEF4pCzzp5lzlk0Y82jN7ldQ03bZpz/5aF1//3tP/YdDsk6nDPOPfXE2dWIiO9Hl2b+YVc3MWlOhPj/7H0FfBzXue+BoWUQM1qWZNmWIWaOYzsOcxoo3KYpt2nv67sp3RSS2/bepvh606YpJHHQYXZiiplkkmWLmXelZRg65/12V5Kl1Yps2Y3b/XcbS9qZ3Tkzc858/w/+H8Pgn8xJ+MpMy3DB0sWJmttzTfcX+L50uKctGA4njvD3KL1E83Kz65slCVM4AqIesIsRvw8It4DXUGV1CrciSZNn4BgIu4PKvh7/ti7VTdgQYYuxjgR/WyNvTNcvG0O9Zl+v/7BTBsoozgYRwMyyBO7T+calSdpUDaNjEQJApdQjk1q39HSD8+kGiQAYXRgpS9U+bleX97qsGOWXLpl2+eXY1TAIzbZowKDyz0UCQVhsHE8YL0vLbszQv9wpAWkkwVPkPV1yd1BO00wsWvNai4uS6BAilsRNGWmftJs5ThHjiONfkyNG7MArSa0qelWNI444hhtSnsBvn/zg8d+/4+53Az1ntiYtWbG+cGYZpVQUA+GUgcgMoiE2SCGN+O8jfJEQilDYyhpYGmB4OyYcazzTRPs9cG05KMqAF+BW6uh2PP3S3qe27Gqu6aAIhriZUQuGJ3oO53JDC5RKmuo6HU7v0Jssxhq9xo/RhVBECAUtHzl6rYYPHYAwzJjT8wcP1fz+z9t+9oO7E8y6GKYSg4FRM5IihpYkXsMNPyFNrbYf/Gzri1v3EVEGWh6YdTErzs7/kdJAn6u2us3jDQ5RRK3AQaOWDk/SUwnCSODPH7AgcMCkAXwURSQ1Z1uff/PQFz61epyTYe/3/u/fdwKDFgxP5Q0Ph9PyOC5re3E42BvoUTFQR5I9lrstnX+oxBpzl7WputdWZ9y8u62DckCRoh57O7u8U6OIYZY4+L38+mTup+UZUT0tvjDDUuMWv3/C/l43iMESKZEA+5NTve+uz42ZbbqrywcwG11/iBCL0E/mWr9abI2KBWIIzRxelKhZlKiZZea/c6KPKqMIH8bvtntiUkS7qHgUEttaobTQyMLLeNN+rtDyakeHCkZmnBLVyfA7u3zjZAUPLBEeab8tAKIShDFTasCzzJ84QT4Un89xxPGvSxPjiCOOfwo43f7v/3zrj3/xqtsTADrOaE5YuvKa/BmliqyoqhxOMRsACTPF8z/TsLL5MIQ16yM/AAIohJRjQVc/+eAoPdM85WWjtqn7//74+Z88+mJTfRfVa4BeAJH0SApiiCgP/yNGQMNhjGOQq+k3hRBgmWde2LP1rUMX3PvH5Q5897GXnn92J8EImLQgIvUTUyh66I8QAo5FGg4PTzCDY/LcCUfhCUjPvLDX6wuOs9Vzrx6or+0AXDxCcElw1iUCNNqFAcfvZzDLzG9ZnmFhw8WKI/ZDPLpQQ50T7soUXl6VEbPn4Uwj//zK9DszNYCL1RFRlvbapY+7fTE/uMU3qngSQIDwL+YlfrPEOn5z/K/MtK5IYAE7KlinKhX9ASVW6qxDHLtlM1HTtezlvL7LU3Wz9QxgYkyfN9s8Eyo7vN3u8WEhOoiKmdtzTdwnT0U6ThHjiCOOOOKI4wpGUJR/8PNX/vDkBwQCwCGNoF+wZHVOXlFYk0YJ60QQSgYQ+mXwNxD+SY38gYZ+OP9GWNQqvDGhhHIYODxk5wlytnUKB9bUbv/+oy+9+NJeESKg5QEcg2HCwdcFA07iNT54RvSL//O7dw6faLyA76eUvvbe0Ze27gMGTYgcxg4b0vP9CSCIHUcFF3cSEKyqbH7prSNjbdLn8P7x2Z0Ax0OFlwo+ObaLwadM4HpYnKR5dnlaEo8Ar4m0KwScwFPly8XWCzkOhp2tA79blCaMLTbFIfjbq1Jmamg0L43crJh5usEx1o7RVSocf3uG5kszJ3Wot+aYwvWQUWSPdPiV/qAa+9QhHEPqBkCgqibushIZBoD7CswQj6KIirK3298VGE/ZVaX0lSYXjYq+QqRVpFtzjJ/AmzlOEeOII45xTR9Cx8nwpBG7UiFjdlilYCBUEdOqUskEu8cRRxwT4We/f+dPf/0orEcJMcRFZeX5haWKIquqCgCNBogKJQ5GDimF5zegNCw/OPBWOBOVxdTpJbtPkeaeSR1VICj9/qltr755mLAMGN0HHAJAKJAU4BeBJxB+BUM/ByWghMUeJ08aFRU4fRO8XN6ANzjeOkMB0PKNNR2P/ur1HptrqpdAkpSnXvh4oA161DAlBbj8oZdfBL7wy+UDTn9ovLISlg+ZvlsBI4cn8MJrBzzeQMz3n31lf2NNO2DjIcRLhcSY0jJEfbbBGZgoQL0uVffBusxb0vgEHhsZtNzKvrQ8dW2q7gK8BRDQH5cnGybqXWHi8A/mJI0xreRd3X57LM52Y7YRUHI+WIoZM1R/Mm7XiuEoNXExdFAp8chqnxjj6yRCY1DKAWljyl/24NutuUYLkKJjxUR1QWZHt3ecHU87xFMuGagjx85yq9O0+Tr2E3gzx5eJOOKIYzx+CDGEAKlKWEVw1FKMeRZzCGEkeUSiEjhysY4IFWIGESVka454N7TmIyxgzCJAgegVQxvEy2DiiGOKeP6Nw7//33cVSgGDASHJGVmzZi8IN7ZQEUIRKjj4PzqkUzP4b0ThEISzTcGQkg0Y0DkdsjZppDaRwcDmpPsqqVELrRO09QYf7K587qW9oa9hR0XVCAV+ESJoSjZlpVlNRg1CWJZlf0Dqd/p6+jySOxCiT2zM0MFIqCQ11bJpdRketzWHEpTL5xXwE2ZX6oX3P6j4w992fPcbN2iEKRhtXT3OyrPtgBu1i6RkpFvXLC8pLsowGTQYIVklDoe3tc1W3dB1rrbT2dRDvKI6XT6y0GoNTp5sfPW9is/euSLqTYfL/9Rzu5V4T4tLiRITH4P/KPIRJ7xvX+fP5iUXjSuIUmLin1uR3hNQFErTNewFPhIZZo4Br0/XT2bb6zINM7W9NX52lKSqalfYY32BTRnRn3NjluH7juBvalw+EBoLIuoPZ1tz9ZOdLykahgFEgTBqdssEeGLFWsc5BxBQfNkpYqrA3JBpeLpNBFK0I+aNVs99eWPqmr7S7JIZbkQfy7CZdU++6ZNp+8QpYhxxxBGTHYZeumR9UkkKoNBW3ePt9iB8niVSQjktl7OqUJ+iRxzuOtHeWdE2nOZRQlktl1icorVqna2O/gY7HcYhKaX6REP2ynzeyKsyaTvQ2Fdnh0zcdokjjimgsaX3p798xeHxh8gJpTwvzJqzQCNoZFmCYX4YbmtBAMXDKCIJJxARQkIUEkSEawa2DFtdA2SRnk+PHJz0EXnOxi5ysh6tnA3HiUXZ+72vv3Wkt70fGDXR/FAlWFWv3jTv7luWzS3Ntph1DIMhBIRQVSWipNj7Pc3ttlOnW/YdrMETNu+XlYK8lJ/98C6BZ8fjWRSw4Y6LEyQsIAgwfvwP7yyen7f56vLJO63au/u9vkB0TzNJsVj1//WDu2/dvIBlMYNxxCqWFdUfEL1+qcfm2rWnyun0sXj6OmYzTF+f95W3Dt9y7QKTYYQ26TNb9zXUdgAmnj52CTHPyicx1EZxdJMGRXq/Gx7Y1nJDpv6GTP2CRE362J3WUzQXZ5xj5ros/SQfpwKGmzIMNY3+GMwWM4dt/tEUEQLw/TlJt2YbD/UFgyqdbWJXpEwc6vQopM4lHesPbu/0xhA1DfflFNUY05PDCIzRnYtQoPwj+nbdX2De0tKmRrFcRd7fo3QE5MxY5ZF+lbzd5ok+XMxksOTqNP0n82aOU8Q44ogjpkFFNRbtzBtnJ5emEklNKEqqfbfK3eFCEfMiRAWBMdOUt6YA4pAlqk/SB/r8fbW9mGci/JDhcNaSnMKNxYjB3h5v867a9mMt4QZIkBKKWJRQkpyzPF+VVIoAp+X8tuN+p29ii/DSgxAaCIiYQQLPXbpvUZTQ8wVP2jQkhPr8QZ5nuXiSWByDeOx3b9XVdUXyBiGlaZk56Rk5oiRBMJhGGmF6lFCIBrgfHWwXH84rhYBQikL/pzTEHMPCNiDSG+O8smnEkx96B0FAITxeT3NSQEH6mEbomZr2nfvPxpAeJZRjmcceuefz96wyhqNqsfZOW76w8NZrF3p9QcMkGjAgiMxG3XDBz/FWtgnjdRzj9wb+z49enF2SnZ0xWSVJUVTo6LbXqmo2agtyk/W6EYogOCxPajWD7HRreWlWUFQ0mulbakI8Hh45WvfO9pP33rJ06M9OV+DvL+0NqgR8AtbYf2Ik8MwtOcYnW8QYffNl0YXQlrbAlhavGZGZJr7cqrkqUZhnFWYYOGYao2GKPFa/iphYkaL9bZ071mwhVS5xrL1KzHzJRCKcDkmtdklH7IGDtsBpR7DVKxGWDwtijUX5YkxPHQNDfHtU1DHMKrFf/QdwxMXJ2vlm7qhTHaFAS4ib4bd3+j5bGEPXdH+3vyFAgDqyEJFhb8rWmD6pzvG4qRFHHHHEsKIQRGnzMpNLUyWPCCg151hzVxacfO5YhCKGLEUGGTLNEKOgJwgBRCxjLUy0nevBA9lq1JBpyl5ZQCkQ3aJgFLJX5Pc12H29XszhEIHUsMZMsywpoifIcAxv1hiyTF6b5x9OESVJPl7ZcKqqSacVliwozs9JvRTdbJvbek9XNcmyPLs0Lz8nlZlo1EFROnj0XE19h9mkW7m0LD3FGk/KjWP73qr3Pziu0oFcUIblCmaUhqwvVUUInaeIBMBwQJEAggAKMz4KBxNNw7+FLDYCAaKD/fQJGaypowMSMwQAFGKbhAKMqMcPTtaDVCvUCbGP7XRVa0dbHxhN2xTl4W/d/M0vbGDHvechQloNr9Xw08P6pgqBqz7b+vBjLz/9uy+yk4u56XU8wihs4A6bmDzX1Gp/5uW92RnWrPTYbJNlGXbanT4sY+t1vvHu0euvLjcZBzj2s6/ur69pA/F149Lj27MS3mxr6WHYGHE5QiIt9ZwIHXYoh12+PzV5BaIUm/ir03Qb0nXzrYLuIsO8EGmhmqefQpp0oZHniCyN5mCEtIXld6Z0QJ1+pcoZPNIXPGLzV7mkTr8MWD60iqjhsKoUnOqALDzLAirFSDilAGGHqFz+S4wBuD/ffOyUkyrRR/Rmm+czBTFyTV9udlHEgOH9LiDEsnRXbuon9mkep4hxxBFHrKcMhroUQ2gFZlFEVyLoDg4IEkZkJChQgrISkFkNRykJ9AVkv4QG1OwpgFAwaXgdR1SKOQwxkvwSkQcTTSGgKpV9ElUJr+OJSkRXgIjKJ2GdrDhV/9s/v1nX1Akh3Lh2wVc+d11GasL0fkVfv/tPT7/38cHKQFC8al7Rd79+Z15O6vi77D1U9es/vdHv9Miy0tze+9XPXW+It7f+l8dTz3/cZXcNNlegJmtCYlKqokghrgfoYLdDECGIEACEEIQo8l8IAYRosOIwHC6E4Wbb4WhjZG8IwNA/g8WJMJKIymJQ2wHm9oPC9BgH5nD5zpxrBZIMohpJy2rhjIyHvjgBP7wAyIrKMGhsqggZjKa2vPDcS1v3rVhU9JXPXj2ZzTNSrSaj1uHwjhALDddv//npne/vOLVmecmG1bOXLizMykhgcOgqXMrlGwCM9uw/99HeM7dfdxUAwO0JvPDafm9QjgvVXAZk67g/Lkm9/2CPF3LR3fCHc0Uy8FYQwpMu+aTX+3hV3wwjtyFdf2eu8aoE4UKvPjSyyMJNYYolcNjIYbsEAFWjvC9OUQ0oZELW2uyVK/oCh+2Bo/ZAjVt0KhAwbGiMF0oLhyORwyaOsUk0+vDCjV46/ep0XbgGj/RSi6fWLWVpmXvzjMWm8VxUN2UbfnraZkMjM4pV+UCP3B5QsrQjJppdVD7s9Ea3Q2TY+SY8z/rJfZTHF4s44ohjtIEBiUI6j7dprFqNSaAUuDucbQeb4aBiDYSQEOJo7HM0O4yZJiKp7nanvdYGw2mT4Xeps9XZUdFqyU9CGAZdwfYDzYF+P+bDGyCoBGR7dY8pyyJYNLJfdjT1u9pdmP3HZ0CdOtvc1esw6ARCwNma1tb23mmniBWV9XVNXQxGJoPuRGXjufr2rIyk8QOJ+w5XSbIqcAzPsfuPnL3/9nVxivgvjv1H644crgEEAGYgDzQ9PQdjRlUVhCAgEQ2acCpWOKPU63G5XQ6fzyNLEsJYp9ObLYlma6LAC+e5U4hjEUrRQBZqOHt1sJIwQhXDOV00RLcCIjjbQjMToTAqR9LtCba190XSVkcUIkryDdeUGw3nU+AkSQlO5BtiMBovD5Njz9S03/iZX48V7VdlxWTS/fd/fmpmfuoUzi8CBKNHfv7K4vkFC+bkTrh5cqJx7qzs3TtPg6hDhZCyuK2z/9nnP372hT3mBP2smVmb1szefM28khnpAs9eKr8Yz/Z29b/1fsU1K2eZjNoX3jx0rqo1HkK8bNiYYdi6Aj1UYavxY6DI0emFUaA0tI0iAwjrvEpdo+9PtY61abp/L7GsStFdAEXUYMhOJfmFx1CLUWiyjzqwIAGSOiZFlAl9s83zTKP7iD3gJhAgHOKEhIZYU+whQ4AxgGhEfuZEMLEwXcPYFDW6vDM82HrP9Gjd7e7xffZgd6+CIzkUT9W7/rg45aasMVW5kgTmxizDX1qDI+RnCPEwwvZO7+dG5pp+2OGzAwaQkVm7EN2dZ/oklwbHKWIcccQRYxkHFPSd6/HbfOYcC6XU0dwf7PcNp3AQAF+Pp/b9KnO2VQnKni63t9s9tAFC0G/3Vr9RaclP5HS8t9fjbOlHgwLckXLEvjqbIiq6ZIPkDrranbJPQuw/frGUFYWoKg7HHBRFURV12r/C75cIGSr3oqoysZyhoih0sF5fVVRFUeI36b843tl+sr3HCQZlPBHDJCanEaIOpJdG0i8xVlW1u6u9qe5sR3uzz+cFqjzUtB1zQnJyWlHJnMKZZSaz5bySDaXnE86GadVQeL67HwwxN1DfQZaW4NEU0ecP9tjcYHSgDOMl8wuGwnmqSl5758hPH39DF2mZGJvhkaVLin/72P1jcznodPp27zo95gaSrEs0udz+ic8piXTaGDwUjOx217d+uOW9F/4PN5H3imXxF+9du2fPGaKoMYr9MAKYixQE7t9/bv+eM//1u7c3r5vzpc9evXLJTJ67NHr3GH2489SBivprVs7a+uYhpycAODY+cS4bVqfqdqznn6h1Pt3gapfCor6qPFYN3nmuqCpAVRQIP+oVd/d0fnWG6UflSVNtqo6mSJggHNN7ME7Tq+N9gf84btvfL0X6E443NIRDzBBhIItZAszTM/t7JXXS6eEMgrPM/CmfCMDoxF31TL8ILlqktzeoPLi/s1dGQB5YKFwM++WDXbPMfKFhTP/UpwvMTze2RkuzUvp6q/uzI3NNX252RQvuIGSk8g1Zhk/yPRyniHHEEUdslggZ5LN5PF0uGM7Tig7xhZZF4G5zuJr7AaAIYzwyswVhJAeV7pMdNJy2yoyUm4cIEoXYa3pt53oABJjBF88PJUmx9TkVRU1KMGm1QqSw0OHy+fxBSgjHs2ajTq/VwHEft8NNRAAmfvQoiupy+zy+oKKoLIsNeo3JoBtff3949xCMUY+tv6Glk2WYiGnPMTgtNSFakwaOOPFRR+X1Bd0en9ms1wj8+Mfr9vjsfW69QZtkNcarGa9cOFy+IxX1clACEX5GqUarMxiMqqoAAAklGGGIkNvpOHumorG2ShGDADMhK405b+6oitLV1tjV0lB1+tji5etmzCxjGJaOVDcdbIAxoH4z+DcSnt/Q5QNtNpBgilZpESXF7Q2EKCIdaf6yOCnRdF70GIDuHtfZQzXAqBnTRFUUw4TtNRAEAjfOuxzPTZDYSSnHMjqd4PMEJEU9Px6OOXzo3KO/fmvN0pnjh+AghDdvXvDAZ9b/9W/bFRLO54y5fYgrIgDYQFB69ZX927af/MoXNv6fr16XZJ0mS3GgL3/4qwWup6Pvw12nG1tsVWfCIUR4nngDHNc1veSw8sz3Zyd+qcjyfof39Vb3YTvpVxkA0UCQbbwunRRIogzRbxr9fcGu/12ajqewWlORUGUq9bkKoaJKYx4Pg1BMHZ2329wPHrG5VBg7kxaGI4qhFwKylMSjORZ+aZJmRUpKuUXo8EmL32sa6YGaAMtTdC90ijG2VtUqp2IT1WTholKQ/lbvbCfsED8MnxTZKWifb3T9cE7iWM/KBYmaq6zcQac64iSo8qFeudUv5wy2Omz0yvt7/SDK28xwG9L5DA0bp4hxxBHHFQnMDhI/GptO4SHiB2NsgzBCWjRQvjjqXYggIzCDMY0xvmLSCIrSgSPntu06LsryyiVlS+YX2fpcleeam1p7+/rdikoMOk1GmnVmQeas4py0FMvF1wIFg1JTa09VdXNDS3ePzSlKsobnkpPNM/LSS4uy87JTuEn47DkW79h7+sSZpsjjklCiEfhVi2dtWDtfp51ULUpnd997Oypa23rT06w3blySlmIZ63nW2+fa+ua+6rrWlCTLLdcuKSnOQXGWeGXiZFVba3PPeVcBpVqtnmFZQgiMlBgC2NvdUXFkb19nG2BZwPGxmRUKMSt7V9tHb7/c32+/avEqjhNoWN50wE8UCUgORrwHZmpY0gaHi46bu0lZLoq60wmhSkyZQQjZYY4kGFa9AjoeaPlBQkWj1gGoIIG79IaKSgQt/vzdqw4eqdl/sAbw7MCphVCC+Mmnd3R297MaTh43p0Dg2cd/9CmDjt/y0t6eXmfoVLF4TCaGETBqvAHpl796o7fP/ctH7kmwXKzwPUYwI83a0eVQVTJwPnnupTcOQQbbPIEhdVlIaHqGtbfPI8tqfCpdBiTw+L580335pk6/fNge2NXtP2AL1LlUmeUjrpoQY4xJligBYuDZdrK0wRlTJHMseumSVI+sGiftdXXLqleOPWF1GPKj7uGDNv/nD/V4FRojm5RhAUQ8kdM0qNTCL07ULErUlJr4pGEUrpGAaGGniSmiVlC7A3BU9wui9hNuf6/vlmzjhT/KCX2pyRWjewYhte7xQpQoHEg8dMJBR+7lZYSPOr0PzLBE/vBmi8vPCEAZmcigKvfkJX/Cn8BxihhHHHGM/awhlITXTcjA0ZyKUirJYVcoDCFGMwYKiEwopQgByKCopZYQKilKREsfY8xcnIJFfWPns1t3VtW0YoyaWnsOHa/u7u6va+yAEEVieuF2ZIpeKywsn3Hd+qsWzivSTU4vMTbdsjt37ju1bWdFbWOHqlIG48jgZFlhGTRrZu6mdQvWrpxjNk5g9iGEOrr62jrtQyeHUFpZ1ZSdmTR/TuFkAn3Pv7b7rW1HFEWVZFmSlQfv2ySMEVF59e29L76xl1KqKA22PufPvv9ZrVaI3+RXIs7Wtvf0ec7TD0o1Wm1kSobnIrTbuysO7u7v6QQcN3EFGsdLknj44w8hAIuWrg3HEofqEGlkroazRgfbZQxSRghBVz+VlOgERoQgjllhQ+lwlkUBCC0vAREwaOAgERwz/jauTQwIHYf+EVWdUPXUH5BWLS5asaSorr6rt88Dhngphg6Pf8urByFGEx6YXic89r07Vy8r2bJ13+FjdR2dDsUnhgbFMTG4IgWAZwkAL7y0d2Zh+sNfu/7iFmvKUXjTNfOOnGg8fLA6RLwpACzu6nGGfmDwwMFTqtFwD9679uf/7215oLtJHJcJ6Vr2lmz2lmyjqNI6j1TRF9zf6z9sD9S5VcAJQBZjEMWwQvHvz9nvzjMJk4wkEuqlsN0nZ2gnG6Hq8Cs+AmJMIoQSBYYfGUX0q/RbR7q9BAF1VD8MlltgYh6YYVmUKGRpWf0YHDWghhYUMBUh4kIDV27mD7rUGEFLBJ9vcN6cZbzge3lbh6fGT2LIzwLAT5Tie0O28cenbN1RojWUvtnq+XyhBUKgAvBqi5tG8U+GLdCAlSnaT/gdG6eIccQRx5j8EDHImG4CAHp7PaqkoGFmX8TkKshNKyrIEIPyubrWHptzuHp7eAOoS9ZzOjbQHwi4Aog5XyJBCGEZpqQoOzs9qc/prq5tdXkDF6NzaOt399idGoGFEDgc7v2HnBjjcGPDyNIcsmlZhlGJ+vHByvrGzntuW3Pt1Qt1F8SROrrtW17ZvW3XcTEosixmmSGHKGVw6KlcWd3c0NLV1mn71K1rkhJME7FEgEaQZ9jv8nb3OhWVTHhCZEU9U92CQvwccZywbVfFDRsW52WnxOS0uw+cYTCkNERoG1u6g5Icp4hXKOqbej0+cRjroGw4IhGZdD6ft+rkkf7eTsBP2gnCskSRjx7YabEmFZeWRwplh8ROwYCyaeT3cGQxrGyBIXT7qDcAorSTeJYxaYUQsRyRHQCBrPTZPUPEBEJg1GsSspP1eiHsZgJBSbW7fcpQEGyyGC95nIQ+eeJaLgqoNyB+6uale+5e9Yc/vi8OT8VEiBJKyaTar/Ecc8OGeetWlB48Vr/7wLmKEw01dZ1tnf2KNxhiwjw3Yq5TCnhGdAfee//YzdcuLC5IvajbgpC87KT5s3MP7z8HyOBZjlpDRHnDpgXXrC575PHX4/PoHwUewzIzX2bmP1Ng8qv0mD3wdINra4ushDMnR/k4lBo3qHaJ5VZhst4Clq/oCy5OmiwDOd4XpAwXQ3cUojw9FzUX32lzn/bSEKGN5hPcg/n6n81P0UxEZW1BFWBmSoo1CIA7802HTrvoaB4nSzt61ZOO4DzrhTzOJAIeP9M3JNw8cvgwTLPHC3haOXxLtvGJ5sAI0RpFPtQrN/vkPD17si9w2i2BqMpLzNyWo9diGKeIccQRx5VIEEP8MGNxTsZVOVRWu052dBxtUWU1wvEiMYbCvPSvP3DD7NK8YEDasffkk1vedzg9LMNEDC4IoTnHkre2SDBr+hv72g40ebvdMKy+SAhBGC1ZWPyF+zfnZCX39blff2//C69/LMsKvtAKmSF7NizuDzmEI39UCVVVlVKAEGIYjCDQ8Gy3zfHMyzsZBl9/zaKpRi8dLu9zr+z+cNdxWZbZcO5WWGhNIZQiBBmMQ9/OYklWXnn7AMsw99y2xmTUjU/zVJXA82Yezc9Oyc5KmsyBsQzOzkzq6OqTZQIo7XN49hysTE+1jhbA2L7nRL/TG9G8oQDNyM/Q8Hz8Nr8SIUlKV68TqMrwwkKMGULCzQ+J2trS0NnaBNgpdmNnODngO3b447SMLLM5MdwpEUMY+g8CGBJCcST3NKJ7CkMzHFFRxm4/TbWOsHW0Oj45yRgtXwFD5u+h4w23XLcw9JHheXr1mrK/P/FVhkEAhm7mqtr2//7t2x3djin0ZpDVvPzUL3967VjzhapEo+Gy0q0T8kwlnGv38NevP1nZvHP3mXDR8OC4pqgXotPy61fNWr9qVnev80x1e0Vly9Fj9QeP1XW126nAjfi0cP3xuYauszXtF0kRI8l7G9bOKZuXf+ZkI9AL0dn7hLIc+9ADG0Prw7Q3k4zjPOMK/LHO1eCRrDy+I1t/Z+54XkIthqtStKtStLfnGB442O0ITa7ozhOE5Zq8UvnkKRCl73d4v1JsneTm2zo8se8HCOdYoh8Tr7d6YnhwGG6phfnlwtTJNIGvcYkAYzBFzbVbsk2PnbLZo+J1EdlVgB853vPaumxm6k2Mn6jpq/DQ2HyVkDlWYcJcnvvyTX9pcI3oKkmJDwsfdXofLLK80uxWMA+UwPCzyinSHblXgBxAnCLGEUccox8wYfdYYdKMjcWshlNlwps1AIDmj+sjpYmEEp5jr141t7ysIGQP6YTVy2afrW3d+vbeCEWkhGoSdfnrZyaXpiqiqrFoWQ1b/cZpyS8hjFSVJCWYNl+zKDcrGQCQmGDcsGb+yTMNR07U6rXCdFkuikp4nivITElLNiMMna5Ac1u3w+VhEOJYbOtzvv7egay0xAXlM6b0se9+dGT3gUpJljGCIRsYgqzMpKy0RIFnA6Lc0trTY3MCQBCEhNI33j9UkJd29cq5GMe2X1WVFBdmpSVbIpY3pYBh4Kols2fkpU/y6XHNynknKpskSYIQChz74e7j165bmJw0onAlIEo79pwaUmeFgF67biHPx9f/KxJef9Dj9gMyQlhJJSolBELg93pbGmrBheQQUsAJPa1NTfXV5fOXhvWowt9BAIXhGkdCYaQ6EdEBRw6Fqkq8AUIpHv5tJoMmOysxdIRRk5lj39x2/Ltfvz4hrM4CIczJSszJShx632rWPaHZNl7WaKwplJ1u/frnNwj89Ag/JCUYf/zwHbX1Xe2d/eCiyyBTk82pyeb1q8p67e5TZ9uefGbH6+8di44TMbjP5e/oclz8wcuKmp5ifuDe1Q+dagIqjWa2AWn95oVLFhRWnGmOz6NLhN3dvrv2dXkAA1QFQPRuV7BPVL88c2K2dm2G/tG5CV+tsMdo7QCgTyFTefhJ++1qpUOcbZnYD3jOJR6wizEq8SCEsrgkeUQoMqjSs04xRqgTofsKTMzklpwDNn8s+VMKIBbHnvvJAr47z/T/mkbG6wbue3F7H3j8bN9/lCVO6WLt6vY9eqafxqwxRshAlUWJEzeXKk/QLEng9/SrIyKrlL7V5r433/ROuyf63DLc0gSmxHQFuGjjJkIc0wHV13zueI2Nz587J98q4PgJueIZIsUMTp2bwRuEoCsIIeT0vDnbEtGpiCSPsSzOTEs6b/txbEZaQiQXi4bMU2DMMCXOTJF8ElEIw2NjhonVcaJHBDj0MVqtEOJFg9BqheQkS1hl4WJ1awb5oZpgMa1bMXfN8tk5mckMi21217GTtR/sPF7X1Ikg4Dmmoalrz+GqosIMg36yCTk1DR37Dp91urwciykFPMcuWThz/ep5JTOy9DqNx+M/W9v63o5jJ840SpKEEHT7/O9tP1ZalJ2ZHvvRJcrK+tXzNq5dwDKYEErClUI8O4VuaYsXFudkJJz1B4iqQkBb2m3HT9evXz1veFBl/+GzbV12VVXDaqgoKz1x4byiS9u8O45LhkBAFgPiyHkCJVEEkBIK+vp6nf02wFzQwz2cX1pbXVlUUq7RaEGksyIdmJNwwEdOAR1Iy4KUqoTY+vykwDycI1pMutml2YBnBosYB8Hi+vrO//rd24//6J7Y01YhhEx5/qtkmgNiK66a8fC3bv73h/8eMlgnF5eYkJInJxqvWTVrVlH6ibNtDY3dI0oTIaSS3O/0TcPSHb5GG9bMKZ+Xf7KiARiGBRIJBTz7jQc28DxD4yHES4ZHTvZ6CALSoDYJZn562r450zCkbzkObsw2PHLKZiejAmWAaqeUX0NpEDKPne59cXXWhNs+fsbuhwygo7JMEc7XojLzCCbjU4hTiiWuQ0iKMKk1p8UrH7AFQMyWF5hp88nj7PulYuszjc1uhGIwTEV6tMqhwfAbJZPtY7yj2/u5A90+hcZu18Fwa1O4rEnUc0IA7i8w73X2jRiSKp/ok/9a52jyKaPzKe7OM6EroQr4X4Ai2iuf+/Pv/7S7W88zUsC78P7vf+3u1ZnDE3CaXrnz4Zc9fgVCCjnNmm89+Z3l+itxoPLJv33x8fc7HDIO33qLvvHkj9YnXo4v9p/d+tsn/vpBtY9FlMm6/f9+99/WFBimx/iUDvzuq4/vsvlVBAFk+Zsf33p/YfwRdHlYIqWBfp/slxkNAwAMOv3dpztHyKYPmiNDvw1plEEAKaSKX/LbvRqLFrOMKsl91T0BRwCPqGYcyUrDxHKaDh4YdLrN66+697Y1et2AF1CfrcnLTk1Jsj757PtNLd2RHNFTVY11jZ3z50z2tjp6oqatwx4pEVQJXXZVyRc/c236YG99rYZPSbbkZaf8/i/vHK+sp4TwLHPyTH1dY2dGWmJsC5JSnYY36ASWvcDVmGOZdSvKG1p6/f4AgAAj/N7OiqWLSk1DDcop/WDnMaKSyAEoqrpx7QKDLl6FeKVCUYmq0qhGKMGgP5zsTPr7ekL2Jb5QTx3D9nR3uN0OrVYbaX4xoFgDB+c7pEN/oxAostzfb6fUFFWuM2dWTnZ2UmtLL9DyI8gsRn/86/agqHzzgWuKCtKin2JyiCNO9ZDxJbC2Hrhn1eHj9Vue3UW1k3L2i5L8yC9fKylIu2bN7IxUy1ibpadatBouZlIfAdNG22bkp957+4qTJxrPBxIhAP7gxmsXLr1qBgAAxBniJUM4yDbs/KqKEwuPnOj5+4rMCffVM9jIInu0uCgEipKmnWKQXBLf6lT/UN3/1XHTTV9ocr7Y5osRFQwvBTdkaaOa5tPo5/4Qn0SnHeLmzIl7t/z+XJ8HsIAEY5KtKqc4zr75eu7BGaZf1vtjBBLDHYYfPtVX6ZC+NychTz9emr1LUp+sc/6iqt+v0tgt/iFEqvzVktRJ+mqvzzKkn+jtwMz5TyPEKcNHT9lI1OlCOBEqmzOuDJZxKSki8dQc2Pfu7tM9Qb/X7Xb22zKv+/dv3TQvdXx/faB7/5ZHv/a3s3qBAUowmL7iC19/6MHlyRd+GKrkcfR2tHfpNYzkc+W4A9Fa3LKvq6vL5ZMhBIjTOgJX6tpJg+6e7u6OPin8vKT9vsukZ924+8P3P9rX7BZ4BlLp+B9f2rtyVsb8FGF6xuTs6ers8SoIQsgLHjn+/LksgBBSlbYdbFYk1ZhhAoT2N9h6z3ZFtS6k43jVKHC2OKrfOpNUmsoIjL/H23GsVZUUPEYHajqtVouiqmUlOdeuWzDED4ewYnFpbUN7R6edUMowqK3D1tzWM0mKGBSl+qZOp9vLMogQkJpsvn7joiF+OITc7NQNa+e3ddi6e/sRAoGgdLa2dcHcQqNBOxYbv8ihr1kx541tB9vag2FBS1p5rqm2vm3B3BmROGHlueaaho7BbvvQatKuXT7nIvVj4/gHAiOIokgRhH6/T1EkCoDb5QAQXcynS0G/x+VISUkL35goRF4gOq9uOtSaHwAMYDDg93tcoznP3NKsq1eX/e0vH0XPa4T8kvzk09u37z49f15+UUFacoIBAtjv8rV19p843dRmd08tvRNCb0Csru8SODzOPCKEGvXajDTLJG0+nmP/63t3HD/dVHWmFUwihZVQ+ta2iiebbel5KXNKs6+amzd/Tm5udpLVpBMEFoLQOtBlc7/0xsHGhu5odVNKAcckmHXTZthhtGFt2QvzC45X1A9UJKoU8NyXP3e1UR/3DV1aJAiML6COIF1S8OV2dVF1/4TFgY1eqTugRidaI2RhaIFhqnnUFBD1uyftfoV8szQhZvP9LY2ub1XYCInVEREijSrdX5Ae9WcdA00cto/OSlWVpxuc/1ZoTtaMN3lfb3E/1egBijLWLK10BMcPyH+7LOmttqZalYtRPUgJUOhz7YH3O1tuytLflGUoswgJPI6okiqEemTS4JU+6vK/2OSqC0RUBMZwSHHCnenciknr/ZhYfFuu8XeNgeGEk1LqUWH0uWW4zVl8Io//5SkiMqSnWxK03uoef8Dr8fn9Bz48tHlZYWrOOG4G4mg7/s7zH3u8ghwgUoCbu6xk6bzki6QZlBCVEEJUVSUxrLHQ+6F3QzelSsgV7F4bHEjYQlcv0zh87i6ns0chnBpaEqkc6HcEFGXahkRp6LIRCiFUpz2dKI7xDC8gucXmXXW8nqeUSj4JIgAnnZoYul6y2lPZ2VdvZzgs+yVVUcfih9M8DUJWLpqRm5admRzL14mKCjJTUqwdXXYMoc8X6OrplySFm4RV2mt39Tl8kSVEUdXSopyM1Ng5LfPKCpISjR3ddoQwy7JtnXafPzgWRbx4WM2GpQuKe2yuYFCEgCoy3bbrRFlJnibc/eK9HcfE4IB3RSVg9bI5yYmm+A1+5UIQWE7gRuaZwqDf5/d7eUEjisGLi8ZDoKh+n2cw4ZMOCyCep4gwonrEoT57L0iP4fg3G7V33Lhk+67KtjY70HJRgUSF0NqG7rrGbh5jBkMajsnLKlEpBRhPrYqSY0+fbd949/9ASMcZk+wNXnvtgv/9+ecmz5EyU62/+en9N973eECUJ2w0D8PLjtMTcJ5rP1fT/tbbRzRaXmPQGAyCJsQwoV+UXU6fw+4OklF6rbKalmrOy0qaxptkdnHWrTcuPn64Frj8gEHAE7z6piVLFxbBeJeLS4y5Fr5VkqPjckR9+KTdp9KvF1vH6l3RHVD+/ViPH2BAR5Ifhl2SzCYLzAWYhIoKHqlyvtfp+0yBaWmSNkXACEKXpJ5yBJ9ucL3b4YscW6xpxd+VxY+ul9NgVGziG0Q5OvimKi0i//mDXU8tS4uZcSqq9K/1zv88ZZdUMqZUkqrWuNR+SU0Ym0GZWfTrRSm37e0KxkjHDa9KUrAf4b+1BP7W6DFhmiJgE4dDz3qF2IJKT0ChnBA6eHVsM5Xl8jjy2LyUKc2V+/Itf6pziXAkJ6TRAWGoSp/KS75SpuGlTTQ1ZOXnZ2cfrTnlCS39DGp6/Y1Dy8vS5iSMFQEWHY37PnixDQpaooqilDFv7to1s7XTwBBVRVEUoCiKGsNnEOKOihKiiAipU09y+QQxxMhAaDiKSC5TsYGuYP7MglLdyTNBgBFVaemCmVkG3bSOSVWUEEXETLx+4vKSRAZCCkWvCGj45ykuahBBjDARFTEgAwzwZQtbUcBxjH5sQ1Cn47UaYcjm9fqCQVGcDEX0eP2SJIfbzYfml8moHasDoUEv8BwDBpT9ocPlFaVLGwLfuGbBrn2VwYAEIMUY7D9Sdfctqwvz0jq6+46dqpdkOXIoGoHduHZ+PIR4RUOn5fUGTVhO5nx2p6rI/X22tIxsMh3PsIg7degRCSOt9OEgRSSUhrucQoQ6OxotK7JQrBjFpjWzP3f/usd++ZoqqSDKPYQgQJhSGqR0UMsBhhVE0QVQWllWenudExA4T9Dh8E81YL9mWfH3v33zD378PBD4iYk3DPfKZ0Pj8qvE7/aH6Nl5cjzY+HH0uZLV8jl58+fkTufqDeG9ty2zmnQuTwBjJMvyxjWzEy26+PS51Lgjx/h2j32UmUkUCh4543ijzXN3rnFpoiZDy+jCkyKgklafvL3T90yjqyU4SloTQkDUL8xInurlD+9IQhRFlg73g8OOPoF0mzmMAPUoxEMQQDj0bswZwTApSPnenNh1jDdmG9/t7YvxhizusIGrP2z9WrHl6lRdioahlHoV0uaTD9r8r7R4T7iUEKmLLFAQxixo7JNhjUtcljye3b82Vf/obOt3TjnDmfCxljuiAinEHl0UuXwE+Actg0gnGCk4LitizZj+ZWl6mnZq/KjMwq9IEnbYlRjtQIad2Fl6tCRRe6XczJe4FpFNLivNrjh5oruBAkAxJh99dOC+1YUJsZNNqbu78o3nPgCcjlJFVDTlcxfdvDJrGixGGpGBIJEEmZhRxAEteHJFx6kGBhJRF7hsdMow785vPUSZJ7Zs78Alm770/QeuyTbCaR1ThO1CEg8i/gNoIkAsgufDCBfCMxFAl/OGHHhG0HHuKQqGuiCFdUfVycXcFTV8L8KhczOyNHPEE4qGlT4G3lVkhV7iuzc/N21WcbbD5ZPDnYVdHv+ufafzc1I/2n3c7R6wUykF88ryC3PT45GEKxoagUtONAIGDddIoZT2dnempmcxDHuxqTAIchw3mAGN4NDsJxQiACGNvIMQCgYDnW31KYmlMaWPIILf/uLGzq6+vzy7iyoqGO2YGJhAcFyHzyTWDggAgybcAE29CxmD8df+bcOBo7XvvXME6DRTMdAnGNd5BOWkdMu9dy4fp4LxwpCbmfjFT687f1VRfNZfDtyQZVxV59jj1ETXy4XZ2gknPXHaCaVuE4e1DETh6JZTIpTlgarGCG3xmpuT8YYpla5h5tpU4Xh/sEdCAx8Ypp1BiLrFQUE4MnYYLTSZ4eMLkzPH4Eg3ZRl+WWmrI7FSPWWxkTDfPtGvpT1mDlEKfApxywRwQoi2KQOeSoAwT1URoFEEj1JWONkfHJ8iAgC+UpzglshPz7mpqsSOgg5yzsHGyJPkLHwCQ55elr4k+UJY3KcLLDv7eum4l+b2XAOPr5iZeMkV7SwFJUW52YIqKYRQzLAVH7170uaNeckkV8OOF/7WyLGQqpJMM2aVb7iuTDsdDDHCEUmEQdHxNqBXstAXHT7SyzkQnL78np9tee/orref+Y/rZiaw0z2moRHFKeLlv6eAGJS9vkBQki+gWJAQGgxIXn9AkhV4eQ97nLtlxLt00IKc3gMIO0gv8w27ad1CjcBFhsax7McHTjc0d+05dEZW5CFOu/maqzguLmR9xSM/O0mj4UYU0iDodNp9XrfBYIrtWZ/05IEcp9MbIi7VyPI7ADDgtaehmU0Zhm1pblAlZ0bamBVWJoP28R/d+9CXN5s0PJAUME6OWUw3j0qgQv6x0rsmg/DzH9ydnZ8GghN0+lZVEo7bTGWAomI0aL7x5c333rLsklh44bJVNLp4NY5LBh7D/12SPkOggI/lU1BkIAUphE6Fdoq0PUgccvgpJAVj8sN5OvCbRWlTmwAMuyRJ+4fFaSyCI2SrKAmxKXXsArzwHQMQ85PZlltzxixGMLLoFwtTWUgBipWNoipAFv0q6BRpl0TdKhgI3EUeQwyHMf6PEvPLa7I4BGJkDVB6ZlzFmiE8PCfp8XKLlsVTbgAb262DAK8pM+C31mSuS7vAYPumDF02SwFmxvoKrSLemmO8gm7mS7/y8tkLSvJyLFBWSejRw7c/9/qeNleMpdbXV/36y9sRhylVRaItK1t859qM6eQZlI5FMuhEG1xRJPGfYSBjDCnOES/3uVdkJSXJPG92QWqSJSjKUyI9kfhvbk7qnNJ8g14XEOVPYuwKTpl6fmKv18K5M/Kykhkm4qMhHT19Tz7zflt772DmISrIS507Kz/e6+KfAMUz0pOsBjBCew3KwWBne6vRbAEXwwcUxWgw6w0mMEgNh1bhAS/kYKYKBPTY4QOF2WazaTxXrtGg+dWP7/3jb7+waGGhgWdCxywpQFaBooIIpyJ04KWS0EtRgawAWWEpSDRoNqwvf+jBTYOUKrQigQt8yUQZkBpQBr9i+EuVFTIGtS6dkf7Y9+7CHBtiiSP3IoMlZwiCJKtBwDg0hMi7AwOkw17DBigpLKVFhan/89P7fvDNG0dcAZXQ8AbDv4jKijrscisKCZ1Debxtxl/bR+8eGo6ixp+y0+DBMXBvrMlcl8AATgAMG/tREroZIoQtVg8JhgWcsCmJfXVN5gVUIQYUsjnT8IeFSVoGTYFBsRyP8f+UW789K3EiLqR/fF4CixFgxvhwOjS6QacJZgCvKTHgl1emP1KefE26/qESK+BGyQVDKE86Vf5LM62vr0orN7MhNo4v1PUJIeAEnsFfytVuuzprXoLmgq+7gcV35JpiX/HQ6WVXpWoL9NwVdCdfDndyyoKrig+dONlapQBAMcfsefft6vV5S9KE4U8xxd+156Wt5wROB6iisukl86+/tZSPLzVxxPEP44cAggXlM+65bY3VrO/scbz5/sGDFdUCx06SH/Ict25V+earF/IcW13X9vJbe5tau3jucqyPEMJxiBBE8MIyLSGc7I4IoeHbQjQBF50W7owxWr+6vKaxQ1FkCCEl5PCJmiGyICnqprUL9Nq4nuE/A8pLszMzElrbbCMmHQDdXW3JKekAX0Qqh6pm5RRotDoS6Zs/EHGngz+FrTcKWZZtaWlorDp5/3c2azUTP6rvvmnJpjWz3/yg4u0PT1TWdLj73D6/JIYYDYkIACAEMYIcxgLH6A2a1HTr4vn5118zf+2KUmZQKobn2fRkk+yXEIen6gmStRqLSRcJWljNuswUMxTOnyWqqBQjzRilxRij6zfMe+jBTc88u1PQDhYlQiBpOItRF5nnHM898YvPvv5+xb7DtU0tvR6n1+8XRUVVVBJmwTQsdoBYFgksYzAI6RmJG1bPvue2ZcWF0Z0/LAZNVrKZIgQHZy9VCQvhcKEds1GbkGLW8szwTGOeEINuUmYTy+K0FBMz0AlzYDhBDZdo1mEcdyFNA/IM3GtrMrc0OJ+oc1W5aIg2RFIiCR0jHwdGMjABxoCQEgPztZnm+wtMzEU4Vu8rMGfr2e8ct1d68YBAS0wHAESAYQBE80z4sbmJa1InFUN7oMiarmW/d9JeG9CE2WAsDzIMVxfj0F2axdMHCo0PzjCbBifvd+ckVTrF9+06IPoH9kUIUHLdJDpnDGFliu7DqzV/rXc+WedqDOCweO+4qafDjw1hwLCcKm1I4f59VsLiRM3FX/d78k1P1Dp8MSstKb23wHxlFXlclowjIX/j/KKjx2uOdsoAIFZTvfWFQ5+afUOW/vy3i676V597z6sRBEBEoJs1a+k961Liq0wccfzDKCIAJoPuM3etXzB3RrjRVqbFqDtX1+r1BicUO4kE2wryUv/tng0piebQ8zI7VVHVX/3xNUIputRrZNiWHadylQ5Lw6aEshizk+szznEMxnigORyAYfuWjEWwybCwt8DzeFjCDxrGGBGEiqJMl7jU6mVzXn1nf0u7LVJcff5MQ5SapF+5pCwuVPPPgYw0S3l53sGKOjq8Nz2EwWCgtakOXHCgWFUYvS6vsBhjhhACIaKQAIrCPh+MUOTWJxhxQVE8tHcnRdLaFWXc5Fp6mk26z9y16jN3rWppt1eea6tr6bX3eTzeoCTJlAKOZbQa1mTSZaZZSwvTi2ek6Ue17pxflrPlia8qhF7AEkJVkpBojLDZ737zxi/ct3Z4rJWG2wfOLEwf8+CNmh/++803bpo33KVDVDU1xaILN06EAMyamTlrZqaqktaOvuqGrsaWXlu/1+MJBIOSrKgYI0HgjAZNerJ5dnFmWXGm0RDbJP3a59bfsXnhiEGGDy8zI2HIV/X1z1592+b5aGSeHgI0N3tSuiYlhWkv/fkbUYsOUdXEBGNSgj4+v6YFHIL/NsPyqXzz3h7fux2+QzZ/s4d4AACYG5CTGf68VBUdoll6vChRe12Gbm2qTs9OA1dflaLbsV7zbJPrmQbXGYeqsvwInZjQz0QgyoIE/v484+05Bi0zhS/dnGlYlqzd0uh6sdld5VBExI1YeSgBspzEo/kJ/M1Z+usz9Qn8iIWCR/CvyzK+fLjrjU42krMqUOWhIsONWVNLxdQz6BvF1k/nm97r9L3W6jnc6++TYYiTR07scEmeyGkPzxqkSDMM7MYM3V05afOs0+Y5LTbx5WZuv1MF8shkScxkMGR92hU2uS5TUUry0uWzdlZUdlR7AYCM4Nr++rYvXf3ZUuPA1xOx98Azr5xmeS2gCuGTCuZuvqU4thtUddva2zpsNrtbDBlnjN5ssqRk5uckXUbfuOJ12bpae3v7+32iQgGkmDXqDaaUzJysJH2MOlQS6G89e/RcL2QRIKqizyouLs63xhgfsVd9XNkhh6UzIOJnLl6TPdqdI9ob66qqOwIMBqqoyyqbU5RjmiAwQxRvb2NjW5fdGZABYhitOSUrOyc9STeWq1mxnd1zumvwQHD+orWFxnCLSVdHdXVrt8NPOFNGQUlpjjE0rf09VWdrmu0igyBR5NSyJaWZFh6Nfzy29vbeLrvL6wsQCCjieJ0xKTU9JyPJwE11WRRd3a3N7V4kcDzHsRjx5qREi5GLe0IvkiJSajHpy4pzhoySjPSklCSL09XOjkszwjpqFCGYkZYY4YcR939RQaZOK/gDImKYS81ug6JkszvHamXR53D3OVwQQUABg5HZpNNoJhXbTDAbNBo2TAsZhGBnT7/b60+wxniedfX0e33BiGYFITQ50Szw57/CoNeFSGlYawQxTFO7LRCQeG4ainiNBu2KJWVdb+8Ld784H5xUFHX9qnKrxRC/sf9psHnt3DffONjR6wZRi90F88OQnaoWF89NTk5XiQoHloGhgt2hzvkII3zixMHqiiMbN8wpyJ2yMzcnMzEnM/ECDtBq0S9fMvPiT11pceYF7GUyalctLZlwM4xRXnZSXvaFd7AoKkgrKkgbf40tKkwrKky7mIVi5dLi+CS6DNBguCFdvyFdLxPaFVBafUqHT7KLqk8hCqUsQjoMrTxO17LZejZNw/DTXTWqZ9GXiyyfLzBXucST/cE6j2QLyDIFAoKpGmamiZ9n1cw0chfmuTVz+GvF1i/PtNa6xXMuqcUrucN9//UMStUyeTp2hpFPEsY0GEwc2rIiY1un91i/aObQ2hRtmfkCswfNHL4n13hPrrEnqFY6gqccwVqX2O6T+yU1oFCZUASBhkGJPJNr4OZY+IUJQqmJnxIlngw6AnKtRwZqjMzhm3K0RgbGKWIsCDOvX1Sw73R9ZY8MAWJxxcsvV9743WXJfOh8ye66l59+u0cQeEAkpMsvW3X/xtFrn9rfdOrY0RMHDx84dKK2tqHTKysECCmZmVllC9YuW7p02fIVpcmX9vSrvu6Gqorjp0+cOX3yWHV1U7PdFyKqlNOnJSWnly5Yvmje7LK5S5aWpY4wOJG/veKZH37lqRaNjlEDHutN//Hoz75/Qwyp1vbtP/jKjw64AhRCivnkB56p/M/F0fev1LXn+f9+6L8/9Bk42cWs+7+//uV3ckzjsTF75faPdh45tG/fscr6tv4AxAKfmFUyf8HyNevXblo6N8MawzgOVjz95W+82udVEKQMr/3W6+e+M0e2nf7oua2vv/vhkcoWu8iW3PqVH//me8tDJmfXkad+/qM/7erRC4zodd30+Ae//Mzi5NjzThVtdXt2H66sOXWqovp0fUeP3SFDSFmtITGjeNas+XM33XHHqjnZuknPWurvPP3uX5/ZdtZtSE5Msposqfnly9daTEYQp4gXh3CbLzy8mjwsCojp5HeP8nBDcHlSmCJqgpXnWk6fbVpYPiOaH/a7j59ucDi9CEEKgMViyEhPxJOzqpMSzWnJFpZlaLg59dnq5qqaluzM5NG77z10prvHERmvoij5uakG/fmIQU5WssAz4cYBkMHowOGz16wqN5vyp2X4G9bM/3D3cTEoDaUzUQD1Wn79qnI2HkL8J8I1q0pnzy3o+OgEGL/V9OT5oSSlZufNmrOQYVmqkmFSpjTsI4pUICKWZZubag9//BFRpXtvX5FojQed4ohjYrAIZuvYbB0LgObyfzuH4TyrMI3hshFuEQhKTDGaKE4GCIJrM/TXZkzbMpIi4JQ03fpByRlCgRRJmg9dAsBc4iSmlxtddsAB4o8ySrAs3ZWbesVpiV8+abuMdesWfHS8oavJH042rX3nL7s/Pf/2fA2iSv+xZ56v4DgNoCoVEnKW3HzHrGh/uqv+wLZn//jnF/fXO1Vew2HAcTzDQYR8zu5zH79xcvubLy+56bOf+fyD1828RKVOqqvzyLatz7z4+vaTzW6VF3iGwYJez1OIEKBed2/1vrdO73wVpi647a7b7vvUnYsyzltjCTmly66b//zfWk1aRsd5Wmwtzb0ga1Q+SPfxjxs1ggHw4X5XDHf0bB1YHO0ytbW3djUEExOtnOI2LV151axszRgmOsJEav7wiT/87i+vHnMxGo5BnMUSWh9osKdu16uVH+/4cNd933j4c9eWJUWfbsgKRqNRxWqYq2oFBnhr33nshz954YRfo+UNCWbWhxRHYEB+C7EandFsFnU8Fhmo5WP7SagqN+9/c8srW19562A30XAcwzJYZ7FEpA+gr/vc/vp9b3SZZhSWZM+Y5EpDPa0H39jy7nGbJjVZJ3BYm5g7Z+ncGRmauGTj9CBaIWjygkGj6y0IAOByCSEwDG5p733lnX1Gg6ao4HzEwOH0vPrOvgNHz0byTURRKchJK8xNn/wnl5XkHj5e22NzYAR9fnHrW/t1Ws3yRaVDuXaKom7/+MT2j0+6vX4EAaEwKclUMiNreJlTblZKdmZSa6edqAqCoNfu+PuL2z9/z4aSouyLZ9HZGUkL5hbu2HNKkqTBqwYXzS/KzkiO97r4ZwLHsZ++a+XRQ9V9viC4SPJPCFBka3rmwqVrjGZLuJYVQxJp2xK6azAEBECMMcfxXV3te3a929/YsGbTopVLS+I3VRxxxPGJBYJAuFxNJkRCn290UWVU+QnDzjfheVbNFXf2LqMprSu/Y2XJ7nOt9Q4FAiT4Dv/9/bobvzSHU1refGqnXUAcoDLUpc5Yc//GkRka1Hnuoy3/9YunP27wMBqTQfF7VC6nsCTdLABve1VNmx9q9Hrcd/zNX3bYJcPPvr1q+osY1f6Gbc/85ufPfFTXj7Qas5HKYlD0yDJrTjKqbqdPpogTNBodrwHus6//v5qaVvt3v/f1NamD+5uS8wrn54oNfVoGY9zU1NHc6ViZHNUEyXt0exWV1IG4DVWU7t3VvZ+bOZJJ9ve2dzV2sthIlYBmQV5BXgo35qXtOfrk7//z1x+2EgQpUZBgIi6bF3C8IPCsRs/RQOuHf/sVwfyjD27MHzMBLZyr7qh96U+/evFUgMdKwCf5gSIGEiQyBY0NSoLn3n78v3639cOGoF5nNQGiylLQ75cpo9NxDJGcXsLyjEavFSaffy85zu544fkdNQEhVU8VkQgFMxZeVZZr4uKrYhxAUZVjJ+vcHv+i+UX52aksw3Tb+k+eaaw41eB0+RgGUQq0WmHxgpkFuVPI11o8f+a+w2d7bM6I5ENjc9dTW7ZVnm0qKcoy6rUut+9MTeuhY9W9dmckXSgoijcsuSovO3pRWrtibmV1i83uZDBiGOb4qXqfP3hV+YzcrBSL2TCrOGcs5YzJYM3S2XsPnRVFKWK9Y0g3Xb0w3uvinw93XLfwxdcPvP3OUYrRmIHEiHAixrETUCkBioIQziiYOXfBsuTkDFUJKz0gAgGkINLekxJAMGQYluvqbN2z45322nOs1fiFT6/NzrDGr0IcccQRBwBgW7vnrJ+AwS5Tw+xodG++mbkCU9suq9GQsXn9wjePtds7gxD8f/buAzyu6s4f/im3T9OMRqPee7VsSS5yt8AGjLGNMYZAwAkLG8ibhOymkd1se5Mt2exmUzbLbgIkWUgBEoyzxDQT27hb7l22uqzeNdLM3Hb+z9xxUTcQE2z8+zziefAzo9Gde+/cOd97zvkdzAmnfvPrQxvyM08989P9QV6izDQkZ9T8u+8rGLMfWefezT/6znPb6wOCTTL8Q3zRisdXLVs4MyfWIbLh1pracwc2/eyFw35JEM2e/c999/sz8r5V5bum26227Xr1R//wzNvNQd5ho0ZwaNievejOWxcX+Jwej83wD42MdNUe3Pzy2/WaIFBeks2aLc9+m0/L+bdVl7onPCmZuXOT1FcGZZmj+rmOlsYetdQ9pg0YPLbtuKnqGJu6znEcYpp5dsfx4dVVo6cj+jsaG87XchzH9BE+PycjLX7KbHf+tf/8+/1bW6TUBXetqSqMc9jsTjTY2dN1evebW3acHZHsPK+4tJZ3n//5q3kZT6ycsuOOGfqJzT85tr1Djkqbt+quxTkeiYQGGgb5GDGAUNR7Coisc/t//e2//mx3p+iyiYjpIZ050uetXTY3OyHKbeepGerp7a7bu/mlLYGA9t6SpznSvO/F7//8ndoRW5xsqipNTJu1sHJGvB2G0oHIvUOsafrxUw21DW3RHhdH6cCgv29gCDHEWZdqTTcqKwoWzS16XyuGeaIct1eV1Ta0NbV0CjylFDc2t7d39Ozcf0oWxeFAqKd3QNcNat22VDUjJzNxxZIyT9T4z+nCuYUHj5x7/Q+HVE0l1qzBk2cbG5o6oqIciiyVFqY9vKHKHfUBpw52dveb7PItHJKfk1SYmwJrXXz8cBz9qydXH6g+39Y5gHg6aT50uNwOh6unpzPkH0Ro9EJkDJkm5nh3bEJGZn5aZq7d4TQMDWFMMEHMZIhcComMchzluPrzp3fveLO9pRGFjE88uGD5kmI4BAAAEG7Cm+a/nOyZZKAVodFYX51yQxYC+NPeV7bN2XBr9ramjguDOsJEbH3nmd23LXvhnVaJ8ojpWInOuWPjqugxv9J38NVXXnzrnJ+TZRYccM9e9/994cn75yZdGkmYW1yxtKrYq375G5sbOIJxoHbHMy/XVD2Rc+022mg7vO0Xz75ZP8K5JGIGh4WMxQ9ufHTjylmpUVdqsjD/8oWzC3/wzR/u7ucwJpQaNVt/+u87Fn5nUSRD4ZikrOyyWPXNEVni+cETdfW1HSwreVTTVD3x7qFQUEMIpaemN7Y2Y6Zp+HD1aaOq/Mo3v9rf0NB0JEB5hxEw04pTMlOmnoZY9+62ACna+Ldfe3h5eW705QOtDa0oz3366ed+u7eDKpRXaPfhX27bP39O9uwpygeYur73jW3Djrx1X/nGZ1eVpbvCb9ocDviHA++xyWn27vnuv7ywp0tWeIRMg1Ep787HvrhxxZzcVPeVgfHG4MrKsuwjQjwJIXS1DhS979zW7/3Hi4e6aIwb6SFmzyhZvGJxbgwskwJG3bnDjFIUDKrNLZ2RtjGJzFNEOKRqJQXpG9YsTE6MmXBDw1ru48o/x7/svPL8ru6Bn/7q7a6eAYHnOI7qhtne0WvNCMOYXFysOBTSE+KiP33f8vzclEmuvJQ+uH7p4NDIjn2nTEMnBPMcDalaW0cPM1ldY2tZSVbl7ILL405Hb8b0i/IbhvHW9sPBoBp5D6qm31ZVbpNhrYuPp9mlGV/+wl1f++vn1SlmJKrBgBKXlJKePeIf7OnuGBkZNgydYCJIksvl9vrivd44hyOKcFTTNGupFsLIxWSITIYJ5gUhpIYOH9x17NDeoYF+FNBmlGc//ulbvR6ofgQAAMhg7KmDnYeHJutC5IW1qZJPpBARry573R2LXj32Sn9XACHMj+x5+tu1dcM8Icw0Jbtj2QOfyh8TO4y63bu3vV0zJMg2Ux20z9648c/XL0gaN543qnDNFx54Y/M39yKMTTVQ9/amY49+pYS/Rls80nhwx+a3G1SHQ2JGaNhd+slPff7J+0rdY+MRtidW3PHo3wca7//66z2UYYIMtXn3s29dWLQ+svw/jUnKzpnh+b8dmiRyfNeZlsbWbpQ8qnV6cm/1UCiEGHItuHWF+fOfXEBI04d2H61F5ZfzrtnXUt94cIjjXXpIz8xPy82YZpQPwdF3Pvl3X76/dOx4Vt6RNn/jn+u9He3f3dbqlDneptW/U31ybdVsb9ykr8MYC5jqnI1f/fqDFZf/HLHJTtt7HFetH3vxO7+rC8kcQczUOdFX+Wff/PojFTHjPjDUmVi2/oksvyBcNeeFBs5t+sGP3qlXndE2Q1X5xLQFq+6szHRCLwm4FA6RYZi6gShHKEb00lQEZi05TQlZOLfwgXVLi/PTJ/6uJAnWyhamyRAv8PyEgv6UkNuXlYsC/8Jvt9U3dlCKrQXMrrTODROHQmpxftqD9yytrMifqkhMnM/z2EO3ud2OLW/v94+oHEcIRtRaPW3QH/APB0fP/BQFIdx2txbb4Hl+mlGjr76+93xDh2FYFSkxSUpwzy3Lh7UuPsaeeLjqxOmW5557k01c9JKQkBpqqD09NNCXlpk7oywTWeNUMMYcHz6POI4Pn+3I1HVGIotaRMrSsPBXCMfzzDTqzp8+dmRfe0uDZuhI1WMTPV99cvWc0gzY8wCAm83hnsDhPtVkZqqNT1R4mcM1g+p/1/S/3h5EujqhLUJEXX0sJ/4GnbP9J5+dYl9y3+pX33i6d9hvEES083WN1qBKk8hK3vpHbh9bPj7YdODIsb1dWHYgPRhIWnrL8tJJJ82RxCUrZn9zz36EMQsGew4crEMluddmewebT1dvPzIsiXbEtCApXnHb+lvG58PLOzP9rs888Mrvv38Ih9uoRjBUv3lvy/p1kWIZoi8rP3+m++1dmihQrr62tbFjYE7M5U7A+urtvaFA+At6YcX62aHnf/JbEzNV637nePsjOZeyW197c+OJDp536ZqaU5RSnD3drEuWvuYzD43LhxcJ6TOrblnwh53Pn2UcTwSh48T5hra+yrhJn8wQVey3bnxs/gecdKKf3vLL8yGOYISYybnciz731Kcn5MNLXK7py1phhMxA+7Yf/f1PdndSxck0Fbmzylc+eGdFPA+XLnClYUxnz8rzelx7D55u6+jTNd2qyYjsNqWwMHXRvKIFswsS472TXrVnFWft3n/q2KkGjqOzijLTk2MnjZG3LJqZnODdtuf43uozTS2dIVW7/FB6SmxlRcHieUVZ6Qn8tEvGJSXEPHxvVXF+6vZdx4+equ/qHjBMU9eN0uKM3Oyk0blu6fySIyfrLrT6McZr75jnckyyuvHwcOCNPxx6cfPOQDAYeWMhVV++uDTKaYNT4mNMFLjv/M2Gjs7+1/7vAJq4cjrGumF0dDT39nZGe+OS0zJjYxNE2Uat8c2MMV3XCSEYE3SpH5xyFGMcCozU156prTnR1tqshUIMY6Qzu13+0hdW37dmLux2AMBNRTfZ1w91/HftkEa4yFKWPDN4jEYQQYROkg/DrW3xnkSh0HWjDnD7CAoY5KxdveDXR18b6tOt++GctcC0KMu3b3woa9zxaD9bW3/AzwtOZKqab155XmrC5NECx+QUIrTPagUGNP/xxj6U674WGxvoudB4+qQqyAJimirklZXNzJtmoiOfdsetM7936IiVEU2/1rH7dN+6pMiWSAkZ2blFyvb9TBSocaypob4nUOS62BPXdHRLZ2gk/HW9eFGpr9hYqv32LQ6bQb1tf41/XVwkN430trXWnec42dBGUgtSCzOmrbKRsfLWkin7+ZyZuZlFOdqJGsTzHCENHQO9wypyTzq+k1Ky9LYlrg+4B43Tezb3WvXwGDNFxX77mvvSP2AdDkwINkOnfvkP//CbswNEtjNNlRKKlj34yRW50AQGV25qMMQYy81MvGfVguVLSltae3r7hwzDVBQpzudOTvDGx3pGr1I4TklB2ucfW33qbJMsCWUzsnwxk8+3FQSuuCA9Ndl3y8LS5tburp4BTdNEgY/xRiXGR6ck+mzKexrb6XE7qhaWFuWmXmjvbW0PbypHyaySrJSxI2DnluV9+Ym7axvaXA7bnLK8yArgEc0XunbuP9nVM9Byofts3YX+Af/lZfmT4t0rlkGhmo8/d5T9J//+Zxt1/Y03DqGJJx7GCFFN09rbmrraWySbI9rr88bERbk9imLnBZFSijExDGToRjA4PNDf29nR2tF+YXiw3zDNi+tN66ZdFr7yxTVPPnYbVDEF4HrATzGRXuBgTNW1t7Nr5D/r/MwwkHbxjrCGscasel6GMVnjmXMj/amSpBv3gvlRNB2cSx5a89N3ftxvrf9nLS2NRbHg4YeXjW/n93d3drUMctSJEBNt2u6f/ePDr9q4yafhBLrwxWn4IYM1DgwjdC0iojnS29FyVrdu5huGmZDgS46ffvpFUnaeiY5Qq78rZOD6vpHLW2KLT0vLyTN3n0KiwIUO1DbV9ugZSdYR6Dy8pSs0yBgz5i8ud3Pu8sWLzbd2YaSG9KMHa9iiWVbti8Hmhrp9OicYeighIyUvc9pS/SwnPXGasWUOrzcq3mueDiGeUKK3dA34A5NPASSElJblfuB7IO3nD/fhiysvC5JQMa/0g51z4VOFkf6TL/zb03u7dV4RmIodueXrvvDwIh90IH5o8I25qYwxQojTYZtRmFmcn6HpumkygaP0PYy35HluZlFmYU4qIfiq4zOdDpvTYcvLTtF03TBMSglv9cC833M7LtYTF+uZWZypajq1/u64FxEErrKioKwkWxC40Q919w7+8JnNp2paAqFQKKha3UEXb6hghjduqIr3Qc3Jm0Kcz/WzH37mc1/7+Uuv7EaCtaLpuPMw/E9sIDTsHxwe7G+ur8GU4wVRsCIiwtgwDE0NqWqIaRqLLMFvDXtGDCFN9ziVp7609i8fvx0jyIcAXBdcwmTfUIzFijCz4No73RdChEemOnpXT7mWV/gKTP5pljfDfgO3UD+au8uFGx5Y/ELd70eGDBzexYJku/uRT2RPuOuh6kyNtHkwptQc6Gzp65iqSgMmnFXYIfxcbJoTmmCXTdFEizw2/gm6NjIy2EGIw1pDGHmcStRV1vek8ZllCB/BVpeXqoUaWxhKvPiazoT8pLwS49g5LPDC0LGm5vY+lBSDEBo8tL095DcRYrMXl8ZyhERnzctGu2oJDmr+7afOf3FWNkLmQEdDbbUqCIIR8GQnZWUn4infSPiReK9zunaw4JAlD0KtGGNCiKEZpjH5KxFCktxRV23jTrWH+9pOEcRMjBnDAkfzk13vOxpeel1d/eVfPM4GA1jkkaGT5Ow5j312Q44MF64PLXSNO57WWT36ejj2DuaY+XgTP0wk0hcxKtGNLrEZfpDgP2bhRBMxZK3tfamgC7t0jwOLwvu+Rr+vnjeMkcBz6I/+IiAES+J0ryJOePTYyYYTZy8MDfkxwZdq22CTIUrwp+6/ZemCGTAL8eYR63U9+71HM9J8P/jxGyPDQcRzaNJOBowRpZHPSCgYCAVHrnzuIh9SeumcYZE1M8zMzLh//KsN966aDTsZgOtHjlNEY5tu4S9eXS12Q32yay9B4REz3tNTKYcw+esC10OZUTf0W/6IOqNdlUvnSqJgNSMJ5fnysknHROJIfsGRH8oRSqf6wZiZLPwTKTPBJrxK5IdMFhJHPWHSEEki20AIoVctHI+poJBRr4bIqBPKk1aUlltgmiYWBL75dEuTtboa8p/ecT4wbGCM05eUxnMEYZJZVhUfDsZkJDS05URb+FkDfe2NZzsFnpjMlpeSkZ8iTdqiv7K7pl0t1NBDmh6g9GICt0nCmDlTV14q3NaMibFdNUpMuYdNnVx6FBPCcR8kpUQ2EpOCrGyVERo+Zzizp7furV3nTLhufWiCIfXyFDurfj4bCQQJvtgpbBpsyB8c9ag5PBKKfPIwRiZjgWBozB0fVVdV7fLpoep6+PmXaLo+HAj+McMxnA6by+XQdGaYSFHkaPdNUW5RFGn4isci88qQYaCRkVBasu/LT6y7+875o8ejgpuB3Sb9/1+95+c/erxsRjpvhj9myDCnu/Ni3ZtB5NLP5U8gY0gzkKa7ZWH96jmbfvZFyIcAXG/meOUk3kTCqNagKM+NFks8EBGvvSXxSomCkGxHhE5WPtq6lnICEuV4mf5XuffrJTE3+lv+qOaoEJ4nl/IYJoSfNHlha4Um6z8jFPAsevChdUvyXUgzp+tqYCaVXKnesV+CkbxGLnYVTviOjEzWx5Guv4mPRirZE0L0kKEFEZouL5ldjdWRHMkYlkQhOW70Lo5NyUvNyTQb2rHE0+MN9U19gYIo6ezBk4FhFSMUt3RWlmglOy5/9hLxx7/WCQpoA/vODqyNl4faGutPUE4xDKEwJ2dWljLJDrv0RjBCbPrG9vBQr7+/g9KL/aPuKGXsSt2Rl2Lhn3Aynj7Gjd/D40KzNYcQIxJ+ohp4n2eKlc2xGX5lQSr6/D8/9LtPPflKJ8cTSvzN1a8+/UziNx6dFwUXr2sP4+6egS1b99+7enEk4L2772RLa3eke40QHFLVd/ceX1xZYrcqZLS0du/Ye1yU+EjNC8Mwa2pbqo/UlJfmIIT6+v1bdxweHglFVoSnlHT3DG7fc7woLy0SL0/XNB8/1SBLIvugHYmFOSkbVi94+Xc7gyF1+ZJZ8+cU3gxHqaw0Z/nS0je2VgdVzem0ZabGlc3MnV2anZEaRyn0H96MeJ6uW1lRWZ79w2fffmXzvrqmzlBQQwQjShC92k1hhpBhIN1EBHmctqKi1Ec/ueT+u+dTAoNLAbjuuEX6g7kJX6juajL5cG4xjRIb+v6cBAE+sB8CF09fWpr8reM9b7RqHSMq43hrKJS1q63qNQ4O5bj4VUmOB9IcibaPwwyoj6yMAaaU4zje2rGUTr54tSvKFZdASSvlOKQh5k3JnbNgjo+iqzci8bgEaP0xjhocRycJo4SGH7eqzdOxjwtKTEzSTErOc5THAt811N85qKPoafZa94UGzFEuHFWRIPE5cWO7MhIzSrMKMt9s7+BEgT/T2N45gtIbj1YHRgIcoXxVRb7IW6kZC9mzqriX3iLY0IyaMxfQkoTWpnO7OUnBZjArJbkofdKEGHkj1tc5a2jrRWiqkqdGf0dXzwVeEClHDZXmJUX77NLEl4qsLHfV5gGxnk0je3hcN6I3pYLndiKTIYYNk+2vufCZosT3kxBp+LURsQYbc47Yyq98+y/bH//hYcbxgsg6z/7hpf9OifuLFekwH/Fa38XBOKRqz/9mW1NLV1JCTFNL5859pxhjkTm/GGPGWPWRc3/37f+dUZQRCAb3Haxpau4S+IsHglLc0dX3vR9vWjC70G5TTtY0Hjh0VhAuP0rUkL7lreqe3qHs9Pj2zv69B08PDY38MaMiFVlcvmRWaVG6bpgxHpfr5ijjKQn8wxtuWVJZrOm6wyY7HTaP2zn9aFVwM4iPjfrWU/d8cn3lrzbt/cP2E+fq2jt7/UYgFFnNwppkiC99U7Lw9dk0Iw8pNjEhxVNcnLJq+ay7V5a7HArsTACuWysS7LtWyId6g/2qGSPRimjJBrVqPjRJCv9fc+J6Qka9X+0I6EOaqVp9VjaOxEg01S4kKVaW+Lj46CIiCYc2zioFxHOTj4lU3Ekx8QUcaeE4UZZ6Ttc1dfbN83nR+y0GQSjlr0REPLGf0NoUFv7S5MYdXZs7OSsvjtQGwr8u9Z+pP3Wq5Zb0tKmqIbKBw3uqeWswpWlQpy16dva4Dq7YrLzUnETcMSjI4vCRuqZef/SJPcGAtTbkmoocib84m4i6iuYuELbuQzioq7vOnN/oaGs4gSUJMbUoJa4swzn5Gw2/ETNyp/jIuWYDxU7e4jY6zp05f7JHku0cZSaxZaUkRNvGvNLFw4MxotzVrjc4sod5jiORPTz6wbisApewr183rdGtesvre5rvvif5vQcVQjme56zeST78xqgjb81TXzrzqX/bScKnhRhoPPn2y5viH11fAl2J1/xDinFf39Dv3tovCpyq6rphjo5wGGNV0/YdPnP0ZK3JmKpqV2qlXMqQ9U0dF9p6woFQ1Rljo2/AYIIHhoa37ji8c89xzTA03eDoH/vFpshiWnLczXaY3C67+yqLxYCbVF5Wwt996e7HN1btPnBu/6G6kzUX2lqdAb1YAAAMw0lEQVR6+gb9Q8OhYFDTDRMjJPBUkQWnXfZEO9NSfTMKk+dX5FSUZvA89EIDcAOIFumt8VDW/U+6w6PFm6IMxkcWEQnlw4gVEfkp2obepMy0vCTaPMDxkk2p27F31/K52QtTp5xew5ihakwcW2jCWuaJszKiGf5LZPxI04tp9XJEHP0YjUnKnbk4fstrQ5xA7crwu9W75x2t2Fgx+cIXgVP/96sdVqRipsnZovM+sWR8hxlNyM5KyvWQA5ooCR31XZ0nTxw0QkEeEby6sjTq8pcypd4ZCwqFA2cxUTVj35GT6d11HaIoYyMjJXFWZvSkLXqrY5YzI32yxmubXr+vZGXCJHG278zRnfuqexVF4QgLqY75eVmpMcKEl7J6BFn4/Vwlk0e6hMMp2trDY0N49vz1vl8806mH452pDjU8/9M3F35j+RTdm5qmE0Lo5fMBY2qt8ByJiJECz5ySduvnv9nY/s0trZQTJBn3nNu/9bX46PULEgW4dl1jlBKTsZFAiGA8McIRQhhDwZAW+f9xg4xx+FeophtWlU4ybh6vVRSDmCYLhLTIM2FvA/BhiPW61t5evvb28iF/oKm1t62zv7fX7x8OhjSDYCSLvNNp80Y7kuLdibFuSIYAAAA+woiIqSDJsowMhBgWZGHybkTiK55ZPCdnzzudgszJsnbw5Rc3p7g3LCvwiRMypR4a7G6pP7q1JfOxlVlj/xQvSjZFsUmUY7okTGzn8oqi6EzDGGFeFrixZRi9qbMqV5a8+3IDJ4mKLLXs2vQLX7zy4LJ8z5gVafTQYNfhp//l+UZZsiHETEaikpc+sGBivXkhMTsjrdB97BRVBK6uq3pfU6OuipIsL5tZ5BxVwJiS1BlLs8XGVg5j3Hqk+jCqcTnsmHmTU0uzYibfp7wsh2Nf5B0ydOB7/7Ep7asrc6JHj4lmI61Htrz66o4aLjqKJ8wMcN47588qThqbu6mgKIqGjHBs5kV++t4dEg5qNpuiCIRDhsiNzYhc3p2Pzf7ddw+NhDM4MrXgu09/+8euv3xgRows8aOeaOra4Pm3jw1mZeZnJzqubIgsyzLTMSZEvLQhRPHOfujLj/v/+dcndElWHHaj7Vz1rr2+Oxbm2GEE/jW/m2P1Ek/5SbaS3nQhc9oKT+TKaDcAwIfLYZcLcxILcxJhVwAAALg+IyLixHCawQZiJhKniogI+WbMX3TrqeObDmmYp4rNPPfad/61u2H9nUsLYh3ypeBjakF/Z82et19+eXe/91Pff2xcG5bwghVgRMohU+K5iRFRlmWdcVYcUiYsJ+PInbv83jUn/uetFpMI1GYLnN7yg39tr129dklRnMvGYWSqqtp3fs+Lv3r5UK9kUzAymUFc2Us+/VDpZEWlpKTS1LRiZ+15XpCkvrM1vZpKZdkxZ1ZulDj6cFAuIXehV9ys80gzTh494nO77LruSUspzk+aojEejlOKcnHuoMBzIyee/9o3Oh/59PKZMQonUKSHBlpOvPXKS68e6hV9LpExI6TZZ61cVlnipeMTvCxHIiIjvCRcJSJSUZRtiiILhMNM4scfzOTlf/7Yjr/5n2ODyOqPNNVzv/mnr9Usu+fuqpIEJyUcxYYe6L1wZPuL//s7bs1Tn5+ZPeo8ESRFUZCOMcbCqKwqRmXd8shnB3/0zM5OTpLtDn646czhQ76oeXmwSuL7uFNzI20sg+MFAAAAAPBxjoiYExW7Q+WsiCjIMj9VY1VKXnHn2sEB/2+rOzREeYcdqefffO7br2ElNsZxsb9M7W/rCmJKqeJ1KxO6OzAVZZvTYVdETqVYFicMmySC3W5HVMcYYU6SuPGbQjw5y+95JBB4dvOx/hDiBbudhZreeuE7v9c4d6zHTofbu4Z1kwiCM8qFTEMzOE9W6W2PfXbeFIv321KLM9IKD7W2UInr7uwmhNjtrtSKvGhx7ABZXsmaudy3dbsuEMT6+npdDntIyUkpKJwiISIq2Ox2h65FImJO+Xy1ZndN187nvrXjp1SJibMZ/d0dw1gQhZhYDwpvqUl8uWvXLJudJk08PHa7nXFmOCJyojD9yCPCiYrN4dBkgaockSdERMylrvrcxvrvvrK/qUen1mRFxure/cU//eHnWLRFRTuQv69vQCM8NsRiu0TG/Kpks9uD1CAYI14Y3XmM7bEFK+5d1f2rHX28rNgddjTQev5MvdueFavAZO33Eg+vuoLL9bW9BGMKBxYAAAAA4GMbERFvc7lcTDIwY0iQFH7q/gwSP/Oue7HgfGP78aaBEQNT6rSqYpjMNHTDWiHbHhNjM00Ty76cgkT7JAHGEeUKySLVBM4+sUuMii6XixP0cKOZEyfdFFtyxaqNgm3L79891trrV60qn9YAOtPUmD3Ga2PINEzTNIgjIT27ZP66NZWJU8cqR1pBZmZ+TX8rjXRZmlrQNyc3VuHHb7iSWTzXc+gojXSemUbIm5yQnZ8wZeyWnQ5XgGmRln9c5bp758j/uam6sSeEOWJqmDp8iU7EzPCGGoizRWctWnXXinlpk/R18rLL5aSiae0TQbpKROQVm9MdxUSeaCKniBO7hDGXuPRzX3O99MKbR+qaOv3h/Ycjc9MYYobJ5CifxAw9FHLalbG3C3jZ4XLpooERxoIgjT1fpdjc+evuCr6+t9EIh1SbbPS3NzdG2bJi7DwMXpweISQhzmMtUHEDbC1jzKZI0VFQlAUAAAAA4GMbETHlJVmWqYmZyTiRn3aZdySnlK6535eec+hE7YXO3r6+/kF/UGcX850sirLTHeWN8niScyvKS1zj/xThRUlRZFmgGmbCxOqphMqSbCINI4R5caoxr46EGXd9IiEn/+Dhsy09/QM9gwND/pBhMIQYkWRBtse4vW6PJ7N8yeKcq9XWtMfnJsWfrOnuJuG/Zmo4rjwrVp5Qa4VQR2punnKm2aopahqaPSEmLT9xyl1FOUmWZJ1aRVkZjznv3Ps/I/veOFjf2dndPTAU1ExMqag4XVEeT2xySXn5rJzYyRdYpYIkyTo2idWLyF1toKkgirIsSTzVMBo/F/HSYeC9ZRueSJ+xc1t1XW/PQM9A39BIMKQa4SjMiYrT6XBHRXkSC/JTnKNPSiJIsixhg2CMOWFC8OMcqcWLbzV3HTjfS4TwYcaB/o7WdjE53ilzkBKn++RTWlGa84vfbseIMGZe51trGGas15WfmwoHDgAAAADg4xoRaVzxouUxISOyFBP1xV2tFiV2JJQuSZgxZ6Ct7UJrR3efXzUYwohxdqciO33xviRftDhpkpGis0sXrfIFeIoNXYvJjreN6xNzZFRVIc2w1ponND5uyn2C5Zj8ytvyyof7O9ubOru6+4Z1gzHEOJtDsbtTElISvPJ7W7DUkVY6Z7ktqc+gNNz81ZKKku2TTKEjkq/wjpXBRhR+mmkaiic+P3bKHj0Snbt4qW1YNSI1W2MSRUy4uJnLP5nf31zb2NTV4w+ZhOOUKG9cXEpCrMs29cHnfEW33OJRrX2CCc1wTftubPFFs5c6MkIcCe/huBSPOMVOoLyncOnavAUjHW0tHe09A0PDgXBE5EXF6Y3xJibGepRxv0pjixbd6gka1jsiJG2SDZHcKUWVgrtlwBAlURAEniM8YuaN0j/2USEE52Ym3b6sbNPr+ySBMnb9TvXTDRbr81QtmBHrhYVNAAAAAAA+dPh6bhoCAD5UPb0DP3z2td9vrRYFnmDErqMCNsyaL4lVTY922x+695a7V1ZSmIsIAAAAAAAREQDwoeawwcHh/YfPvrPjSH1Lp6bq18uFCWOEkcOuzChIq1o0Mz87efSq/QAAAAAAACIiAODDoutGIBhSNcM0jevn0oQw4igVBV6SeIKh/xAAAAAAACIiAAAAAAAAAIA/Lbg3DwAAAAAAAAAAIiIAAAAAAAAAAIiIAAAAAAAAAAAgIgIAAAAAAAAAgIgIAAAAAAAAAAAiIgAAAAAAAAAAiIgAAAAAAAAAACAiAgAAAAAAAACAiAgAAAAAAAAAACIiAAAAAAAAAACIiAAAAAAAAAAAICICAAAAAAAAAICICAAAAAAAAAAAIiIAAAAAAAAAAIiIAAAAAAAAAAAgIgIAAAAAAAAAgIgIAAAAAAAAAAAiIgAAAAAAAAAAiIgAAAAAAAAAACAiAgAAAAAAAACAiAgAAAAAAAAAACIiAAAAAAAAAACIiAAAAAAAAAAAICICAAAAAAAAAICICAAAAAAAAAAAIiIAAAAAAAAAAIiIAAAAAAAAAAAgIgIAAAAAAAAAgIgIAAAAAAAAAAAiIgAAAAAAAAAAiIgAAAAAAAAAACAiAgAAAAAAAACAiAgAAAAAAAAAACIiAAAAAAAAAICby/8LAAD//+OMswyJnBkNAAAAAElFTkSuQmCC)
 """
 
-!pip install numpy==1.20.3 scikit-learn==0.23.2
-!pip install -pre pycaret
+# Пакеты не ставятся из сети при каждом запуске: используется установленное окружение,
+# заранее собранное окружение .venv-pycaret или локальный каталог колес wheelhouse
+from env_bootstrap import bootstrap, load_pycaret
+bootstrap()
 
 """# 2. Install numpy lib to avoid errors in using PyCaret
 pip install numpy==1.20.3 scikit-learn==0.23.2
@@ -23,7 +25,10 @@ pip install --pre pycaret
 """
 
 # 3. Import PyCaret regression libs
-from pycaret.regression import *
+# Импортируется только модуль регрессии
+pycaret_regression = load_pycaret('regression')
+setup, get_config = pycaret_regression.setup, pycaret_regression.get_config
+create_model, plot_model = pycaret_regression.create_model, pycaret_regression.plot_model
 
 """4. Импортируем библиотеки PyCaret для работы с наборами данных и регрессией
 from pycaret.datasets import get_data  # Импортируем функцию get_data из модуля datasets библиотеки PyCaret, которая позволяет загружать различные наборы данных.
@@ -33,7 +38,7 @@ all_datasets = get_data('index')  # Вызываем функцию get_data с
 """
 
 # 4. Import PyCaret regression libs and review PyCaret's datasets
-from pycaret.datasets import get_data
+get_data = load_pycaret('datasets').get_data
 all_datasets = get_data('index')
 
 """5. Загружаем набор данных 'Insurance'
@@ -53,8 +58,19 @@ reg = setup(
 # 5. Load dataset 'Insurance'
 # While loading you should press 'Enter' in field below
 data=get_data('insurance')
-reg = setup(
+# Преобразованные выборки, конвейер и эксперимент кэшируются по хэшу данных и аргументам setup():
+# при повторном запуске с теми же данными setup() не вызывается, а эксперимент восстанавливается
+# из кэша только при первом вызове create_model/plot_model
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Общий модуль atomic_dir находится в родительском каталоге скрипта
+from setup_cache import cached_setup
+
+reg = cached_setup(
+    setup, get_config,
     data=data,
+    save_experiment=pycaret_regression.save_experiment,
+    load_experiment=pycaret_regression.load_experiment,
     target='charges',
     train_size=0.8,
     session_id=10,
@@ -66,7 +82,7 @@ get_config('X')  # Используем функцию get_config для пол
 """
 
 # 7. Review normalized features
-get_config('X')
+reg.X
 
 """Функция get_config('X') возвращает набор признаков после предобработки.
 
@@ -93,7 +109,29 @@ best = compare_models()  # Используем функцию compare_models д
 
 # 8. Prepare to magic;) Evaluate all models by 1 line of code
 # compare models
-best = compare_models()
+# Пары (модель, фолд) обучаются параллельно на матрицах из setup(), оценки кэшируются на диске:
+# повторный запуск или добавление модели вычисляет только недостающие пары
+from model_compare import best_model_id, compare_models_cached, race_models
+
+# Быстрый режим: последовательное отсеивание (полную кросс-валидацию проходят только лидеры)
+FAST_SELECTION = True
+compare = race_models if FAST_SELECTION else compare_models_cached
+
+# Фолды как в setup() по умолчанию: 10 фолдов KFold без перемешивания
+from sklearn.model_selection import KFold, StratifiedKFold
+
+leaderboard = compare(
+    reg.X_train,
+    reg.y_train,
+    task='regression',
+    fold=KFold(10),
+    timeout=600,
+    random_state=10,
+)
+print(leaderboard)
+# Эксперимент PyCaret нужен для create_model и plot_model и подготавливается при их первом вызове
+create_model, plot_model = reg.bind(create_model), reg.bind(plot_model)
+best = create_model(best_model_id(leaderboard))
 
 """Визуализация модели
 plot_model(best)  # Используем функцию plot_model для создания графиков, которые помогают визуализировать производительность лучшей модели.
@@ -125,7 +163,7 @@ plot_model(best, plot = 'learning')
 Импортируйте набор данных 'diabetes'
 """
 
-from pycaret.datasets import get_data
+get_data = load_pycaret('datasets').get_data
 
 # Загрузка набора данных 'diabetes'
 data = get_data('diabetes')
@@ -133,13 +171,18 @@ print(data.head())  # Просмотр первых строк данных
 
 """Выполните импорт всех библиотек из модуля classification библиотеки pycaret"""
 
-from pycaret.classification import *
+pycaret_classification = load_pycaret('classification')
+setup, get_config = pycaret_classification.setup, pycaret_classification.get_config
+create_model, plot_model = pycaret_classification.create_model, pycaret_classification.plot_model
 
 """Настройте эксперимент, цель - значения столбца 'Class variable'"""
 
 # Настройка эксперимента
-clf_setup = setup(
+clf_setup = cached_setup(
+    setup, get_config,
     data=data,
+    save_experiment=pycaret_classification.save_experiment,
+    load_experiment=pycaret_classification.load_experiment,
     target='Class variable',  # Целевая переменная
     session_id=42,            # Для воспроизводимости
     normalize=True,           # Нормализация данных
@@ -148,8 +191,18 @@ clf_setup = setup(
 
 """Выполните поиск наилучшей модели"""
 
-# Сравнение моделей
-best_model = compare_models()
+# Сравнение моделей (параллельно, с кэшем оценок по фолдам; режим задается FAST_SELECTION)
+leaderboard = compare(
+    clf_setup.X_train,
+    clf_setup.y_train,
+    task='classification',
+    fold=StratifiedKFold(10),
+    timeout=600,
+    random_state=42,
+)
+print(leaderboard)
+create_model, plot_model = clf_setup.bind(create_model), clf_setup.bind(plot_model)
+best_model = create_model(best_model_id(leaderboard))
 print(best_model)
 
 """Определите наиболее значимые признаки"""
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Подготовка окружения PyCaret без установки пакетов из сети.
+
+Вместо `!pip install numpy==1.20.3 scikit-learn==0.23.2` и `!pip install -pre pycaret`
+в каждом новом ядре окружение проверяется в таком порядке:
+1. версии из PINNED уже установлены - ничего не делается;
+2. есть заранее собранное окружение (каталог ENV_DIR) - его site-packages
+   подключается через site.addsitedir и ставится в начало sys.path;
+3. есть локальный каталог колес (WHEELHOUSE) - пакеты ставятся из него
+   через pip --no-index, без обращения к сети.
+PINNED - согласованный набор диапазонов для PyCaret 3 (numpy 1.20.3 и
+scikit-learn 0.23.2 из исходного блокнота с ним несовместимы). Если пакеты
+установлены, но их версии вне диапазонов и исправить это нечем, выводится
+предупреждение, а не ошибка.
+Каталог колес собирается один раз на машине с доступом к сети:
+    pip download -d wheelhouse "numpy>=1.21,<1.27" "scikit-learn>=1.0,<1.5" "pycaret>=3.0,<4"
+
+Модуль использует только стандартную библиотеку и должен импортироваться
+до numpy и sklearn, чтобы подключенное окружение имело приоритет.
+"""
+
+import glob
+import importlib
+import operator
+import os
+import re
+import site
+import subprocess
+import sys
+import warnings
+from importlib import metadata
+
+# Допустимые версии для PyCaret 3 в формате pip ('>=1.21,<1.27'); None - подходит любая установленная версия
+PINNED = {
+    'numpy': '>=1.21,<1.27',
+    'scikit-learn': '>=1.0,<1.5',
+    'pycaret': '>=3.0,<4',
+}
+
+_OPERATORS = {
+    '>=': operator.ge, '<=': operator.le, '==': operator.eq,
+    '!=': operator.ne, '>': operator.gt, '<': operator.lt,
+}
+
+ENV_DIR = '.venv-pycaret'
+WHEELHOUSE = 'wheelhouse'
+
+_ready = False
+
+
+def _release(version):
+    """Числовая часть версии: '1.26.4' -> (1, 26, 4), '3.0.0rc1' -> (3, 0, 0)."""
+    return tuple(int(part) for part in re.findall(r'\d+', re.match(r'[\d.]*', version).group()))
+
+
+def version_matches(version, spec):
+    """Проверяет версию по условиям вида '>=1.21,<1.27' (None - любая версия)."""
+    if spec is None:
+        return True
+    installed = _release(version)
+    for clause in spec.split(','):
+        op, bound = re.match(r'\s*(>=|<=|==|!=|>|<)\s*(\S+)', clause).groups()
+        width = max(len(installed), len(_release(bound)))
+        pad = lambda release: release + (0,) * (width - len(release))
+        if not _OPERATORS[op](pad(installed), pad(_release(bound))):
+            return False
+    return True
+
+
+def missing_packages(pins=None, absent_only=False):
+    """Пакеты, которые не установлены или установлены в версии вне диапазона из pins.
+    Args:
+        absent_only: только неустановленные пакеты, без проверки версий
+    """
+    pins = PINNED if pins is None else pins
+    missing = []
+    for name, spec in pins.items():
+        try:
+            installed = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            missing.append(name)
+            continue
+        if not absent_only and not version_matches(installed, spec):
+            missing.append(name)
+    return missing
+
+
+def _add_site_dir(path):
+    """Подключает site-packages (с его .pth файлами) и ставит добавленные пути перед остальными."""
+    before = list(sys.path)
+    site.addsitedir(path)
+    added = [entry for entry in sys.path if entry not in before]
+    sys.path[:] = added + before
+
+
+def _site_packages(env_dir):
+    # Linux/macOS: lib/pythonX.Y/site-packages, Windows: Lib/site-packages
+    version = f"python{sys.version_info.major}.{sys.version_info.minor}"
+    candidates = glob.glob(os.path.join(env_dir, 'lib', version, 'site-packages'))
+    candidates += glob.glob(os.path.join(env_dir, 'Lib', 'site-packages'))
+    return [path for path in candidates if os.path.isdir(path)]
+
+
+def _requirement(name, spec):
+    return name if spec is None else f"{name}{spec}"
+
+
+def bootstrap(env_dir=ENV_DIR, wheelhouse=WHEELHOUSE, pins=None):
+    """Проверяет окружение и при необходимости подключает локальное окружение или ставит колеса.
+    Args:
+        env_dir: каталог заранее собранного виртуального окружения
+        wheelhouse: каталог колес для установки без сети
+        pins: dict {пакет: диапазон версий или None}; по умолчанию PINNED
+    returns:
+        'installed', 'env' или 'wheelhouse' - откуда взяты пакеты
+    """
+    global _ready
+    pins = PINNED if pins is None else pins
+    if not missing_packages(pins):
+        _ready = True
+        return 'installed'
+
+    site_dirs = _site_packages(env_dir)
+    for path in site_dirs:
+        if path not in sys.path:
+            _add_site_dir(path)
+    if site_dirs:
+        importlib.invalidate_caches()
+        if not missing_packages(pins):
+            _ready = True
+            return 'env'
+
+    if os.path.isdir(wheelhouse):
+        requirements = [_requirement(name, pins[name]) for name in missing_packages(pins)]
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '--no-index', '--find-links', wheelhouse,
+                               *requirements])
+        importlib.invalidate_caches()
+        missing = missing_packages(pins)
+        if missing:
+            raise RuntimeError(f"После установки из {wheelhouse!r} не подходят пакеты {missing}: "
+                               f"в каталоге колес нет версий {[_requirement(name, pins[name]) for name in missing]}")
+        _ready = True
+        return 'wheelhouse'
+
+    missing = missing_packages(pins)
+    if not missing_packages(pins, absent_only=True):
+        # Все пакеты есть, но версии вне диапазонов: работаем с тем, что установлено
+        versions = {name: metadata.version(name) for name in missing}
+        warnings.warn(f"Версии {versions} вне диапазонов {[_requirement(name, pins[name]) for name in missing]}; "
+                      f"нет окружения {env_dir!r} и каталога колес {wheelhouse!r}, используются установленные")
+        _ready = True
+        return 'installed'
+
+    raise RuntimeError(
+        f"Не найдены пакеты {missing_packages(pins, absent_only=True)}: нет окружения {env_dir!r} "
+        f"и каталога колес {wheelhouse!r}. Соберите колеса заранее: pip download -d {wheelhouse} "
+        + ' '.join(f'"{_requirement(name, spec)}"' for name, spec in pins.items())
+    )
+
+
+def load_pycaret(task):
+    """Импортирует только нужный модуль PyCaret ('regression', 'classification', 'datasets', ...).
+    При первом вызове проверяет окружение через bootstrap().
+    """
+    if not _ready:
+        bootstrap()
+    return importlib.import_module(f"pycaret.{task}")
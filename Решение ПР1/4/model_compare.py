@@ -0,0 +1,547 @@
+# -*- coding: utf-8 -*-
+"""Параллельное сравнение моделей с кэшем результатов по фолдам.
+
+Замена compare_models() для матриц, подготовленных setup(): каждая пара
+(модель, фолд) - отдельная задача в пуле процессов с ограничением времени.
+Время задачи контролирует родительский процесс: зависшая задача (в том числе
+внутри кода на C, который не прерывается сигналами) завершается вместе с
+процессами пула, а пул создается заново. Оценки каждой пары сохраняются на
+диск под ключом из хэша данных, задачи, набора метрик, версии scikit-learn,
+класса и параметров модели и номера фолда, поэтому повторный запуск или
+добавление новой модели вычисляет только недостающие пары.
+
+Пул запускается методом fork: скрипт вызывает сравнение на верхнем уровне
+без защиты if __name__ == '__main__', а при spawn и forkserver (по умолчанию
+на macOS и Windows, на Linux - с Python 3.14) каждый процесс пула заново
+выполнял бы весь скрипт. Где fork недоступен (Windows), задачи выполняются
+последовательно в текущем процессе, без ограничения времени. Результат - таблица в
+формате compare_models(): строки - идентификаторы моделей PyCaret ('lr',
+'rf', ...), столбцы - Model, метрики и TT (Sec).
+
+race_models() - последовательное отсеивание (successive halving): модели
+оцениваются на растущем числе фолдов, после каждого раунда худшая часть
+отбрасывается, и полную кросс-валидацию проходят только лидеры.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+import warnings
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn import metrics
+from sklearn.base import clone
+from sklearn.model_selection import KFold, StratifiedKFold
+
+# Названия моделей в таблице, как в PyCaret
+MODEL_NAMES = {
+    'lr': 'Linear Regression', 'lasso': 'Lasso Regression', 'ridge': 'Ridge Regression',
+    'en': 'Elastic Net', 'lar': 'Least Angle Regression', 'llar': 'Lasso Least Angle Regression',
+    'omp': 'Orthogonal Matching Pursuit', 'br': 'Bayesian Ridge', 'par': 'Passive Aggressive Regressor',
+    'huber': 'Huber Regressor', 'knn': 'K Neighbors Regressor', 'dt': 'Decision Tree Regressor',
+    'rf': 'Random Forest Regressor', 'et': 'Extra Trees Regressor', 'ada': 'AdaBoost Regressor',
+    'gbr': 'Gradient Boosting Regressor', 'dummy': 'Dummy Regressor',
+}
+CLASSIFIER_NAMES = {
+    'lr': 'Logistic Regression', 'knn': 'K Neighbors Classifier', 'nb': 'Naive Bayes',
+    'dt': 'Decision Tree Classifier', 'svm': 'SVM - Linear Kernel', 'ridge': 'Ridge Classifier',
+    'rf': 'Random Forest Classifier', 'qda': 'Quadratic Discriminant Analysis', 'ada': 'Ada Boost Classifier',
+    'gbc': 'Gradient Boosting Classifier', 'lda': 'Linear Discriminant Analysis',
+    'et': 'Extra Trees Classifier', 'dummy': 'Dummy Classifier',
+}
+
+
+def regression_models(random_state=None):
+    """Набор регрессоров scikit-learn с идентификаторами PyCaret."""
+    from sklearn import dummy, ensemble, linear_model, neighbors, tree
+
+    return {
+        'lr': linear_model.LinearRegression(),
+        'lasso': linear_model.Lasso(random_state=random_state),
+        'ridge': linear_model.Ridge(random_state=random_state),
+        'en': linear_model.ElasticNet(random_state=random_state),
+        'lar': linear_model.Lars(random_state=random_state),
+        'llar': linear_model.LassoLars(random_state=random_state),
+        'omp': linear_model.OrthogonalMatchingPursuit(),
+        'br': linear_model.BayesianRidge(),
+        'par': linear_model.PassiveAggressiveRegressor(random_state=random_state),
+        'huber': linear_model.HuberRegressor(),
+        'knn': neighbors.KNeighborsRegressor(),
+        'dt': tree.DecisionTreeRegressor(random_state=random_state),
+        'rf': ensemble.RandomForestRegressor(random_state=random_state),
+        'et': ensemble.ExtraTreesRegressor(random_state=random_state),
+        'ada': ensemble.AdaBoostRegressor(random_state=random_state),
+        'gbr': ensemble.GradientBoostingRegressor(random_state=random_state),
+        'dummy': dummy.DummyRegressor(),
+    }
+
+
+def classification_models(random_state=None):
+    """Набор классификаторов scikit-learn с идентификаторами PyCaret."""
+    from sklearn import discriminant_analysis, dummy, ensemble, linear_model, naive_bayes, neighbors, tree
+
+    return {
+        'lr': linear_model.LogisticRegression(max_iter=1000, random_state=random_state),
+        'knn': neighbors.KNeighborsClassifier(),
+        'nb': naive_bayes.GaussianNB(),
+        'dt': tree.DecisionTreeClassifier(random_state=random_state),
+        'svm': linear_model.SGDClassifier(random_state=random_state),
+        'ridge': linear_model.RidgeClassifier(random_state=random_state),
+        'rf': ensemble.RandomForestClassifier(random_state=random_state),
+        'qda': discriminant_analysis.QuadraticDiscriminantAnalysis(),
+        'ada': ensemble.AdaBoostClassifier(random_state=random_state),
+        'gbc': ensemble.GradientBoostingClassifier(random_state=random_state),
+        'lda': discriminant_analysis.LinearDiscriminantAnalysis(),
+        'et': ensemble.ExtraTreesClassifier(random_state=random_state),
+        'dummy': dummy.DummyClassifier(),
+    }
+
+
+def _rmsle(y_true, y_pred):
+    # Как в PyCaret: по модулю значений, чтобы логарифм был определен
+    return np.sqrt(metrics.mean_squared_log_error(np.abs(y_true), np.abs(y_pred)))
+
+
+def _mape(y_true, y_pred):
+    nonzero = y_true != 0
+    return np.mean(np.abs((y_true[nonzero] - y_pred[nonzero]) / y_true[nonzero]))
+
+
+def _auc(y_true, y_score):
+    if y_score is None:
+        return 0.0
+    if y_score.ndim == 2 and y_score.shape[1] == 2:
+        y_score = y_score[:, 1]
+    if y_score.ndim == 1:
+        return metrics.roc_auc_score(y_true, y_score)
+    return metrics.roc_auc_score(y_true, y_score, multi_class='ovr', average='weighted')
+
+
+# Метрики: функция (y_true, y_pred, y_score) -> число; порядок совпадает со столбцами compare_models()
+REGRESSION_METRICS = {
+    'MAE': lambda y, p, s: metrics.mean_absolute_error(y, p),
+    'MSE': lambda y, p, s: metrics.mean_squared_error(y, p),
+    'RMSE': lambda y, p, s: np.sqrt(metrics.mean_squared_error(y, p)),
+    'R2': lambda y, p, s: metrics.r2_score(y, p),
+    'RMSLE': lambda y, p, s: _rmsle(y, p),
+    'MAPE': lambda y, p, s: _mape(y, p),
+}
+CLASSIFICATION_METRICS = {
+    'Accuracy': lambda y, p, s: metrics.accuracy_score(y, p),
+    'AUC': lambda y, p, s: _auc(y, s),
+    'Recall': lambda y, p, s: metrics.recall_score(y, p, average='weighted', zero_division=0),
+    'Prec.': lambda y, p, s: metrics.precision_score(y, p, average='weighted', zero_division=0),
+    'F1': lambda y, p, s: metrics.f1_score(y, p, average='weighted', zero_division=0),
+    'Kappa': lambda y, p, s: metrics.cohen_kappa_score(y, p),
+    'MCC': lambda y, p, s: metrics.matthews_corrcoef(y, p),
+}
+
+# Метрики ошибок: чем меньше, тем лучше
+LOWER_IS_BETTER = {'MAE', 'MSE', 'RMSE', 'RMSLE', 'MAPE'}
+
+# Версия формата кэша оценок; увеличивается при изменении определений метрик
+CACHE_VERSION = 2
+
+# Данные, переданные в процесс пула инициализатором
+_data = {}
+
+
+def _share(arr):
+    """Массив для передачи в процесс пула.
+    Целый .npy файл, открытый через mmap (например, из setup_cache), передается по имени файла:
+    процессы открывают его сами и делят одну копию в кэше страниц ОС.
+    """
+    if isinstance(arr, np.memmap) and arr.filename is not None and arr.flags.c_contiguous:
+        try:
+            full = np.load(arr.filename, mmap_mode='r')
+        except (OSError, ValueError):
+            return arr
+        if full.offset == arr.offset and full.size == arr.size and full.dtype == arr.dtype:
+            return ('npy', arr.filename, arr.shape)
+    return arr
+
+
+def _attach(shared):
+    if isinstance(shared, tuple):
+        _, filename, shape = shared
+        return np.load(filename, mmap_mode='r').reshape(shape)
+    return shared
+
+
+def _init_worker(X, y, task):
+    """Инициализатор процесса пула: данные передаются один раз на процесс (или открываются из файла)."""
+    _data['X'], _data['y'], _data['task'] = _attach(X), _attach(y), task
+
+
+def _fit_fold(estimator, train, test):
+    """Обучает копию модели на одном фолде и возвращает dict метрик."""
+    X, y, task = _data['X'], _data['y'], _data['task']
+    start = time.perf_counter()
+    model = clone(estimator).fit(X[train], y[train])
+    y_pred = model.predict(X[test])
+    elapsed = time.perf_counter() - start
+
+    y_score = None
+    if task == 'classification':
+        if hasattr(model, 'predict_proba'):
+            y_score = model.predict_proba(X[test])
+        elif hasattr(model, 'decision_function'):
+            y_score = model.decision_function(X[test])
+    scores = {name: float(metric(y[test], y_pred, y_score)) for name, metric in _metric_set(task).items()}
+    scores['TT (Sec)'] = elapsed
+    return scores
+
+
+def data_hash(X, y):
+    """SHA-256 матрицы признаков и целевой переменной.
+    Непрерывные массивы (в том числе memmap) хэшируются через буфер, без копии в bytes.
+    """
+    digest = hashlib.sha256()
+    for arr in (X, y):
+        arr = np.ascontiguousarray(arr)
+        digest.update(f"{arr.dtype.str}{arr.shape}".encode('utf-8'))
+        digest.update(memoryview(arr).cast('B'))
+    return digest.hexdigest()
+
+
+def estimator_key(estimator):
+    """Класс и параметры модели в виде строки JSON для ключа кэша."""
+    params = estimator.get_params(deep=False)
+    cls = type(estimator)
+    return json.dumps({'class': f"{cls.__module__}.{cls.__qualname__}", 'params': params},
+                      sort_keys=True, default=repr)
+
+
+class ScoreCache:
+    """Оценки пар (модель, фолд) в каталоге root, по одному JSON файлу на пару.
+    Args:
+        root: каталог кэша (None - кэш отключен)
+    """
+
+    def __init__(self, root='compare_cache'):
+        self.root = root
+
+    def key(self, data_digest, estimator, fold, test_index, task='regression'):
+        payload = json.dumps({
+            'version': CACHE_VERSION,
+            'sklearn': sklearn.__version__,
+            'task': task,
+            'metrics': list(_metric_set(task)),
+            'data': data_digest,
+            'estimator': estimator_key(estimator),
+            'fold': fold,
+            'test': hashlib.sha256(np.asarray(test_index, dtype=np.int64).tobytes()).hexdigest(),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        if self.root is None:
+            return None
+        path = os.path.join(self.root, f"{key}.json")
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def put(self, key, scores):
+        if self.root is None:
+            return
+        os.makedirs(self.root, exist_ok=True)
+        # Запись во временный файл и переименование: другой процесс не прочитает неполный файл
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(scores, f)
+        os.replace(tmp, os.path.join(self.root, f"{key}.json"))
+
+
+def _metric_set(task):
+    return CLASSIFICATION_METRICS if task == 'classification' else REGRESSION_METRICS
+
+
+def _fork_context():
+    """Контекст multiprocessing с методом fork или None, если fork недоступен."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def _run_inline(jobs, initargs, timeout):
+    """Выполняет задачи в текущем процессе (без fork); timeout не соблюдается."""
+    if timeout is not None:
+        warnings.warn("fork недоступен: задачи выполняются в текущем процессе без ограничения времени")
+    _init_worker(*initargs)
+    try:
+        for job in jobs:
+            try:
+                yield job[0], _fit_fold(*job[1:])
+            except Exception as error:
+                yield job[0], error
+    finally:
+        _data.clear()
+
+
+def _terminate(pool):
+    """Завершает процессы пула вместе с выполняемыми задачами."""
+    # У ProcessPoolExecutor нет публичного способа прервать запущенную задачу
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_jobs(jobs, n_jobs, initargs, timeout):
+    """Выполняет задачи (метка, модель, train, test) в пуле процессов с ограничением времени.
+    Одновременно отправляется не больше задач, чем процессов, поэтому время задачи считается
+    от ее отправки. Задача, превысившая timeout, завершается вместе с процессами пула;
+    остальные выполнявшиеся задачи повторяются в новом пуле.
+    returns:
+        генератор пар (метка, dict метрик или исключение)
+    """
+    context = _fork_context()
+    if context is None:
+        yield from _run_inline(jobs, initargs, timeout)
+        return
+
+    workers = n_jobs or os.cpu_count() or 1
+    pending = list(jobs)
+    running = {}  # future -> (задача, время отправки)
+    pool = None
+    try:
+        while pending or running:
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_worker,
+                                           initargs=initargs)
+            while pending and len(running) < workers:
+                job = pending.pop(0)
+                running[pool.submit(_fit_fold, *job[1:])] = (job, time.monotonic())
+
+            wait_time = None
+            if timeout is not None:
+                wait_time = max(0.0, min(start for _, start in running.values()) + timeout - time.monotonic())
+            done, _ = wait(running, timeout=wait_time, return_when=FIRST_COMPLETED)
+
+            broken = False
+            for future in done:
+                job, _ = running.pop(future)
+                try:
+                    yield job[0], future.result()
+                except BrokenProcessPool as error:
+                    broken = True
+                    yield job[0], error
+                except Exception as error:
+                    yield job[0], error
+
+            now = time.monotonic()
+            expired = [future for future, (_, start) in running.items()
+                       if timeout is not None and now - start >= timeout]
+            if expired or broken:
+                for future in expired:
+                    job, _ = running.pop(future)
+                    yield job[0], TimeoutError(f"превышено время {timeout} с")
+                # Незавершенные задачи выполняются заново в новом пуле
+                pending[:0] = [job for job, _ in running.values()]
+                running.clear()
+                _terminate(pool)
+                pool = None
+    finally:
+        if running:
+            _terminate(pool)
+        elif pool is not None:
+            pool.shutdown(wait=True)
+
+
+def make_folds(X, y, fold=10, task='regression', random_state=None):
+    """Список фолдов (train, test) как в PyCaret: KFold для регрессии, StratifiedKFold для классификации.
+    Args:
+        fold: число фолдов или объект-разбиение scikit-learn с методом split
+    """
+    if isinstance(fold, int):
+        splitter = StratifiedKFold if task == 'classification' else KFold
+        fold = splitter(fold, shuffle=random_state is not None, random_state=random_state)
+    return [(np.asarray(train), np.asarray(test)) for train, test in fold.split(X, y)]
+
+
+def score_folds(X, y, estimators, folds, task='regression', cache_dir='compare_cache', n_jobs=None, timeout=None,
+                digest=None):
+    """Оценки каждой модели на каждом из указанных фолдов; недостающие вычисляются в пуле процессов.
+    Args:
+        X, y: подготовленные матрица признаков и целевая переменная
+        estimators: dict {идентификатор: модель scikit-learn}
+        folds: dict {номер фолда: (train, test)} или список фолдов
+        task: 'regression' или 'classification'
+        cache_dir: каталог кэша оценок (None - без кэша)
+        n_jobs: число процессов (None - по числу ядер)
+        timeout: ограничение времени одной задачи (модель, фолд) в секундах
+        digest: готовый data_hash(X, y), чтобы не хэшировать данные при каждом вызове
+    returns:
+        dict {идентификатор: {номер фолда: dict метрик или None при ошибке или превышении времени}}
+    """
+    # Подкласс np.memmap сохраняется, чтобы передать процессам имя файла, а не копию данных
+    X, y = np.asanyarray(X), np.asanyarray(y).ravel()
+    if not isinstance(folds, dict):
+        folds = dict(enumerate(folds))
+    cache = ScoreCache(cache_dir)
+    if digest is None:
+        digest = data_hash(X, y)
+
+    results = {name: {} for name in estimators}
+    missing = []
+    for name, estimator in estimators.items():
+        for i, (train, test) in folds.items():
+            key = cache.key(digest, estimator, i, test, task)
+            scores = cache.get(key)
+            if scores is None:
+                missing.append((name, i, key))
+            else:
+                results[name][i] = scores
+
+    if missing:
+        jobs = [((name, i, key), estimators[name], folds[i][0], folds[i][1]) for name, i, key in missing]
+        for (name, i, key), scores in _run_jobs(jobs, n_jobs, (_share(X), _share(y), task), timeout):
+            if isinstance(scores, BaseException):
+                # Как compare_models(errors='ignore'): модель с ошибкой обучения исключается из сравнения
+                warnings.warn(f"Ошибка обучения модели {name} на фолде {i}: {scores!r}")
+                scores = None
+            results[name][i] = scores
+            # Ошибки и превышение времени не кэшируются: задача будет выполнена при следующем запуске
+            if scores is not None:
+                cache.put(key, scores)
+    return results
+
+
+def leaderboard(results, task='regression', sort=None, names=None, round=4):
+    """Таблица в формате compare_models() по результатам score_folds.
+    Модели, у которых хотя бы один фолд завершился ошибкой или превысил время, в таблицу не попадают.
+    """
+    if names is None:
+        names = CLASSIFIER_NAMES if task == 'classification' else MODEL_NAMES
+    metric_names = list(CLASSIFICATION_METRICS if task == 'classification' else REGRESSION_METRICS)
+    sort = _default_sort(task, sort)
+
+    rows = {}
+    for model_id, fold_scores in results.items():
+        if not fold_scores or any(scores is None for scores in fold_scores.values()):
+            continue
+        frame = pd.DataFrame(list(fold_scores.values()))
+        rows[model_id] = {'Model': names.get(model_id, model_id), **frame.mean().to_dict()}
+
+    table = pd.DataFrame.from_dict(rows, orient='index', columns=['Model'] + metric_names + ['TT (Sec)'])
+    table = table.sort_values(sort, ascending=sort in LOWER_IS_BETTER, kind='stable')
+    table[metric_names] = table[metric_names].round(round)
+    table['TT (Sec)'] = table['TT (Sec)'].round(2)
+    return table
+
+
+def _default_sort(task, sort):
+    return sort if sort is not None else ('Accuracy' if task == 'classification' else 'R2')
+
+
+def compare_models_cached(X, y, estimators=None, task='regression', fold=10, sort=None, cache_dir='compare_cache',
+                          n_jobs=None, timeout=None, random_state=None):
+    """Сравнение моделей по кросс-валидации: все пары (модель, фолд) параллельно, с кэшем на диске.
+    Args:
+        X, y: подготовленные матрица признаков и целевая переменная (например, get_config('X_train_transformed'))
+        estimators: dict {идентификатор: модель}; None - regression_models() или classification_models()
+        task: 'regression' или 'classification'
+        fold: число фолдов или объект-разбиение (например, get_config('fold_generator'))
+        sort: метрика сортировки (по умолчанию R2 для регрессии и Accuracy для классификации)
+        cache_dir: каталог кэша оценок (None - без кэша)
+        n_jobs: число процессов (None - по числу ядер)
+        timeout: ограничение времени одной задачи (модель, фолд) в секундах
+        random_state: random_state моделей по умолчанию и перемешивания фолдов
+    returns:
+        DataFrame в формате compare_models()
+    """
+    if estimators is None:
+        estimators = classification_models(random_state) if task == 'classification' else regression_models(random_state)
+    folds = make_folds(X, y, fold, task, random_state)
+    results = score_folds(X, y, estimators, folds, task, cache_dir, n_jobs, timeout)
+
+    failed = [name for name, fold_scores in results.items() if any(s is None for s in fold_scores.values())]
+    if failed:
+        warnings.warn(f"Модели исключены из таблицы (ошибка или превышение времени): {failed}")
+    return leaderboard(results, task, sort)
+
+
+def race_models(X, y, estimators=None, task='regression', fold=10, sort=None, eta=2, min_folds=1,
+                cache_dir='compare_cache', n_jobs=None, timeout=None, random_state=None):
+    """Выбор модели последовательным отсеиванием вместо полной кросс-валидации каждой модели.
+
+    В первом раунде все модели оцениваются на min_folds фолдах; после каждого
+    раунда остается лучшая 1/eta часть по метрике sort, а число фолдов
+    увеличивается в eta раз (уже вычисленные фолды не пересчитываются).
+    Последний раунд проводится на всех фолдах. Лидеры стоят в начале таблицы
+    со средними по всем фолдам, за ними - отсеянные модели в порядке раунда
+    выбывания, со средними по тем фолдам, на которых они оценивались; число
+    этих фолдов - в table.attrs['folds']. Модели с метрикой NaN считаются худшими.
+    Args:
+        eta: во сколько раз сокращается число моделей и растет число фолдов за раунд
+        min_folds: число фолдов первого раунда
+        остальные параметры - как в compare_models_cached
+    returns:
+        DataFrame в формате compare_models() (те же столбцы, что у compare_models_cached);
+        attrs['folds'] - dict {идентификатор: число фолдов, на которых оценена модель}
+    """
+    if eta < 2:
+        raise ValueError("eta должно быть не меньше 2")
+    if estimators is None:
+        estimators = classification_models(random_state) if task == 'classification' else regression_models(random_state)
+    folds = make_folds(X, y, fold, task, random_state)
+    sort = _default_sort(task, sort)
+    sign = 1 if sort in LOWER_IS_BETTER else -1
+    # Данные хэшируются один раз на все раунды
+    digest = data_hash(np.asanyarray(X), np.asanyarray(y).ravel())
+
+    results = {name: {} for name in estimators}
+    survivors = list(estimators)
+    eliminated = []  # Списки моделей, выбывших в каждом раунде
+    failed = []
+    n_done, n_folds = 0, min(min_folds, len(folds))
+    while True:
+        # Новые фолды только для оставшихся моделей; предыдущие оценки сохраняются
+        new = score_folds(X, y, {name: estimators[name] for name in survivors},
+                          {i: folds[i] for i in range(n_done, n_folds)}, task, cache_dir, n_jobs, timeout, digest)
+        for name, fold_scores in new.items():
+            results[name].update(fold_scores)
+        broken = [name for name in survivors if any(s is None for s in results[name].values())]
+        failed += broken
+        survivors = [name for name in survivors if name not in broken]
+
+        n_done = n_folds
+        if n_done == len(folds) or not survivors:
+            break
+
+        # Устойчивая сортировка: при равенстве сохраняется порядок моделей, NaN - в конце
+        ranked = sorted(survivors, key=lambda name: _rank_key(results[name], sort, sign))
+        keep = max(1, -(-len(ranked) // eta))
+        survivors, dropped = ranked[:keep], ranked[keep:]
+        if dropped:
+            eliminated.append(dropped)
+        # Единственный лидер сразу проходит полную кросс-валидацию
+        n_folds = len(folds) if keep == 1 else min(len(folds), n_folds * eta)
+
+    if failed:
+        warnings.warn(f"Модели исключены из таблицы (ошибка или превышение времени): {failed}")
+    groups = [survivors] + eliminated[::-1]
+    tables = [leaderboard({name: results[name] for name in group}, task, sort) for group in groups if group]
+    table = pd.concat(tables) if tables else leaderboard({}, task, sort)
+    table.attrs['folds'] = {name: len(results[name]) for name in table.index}
+    return table
+
+
+def _rank_key(fold_scores, sort, sign):
+    score = np.mean([scores[sort] for scores in fold_scores.values()])
+    return (True, 0.0) if np.isnan(score) else (False, sign * score)
+
+
+def best_model_id(table):
+    """Идентификатор лучшей модели (первая строка таблицы compare_models_cached или race_models)."""
+    if table.empty:
+        raise RuntimeError("Ни одна модель не прошла кросс-валидацию без ошибок и превышения времени")
+    return table.index[0]
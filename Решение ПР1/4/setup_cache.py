@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Кэш результатов setup() PyCaret: преобразованные матрицы и обученный конвейер.
+
+setup() при каждом вызове заново обучает конвейер предобработки и строит
+преобразованные выборки. Здесь результат сохраняется в каталог кэша под
+ключом из хэша данных и аргументов setup(): матрицы - как .npy (открываются
+через отображение в память, только для чтения), конвейер - через joblib.
+Повторный вызов с теми же данными и аргументами загружает все с диска без
+вызова setup(), а процессы пула model_compare подключаются к тем же файлам
+вместо получения собственной копии данных. Сам эксперимент PyCaret
+(нужен для create_model и plot_model) строится setup() только при промахе
+кэша и сохраняется рядом с матрицами через save_experiment; при попадании он
+восстанавливается через load_experiment при первом вызове функции PyCaret,
+обернутой в PreparedData.bind.
+"""
+
+import functools
+import hashlib
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from atomic_dir import write_directory
+
+# Выборки, которые сохраняются из get_config()
+PARTS = ['X_train', 'y_train', 'X_test', 'y_test']
+
+# Файл эксперимента PyCaret в каталоге записи кэша
+EXPERIMENT_FILE = 'experiment.pkl'
+
+
+def _pycaret_version():
+    try:
+        from importlib.metadata import version
+        return version('pycaret')
+    except Exception:
+        return None
+
+
+def _as_saveable(name, values):
+    """Массив без dtype object: такой .npy сохраняется через pickle и не открывается через mmap.
+    Числа переводятся в float64, строки - в строковый тип фиксированной длины.
+    """
+    if values.dtype != object:
+        return values
+    # Метки-строки ('0', '1', ...) остаются строками
+    if all(isinstance(value, str) for value in values.ravel()):
+        return values.astype(str)
+    try:
+        return values.astype(np.float64)
+    except (TypeError, ValueError):
+        pass
+    raise TypeError(f"{name}: значения типа object нельзя сохранить в кэш без pickle")
+
+
+def setup_key(data, setup, setup_kwargs):
+    """SHA-256 от содержимого данных, модуля setup() (regression/classification), версии PyCaret и аргументов."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([str(column) for column in data.columns]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    payload = {
+        'module': getattr(setup, '__module__', None),
+        'pycaret': _pycaret_version(),
+        'kwargs': setup_kwargs,
+    }
+    digest.update(json.dumps(payload, sort_keys=True, default=repr).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class PreparedData:
+    """Преобразованные выборки и конвейер из кэша.
+    Args:
+        arrays: dict {часть: массив} (X_train, y_train, X_test, y_test)
+        pipeline: обученный конвейер предобработки
+        columns: названия преобразованных признаков
+        run_setup: функция без аргументов, вызывающая setup()
+    """
+
+    def __init__(self, arrays, pipeline, columns, run_setup):
+        self.arrays = arrays
+        self.pipeline = pipeline
+        self.columns = columns
+        self._run_setup = run_setup
+        self._experiment = None
+
+    def __getattr__(self, name):
+        # X_train, y_train, X_test, y_test
+        if name in PARTS:
+            return self.arrays[name]
+        raise AttributeError(name)
+
+    @property
+    def X(self):
+        """Все преобразованные признаки (обучающие и тестовые) в виде DataFrame, как get_config('X_transformed')."""
+        return pd.DataFrame(np.concatenate([self.X_train, self.X_test]), columns=self.columns)
+
+    def experiment(self):
+        """Эксперимент PyCaret; строится или восстанавливается один раз при первом обращении."""
+        if self._experiment is None:
+            self._experiment = self._run_setup()
+        return self._experiment
+
+    def bind(self, func):
+        """Функция PyCaret (create_model, plot_model, ...), которая перед вызовом подготавливает эксперимент."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.experiment()
+            return func(*args, **kwargs)
+        return wrapper
+
+
+class SetupCache:
+    """Каталог кэша результатов setup().
+    Args:
+        root: каталог кэша
+    """
+
+    def __init__(self, root='setup_cache'):
+        self.root = root
+
+    def path(self, key):
+        return os.path.join(self.root, key)
+
+    def load(self, key):
+        """Загружает (arrays, pipeline, columns) или возвращает None."""
+        path = self.path(key)
+        meta_path = os.path.join(path, 'meta.json')
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in PARTS}
+        pipeline = joblib.load(os.path.join(path, 'pipeline.joblib'))
+        return arrays, pipeline, meta['columns']
+
+    def save(self, key, arrays, pipeline, columns, save_experiment=None):
+        """Сохраняет запись; save_experiment(path) - функция PyCaret для сохранения эксперимента."""
+        arrays = {name: _as_saveable(name, np.ascontiguousarray(arrays[name])) for name in PARTS}
+
+        def write(path):
+            for name in PARTS:
+                np.save(os.path.join(path, f"{name}.npy"), arrays[name], allow_pickle=False)
+            joblib.dump(pipeline, os.path.join(path, 'pipeline.joblib'))
+            if save_experiment is not None:
+                save_experiment(os.path.join(path, EXPERIMENT_FILE))
+            with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump({'columns': [str(column) for column in columns]}, f)
+
+        # Другие процессы не увидят неполную запись, а при ошибке временный каталог удаляется
+        write_directory(self.path(key), write)
+
+
+def cached_setup(setup, get_config, data, cache_dir='setup_cache', save_experiment=None, load_experiment=None,
+                 **setup_kwargs):
+    """setup() с кэшем преобразованных выборок и эксперимента.
+    Args:
+        setup, get_config: функции модуля pycaret.regression или pycaret.classification
+        data: исходный DataFrame
+        cache_dir: каталог кэша
+        save_experiment, load_experiment: функции того же модуля PyCaret для сохранения и
+            восстановления эксперимента (None - при попадании эксперимент строится через setup())
+        setup_kwargs: аргументы setup() (target, train_size, session_id, normalize, ...)
+    returns:
+        PreparedData; на промахе кэша setup() уже вызван, на попадании эксперимент
+        восстанавливается при первом вызове experiment()
+    """
+    cache = SetupCache(cache_dir)
+    key = setup_key(data, setup, setup_kwargs)
+
+    def run_setup():
+        path = os.path.join(cache.path(key), EXPERIMENT_FILE)
+        if load_experiment is not None and os.path.exists(path):
+            return load_experiment(path, data=data)
+        return setup(data=data, **setup_kwargs)
+
+    loaded = cache.load(key)
+    if loaded is not None:
+        return PreparedData(*loaded, run_setup)
+
+    experiment = setup(data=data, **setup_kwargs)
+    frames = {name: get_config(f"{name}_transformed") for name in PARTS}
+    columns = list(frames['X_train'].columns)
+    cache.save(key, {name: frame.to_numpy() for name, frame in frames.items()}, get_config('pipeline'), columns,
+               save_experiment)
+    prepared = PreparedData(*cache.load(key), run_setup)
+    prepared._experiment = experiment
+    return prepared
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Атомарная запись каталога кэша.
+
+Общий модуль для хранилищ split_manifest (разбиения) и setup_cache
+(результаты setup() PyCaret). Содержимое пишется во временный каталог рядом
+с целевым и переименовывается одной операцией, поэтому другие процессы видят
+либо полную запись, либо ее отсутствие. Временный каталог удаляется при
+любой ошибке записи.
+"""
+
+import os
+import shutil
+import tempfile
+
+
+def write_directory(target, write):
+    """Создает каталог target, заполняя его функцией write во временном каталоге.
+    Args:
+        target: путь к создаваемому каталогу
+        write: функция (path) -> None, записывающая файлы в каталог path
+    returns:
+        True - каталог записан, False - такой каталог уже записан другим процессом
+    """
+    parent = os.path.dirname(target) or '.'
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent, prefix='.tmp-')
+    try:
+        write(tmp)
+        os.replace(tmp, target)
+    except OSError:
+        # Запись с тем же ключом уже сделана другим процессом
+        if not os.path.isdir(target):
+            raise
+        return False
+    finally:
+        # После успешного переименования временного каталога уже нет
+        if os.path.isdir(tmp):
+            shutil.rmtree(tmp, ignore_errors=True)
+    return True
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Автоматическое уменьшение типов столбцов DataFrame после загрузки.
+
+Общий модуль для всех наборов данных проекта (spambase, King County,
+wine_types.csv, NSFG, база испытаний ракет). Правила:
+- float64 -> float32, если значения совпадают в пределах относительной погрешности
+  (по умолчанию - точно: столбцы с дробными значениями вроде 0.67 остаются float64);
+  даже без потерь при хранении арифметика над float32 накапливает ошибку округления
+  (разности, квантили, логарифмы), поэтому для столбцов, участвующих в вычислениях,
+  перевод float отключается через downcast_floats=False;
+- целые -> наименьший знаковый целый тип, вмещающий все значения
+  (бинарный столбец 0/1, например 'class' в spambase, становится int8 или bool);
+- строки с небольшим числом уникальных значений -> category.
+Возвращается также отчет с объемом памяти до и после по каждому столбцу.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _optimize_column(series, float_tolerance, category_ratio, binary_as_bool, downcast_floats):
+    """Возвращает столбец в более компактном типе (или исходный столбец)."""
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+
+    if pd.api.types.is_integer_dtype(dtype) and not isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        if binary_as_bool and series.isin([0, 1]).all():
+            return series.astype(bool)
+        # Только знаковые типы: разность беззнаковых столбцов переполнялась бы
+        return pd.to_numeric(series, downcast='integer')
+
+    if downcast_floats and pd.api.types.is_float_dtype(dtype) and dtype == np.float64:
+        values = series.to_numpy()
+        converted = values.astype(np.float32)
+        # Значения вне диапазона float32 превратятся в inf и не пройдут проверку
+        if np.allclose(converted, values, rtol=float_tolerance, atol=0, equal_nan=True):
+            return series.astype(np.float32)
+        return series
+
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        if len(series) and series.nunique(dropna=True) / len(series) <= category_ratio:
+            return series.astype('category')
+    return series
+
+
+def optimize_dtypes(df, float_tolerance=0.0, category_ratio=0.5, binary_as_bool=False, columns=None,
+                    downcast_floats=True):
+    """Уменьшает типы столбцов DataFrame.
+    Args:
+        df: DataFrame
+        float_tolerance: допустимая относительная погрешность при переходе float64 -> float32
+            (0 - только без потерь; 1e-6 переводит практически любые конечные значения)
+        category_ratio: максимальная доля уникальных значений для перевода строк в category
+        binary_as_bool: переводить целые столбцы 0/1 в bool (иначе - в int8)
+        columns: список столбцов для обработки (None - все)
+        downcast_floats: переводить float64 в float32 (False - оставить float64 для вычислений)
+    returns:
+        (DataFrame, DataFrame-отчет со столбцами dtype_before, dtype_after, bytes_before, bytes_after)
+    """
+    result = df.copy(deep=False)
+    rows = {}
+    for column in (df.columns if columns is None else columns):
+        before = df[column]
+        after = _optimize_column(before, float_tolerance, category_ratio, binary_as_bool, downcast_floats)
+        if after is not before:
+            result[column] = after
+        rows[column] = {
+            'dtype_before': str(before.dtype),
+            'dtype_after': str(after.dtype),
+            'bytes_before': int(before.memory_usage(index=False, deep=True)),
+            'bytes_after': int(after.memory_usage(index=False, deep=True)),
+        }
+
+    report = pd.DataFrame.from_dict(rows, orient='index')
+    return result, report
+
+
+def memory_saved(report):
+    """Строка со сводкой отчета optimize_dtypes: объем до, после и экономия."""
+    before = report['bytes_before'].sum()
+    after = report['bytes_after'].sum()
+    saved = 100 * (1 - after / before) if before else 0.0
+    return f"{before / 1024:.1f} KiB -> {after / 1024:.1f} KiB (сэкономлено {saved:.1f}%)"
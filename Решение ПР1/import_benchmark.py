@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Замер времени импорта при запуске скриптов решения.
+
+Из каждого скрипта берутся импорты верхнего уровня (import, from ... import и
+присваивания lazy_import/lazy_attr) и выполняются в новом процессе Python в
+каталоге скрипта - так измеряется стоимость запуска без загрузки данных и
+обучения моделей. Каждый замер повторяется несколько раз, выводится медиана.
+
+Запуск из каталога 'Решение ПР1':
+    python import_benchmark.py [скрипт ...] [--repeat 5]
+"""
+
+import argparse
+import ast
+import glob
+import os
+import statistics
+import subprocess
+import sys
+
+LAZY_CALLS = {'lazy_import', 'lazy_attr'}
+
+# Код, выполняемый в дочернем процессе: время импортов печатается последней строкой
+_RUNNER = """
+import sys, time
+sys.path[:0] = [{script_dir!r}, {root_dir!r}]
+start = time.perf_counter()
+exec(compile({source!r}, {script!r}, 'exec'), {{'__name__': '__benchmark__'}})
+print(time.perf_counter() - start)
+"""
+
+
+def _is_lazy_assign(node):
+    if not isinstance(node, ast.Assign) or not isinstance(node.value, ast.Call):
+        return False
+    func = node.value.func
+    name = func.id if isinstance(func, ast.Name) else getattr(func, 'attr', None)
+    return name in LAZY_CALLS
+
+
+def startup_source(path):
+    """Импорты верхнего уровня скрипта в виде исходного кода."""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    nodes = [node for node in tree.body
+             if isinstance(node, (ast.Import, ast.ImportFrom)) or _is_lazy_assign(node)]
+    return '\n'.join(ast.unparse(node) for node in nodes)
+
+
+def measure(path, repeat=5):
+    """Медиана времени импортов скрипта в секундах по repeat запускам в новых процессах.
+    returns:
+        (секунды или None, текст ошибки или None)
+    """
+    path = os.path.abspath(path)
+    script_dir = os.path.dirname(path)
+    code = _RUNNER.format(script_dir=script_dir, root_dir=os.path.dirname(script_dir),
+                          source=startup_source(path), script=path)
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', code], cwd=script_dir, capture_output=True, text=True)
+        if result.returncode != 0:
+            return None, result.stderr.strip().splitlines()[-1]
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(times), None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('scripts', nargs='*', help='скрипты (по умолчанию все */0*.py)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    scripts = args.scripts or sorted(glob.glob(os.path.join(root, '*', '0*.py')))
+    for script in scripts:
+        seconds, error = measure(script, args.repeat)
+        name = os.path.relpath(script, root)
+        if error is None:
+            print(f"{name:45s} {seconds:8.3f} с")
+        else:
+            print(f"{name:45s}   ошибка: {error}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Отложенный импорт тяжелых библиотек (matplotlib, seaborn, statsmodels, patsy).
+
+lazy_import('statsmodels.api') возвращает объект-заместитель: сам модуль
+импортируется при первом обращении к его атрибуту. Скрипт, который только
+разбивает данные и не строит графиков и моделей statsmodels, не тратит
+время на загрузку этих библиотек. on_load выполняется один раз сразу после
+импорта - например, настройка стиля seaborn.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """Модуль, импортируемый при первом обращении к атрибуту.
+    Args:
+        name: полное имя модуля
+        on_load: функция (module) -> None, вызываемая один раз после импорта
+    """
+
+    def __init__(self, name, on_load=None):
+        self.__dict__['_name'] = name
+        self.__dict__['_on_load'] = on_load
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            module = importlib.import_module(self._name)
+            self.__dict__['_module'] = module
+            if self._on_load is not None:
+                self._on_load(module)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'загружен' if self.__dict__['_module'] is not None else 'не загружен'
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+class LazyAttribute:
+    """Атрибут модуля (функция или класс), импортируемый при первом вызове или обращении.
+    Args:
+        module: LazyModule или имя модуля
+        attr: имя атрибута
+    """
+
+    def __init__(self, module, attr):
+        self._module = module if isinstance(module, LazyModule) else LazyModule(module)
+        self._attr = attr
+
+    def _load(self):
+        return getattr(self._module, self._attr)
+
+    def __call__(self, *args, **kwargs):
+        return self._load()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        return f"<LazyAttribute {self._module._name}.{self._attr}>"
+
+
+def lazy_import(name, on_load=None):
+    """Заместитель модуля name; импорт происходит при первом обращении."""
+    return LazyModule(name, on_load)
+
+
+def lazy_attr(module, attr):
+    """Заместитель атрибута attr модуля module (например, функции abline_plot)."""
+    return LazyAttribute(module, attr)